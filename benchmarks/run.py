@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+"""
+Benchmark django-tastypie-swagger against synthetic tastypie APIs
+
+Generates tastypie.api.Api registries of increasing size, whose resources
+have a configurable number of fields, ALL_WITH_RELATIONS filters chaining
+to the following resources (wrapping around, so the graph has cycles), a
+self reference and extra_actions. For each registry and filter depth it
+measures the mapping builders, SchemaView (without cache, filling the cache
+and from the cache), ResourcesView and AggregateView, reporting wall time,
+peak memory (Python 3 only, through tracemalloc) and payload size.
+
+Filters are measured at the default depth and with no limit. Without a
+limit each resource documents the filters of every resource after it on the
+ring, so the unbounded runs are skipped for registries larger than
+--max-unbounded-size.
+
+Usage::
+
+    python benchmarks/run.py --sizes 10,100 --output before.json
+    python benchmarks/run.py --sizes 10,100 --output after.json --compare before.json
+
+Requires Django and django-tastypie to be installed.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import types
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from django.conf import settings
+
+RESOURCES_MODULE = 'benchmark_resources'
+URLS_MODULE = 'benchmark_urls'
+
+
+def configure():
+    settings.configure(
+        DEBUG=False,
+        SECRET_KEY='benchmark',
+        ALLOWED_HOSTS=['*'],
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'tastypie',
+            'tastypie_swagger',
+        ],
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        ROOT_URLCONF=URLS_MODULE,
+        MIDDLEWARE_CLASSES=[],
+        TASTYPIE_SWAGGER_CACHE=False,
+    )
+    import django
+    if hasattr(django, 'setup'):
+        django.setup()
+
+
+def build_api(size, field_count, relation_count, action_count):
+    """
+    Return a tastypie.api.Api of size synthetic resources
+    """
+    from tastypie import fields
+    from tastypie.api import Api
+    from tastypie.resources import Resource, ALL, ALL_WITH_RELATIONS
+
+    module = sys.modules[RESOURCES_MODULE]
+    api = Api(api_name='bench%d' % size)
+    for i in range(size):
+        name = 'r%d_%d' % (size, i)
+        attrs = {
+            '__module__': RESOURCES_MODULE,
+            '__doc__': 'Synthetic resource %d of %d' % (i, size),
+            'id': fields.IntegerField(attribute='id', help_text='Primary key'),
+            'parent': fields.ToOneField('self', 'parent', null=True, help_text='Self reference'),
+        }
+        filtering = {'id': ALL, 'parent': ALL_WITH_RELATIONS}
+        for j in range(field_count):
+            attrs['field%d' % j] = fields.CharField(attribute='field%d' % j, help_text='Field %d of %s' % (j, name))
+            filtering['field%d' % j] = ALL
+        for j in range(1, relation_count + 1):
+            target = 'R%d_%d' % (size, (i + j) % size)
+            attrs['related%d' % j] = fields.ToOneField('%s.%s' % (RESOURCES_MODULE, target), 'related%d' % j, null=True)
+            filtering['related%d' % j] = ALL_WITH_RELATIONS
+
+        extra_actions = []
+        for j in range(action_count):
+            extra_actions.append({
+                'name': 'action%d' % j,
+                'http_method': j % 2 and 'POST' or 'GET',
+                'resource_type': j % 3 and 'view' or 'list',
+                'summary': 'Extra action %d' % j,
+                'fields': {'q%d' % k: {'type': 'string', 'description': 'Parameter %d' % k} for k in range(3)},
+            })
+
+        attrs['Meta'] = type('Meta', (object,), {
+            'resource_name': name,
+            'filtering': filtering,
+            'ordering': ['field%d' % j for j in range(field_count)],
+            'list_allowed_methods': ['get', 'post'],
+            'detail_allowed_methods': ['get', 'put', 'delete'],
+            'extra_actions': extra_actions,
+        })
+        resource_class = type('R%d_%d' % (size, i), (Resource,), attrs)
+        setattr(module, resource_class.__name__, resource_class)
+        api.register(resource_class())
+    return api
+
+
+def install_urls(apis):
+    from django.conf.urls import include, url
+    from django.core.urlresolvers import clear_url_caches
+
+    module = types.ModuleType(URLS_MODULE)
+    module.urlpatterns = []
+    for api in apis:
+        namespace = 'docs_%s' % api.api_name
+        module.urlpatterns.extend([
+            url(r'^api/', include(api.urls)),
+            url(r'^docs/%s/' % api.api_name, include('tastypie_swagger.urls', namespace=namespace),
+                kwargs={'tastypie_api_module': api, 'namespace': namespace, 'version': '1'}),
+        ])
+    sys.modules[URLS_MODULE] = module
+    clear_url_caches()
+
+
+def measure(func):
+    """
+    Run func, returning (seconds, peak traced bytes or None, payload bytes)
+    """
+    if tracemalloc is not None:
+        tracemalloc.start()
+    started = time.time()
+    payload = func()
+    seconds = time.time() - started
+    peak = None
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak, payload
+
+
+def run_scenario(api, client):
+    from django.test.utils import override_settings
+    from tastypie_swagger.cache import invalidate_schema_cache
+    from tastypie_swagger.mapping import ResourceSwaggerMapping
+
+    names = sorted(api._registry.keys())
+    prefix = '/docs/%s/' % api.api_name
+
+    def mapping():
+        size = 0
+        for name in names:
+            mapping = ResourceSwaggerMapping(api._registry[name])
+            size += len(json.dumps([mapping.build_apis(), mapping.build_models()]))
+        return size
+
+    def schema_view():
+        size = 0
+        for name in names:
+            response = client.get('%sschema/%s' % (prefix, name))
+            assert response.status_code == 200, response.status_code
+            size += len(response.content)
+        return size
+
+    def resources_view():
+        return len(client.get('%sresources/' % prefix).content)
+
+    def aggregate_view():
+        return len(client.get('%saggregate/' % prefix).content)
+
+    results = [
+        ('mapping', measure(mapping)),
+        ('schema_view', measure(schema_view)),
+        ('resources_view', measure(resources_view)),
+        ('aggregate_view', measure(aggregate_view)),
+    ]
+    with override_settings(TASTYPIE_SWAGGER_CACHE=True):
+        invalidate_schema_cache()
+        results.append(('schema_view_cache_fill', measure(schema_view)))
+        results.append(('schema_view_cached', measure(schema_view)))
+        results.append(('aggregate_view_cache_fill', measure(aggregate_view)))
+        results.append(('aggregate_view_cached', measure(aggregate_view)))
+        invalidate_schema_cache()
+    return results
+
+
+def parse_depth(value):
+    return None if value.strip().lower() == 'none' else int(value)
+
+
+def format_depth(depth):
+    return 'none' if depth is None else str(depth)
+
+
+def compare(previous, current):
+    """
+    Print the change of each measurement from a previous run
+    """
+    def key(result):
+        return result['resources'], result.get('filter_depth'), result['benchmark']
+
+    before = dict((key(r), r) for r in previous['results'])
+    print('%-10s %-6s %-24s %12s %12s %10s %14s' % (
+        'resources', 'depth', 'benchmark', 'before (s)', 'after (s)', 'ratio', 'payload delta'))
+    for result in current['results']:
+        old = before.get(key(result))
+        if old is None:
+            continue
+        ratio = old['seconds'] and result['seconds'] / old['seconds'] or 0
+        print('%-10s %-6s %-24s %12.3f %12.3f %9.2fx %14d' % (
+            result['resources'], format_depth(result.get('filter_depth')), result['benchmark'],
+            old['seconds'], result['seconds'], ratio, result['payload_bytes'] - old['payload_bytes']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='10,100,1000', help='Comma separated numbers of resources')
+    parser.add_argument('--fields', type=int, default=5, help='Filterable fields per resource')
+    parser.add_argument('--relations', type=int, default=1, help='ALL_WITH_RELATIONS fields per resource, besides the self reference')
+    parser.add_argument('--actions', type=int, default=5, help='extra_actions per resource')
+    parser.add_argument('--filter-depths',
+                        help="Comma separated TASTYPIE_SWAGGER_FILTER_DEPTH values, 'none' for no limit, "
+                             "defaults to the default depth and none")
+    parser.add_argument('--max-unbounded-size', type=int, default=100,
+                        help='Largest number of resources measured with no filter depth limit')
+    parser.add_argument('--output', help='Write the results as JSON to this file')
+    parser.add_argument('--compare', help='Results of a previous run to compare with')
+    args = parser.parse_args()
+
+    sys.modules[RESOURCES_MODULE] = types.ModuleType(RESOURCES_MODULE)
+    configure()
+
+    from django.test import Client
+    from django.test.utils import override_settings
+    from tastypie_swagger.mapping import DEFAULT_FILTER_DEPTH
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    depths = [parse_depth(depth) for depth in (args.filter_depths or '%d,none' % DEFAULT_FILTER_DEPTH).split(',')]
+    apis = [build_api(size, args.fields, args.relations, args.actions) for size in sizes]
+    install_urls(apis)
+    client = Client()
+
+    report = {
+        'python': platform.python_version(),
+        'parameters': {
+            'fields': args.fields,
+            'relations': args.relations,
+            'actions': args.actions,
+            'filter_depths': depths,
+        },
+        'results': [],
+    }
+    for size, api in zip(sizes, apis):
+        for depth in depths:
+            if depth is None and size > args.max_unbounded_size:
+                sys.stderr.write('%6d skipped with no filter depth limit, see --max-unbounded-size\n' % size)
+                continue
+            with override_settings(TASTYPIE_SWAGGER_FILTER_DEPTH=depth):
+                results = run_scenario(api, client)
+            for benchmark, (seconds, peak, payload) in results:
+                report['results'].append({
+                    'resources': size,
+                    'filter_depth': depth,
+                    'benchmark': benchmark,
+                    'seconds': seconds,
+                    'peak_bytes': peak,
+                    'payload_bytes': payload,
+                })
+                sys.stderr.write('%6d %-6s %-24s %10.3fs %12s bytes peak %12d bytes payload\n' % (
+                    size, format_depth(depth), benchmark, seconds, peak if peak is not None else '-', payload))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
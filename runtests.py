@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Run the test suite
+
+Usage::
+
+    python runtests.py [test label ...]
+
+Requires Django and django-tastypie to be installed.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from django.conf import settings
+
+
+def main():
+    settings.configure(
+        DEBUG=False,
+        SECRET_KEY='tests',
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'tastypie',
+            'tastypie_swagger',
+        ],
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'default'},
+            'swagger': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'swagger'},
+        },
+        ROOT_URLCONF='tests.urls',
+        MIDDLEWARE_CLASSES=[],
+    )
+    import django
+    if hasattr(django, 'setup'):
+        django.setup()
+
+    from django.test.utils import get_runner
+
+    runner = get_runner(settings)()
+    failures = runner.run_tests(sys.argv[1:] or ['tests'])
+    sys.exit(bool(failures))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Build the minified, content hashed swagger-ui bundles
+
+Concatenates and minifies tastypie_swagger.assets.JS_SOURCES and CSS_SOURCES
+into tastypie_swagger/js/swagger-ui.bundle.<hash>.js and
+tastypie_swagger/css/swagger-ui.bundle.<hash>.css (next to the sources, so
+relative URLs in the stylesheets still resolve), removes previous bundles
+and records the new names in the manifest read by SwaggerView.
+
+Run it after changing any of the sources and commit its output::
+
+    python scripts/build_assets.py
+
+Requires the rjsmin and rcssmin packages.
+"""
+import glob
+import hashlib
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:
+    sys.exit('build_assets.py requires the rjsmin and rcssmin packages')
+
+from tastypie_swagger.assets import CSS_SOURCES, JS_SOURCES, MANIFEST, STATIC_ROOT
+
+
+def read(path):
+    with open(os.path.join(STATIC_ROOT, path), 'rb') as f:
+        return f.read().decode('utf-8')
+
+
+def write_bundle(directory, extension, content):
+    """
+    Write content to a bundle named after its hash, returning its static path
+    """
+    data = content.encode('utf-8')
+    name = 'swagger-ui.bundle.%s.%s' % (hashlib.sha1(data).hexdigest()[:12], extension)
+    for previous in glob.glob(os.path.join(STATIC_ROOT, directory, 'swagger-ui.bundle.*.%s' % extension)):
+        os.remove(previous)
+    with open(os.path.join(STATIC_ROOT, directory, name), 'wb') as f:
+        f.write(data)
+    sys.stderr.write('%s/%s: %d bytes\n' % (directory, name, len(data)))
+    return '%s/%s' % (directory, name)
+
+
+def main():
+    # Files end with a statement separator so they cannot run into each other
+    js = ';\n'.join(rjsmin.jsmin(read(path), keep_bang_comments=True) for path in JS_SOURCES)
+    css = '\n'.join(rcssmin.cssmin(read(path), keep_bang_comments=True) for path in CSS_SOURCES)
+
+    manifest = {
+        'js': write_bundle('tastypie_swagger/js', 'js', js),
+        'css': write_bundle('tastypie_swagger/css', 'css', css),
+    }
+    with open(os.path.join(STATIC_ROOT, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=2, separators=(',', ': '), sort_keys=True)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -26,7 +26,7 @@ setup(
     url='https://github.com/concentricsky/django-tastypie-swagger',
     download_url='https://github.com/concentricsky/django-tastypie-swagger/downloads',
     license='BSD',
-    packages=['tastypie_swagger'],
+    packages=['tastypie_swagger', 'tastypie_swagger.management', 'tastypie_swagger.management.commands'],
     include_package_data=True,
     zip_safe=False,
 )
@@ -1 +1,3 @@
 VERSION = (0, 1, 4)
+
+default_app_config = 'tastypie_swagger.apps.TastypieSwaggerConfig'
@@ -0,0 +1,54 @@
+import logging
+import threading
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started
+from django.core.urlresolvers import get_script_prefix
+
+logger = logging.getLogger(__name__)
+
+
+class TastypieSwaggerConfig(AppConfig):
+    name = 'tastypie_swagger'
+    verbose_name = "Tastypie Swagger"
+
+    _warmup_lock = threading.Lock()
+    _warmup_started = False
+
+    def ready(self):
+        if not getattr(settings, 'TASTYPIE_SWAGGER_WARMUP', False):
+            return
+
+        # Wait for the first request, so management commands do not build
+        # the documents and the URLconf is not imported from ready()
+        request_started.connect(self.start_warm_up, dispatch_uid='tastypie_swagger_warmup')
+
+    def start_warm_up(self, **kwargs):
+        """
+        Run the warm-up on the first request, with the script prefix it is served under
+        """
+        with self._warmup_lock:
+            if self._warmup_started:
+                return
+            self._warmup_started = True
+        request_started.disconnect(dispatch_uid='tastypie_swagger_warmup')
+
+        script_prefix = get_script_prefix()
+        if getattr(settings, 'TASTYPIE_SWAGGER_WARMUP', False) == 'background':
+            # Forking a process pool from this thread, while the server
+            # starts its own, can deadlock the children
+            thread = threading.Thread(target=self.warm_up, args=(script_prefix, 1), name='tastypie-swagger-warmup')
+            thread.daemon = True
+            thread.start()
+        else:
+            self.warm_up(script_prefix)
+
+    def warm_up(self, script_prefix, workers=None):
+        from .warmup import warm_up
+
+        # A broken resource must not keep the site from serving
+        try:
+            warm_up(workers=workers, script_prefix=script_prefix)
+        except Exception:
+            logger.exception('Swagger warm-up failed')
@@ -0,0 +1,52 @@
+import json
+import os
+
+from django.conf import settings
+
+STATIC_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+# Sources of the swagger-ui page, relative to STATIC_ROOT, in load order.
+# The templates of swagger-ui.js are precompiled, so only the Handlebars
+# runtime is needed.
+JS_SOURCES = [
+    'tastypie_swagger/js/lib/shred.bundle.js',
+    'tastypie_swagger/js/lib/jquery-1.8.0.min.js',
+    'tastypie_swagger/js/lib/jquery.slideto.min.js',
+    'tastypie_swagger/js/lib/jquery.wiggle.min.js',
+    'tastypie_swagger/js/lib/jquery.ba-bbq.min.js',
+    'tastypie_swagger/js/lib/handlebars.runtime-1.0.0.js',
+    'tastypie_swagger/js/lib/underscore-min.js',
+    'tastypie_swagger/js/lib/backbone-min.js',
+    'tastypie_swagger/js/lib/swagger.js',
+    'tastypie_swagger/js/swagger-ui.js',
+    'tastypie_swagger/js/lib/highlight.7.3.pack.js',
+]
+CSS_SOURCES = [
+    'tastypie_swagger/css/droid-sans.css',
+    'tastypie_swagger/css/highlight.default.css',
+    'tastypie_swagger/css/screen.css',
+]
+
+# Written by scripts/build_assets.py, maps 'js' and 'css' to
+# the content hashed bundles
+MANIFEST = 'tastypie_swagger/bundles.json'
+
+_bundles = {}
+
+
+def get_bundles():
+    """
+    Return the static paths of the prebuilt bundles as a dict with 'js' and
+    'css' keys, or None if TASTYPIE_SWAGGER_BUNDLE is False or they were not built
+
+    Bundle file names contain a hash of their content, so they can be cached forever.
+    """
+    if not getattr(settings, 'TASTYPIE_SWAGGER_BUNDLE', True):
+        return None
+    if 'manifest' not in _bundles:
+        try:
+            with open(os.path.join(STATIC_ROOT, MANIFEST)) as f:
+                _bundles['manifest'] = json.load(f)
+        except (IOError, ValueError):
+            _bundles['manifest'] = None
+    return _bundles['manifest']
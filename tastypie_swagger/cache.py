@@ -0,0 +1,432 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+try:
+    from django.utils.encoding import force_text
+except ImportError:
+    from django.utils.encoding import force_unicode as force_text
+
+try:
+    from django.core.cache import caches
+except ImportError:
+    # Django < 1.7
+    from django.core.cache import get_cache
+else:
+    def get_cache(alias):
+        return caches[alias]
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from .fingerprint import api_fingerprint, clear_fingerprints, resource_fingerprint
+from .mapping import clear_shared_artifacts
+from .registry import clear_api_states
+from .utils import gzip_compress
+
+# Content codings in order of preference
+ENCODINGS = ('br', 'gzip')
+# Documents smaller than this are not worth compressing
+MIN_COMPRESS_LENGTH = 200
+# Rebased documents kept by the process, see SchemaDocument.rebase
+MAX_REBASED = 32
+
+_rebase_lock = threading.Lock()
+# Rebased documents by (etag, old, new), least recently used first
+_rebased = OrderedDict()
+
+
+class SchemaDocument(object):
+    """
+    A serialized swagger document along with its HTTP validators
+    """
+
+    def __init__(self, content, built=None):
+        self.content = content
+        self.etag = '"%s"' % hashlib.sha1(content.encode('utf-8')).hexdigest()
+        self.built = built if built is not None else time.time()
+        self.encodings = {}
+
+    def compress(self):
+        """
+        Store gzip and, when the brotli package is installed, brotli encoded
+        variants of the content
+        """
+        data = self.content.encode('utf-8')
+        if len(data) >= MIN_COMPRESS_LENGTH:
+            self.encodings['gzip'] = gzip_compress(data)
+            if brotli is not None:
+                self.encodings['br'] = brotli.compress(data)
+        return self
+
+    def rebase(self, old, new):
+        """
+        Return a document whose content has the first occurrence of old
+        replaced by new, compressed like this one
+
+        Used to fill in the absolute url of each request. The process keeps
+        the MAX_REBASED most recently used documents, keyed by the ETag of
+        this one, so they are built once per host even when this one is
+        unpickled from a Django cache on every request.
+        """
+        key = (self.etag, old, new)
+        with _rebase_lock:
+            document = _rebased.pop(key, None)
+            if document is not None:
+                _rebased[key] = document
+                return document
+
+        document = SchemaDocument(self.content.replace(old, new, 1), built=self.built)
+        if self.encodings:
+            document.compress()
+        with _rebase_lock:
+            document = _rebased.setdefault(key, document)
+            while len(_rebased) > MAX_REBASED:
+                _rebased.popitem(last=False)
+        return document
+
+    @property
+    def version(self):
+        """
+        Short hash of the content, used in content addressed urls
+        """
+        return self.etag[1:13]
+
+    def get_etag(self, encoding=None):
+        """
+        Return the ETag of the content, or of one of its encoded variants
+        """
+        if encoding is None:
+            return self.etag
+        return '%s-%s"' % (self.etag[:-1], encoding)
+
+
+def cache_enabled():
+    """
+    Return whether generated swagger documents should be cached, based on
+    the TASTYPIE_SWAGGER_CACHE setting
+    """
+    return getattr(settings, 'TASTYPIE_SWAGGER_CACHE', True)
+
+
+def compression_enabled():
+    """
+    Return whether cached documents should keep pre-compressed variants, based
+    on the TASTYPIE_SWAGGER_COMPRESS setting
+    """
+    return getattr(settings, 'TASTYPIE_SWAGGER_COMPRESS', True)
+
+
+def hashed_urls_enabled():
+    """
+    Return whether the resource listing should point to content hashed
+    declaration urls, based on the TASTYPIE_SWAGGER_HASHED_URLS setting
+    """
+    return getattr(settings, 'TASTYPIE_SWAGGER_HASHED_URLS', False)
+
+
+class _Flight(object):
+    """
+    A build in progress, whose outcome is shared with the callers waiting for it
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces concurrent builds of the same key within a process
+
+    The first caller asking for a key runs the builder, callers arriving
+    before it returns wait for it and get the same value, or a copy of the
+    same exception: raising the shared instance in each of them would chain
+    their tracebacks onto it on Python 3. Waiters giving up after timeout
+    seconds run the builder themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+
+    def do(self, key, builder, timeout=None):
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            if flight.done.wait(timeout):
+                if flight.error is not None:
+                    raise _copy_error(flight.error)
+                if flight.value is not None:
+                    return flight.value
+            return builder()
+
+        try:
+            flight.value = builder()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.value
+
+
+def _copy_error(error):
+    """
+    Return a shallow copy of an exception, or the exception itself if it
+    cannot be copied
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return error
+
+
+def wait_timeout():
+    """
+    Return how long to wait for a document being built by someone else, based
+    on the TASTYPIE_SWAGGER_CACHE_WAIT setting
+    """
+    return getattr(settings, 'TASTYPIE_SWAGGER_CACHE_WAIT', 10)
+
+
+class SchemaCache(object):
+    """
+    Process-wide store of serialized swagger documents
+
+    Keys are tuples of (tastypie.api.Api instance, resource name, ...), the
+    remaining items being whatever else the document depends on (namespace,
+    version, script prefix). Values are the final JSON strings, so a cache hit
+    costs neither a ResourceSwaggerMapping nor a json.dumps. Threads missing
+    the same key at once share a single build.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._flights = SingleFlight()
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+
+    def get_or_build(self, key, builder):
+        """
+        Return the cached value for key, calling builder() to create it if missing
+
+        Concurrent callers missing the same key wait for the first one's
+        build, up to TASTYPIE_SWAGGER_CACHE_WAIT seconds, and share its
+        result or exception.
+        """
+        value = self.get(key)
+        if value is None:
+            value = self._flights.do(key, lambda: self._build(key, builder), wait_timeout())
+        return value
+
+    def _build(self, key, builder):
+        # The previous build may have completed since the caller's lookup
+        value = self.get(key)
+        if value is None:
+            value = builder()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, api=None, resource_name=None):
+        """
+        Drop cached documents, optionally only those of one api and/or resource
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if api is not None and key[0] is not api:
+                    continue
+                # Documents spanning every resource (key[1] is None) are
+                # dropped along with any single resource.
+                if resource_name is not None and key[1] not in (resource_name, None):
+                    continue
+                del self._entries[key]
+
+    def clear(self):
+        self.invalidate()
+
+
+class DjangoSchemaCache(object):
+    """
+    Store of serialized swagger documents shared by all workers through a
+    Django cache alias
+
+    Entries are keyed by the fingerprint of the resources they document, so
+    a deploy (or a development server reload, which restarts the process)
+    that changes a resource never serves its documents from before the
+    change, while the declarations of the other resources are kept.
+
+    When an entry is missing a single worker takes a lease and builds it;
+    the others serve the last value written for that document if there is
+    one, or wait for the builder, falling back to building themselves if it
+    takes longer than TASTYPIE_SWAGGER_CACHE_WAIT seconds. Within a worker,
+    threads missing the same entry share a single lookup and build.
+    """
+    key_prefix = 'tastypie_swagger'
+    poll_interval = 0.05
+
+    def __init__(self, alias):
+        self.alias = alias
+        self._flights = SingleFlight()
+
+    @property
+    def cache(self):
+        return get_cache(self.alias)
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'TASTYPIE_SWAGGER_CACHE_TIMEOUT', None)
+
+    @property
+    def lock_timeout(self):
+        return getattr(settings, 'TASTYPIE_SWAGGER_CACHE_LOCK_TIMEOUT', 60)
+
+    @property
+    def wait_timeout(self):
+        return wait_timeout()
+
+    def _set(self, key, value):
+        if self.timeout is None:
+            self.cache.set(key, value)
+        else:
+            self.cache.set(key, value, self.timeout)
+
+    def get_fingerprint(self, key):
+        """
+        Return the fingerprint of what the document stored under key depends on
+
+        Declarations depend on their resource only, so a change to one
+        resource leaves the other declarations in the cache.
+        """
+        api, resource_name = key[0], key[1]
+        if resource_name is not None and resource_name in api._registry:
+            return resource_fingerprint(api._registry[resource_name])
+        return api_fingerprint(api)
+
+    def make_key(self, key, kind):
+        """
+        Turn a (api, resource name, ...) key into a cache key safe for any backend
+        """
+        api = key[0]
+        ident = ':'.join(force_text(part) for part in (api.api_name,) + tuple(key[1:]))
+        if kind == 'data':
+            generation = self.cache.get('%s:generation' % self.key_prefix, 0)
+            ident = '%s:%s:%s' % (self.get_fingerprint(key), generation, ident)
+        return '%s:%s:%s' % (self.key_prefix, kind, hashlib.md5(ident.encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        return self.cache.get(self.make_key(key, 'data'))
+
+    def set(self, key, value):
+        self._set(self.make_key(key, 'data'), value)
+        self._set(self.make_key(key, 'stale'), value)
+
+    def get_or_build(self, key, builder):
+        """
+        Return the cached value for key, making sure only one worker calls builder() for it
+        """
+        data_key = self.make_key(key, 'data')
+        value = self.cache.get(data_key)
+        if value is not None:
+            return value
+        return self._flights.do(data_key, lambda: self._lease_or_wait(key, data_key, builder), self.wait_timeout)
+
+    def _lease_or_wait(self, key, data_key, builder):
+        lock_key = self.make_key(key, 'lock')
+        if self.cache.add(lock_key, 1, self.lock_timeout):
+            try:
+                value = builder()
+                self.set(key, value)
+            finally:
+                self.cache.delete(lock_key)
+            return value
+
+        # Someone else is building it; serve the previous document meanwhile
+        value = self.cache.get(self.make_key(key, 'stale'))
+        if value is not None:
+            return value
+
+        deadline = time.time() + self.wait_timeout
+        while time.time() < deadline:
+            time.sleep(self.poll_interval)
+            value = self.cache.get(data_key)
+            if value is not None:
+                return value
+
+        value = builder()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, api=None, resource_name=None):
+        """
+        Drop cached documents
+
+        Shared entries cannot be enumerated, so this always invalidates every
+        document stored in the alias.
+        """
+        generation_key = '%s:generation' % self.key_prefix
+        if not self.cache.add(generation_key, 1):
+            try:
+                self.cache.incr(generation_key)
+            except ValueError:
+                self.cache.set(generation_key, 1)
+
+    def clear(self):
+        self.invalidate()
+
+
+schema_cache = SchemaCache()
+
+_shared_caches = {}
+
+
+def get_schema_cache():
+    """
+    Return the cache configured through TASTYPIE_SWAGGER_CACHE_ALIAS, or the
+    process-wide one if it is not set
+    """
+    alias = getattr(settings, 'TASTYPIE_SWAGGER_CACHE_ALIAS', None)
+    if not alias:
+        return schema_cache
+    if alias not in _shared_caches:
+        _shared_caches[alias] = DjangoSchemaCache(alias)
+    return _shared_caches[alias]
+
+
+def invalidate_schema_cache(api=None, resource_name=None):
+    """
+    Invalidation hook for code that changes resources at runtime
+
+    With no arguments every cached document is dropped, along with what the
+    views precomputed from the Apis. The parts of declarations shared between
+    Apis and the fingerprints of resources are always dropped.
+    """
+    clear_api_states(api)
+    clear_shared_artifacts()
+    clear_fingerprints()
+    with _rebase_lock:
+        _rebased.clear()
+    schema_cache.invalidate(api=api, resource_name=resource_name)
+    shared_cache = get_schema_cache()
+    if shared_cache is not schema_cache:
+        shared_cache.invalidate(api=api, resource_name=resource_name)
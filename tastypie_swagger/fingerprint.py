@@ -0,0 +1,173 @@
+import hashlib
+import json
+import threading
+
+from django.conf import settings
+
+try:
+    from django.utils.encoding import force_text
+except ImportError:
+    from django.utils.encoding import force_unicode as force_text
+
+import tastypie_swagger
+
+from .mapping import ALL_WITH_RELATIONS, get_filter_depth
+
+_lock = threading.Lock()
+# Digests of a resource on its own, keyed by (resource class, api name)
+_resource_digests = {}
+_fingerprints = {}
+_api_fingerprints = {}
+
+
+def clear_fingerprints():
+    """
+    Drop the memoized fingerprints, after resources or settings change at runtime
+    """
+    with _lock:
+        _resource_digests.clear()
+        _fingerprints.clear()
+        _api_fingerprints.clear()
+
+
+def _dumps(obj):
+    return json.dumps(obj, sort_keys=True, default=force_text)
+
+
+def settings_fingerprint():
+    """
+    Return a digest of this package's version and the settings shaping the documents
+    """
+    return hashlib.sha1(_dumps([
+        '.'.join(map(str, tastypie_swagger.VERSION)),
+        getattr(settings, 'TASTYPIE_SWAGGER_CACHE_VERSION', ''),
+        get_filter_depth(),
+        getattr(settings, 'TASTYPIE_SWAGGER_COMPACT_FILTERS', False),
+    ]).encode('utf-8')).hexdigest()
+
+
+def _callable_name(func):
+    """
+    Return the qualified name of a callable, e.g. 'datetime.datetime.now'
+    """
+    owner = getattr(func, '__self__', None)
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or type(func).__name__
+    if owner is not None and '.' not in name:
+        name = '%s.%s' % (getattr(owner, '__name__', type(owner).__name__), name)
+    module = getattr(func, '__module__', None) or getattr(owner, '__module__', None)
+    return module and '%s.%s' % (module, name) or name
+
+
+def _stable_schema(resource):
+    """
+    Return the build_schema() output of a resource, with callable field
+    defaults represented by their qualified name
+
+    build_schema() calls them, so defaults such as datetime.now or uuid4
+    would otherwise give a different digest on every call.
+    """
+    schema = resource.build_schema()
+    schema_fields = {}
+    for name, field in schema.get('fields', {}).items():
+        default = getattr(resource.fields.get(name), '_default', None)
+        if callable(default):
+            field = dict(field, default=_callable_name(default))
+        schema_fields[name] = field
+    return dict(schema, fields=schema_fields)
+
+
+def _resource_key(resource):
+    return (resource.__class__, getattr(resource._meta, 'api_name', None))
+
+
+def _resource_digest(resource):
+    """
+    Return a digest of what the declaration of a resource depends on, besides its relations
+    """
+    key = _resource_key(resource)
+    with _lock:
+        digest = _resource_digests.get(key)
+    if digest is not None:
+        return digest
+
+    meta = resource._meta
+    digest = hashlib.sha1(_dumps([
+        '%s.%s' % (resource.__class__.__module__, resource.__class__.__name__),
+        meta.resource_name,
+        getattr(meta, 'api_name', None),
+        resource.__doc__,
+        _stable_schema(resource),
+        getattr(meta, 'extra_actions', None),
+        getattr(getattr(resource, 'Meta', None), 'custom_filtering', None),
+    ]).encode('utf-8')).hexdigest()
+
+    with _lock:
+        _resource_digests[key] = digest
+    return digest
+
+
+def _related_resources(resource):
+    """
+    Yield the resources whose filters are documented along with this resource's
+    """
+    filtering = getattr(resource._meta, 'filtering', {}) or {}
+    for name in sorted(filtering):
+        field = resource.fields.get(name)
+        if filtering[name] == ALL_WITH_RELATIONS and hasattr(field, 'get_related_resource'):
+            yield field.get_related_resource(None)
+
+
+def resource_fingerprint(resource):
+    """
+    Return a digest of everything the API declaration of a tastypie resource depends on
+
+    Covers its build_schema() output, extra_actions, custom_filtering and
+    docstring, those of the resources reached through ALL_WITH_RELATIONS
+    filters (transitively), and settings_fingerprint(). It is computed once
+    per resource, until clear_fingerprints() is called.
+    """
+    key = _resource_key(resource)
+    with _lock:
+        fingerprint = _fingerprints.get(key)
+    if fingerprint is not None:
+        return fingerprint
+
+    digests = {}
+    pending = [resource]
+    while pending:
+        current = pending.pop()
+        current_key = _resource_key(current)
+        if current_key in digests:
+            continue
+        digests[current_key] = _resource_digest(current)
+        pending.extend(_related_resources(current))
+
+    fingerprint = hashlib.sha1(_dumps([
+        settings_fingerprint(),
+        digests[key],
+        sorted(digests.values()),
+    ]).encode('utf-8')).hexdigest()
+
+    with _lock:
+        _fingerprints[key] = fingerprint
+    return fingerprint
+
+
+def api_fingerprint(api):
+    """
+    Return a digest of everything the documents of a tastypie.api.Api depend on
+
+    That is the fingerprints of its resources, see resource_fingerprint.
+    """
+    with _lock:
+        fingerprint = _api_fingerprints.get(api)
+    if fingerprint is not None:
+        return fingerprint
+
+    fingerprint = hashlib.sha1(_dumps([
+        (name, resource_fingerprint(api._registry[name])) for name in sorted(api._registry.keys())
+    ]).encode('utf-8')).hexdigest()
+
+    with _lock:
+        _api_fingerprints[api] = fingerprint
+    return fingerprint
@@ -0,0 +1,52 @@
+from optparse import make_option
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from tastypie_swagger.registry import resolve_api
+from tastypie_swagger.spec import export_spec
+
+
+class Command(BaseCommand):
+    help = "Export the swagger documentation of a tastypie.api.Api to static files"
+    args = '<tastypie_api_module> <output_dir>'
+
+    option_list = BaseCommand.option_list + (
+        make_option('--base-url', dest='base_url',
+            help='URL the output directory is served from, e.g. /static/api-docs/ (required)'),
+        make_option('--api-base-path', dest='api_base_path', default='/',
+            help='URL API calls are made against, if the API is not on the same host as the docs'),
+        make_option('--api-version', dest='api_version', default='Unknown',
+            help='Version reported in the documents'),
+        make_option('--aggregate', action='store_true', dest='aggregate', default=False,
+            help='Also write aggregate.json, the listing with every declaration'),
+        make_option('--workers', type='int', dest='workers', default=None,
+            help='Number of processes building declarations, defaults to TASTYPIE_SWAGGER_BUILD_WORKERS or 1'),
+        make_option('--force', action='store_true', dest='force', default=False,
+            help='Rebuild every declaration, including those unchanged since the last export'),
+    )
+
+    def handle(self, *args, **options):
+        if len(args) != 2:
+            raise CommandError("Usage: manage.py export_tastypie_swagger %s" % self.args)
+        if not options.get('base_url'):
+            raise CommandError("--base-url is required")
+
+        tastypie_api_module, output_dir = args
+        try:
+            tastypie_api = resolve_api(tastypie_api_module)
+        except ImproperlyConfigured as e:
+            raise CommandError(str(e))
+
+        paths = export_spec(
+            tastypie_api,
+            output_dir,
+            base_url=options['base_url'],
+            version=options['api_version'],
+            aggregate=options['aggregate'],
+            api_base_path=options['api_base_path'],
+            workers=options['workers'] or getattr(settings, 'TASTYPIE_SWAGGER_BUILD_WORKERS', 1),
+            force=options['force'],
+        )
+        self.stdout.write("Wrote %d files to %s\n" % (len(paths), output_dir))
@@ -0,0 +1,25 @@
+from optparse import make_option
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tastypie_swagger.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = "Build the swagger documents of every mount of tastypie_swagger.urls into the schema cache"
+
+    option_list = BaseCommand.option_list + (
+        make_option('--workers', type='int', dest='workers', default=None,
+            help='Number of processes building declarations, defaults to TASTYPIE_SWAGGER_BUILD_WORKERS or 1'),
+        make_option('--script-name', dest='script_name', default=None,
+            help='Script prefix the site is served under, defaults to TASTYPIE_SWAGGER_WARMUP_SCRIPT_NAME, '
+                 'FORCE_SCRIPT_NAME or /'),
+    )
+
+    def handle(self, *args, **options):
+        timings = warm_up(
+            workers=options['workers'] or getattr(settings, 'TASTYPIE_SWAGGER_BUILD_WORKERS', 1),
+            script_prefix=options['script_name'],
+        )
+        self.stdout.write("Built %d declarations\n" % len(timings))
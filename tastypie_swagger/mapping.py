@@ -1,6 +1,8 @@
-import datetime
 import logging
+import threading
 
+from django.conf import settings
+from django.core.urlresolvers import NoReverseMatch
 from django.db.models.sql.constants import QUERY_TERMS
 
 try:
@@ -9,9 +11,9 @@ except ImportError:
     from django.utils.encoding import force_text as force_text
 
 
-from tastypie import fields
-
-from .utils import trailing_slash_or_none, urljoin_forced
+from .registry import get_api_state
+from .timing import PhaseTimer
+from .utils import freeze, trailing_slash_or_none, urljoin_forced
 
 logger = logging.getLogger(__name__)
 # Ignored POST fields
@@ -23,6 +25,42 @@ ALL = 1
 # Enable all ORM filters, including across relationships
 ALL_WITH_RELATIONS = 2
 
+# How many relations deep ALL_WITH_RELATIONS filters are documented by default
+DEFAULT_FILTER_DEPTH = 3
+
+_lock = threading.Lock()
+# Parts of declarations that do not depend on the Api a resource is
+# registered with, see ResourceSwaggerMapping.get_shared_artifact
+_shared_artifacts = {}
+
+
+def get_filter_depth():
+    """
+    Return how many relations deep ALL_WITH_RELATIONS filters are documented,
+    based on the TASTYPIE_SWAGGER_FILTER_DEPTH setting, None meaning no limit
+    """
+    return getattr(settings, 'TASTYPIE_SWAGGER_FILTER_DEPTH', DEFAULT_FILTER_DEPTH)
+
+
+def clear_shared_artifacts():
+    """
+    Drop the artifacts shared between the Apis a resource class is registered with
+    """
+    with _lock:
+        _shared_artifacts.clear()
+
+
+def prefix_parameters(prefix, parameters):
+    """
+    Return copies of filter parameters with prefix prepended to their names
+    """
+    prefixed = []
+    for parameter in parameters:
+        parameter = dict(parameter)
+        parameter['name'] = "%s%s" % (prefix, parameter['name'])
+        prefixed.append(parameter)
+    return prefixed
+
 
 class ResourceSwaggerMapping(object):
     """
@@ -30,6 +68,11 @@ class ResourceSwaggerMapping(object):
 
     Tries to use tastypie.resources.Resource.build_schema
 
+    The schema and resource are only read. build_apis() and build_models()
+    return frozen structures (see utils.freeze), which may be shared between
+    threads and documents as they are. The models and filters are shared
+    between the Apis a resource class is registered with.
+
     http://django-tastypie.readthedocs.org/en/latest/resources.html
     https://github.com/wordnik/swagger-core/wiki/API-Declaration
     """
@@ -44,11 +87,57 @@ class ResourceSwaggerMapping(object):
         'delete-detail': "Delete an existing %s",
     }
 
-    def __init__(self, resource):
+    # Meta model of list views, see build_list_meta_model
+    _list_meta_model = None
+
+    def __init__(self, resource, related_mappings=None, timer=None, api=None):
         self.resource = resource
+        # The tastypie.api.Api the resource is documented for, if known
+        self.api = api
         self.resource_name = self.resource._meta.resource_name
         self.resource_pk_type = self.get_pk_type()
-        self.schema = self.resource.build_schema()
+        self.timer = timer if timer is not None else PhaseTimer()
+        with self.timer.phase('build_schema'):
+            self.schema = self.resource.build_schema()
+
+        # Mappings of resources reached through ALL_WITH_RELATIONS filters,
+        # keyed by resource class and shared by every mapping of one build.
+        if related_mappings is None:
+            related_mappings = {}
+        related_mappings.setdefault(self.resource.__class__, self)
+        self.related_mappings = related_mappings
+        self._filter_definitions = None
+        self._base_uri = None
+
+    def get_shared_artifact(self, name, builder):
+        """
+        Return a part of the declaration that does not depend on the Api the
+        resource is registered with, calling builder() once per resource
+        class to create it
+
+        The same resource classes are often registered with several Apis,
+        such as successive versions, whose declarations then share these
+        parts. They are only shared when the schema cache is enabled, and
+        are dropped along with it by cache.invalidate_schema_cache.
+        """
+        from .cache import cache_enabled
+
+        if not cache_enabled():
+            return builder()
+        key = (
+            self.resource.__class__,
+            self.resource_name,
+            name,
+            get_filter_depth(),
+            getattr(settings, 'TASTYPIE_SWAGGER_COMPACT_FILTERS', False),
+        )
+        with _lock:
+            artifact = _shared_artifacts.get(key)
+        if artifact is None:
+            artifact = builder()
+            with _lock:
+                artifact = _shared_artifacts.setdefault(key, artifact)
+        return artifact
 
     def _get_native_field_type(self, field):
         if not field:
@@ -101,18 +190,51 @@ class ResourceSwaggerMapping(object):
         return ''
 
     def get_resource_base_uri(self):
+        """
+        Return the URL of the list endpoint, see reverse_resource_base_uri
+
+        It is reversed once per mapping and, when the mapping is given its
+        Api, once per Api, resource and script prefix.
+        """
+        if self._base_uri is None:
+            if self.api is not None:
+                self._base_uri = get_api_state(self.api).get_url(
+                    ('resource_base_uri', self.resource_name), self.reverse_resource_base_uri)
+            else:
+                self._base_uri = self.reverse_resource_base_uri()
+        return self._base_uri
+
+    def reverse_resource_base_uri(self):
         """
         Use Resource.get_resource_list_uri (or Resource.get_resource_uri, depending on version of tastypie)
         to get the URL of the list endpoint
 
-        We also use this to build the detail url, which may not be correct
+        We also use this to build the detail url, which may not be correct.
+        When the mapping is given its Api, the url is the one of that Api, or
+        the one tastypie returns if that Api is not routed. Either way, a
+        warning is logged when the resource has no url.
         """
+        if self.api is not None and self.resource._meta.api_name != self.api.api_name:
+            # The resource class was registered with another Api since,
+            # which tastypie records on the class
+            kwargs = self.resource.resource_uri_kwargs()
+            kwargs['api_name'] = self.api.api_name
+            try:
+                return self.resource._build_reverse_url('api_dispatch_list', kwargs=kwargs)
+            except NoReverseMatch:
+                logger.warning(
+                    'The urls of the %s Api are not in the URLconf, documenting %s with those of the %s Api',
+                    self.api.api_name, self.resource_name, self.resource._meta.api_name)
         if hasattr(self.resource, 'get_resource_list_uri'):
-            return self.resource.get_resource_list_uri()
+            uri = self.resource.get_resource_list_uri()
         elif hasattr(self.resource, 'get_resource_uri'):
-            return self.resource.get_resource_uri()
+            uri = self.resource.get_resource_uri()
         else:
             raise AttributeError('Resource %(resource)s has neither get_resource_list_uri nor get_resource_uri' % {'resource': self.resource})
+        if not uri:
+            # tastypie returns an empty url when it cannot reverse it
+            logger.warning('%s is not in the URLconf, its paths are documented relative to the root', self.resource_name)
+        return uri
 
     def build_parameter(self, paramType='body', name='', dataType='', required=True, description='', allowed_values = None):
         parameter = {
@@ -170,6 +292,178 @@ class ResourceSwaggerMapping(object):
             }
         }
 
+    def get_related_mapping(self, name):
+        """
+        Return the mapping of the resource a related field points to
+
+        Mappings are shared by every resource reached while building, so each
+        related resource is mapped (and its schema built) only once.
+        """
+        field = self.resource.fields[name]
+        related_class = field.to_class
+        if related_class not in self.related_mappings:
+            related_resource = field.get_related_resource(None)
+            self.related_mappings[related_class] = ResourceSwaggerMapping(
+                related_resource, related_mappings=self.related_mappings, timer=self.timer)
+        return self.related_mappings[related_class]
+
+    def get_filter_definitions(self):
+        """
+        Return the filters of this resource, without prefix, as a list of
+        (field name, related mapping or None, parameters) tuples
+
+        Computed once per mapping and reused whenever the resource is reached
+        through a relation.
+        """
+        if self._filter_definitions is not None:
+            return self._filter_definitions
+
+        definitions = []
+        for name, field in self.schema.get('filtering', {}).items():
+            related_mapping = None
+            # Integer value means this points to a related model
+            if field in [ALL, ALL_WITH_RELATIONS]:
+                # For fields marked as ALL_WITH_RELATIONS, we must fetch information on their related resources as well.
+                # However, tastypie allows us to mark fields that do not have related resources as ALL_WITH_RELATIONS.
+                # This functions like a white list.
+                # Therefore, we need to check whether a field actually has a related resource.
+                if field == ALL:
+                    has_related_resource = False
+                else:
+                    has_related_resource = hasattr(self.resource.fields[name], 'get_related_resource')
+
+                if not has_related_resource:
+                    #This code has been mostly sucked from the tastypie lib
+                    if getattr(self.resource._meta, 'queryset', None) is not None:
+                        # Get the possible query terms from the current QuerySet.
+                        if hasattr(self.resource._meta.queryset.query.query_terms, 'keys'):
+                            # Django 1.4 & below compatibility.
+                            field = self.resource._meta.queryset.query.query_terms.keys()
+                        else:
+                            # Django 1.5+.
+                            field = self.resource._meta.queryset.query.query_terms
+                    else:
+                        if hasattr(QUERY_TERMS, 'keys'):
+                            # Django 1.4 & below compatibility.
+                            field = QUERY_TERMS.keys()
+                        else:
+                            # Django 1.5+.
+                            field = QUERY_TERMS
+
+                else: # Show all params from related model
+                    # Add a subset of filter only foreign-key compatible on the relation itself.
+                    # We assume foreign keys are only int based.
+                    field = ['gt', 'in', 'gte', 'lt', 'lte', 'exact'] # TODO This could be extended by checking the actual type of the relational field, but afaik it's also an issue on tastypie.
+                    related_mapping = self.get_related_mapping(name)
+
+            parameters = []
+            if isinstance(field, (list, tuple, set)):
+                # Skip if this is an incorrect filter
+                if name not in self.schema['fields']: continue
+
+                schema_field = self.schema['fields'][name]
+
+                dataType = schema_field['type']
+                if dataType == 'related':
+                    dataType = self.get_related_field_type(name)
+
+                if getattr(settings, 'TASTYPIE_SWAGGER_COMPACT_FILTERS', False):
+                    # A single parameter, with the lookups listed once
+                    parameters.append(self.build_parameter(
+                        paramType="query",
+                        name=name,
+                        dataType=dataType,
+                        required = False,
+                        description=self.build_lookups_description(schema_field['help_text'], field),
+                    ))
+                else:
+                    for query in field:
+                        parameters.append(self.build_parameter(
+                            paramType="query",
+                            name=name if query == 'exact' else "%s__%s" % (name, query),
+                            dataType=dataType,
+                            required = False,
+                            description=force_text(schema_field['help_text']),
+                        ))
+
+            definitions.append((name, related_mapping, freeze(parameters)))
+
+        self._filter_definitions = tuple(definitions)
+        return self._filter_definitions
+
+    def build_lookups_description(self, help_text, lookups):
+        """
+        Description of a compact filter parameter: the field's help text
+        followed by the lookups it can be suffixed with
+        """
+        help_text = force_text(help_text)
+        lookups = ', '.join('__%s' % lookup for lookup in sorted(lookups) if lookup != 'exact')
+        if not lookups:
+            return help_text
+        if not help_text:
+            return u'Lookups: %s' % lookups
+        return u'%s (lookups: %s)' % (help_text, lookups)
+
+    def expand_filters(self, prefix="", path=(), max_depth=None):
+        """
+        Build the filter parameters of this resource and, for ALL_WITH_RELATIONS
+        fields, of the related resources
+
+        path holds the resource classes the relations followed so far go
+        through. With max_depth, relations are followed that many deep
+        (counting those of path), wherever they lead, e.g. books__author__name
+        on an author. The filters of a resource with a given depth left are
+        only built once per call.
+
+        Without a limit, a relation leading back to a resource of path, or to
+        this resource, is a cycle: the filters of that resource are listed,
+        but its relations are not expanded, so each resource is expanded at
+        most once along any prefix. The relations are then walked with an
+        explicit stack, so long chains of resources do not run into the
+        recursion limit.
+        """
+        if max_depth is not None:
+            return prefix_parameters(prefix, self.expand_filters_to_depth(max_depth - len(path), {}))
+
+        parameters = []
+        # ('expand', mapping, prefix, path, cycle) and ('list', prefix,
+        # parameters) items, handled last in first out
+        pending = [('expand', self, prefix, path, False)]
+        while pending:
+            item = pending.pop()
+            if item[0] == 'list':
+                parameters.extend(prefix_parameters(item[1], item[2]))
+                continue
+
+            mapping, prefix, path, cycle = item[1:]
+            on_path = path + (mapping.resource.__class__,)
+            for name, related_mapping, filter_parameters in reversed(mapping.get_filter_definitions()):
+                # The related filters come before those of the relation itself
+                pending.append(('list', prefix, filter_parameters))
+                if related_mapping is None or cycle:
+                    continue
+                pending.append(('expand', related_mapping, "%s%s__" % (prefix, name), on_path,
+                                related_mapping.resource.__class__ in on_path))
+        return parameters
+
+    def expand_filters_to_depth(self, depth, memo):
+        """
+        Return the filter parameters of this resource, without prefix, with
+        relations followed depth deep
+
+        memo holds the parameters already built, by resource class and depth.
+        """
+        key = (self.resource.__class__, depth)
+        if key not in memo:
+            parameters = []
+            for name, related_mapping, filter_parameters in self.get_filter_definitions():
+                if related_mapping is not None and depth > 0:
+                    parameters.extend(prefix_parameters(
+                        "%s__" % name, related_mapping.expand_filters_to_depth(depth - 1, memo)))
+                parameters.extend(filter_parameters)
+            memo[key] = parameters
+        return memo[key]
+
     def build_parameters_from_filters(self, prefix="", method='GET'):
         parameters = []
 
@@ -189,78 +483,11 @@ class ResourceSwaggerMapping(object):
                     description=force_text(desc),
                 ))
         if 'filtering' in self.schema and method.upper() == 'GET':
-            for name, field in self.schema['filtering'].items():
-                # Avoid infinite recursion for self referencing resource (issue #22)
-                if not prefix.find('{0}__'.format(name)) >= 0:
-                    # Integer value means this points to a related model
-                    if field in [ALL, ALL_WITH_RELATIONS]:
-                        # For fields marked as ALL_WITH_RELATIONS, we must fetch information on their related resources as well.
-                        # However, tastypie allows us to mark fields that do not have related resources as ALL_WITH_RELATIONS.
-                        # This functions like a white list.
-                        # Therefore, we need to check whether a field actually has a related resource.
-                        if field == ALL:
-                            has_related_resource = False
-                        else:
-                            has_related_resource = hasattr(self.resource.fields[name], 'get_related_resource')
-
-                        if not has_related_resource:
-                            #This code has been mostly sucked from the tastypie lib
-                            if getattr(self.resource._meta, 'queryset', None) is not None:
-                                # Get the possible query terms from the current QuerySet.
-                                if hasattr(self.resource._meta.queryset.query.query_terms, 'keys'):
-                                    # Django 1.4 & below compatibility.
-                                    field = self.resource._meta.queryset.query.query_terms.keys()
-                                else:
-                                    # Django 1.5+.
-                                    field = self.resource._meta.queryset.query.query_terms
-                            else:
-                                if hasattr(QUERY_TERMS, 'keys'):
-                                    # Django 1.4 & below compatibility.
-                                    field = QUERY_TERMS.keys()
-                                else:
-                                    # Django 1.5+.
-                                    field = QUERY_TERMS
-
-                        else: # Show all params from related model
-                            # Add a subset of filter only foreign-key compatible on the relation itself.
-                            # We assume foreign keys are only int based.
-                            field = ['gt', 'in', 'gte', 'lt', 'lte', 'exact'] # TODO This could be extended by checking the actual type of the relational field, but afaik it's also an issue on tastypie.
-                            related_resource = self.resource.fields[name].get_related_resource(None)
-                            related_mapping = ResourceSwaggerMapping(related_resource)
-
-                            parameters.extend(related_mapping.build_parameters_from_filters(prefix="%s%s__" % (prefix, name)))
-
-                    if isinstance(field, (list, tuple, set)):
-                        # Skip if this is an incorrect filter
-                        if name not in self.schema['fields']: continue
-
-                        schema_field = self.schema['fields'][name]
-
-                        dataType = schema_field['type']
-                        if dataType == 'related':
-                            dataType = self.get_related_field_type(name)
-                            description = 'ID of related resource'
-
-                        for query in field:
-                            if query == 'exact':
-                                description = force_text(schema_field['help_text'])
-
-                                # Use a better description for related models with exact filter
-                                parameters.append(self.build_parameter(
-                                    paramType="query",
-                                    name="%s%s" % (prefix, name),
-                                    dataType=dataType,
-                                    required = False,
-                                    description=description,
-                                ))
-                            else:
-                                parameters.append(self.build_parameter(
-                                    paramType="query",
-                                    name="%s%s__%s" % (prefix, name, query),
-                                    dataType=dataType,
-                                    required = False,
-                                    description=force_text(schema_field['help_text']),
-                                ))
+            with self.timer.phase('filters'):
+                parameters.extend(self.get_shared_artifact('filters:%s' % prefix, lambda: freeze(self.expand_filters(
+                    prefix=prefix,
+                    max_depth=get_filter_depth(),
+                ))))
 
         return parameters
 
@@ -333,7 +560,7 @@ class ResourceSwaggerMapping(object):
             'summary': self.get_operation_summary(detail=False, method=method),
             'httpMethod': method.upper(),
             'parameters': self.build_parameters_for_list(method=method),
-            'responseClass': 'ListView' if method.upper() == 'GET' else self.resource_name,
+            'responseClass': self.get_list_model_id() if method.upper() == 'GET' else self.resource_name,
             'nickname': '%s_list' % self.resource_name,
             'notes': self.resource.__doc__,
         }
@@ -390,8 +617,10 @@ class ResourceSwaggerMapping(object):
 
         return list_api
 
-    def build_extra_apis(self):
-        extra_apis = []
+    def iter_extra_apis(self):
+        """
+        Yield the apis of the resource's extra_actions one at a time
+        """
         if hasattr(self.resource._meta, 'extra_actions'):
             identifier = self._detail_uri_name()
             for extra_action in self.resource._meta.extra_actions:
@@ -405,13 +634,23 @@ class ResourceSwaggerMapping(object):
 
                 operation = self.build_extra_operation(extra_action)
                 extra_api['operations'].append(operation)
-                extra_apis.append(extra_api)
-        return extra_apis
+                yield extra_api
+
+    def build_extra_apis(self):
+        return list(self.iter_extra_apis())
+
+    def iter_apis(self):
+        """
+        Yield the apis of the declaration one at a time
+        """
+        yield self.build_list_api()
+        yield self.build_detail_api()
+        for extra_api in self.iter_extra_apis():
+            yield extra_api
 
     def build_apis(self):
-        apis = [self.build_list_api(), self.build_detail_api()]
-        apis.extend(self.build_extra_apis())
-        return apis
+        with self.timer.phase('apis'):
+            return freeze(list(self.iter_apis()))
 
     def build_property(self, name, type, description="", required=False):
         prop = {
@@ -438,12 +677,6 @@ class ResourceSwaggerMapping(object):
                     continue
                 if field.get('readonly'):
                     continue
-            # Deal with default format
-            if isinstance(field.get('default'), fields.NOT_PROVIDED):
-                field['default'] = None
-            elif isinstance(field.get('default'), datetime.datetime):
-                field['default'] = field.get('default').isoformat()
-
             properties.update(self.build_property(
                     name,
                     field.get('type'),
@@ -464,113 +697,103 @@ class ResourceSwaggerMapping(object):
         }
 
 
-    def build_list_models_and_properties(self):
-        models = {}
-
-        # Build properties added by list view in the meta section by tastypie
-        meta_properties = {}
-        meta_properties.update(
-            self.build_property('limit', 'int', 'Specify the number of element to display per page.')
-        )
-        meta_properties.update(
-            self.build_property('next', 'string', 'Uri of the next page relative to the current page settings.')
-        )
-        meta_properties.update(
-            self.build_property('offset', 'int', 'Specify the offset to start displaying element on a page.')
-        )
-        meta_properties.update(
-            self.build_property('previous', 'string', 'Uri of the previous page relative to the current page settings.')
-        )
-        meta_properties.update(
-            self.build_property('total_count', 'int', 'Total items count for the all collection')
-        )
+    def build_list_meta_model(self):
+        """
+        Build the Meta model of list views, which tastypie adds to every list
 
-        models.update(
-            self.build_model(
-                'Meta',
-                'Meta',
-                meta_properties
+        It is the same for every resource, so it is only built once and
+        shared by all declarations.
+        """
+        if ResourceSwaggerMapping._list_meta_model is None:
+            # Build properties added by list view in the meta section by tastypie
+            meta_properties = {}
+            meta_properties.update(
+                self.build_property('limit', 'int', 'Specify the number of element to display per page.')
             )
-        )
-
-        objects_properties = {}
-        objects_properties.update(
-            self.build_property(
-                self.resource_name,
-                "List")
-        )
-        # Build the Objects class added by tastypie in the list view.
-        models.update(
-            self.build_model(
-                'Objects',
-                'Objects',
-                objects_properties
+            meta_properties.update(
+                self.build_property('next', 'string', 'Uri of the next page relative to the current page settings.')
             )
-        )
-        # Build the actual List class
+            meta_properties.update(
+                self.build_property('offset', 'int', 'Specify the offset to start displaying element on a page.')
+            )
+            meta_properties.update(
+                self.build_property('previous', 'string', 'Uri of the previous page relative to the current page settings.')
+            )
+            meta_properties.update(
+                self.build_property('total_count', 'int', 'Total items count for the all collection')
+            )
+            ResourceSwaggerMapping._list_meta_model = freeze(self.build_model('Meta', 'Meta', meta_properties))
+        return ResourceSwaggerMapping._list_meta_model
+
+    def get_list_model_id(self):
+        return '%s_list' % self.resource_name
+
+    def build_list_models_and_properties(self):
+        models = {}
+        models.update(self.build_list_meta_model())
+
+        # Build the list class, named after the resource so declarations
+        # sharing a document do not overwrite each other's.
         list_properties = {}
         list_properties.update(self.build_property(
             'meta',
             'Meta'
         ))
-
-        list_properties.update(self.build_property(
-            'objects',
-            'Objects'
-        ))
+        objects_property = self.build_property('objects', 'List')
+        objects_property['objects']['items'] = {'$ref': self.resource_name}
+        list_properties.update(objects_property)
         models.update(
             self.build_model(
-                'ListView',
-                'ListView',
+                self.get_list_model_id(),
+                self.get_list_model_id(),
                 list_properties
             )
         )
-
         return models
 
     def build_models(self):
-        models = {}
+        with self.timer.phase('models'):
+            return self.get_shared_artifact('models', lambda: freeze(dict(self.iter_models())))
 
+    def iter_models(self):
+        """
+        Yield the (model id, model) pairs of the declaration one at a time
+        """
         # Take care of the list particular schema with meta and so on.
         if 'get' in self.schema['allowed_list_http_methods']:
-            models.update(self.build_list_models_and_properties())
+            for item in self.build_list_models_and_properties().items():
+                yield item
 
         if 'post' in self.resource._meta.list_allowed_methods:
-            models.update(
-                self.build_model(
-                    resource_name='%s_post' % self.resource._meta.resource_name,
-                    properties=self.build_properties_from_fields(method='post'),
-                    id='%s_post' % self.resource_name
-                )
-            )
+            for item in self.build_model(
+                resource_name='%s_post' % self.resource._meta.resource_name,
+                properties=self.build_properties_from_fields(method='post'),
+                id='%s_post' % self.resource_name
+            ).items():
+                yield item
 
         if 'put' in self.resource._meta.detail_allowed_methods:
-            models.update(
-                self.build_model(
-                    resource_name='%s_put' % self.resource._meta.resource_name,
-                    properties=self.build_properties_from_fields(method='put'),
-                    id='%s_put' % self.resource_name
-                )
-            )
+            for item in self.build_model(
+                resource_name='%s_put' % self.resource._meta.resource_name,
+                properties=self.build_properties_from_fields(method='put'),
+                id='%s_put' % self.resource_name
+            ).items():
+                yield item
 
         # Actually add the related model
-        models.update(
-            self.build_model(
-                resource_name=self.resource._meta.resource_name,
-                properties=self.build_properties_from_fields(),
-                id=self.resource_name
-            )
-        )
+        for item in self.build_model(
+            resource_name=self.resource._meta.resource_name,
+            properties=self.build_properties_from_fields(),
+            id=self.resource_name
+        ).items():
+            yield item
 
         if hasattr(self.resource._meta, 'extra_actions'):
             for extra_action in self.resource._meta.extra_actions:
                 if "model" in extra_action:
-                    models.update(
-                        self.build_model(
+                    for item in self.build_model(
                         resource_name=extra_action['model']['id'],
                         properties=extra_action['model']['properties'],
                         id=extra_action['model']['id']
-                        )
-                    )
-
-        return models
+                    ).items():
+                        yield item
@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.urlresolvers import get_script_prefix, get_urlconf
+
+try:
+    from importlib import import_module
+except ImportError:
+    from django.utils.importlib import import_module
+
+import tastypie.api
+
+_lock = threading.Lock()
+# tastypie.api.Api instances by python path
+_apis = {}
+# Apis of the tastypie_apis parameter by api_name, by tuple of that parameter
+_api_sets = {}
+# ApiState instances by tastypie.api.Api instance
+_states = {}
+
+
+def resolve_api(tastypie_api_module):
+    """
+    Return the tastypie.api.Api instance at a python path such as
+    'myapp.registration.my_api', importing its module if needed
+
+    An Api instance is returned as is. Paths are resolved once per process.
+    """
+    if isinstance(tastypie_api_module, tastypie.api.Api):
+        return tastypie_api_module
+
+    with _lock:
+        api = _apis.get(tastypie_api_module)
+    if api is not None:
+        return api
+
+    path, _, attr = tastypie_api_module.rpartition('.')
+    try:
+        api = getattr(import_module(path), attr, None)
+    except (ImportError, ValueError):
+        raise ImproperlyConfigured("%s is not a valid python path" % (path or tastypie_api_module))
+    if not isinstance(api, tastypie.api.Api):
+        raise ImproperlyConfigured("%s is not a valid tastypie.api.Api instance" % tastypie_api_module)
+
+    with _lock:
+        _apis[tastypie_api_module] = api
+    return api
+
+
+def resolve_apis(tastypie_apis):
+    """
+    Return an ordered dict of the tastypie.api.Api instances in tastypie_apis,
+    a sequence of instances or python paths, keyed by their api_name
+    """
+    key = tuple(tastypie_apis)
+    with _lock:
+        apis = _api_sets.get(key)
+    if apis is not None:
+        return apis
+
+    apis = OrderedDict()
+    for tastypie_api_module in key:
+        api = resolve_api(tastypie_api_module)
+        if api.api_name in apis:
+            raise ImproperlyConfigured("tastypie_apis has several Apis named %s" % api.api_name)
+        apis[api.api_name] = api
+
+    with _lock:
+        _api_sets[key] = apis
+    return apis
+
+
+class ApiState(object):
+    """
+    What the views compute from a tastypie.api.Api, kept for the life of the process
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self.resource_names = tuple(sorted(api._registry.keys()))
+        # Reversed urls, by urlconf, script prefix and key
+        self._urls = {}
+
+    def get_resource(self, resource_name):
+        """
+        Return the resource registered under resource_name, or None
+        """
+        return self.api._registry.get(resource_name)
+
+    def get_url(self, key, reverse):
+        """
+        Return the url stored under key, calling reverse() to resolve it the
+        first time it is asked for with the current urlconf and script prefix
+        """
+        key = (get_urlconf(), get_script_prefix()) + tuple(key)
+        url = self._urls.get(key)
+        if url is None:
+            url = reverse()
+            with _lock:
+                url = self._urls.setdefault(key, url)
+        return url
+
+
+def get_api_state(api):
+    """
+    Return the ApiState of a tastypie.api.Api instance
+    """
+    with _lock:
+        state = _states.get(api)
+        if state is None:
+            state = _states[api] = ApiState(api)
+    return state
+
+
+def clear_api_states(api=None):
+    """
+    Drop the ApiState of an Api, or of every Api, after resources are registered at runtime
+    """
+    with _lock:
+        if api is None:
+            _states.clear()
+        else:
+            _states.pop(api, None)
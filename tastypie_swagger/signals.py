@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent by the JSON views after building a document, with the seconds spent
+# in each phase as an ordered dict.
+schema_built = Signal(providing_args=['request', 'phases'])
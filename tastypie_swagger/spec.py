@@ -0,0 +1,202 @@
+import json
+import os
+
+from .fingerprint import resource_fingerprint
+from .mapping import ResourceSwaggerMapping
+from .utils import LazyObject, json_dumps, parallel_imap
+
+SWAGGER_VERSION = '1.2'
+
+# Written by export_spec next to the documents
+EXPORT_MANIFEST = 'manifest.json'
+
+
+def build_resource_listing(api, base_path, names=None, path_format='/%s', versions=None):
+    """
+    Build the resource listing of a tastypie.api.Api, without version information
+
+    versions optionally maps resource names to a hash of their declaration,
+    added to their path as a 'v' query parameter.
+
+    https://github.com/wordnik/swagger-core/wiki/Resource-Listing
+    """
+    if names is None:
+        names = sorted(api._registry.keys())
+    apis = []
+    for name in names:
+        path = path_format % name
+        if versions and name in versions:
+            path = '%s?v=%s' % (path, versions[name])
+        apis.append({'path': path})
+    return {
+        'basePath': base_path,
+        'apis': apis,
+    }
+
+
+def build_api_declaration(resource, timer=None, lazy=False, api=None):
+    """
+    Build the API declaration of a tastypie resource, without version information
+
+    The time spent in each phase is recorded in timer, a PhaseTimer, if given.
+    With lazy, apis and models are a generator and a utils.LazyObject built
+    as utils.iter_json encodes them; the declaration can be encoded only once.
+    api is the tastypie.api.Api the resource is documented for, needed when
+    its class is registered with several Apis.
+
+    https://github.com/wordnik/swagger-core/wiki/API-Declaration
+    """
+    # Generate mapping from tastypie.resources.Resource.build_schema
+    mapping = ResourceSwaggerMapping(resource, timer=timer, api=api)
+    if lazy:
+        return {
+            'basePath': '/',
+            'apis': mapping.iter_apis(),
+            'models': LazyObject(mapping.iter_models()),
+            'resourcePath': '/{0}'.format(resource._meta.resource_name)
+        }
+    return {
+        'basePath': '/',
+        'apis': mapping.build_apis(),
+        'models': mapping.build_models(),
+        'resourcePath': '/{0}'.format(resource._meta.resource_name)
+    }
+
+
+def serialize_api_declaration(resource, version='Unknown', base_path='/', api=None):
+    """
+    Return the complete API declaration of a tastypie resource as JSON
+    """
+    declaration = dict({'apiVersion': version, 'swaggerVersion': SWAGGER_VERSION},
+                       **build_api_declaration(resource, api=api))
+    declaration['basePath'] = base_path
+    return json_dumps(declaration)
+
+
+def iter_declarations(api, names=None, version='Unknown', base_path='/', workers=None):
+    """
+    Yield (resource name, serialized API declaration) tuples one resource at
+    a time, in the order of names (every registered resource by default)
+
+    Only the declarations being built are held in memory, whatever the size
+    of the registry. With workers > 1 they are built by a pool of forked
+    processes, with the same output as a serial build (see utils.parallel_imap).
+    """
+    if names is None:
+        names = sorted(api._registry.keys())
+    contents = parallel_imap(
+        lambda name: serialize_api_declaration(api._registry[name], version, base_path, api=api),
+        names,
+        workers=workers,
+    )
+    for name in names:
+        yield name, next(contents)
+
+
+def build_declarations(api, names=None, version='Unknown', base_path='/', workers=None):
+    """
+    Return a list of (resource name, serialized API declaration) tuples, see
+    iter_declarations
+    """
+    return list(iter_declarations(api, names, version, base_path, workers))
+
+
+def splice_declarations(listing, declarations):
+    """
+    Add serialized declarations to a serialized resource listing, under 'apiDeclarations'
+
+    declarations is a list of (resource name, JSON string) tuples. Working on
+    the strings avoids decoding and re-encoding documents that are already built.
+    """
+    return '%s, "apiDeclarations": {%s}}' % (
+        listing.rstrip()[:-1],
+        ', '.join('%s: %s' % (json.dumps(name), content) for name, content in declarations),
+    )
+
+
+def _write(path, content):
+    with open(path, 'wb') as f:
+        f.write(content.encode('utf-8'))
+
+
+def _read_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def export_spec(api, output_dir, base_url, version='Unknown', aggregate=False, api_base_path='/', workers=None,
+                force=False):
+    """
+    Write the documentation of a tastypie.api.Api to static files
+
+    output_dir receives resources.json (the listing), schema/<resource>.json
+    (one declaration per resource) and, with aggregate, aggregate.json.
+    base_url is the URL output_dir is served from and api_base_path the
+    URL the API calls are made against. Declarations are built by workers
+    processes, see iter_declarations; each is written out as soon as it is
+    built, so memory use does not grow with the registry.
+
+    The fingerprint of each resource (see fingerprint.resource_fingerprint)
+    is recorded in manifest.json, and declarations whose fingerprint did not
+    change since the previous export to output_dir are kept unless force is
+    set. Returns the paths written.
+    """
+    schema_dir = os.path.join(output_dir, 'schema')
+    if not os.path.isdir(schema_dir):
+        os.makedirs(schema_dir)
+
+    names = sorted(api._registry.keys())
+    manifest = {
+        'options': {'version': version, 'api_base_path': api_base_path},
+        'resources': dict((name, resource_fingerprint(api._registry[name])) for name in names),
+    }
+    manifest_path = os.path.join(output_dir, EXPORT_MANIFEST)
+    previous = {} if force else _read_manifest(manifest_path)
+    if previous.get('options') != manifest['options']:
+        previous = {}
+    exported = previous.get('resources', {})
+
+    paths = []
+    # Declarations of resources that are no longer registered
+    for name in exported:
+        path = os.path.join(schema_dir, '%s.json' % name)
+        if name not in manifest['resources'] and os.path.exists(path):
+            os.remove(path)
+
+    stale = [
+        name for name in names
+        if exported.get(name) != manifest['resources'][name]
+        or not os.path.exists(os.path.join(schema_dir, '%s.json' % name))
+    ]
+    for name, content in iter_declarations(api, stale, version=version, base_path=api_base_path, workers=workers):
+        path = os.path.join(schema_dir, '%s.json' % name)
+        _write(path, content)
+        paths.append(path)
+
+    # swagger-ui requests basePath + path, with {format} replaced by json
+    listing = dict({'apiVersion': version, 'swaggerVersion': SWAGGER_VERSION}, **build_resource_listing(
+        api, '%s/schema' % base_url.rstrip('/'), path_format='/%s.{format}'))
+    listing = json_dumps(listing)
+    path = os.path.join(output_dir, 'resources.json')
+    _write(path, listing)
+    paths.append(path)
+
+    if aggregate:
+        # Copied from the files just written, one declaration at a time
+        path = os.path.join(output_dir, 'aggregate.json')
+        with open(path, 'wb') as f:
+            f.write(('%s, "apiDeclarations": {' % listing.rstrip()[:-1]).encode('utf-8'))
+            for i, name in enumerate(names):
+                f.write(('%s%s: ' % (i and ', ' or '', json.dumps(name))).encode('utf-8'))
+                with open(os.path.join(schema_dir, '%s.json' % name), 'rb') as declaration:
+                    f.write(declaration.read())
+            f.write(b'}}')
+        paths.append(path)
+
+    # Last, so an interrupted export is redone
+    _write(manifest_path, json.dumps(manifest, indent=2, sort_keys=True, separators=(',', ': ')))
+    paths.append(manifest_path)
+    return paths
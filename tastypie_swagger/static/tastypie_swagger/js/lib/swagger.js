@@ -106,6 +106,13 @@ var SwaggerApi = function(url, options) {
   if (typeof options.useJQuery === 'boolean')
     this.useJQuery = options.useJQuery;
 
+  // Fetch api declarations only when SwaggerResource.load is called
+  this.lazy = options.lazy === true;
+
+  // Resource listing already at hand, built from instead of fetching url
+  if (options.spec != null)
+    this.spec = options.spec;
+
   this.failure = options.failure != null ? options.failure : function() {};
   this.progress = options.progress != null ? options.progress : function() {};
   if (options.success != null)
@@ -114,6 +121,20 @@ var SwaggerApi = function(url, options) {
 
 SwaggerApi.prototype.build = function() {
   var _this = this;
+  if (this.spec != null) {
+    var spec = this.spec;
+    this.spec = null;
+    // Asynchronous, like a fetched listing
+    setTimeout(function() {
+      _this.swaggerVersion = spec.swaggerVersion;
+      if (_this.swaggerVersion === "1.2") {
+        return _this.buildFromSpec(spec);
+      } else {
+        return _this.buildFrom1_1Spec(spec);
+      }
+    }, 0);
+    return this;
+  }
   this.progress('fetching resource list: ' + this.url);
   var obj = {
     useJQuery: this.useJQuery,
@@ -182,6 +203,15 @@ SwaggerApi.prototype.buildFromSpec = function(response) {
   else
     this.basePath = this.url;
 
+  // Resolve host relative base paths, as written by static exports
+  if (this.basePath.substring(0, 1) === '/' && this.url.indexOf('http') === 0) {
+    var urlParts = this.url.split('/');
+    this.basePath = urlParts[0] + '//' + urlParts[2] + this.basePath;
+  }
+
+  // Aggregated listings embed every api declaration, keyed by resource name
+  this.apiDeclarations = response.apiDeclarations || null;
+
   if (isApi) {
     var newName = response.resourcePath.replace(/\//g, '');
     this.resourcePath = response.resourcePath;
@@ -197,6 +227,10 @@ SwaggerApi.prototype.buildFromSpec = function(response) {
       this.apisArray.push(res);
     }
   }
+  // Render once if every declaration was embedded
+  if (this.apiDeclarations && this.selfReflect() !== false) {
+    return this;
+  }
   if (this.success) {
     this.success();
   }
@@ -326,7 +360,8 @@ var SwaggerResource = function(resourceObj, api) {
   this.path = this.api.resourcePath != null ? this.api.resourcePath : resourceObj.path;
   this.description = resourceObj.description;
 
-  var parts = this.path.split("/");
+  // Leave out the query, e.g. the content hash of the declaration
+  var parts = this.path.split("?")[0].split("/");
   this.name = parts[parts.length - 1].replace('.{format}', '');
   this.basePath = this.api.basePath;
   this.operations = {};
@@ -338,6 +373,9 @@ var SwaggerResource = function(resourceObj, api) {
 
   if ((resourceObj.apis != null) && (this.api.resourcePath != null)) {
     this.addApiDeclaration(resourceObj);
+  } else if (this.api.apiDeclarations && this.api.apiDeclarations[this.name]) {
+    // The api will reflect once all resources are built
+    this.loadApiDeclaration(this.api.apiDeclarations[this.name]);
   } else {
     if (this.path == null) {
       this.api.fail("SwaggerResources must have a path.");
@@ -347,31 +385,60 @@ var SwaggerResource = function(resourceObj, api) {
     } else {
       this.url = this.api.basePath + this.path.replace('{format}', 'json');
     }
-    this.api.progress('fetching resource ' + this.name + ': ' + this.url);
-    obj = {
-      url: this.url,
-      method: "get",
-      useJQuery: this.useJQuery,
-      headers: {
-        accept: "application/json"
-      },
-      on: {
-        response: function(resp) {
-          var responseObj = resp.obj || JSON.parse(resp.data);
-          return _this.addApiDeclaration(responseObj);
-        },
-        error: function(response) {
-          return _this.api.fail("Unable to read api '" +
-            _this.name + "' from path " + _this.url + " (server returned " + response.statusText + ")");
-        }
-      }
-    };
-    var e = typeof window !== 'undefined' ? window : exports;
-    e.authorizations.apply(obj);
-    new SwaggerHttp().execute(obj);
+    if (!this.api.lazy) {
+      this.load(function() {
+        return _this.api.selfReflect();
+      });
+    }
   }
 }
 
+SwaggerResource.prototype.load = function(callback) {
+  var _this = this;
+  if (this.ready) {
+    if (callback != null)
+      callback(this);
+    return this;
+  }
+  this.callbacks = this.callbacks || [];
+  if (callback != null)
+    this.callbacks.push(callback);
+  if (this.loading)
+    return this;
+  this.loading = true;
+
+  this.api.progress('fetching resource ' + this.name + ': ' + this.url);
+  var obj = {
+    url: this.url,
+    method: "get",
+    useJQuery: this.useJQuery,
+    headers: {
+      accept: "application/json"
+    },
+    on: {
+      response: function(resp) {
+        var responseObj = resp.obj || JSON.parse(resp.data);
+        _this.loadApiDeclaration(responseObj);
+        _this.loading = false;
+        var callbacks = _this.callbacks;
+        _this.callbacks = [];
+        for (var i = 0; i < callbacks.length; i++) {
+          callbacks[i](_this);
+        }
+      },
+      error: function(response) {
+        _this.loading = false;
+        return _this.api.fail("Unable to read api '" +
+          _this.name + "' from path " + _this.url + " (server returned " + response.statusText + ")");
+      }
+    }
+  };
+  var e = typeof window !== 'undefined' ? window : exports;
+  e.authorizations.apply(obj);
+  new SwaggerHttp().execute(obj);
+  return this;
+};
+
 SwaggerResource.prototype.getAbsoluteBasePath = function (relativeBasePath) {
   var pos, url;
   url = this.api.basePath;
@@ -398,6 +465,11 @@ SwaggerResource.prototype.getAbsoluteBasePath = function (relativeBasePath) {
 };
 
 SwaggerResource.prototype.addApiDeclaration = function(response) {
+  this.loadApiDeclaration(response);
+  return this.api.selfReflect();
+};
+
+SwaggerResource.prototype.loadApiDeclaration = function(response) {
   if (response.produces != null)
     this.produces = response.produces;
   if (response.consumes != null)
@@ -414,7 +486,7 @@ SwaggerResource.prototype.addApiDeclaration = function(response) {
   }
   this.api[this.name] = this;
   this.ready = true;
-  return this.api.selfReflect();
+  return this;
 };
 
 SwaggerResource.prototype.addModels = function(models) {
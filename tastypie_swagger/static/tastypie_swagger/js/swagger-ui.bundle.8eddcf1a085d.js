@@ -0,0 +1,920 @@
+var require=function(file,cwd){var resolved=require.resolve(file,cwd||'/');var mod=require.modules[resolved];if(!mod)throw new Error('Failed to resolve module '+file+', tried '+resolved);var res=mod._cached?mod._cached:mod();return res;}
+require.paths=[];require.modules={};require.extensions=[".js",".coffee"];require._core={'assert':true,'events':true,'fs':true,'path':true,'vm':true};require.resolve=(function(){return function(x,cwd){if(!cwd)cwd='/';if(require._core[x])return x;var path=require.modules.path();var y=cwd||'.';if(x.match(/^(?:\.\.?\/|\/)/)){var m=loadAsFileSync(path.resolve(y,x))||loadAsDirectorySync(path.resolve(y,x));if(m)return m;}
+var n=loadNodeModulesSync(x,y);if(n)return n;throw new Error("Cannot find module '"+x+"'");function loadAsFileSync(x){if(require.modules[x]){return x;}
+for(var i=0;i<require.extensions.length;i++){var ext=require.extensions[i];if(require.modules[x+ext])return x+ext;}}
+function loadAsDirectorySync(x){x=x.replace(/\/+$/,'');var pkgfile=x+'/package.json';if(require.modules[pkgfile]){var pkg=require.modules[pkgfile]();var b=pkg.browserify;if(typeof b==='object'&&b.main){var m=loadAsFileSync(path.resolve(x,b.main));if(m)return m;}
+else if(typeof b==='string'){var m=loadAsFileSync(path.resolve(x,b));if(m)return m;}
+else if(pkg.main){var m=loadAsFileSync(path.resolve(x,pkg.main));if(m)return m;}}
+return loadAsFileSync(x+'/index');}
+function loadNodeModulesSync(x,start){var dirs=nodeModulesPathsSync(start);for(var i=0;i<dirs.length;i++){var dir=dirs[i];var m=loadAsFileSync(dir+'/'+x);if(m)return m;var n=loadAsDirectorySync(dir+'/'+x);if(n)return n;}
+var m=loadAsFileSync(x);if(m)return m;}
+function nodeModulesPathsSync(start){var parts;if(start==='/')parts=[''];else parts=path.normalize(start).split('/');var dirs=[];for(var i=parts.length-1;i>=0;i--){if(parts[i]==='node_modules')continue;var dir=parts.slice(0,i+1).join('/')+'/node_modules';dirs.push(dir);}
+return dirs;}};})();require.alias=function(from,to){var path=require.modules.path();var res=null;try{res=require.resolve(from+'/package.json','/');}
+catch(err){res=require.resolve(from,'/');}
+var basedir=path.dirname(res);var keys=(Object.keys||function(obj){var res=[];for(var key in obj)res.push(key)
+return res;})(require.modules);for(var i=0;i<keys.length;i++){var key=keys[i];if(key.slice(0,basedir.length+1)===basedir+'/'){var f=key.slice(basedir.length);require.modules[to+f]=require.modules[basedir+f];}
+else if(key===basedir){require.modules[to]=require.modules[basedir];}}};require.define=function(filename,fn){var dirname=require._core[filename]?'':require.modules.path().dirname(filename);var require_=function(file){return require(file,dirname)};require_.resolve=function(name){return require.resolve(name,dirname);};require_.modules=require.modules;require_.define=require.define;var module_={exports:{}};require.modules[filename]=function(){require.modules[filename]._cached=module_.exports;fn.call(module_.exports,require_,module_,module_.exports,dirname,filename);require.modules[filename]._cached=module_.exports;return module_.exports;};};if(typeof process==='undefined')process={};if(!process.nextTick)process.nextTick=(function(){var queue=[];var canPost=typeof window!=='undefined'&&window.postMessage&&window.addEventListener;if(canPost){window.addEventListener('message',function(ev){if(ev.source===window&&ev.data==='browserify-tick'){ev.stopPropagation();if(queue.length>0){var fn=queue.shift();fn();}}},true);}
+return function(fn){if(canPost){queue.push(fn);window.postMessage('browserify-tick','*');}
+else setTimeout(fn,0);};})();if(!process.title)process.title='browser';if(!process.binding)process.binding=function(name){if(name==='evals')return require('vm')
+else throw new Error('No such module')};if(!process.cwd)process.cwd=function(){return'.'};require.define("path",function(require,module,exports,__dirname,__filename){function filter(xs,fn){var res=[];for(var i=0;i<xs.length;i++){if(fn(xs[i],i,xs))res.push(xs[i]);}
+return res;}
+function normalizeArray(parts,allowAboveRoot){var up=0;for(var i=parts.length;i>=0;i--){var last=parts[i];if(last=='.'){parts.splice(i,1);}else if(last==='..'){parts.splice(i,1);up++;}else if(up){parts.splice(i,1);up--;}}
+if(allowAboveRoot){for(;up--;up){parts.unshift('..');}}
+return parts;}
+var splitPathRe=/^(.+\/(?!$)|\/)?((?:.+?)?(\.[^.]*)?)$/;exports.resolve=function(){var resolvedPath='',resolvedAbsolute=false;for(var i=arguments.length;i>=-1&&!resolvedAbsolute;i--){var path=(i>=0)?arguments[i]:process.cwd();if(typeof path!=='string'||!path){continue;}
+resolvedPath=path+'/'+resolvedPath;resolvedAbsolute=path.charAt(0)==='/';}
+resolvedPath=normalizeArray(filter(resolvedPath.split('/'),function(p){return!!p;}),!resolvedAbsolute).join('/');return((resolvedAbsolute?'/':'')+resolvedPath)||'.';};exports.normalize=function(path){var isAbsolute=path.charAt(0)==='/',trailingSlash=path.slice(-1)==='/';path=normalizeArray(filter(path.split('/'),function(p){return!!p;}),!isAbsolute).join('/');if(!path&&!isAbsolute){path='.';}
+if(path&&trailingSlash){path+='/';}
+return(isAbsolute?'/':'')+path;};exports.join=function(){var paths=Array.prototype.slice.call(arguments,0);return exports.normalize(filter(paths,function(p,index){return p&&typeof p==='string';}).join('/'));};exports.dirname=function(path){var dir=splitPathRe.exec(path)[1]||'';var isWindows=false;if(!dir){return'.';}else if(dir.length===1||(isWindows&&dir.length<=3&&dir.charAt(1)===':')){return dir;}else{return dir.substring(0,dir.length-1);}};exports.basename=function(path,ext){var f=splitPathRe.exec(path)[2]||'';if(ext&&f.substr(-1*ext.length)===ext){f=f.substr(0,f.length-ext.length);}
+return f;};exports.extname=function(path){return splitPathRe.exec(path)[3]||'';};});require.define("/shred.js",function(require,module,exports,__dirname,__filename){var Ax=require("ax"),CookieJarLib=require("cookiejar"),CookieJar=CookieJarLib.CookieJar;var Shred=function(options){options=(options||{});this.agent=options.agent;this.defaults=options.defaults||{};this.log=options.logger||(new Ax({level:"info"}));this._sharedCookieJar=new CookieJar();this.logCurl=options.logCurl||false;};Shred.Request=require("./shred/request");Shred.Response=require("./shred/response");Shred.prototype={request:function(options){options.logger=this.log;options.logCurl=options.logCurl||this.logCurl;options.cookieJar=('cookieJar'in options)?options.cookieJar:this._sharedCookieJar;options.agent=options.agent||this.agent;for(var key in this.defaults){if(this.defaults.hasOwnProperty(key)&&!options[key]){options[key]=this.defaults[key]}}
+return new Shred.Request(options);}};"get put post delete".split(" ").forEach(function(method){Shred.prototype[method]=function(options){options.method=method;return this.request(options);};});module.exports=Shred;});require.define("/node_modules/ax/package.json",function(require,module,exports,__dirname,__filename){module.exports={"main":"./lib/ax.js"}});require.define("/node_modules/ax/lib/ax.js",function(require,module,exports,__dirname,__filename){var inspect=require("util").inspect,fs=require("fs");var format=function(level,message){var debug=(level=="debug"||level=="error");if(!message){return message.toString();}
+if(typeof(message)=="object"){if(message instanceof Error&&debug){return message.stack;}else{return inspect(message);}}else{return message.toString();}};var noOp=function(message){return this;}
+var makeLogger=function(level,fn){return function(message){this.stream.write(this.format(level,message)+"\n");return this;}};var Logger=function(options){var logger=this;var options=options||{};options.level=options.level||"info";options.timestamp=options.timestamp||true;options.prefix=options.prefix||"";logger.options=options;if(logger.options.module){logger.options.prefix=logger.options.module;}
+if(logger.options.file){logger.stream=fs.createWriteStream(logger.options.file,{"flags":"a"});}else{if(process.title==="node")
+logger.stream=process.stderr;else if(process.title==="browser")
+logger.stream=function(){return console[logger.options.level].apply(console,arguments);};}
+switch(logger.options.level){case'debug':['debug','info','warn'].forEach(function(level){logger[level]=Logger.writer(level);});case'info':['info','warn'].forEach(function(level){logger[level]=Logger.writer(level);});case'warn':logger.warn=Logger.writer('warn');}}
+Logger.writer=function(level){return function(message){var logger=this;if(process.title==="node")
+logger.stream.write(logger.format(level,message)+'\n');else if(process.title==="browser")
+logger.stream(logger.format(level,message)+'\n');};}
+Logger.prototype={info:function(){},debug:function(){},warn:function(){},error:Logger.writer('error'),format:function(level,message){if(!message)return'';var logger=this,prefix=logger.options.prefix,timestamp=logger.options.timestamp?" "+(new Date().toISOString()):"";return(prefix+timestamp+": "+message);}};module.exports=Logger;});require.define("util",function(require,module,exports,__dirname,__filename){});require.define("fs",function(require,module,exports,__dirname,__filename){});require.define("/node_modules/cookiejar/package.json",function(require,module,exports,__dirname,__filename){module.exports={"main":"cookiejar.js"}});require.define("/node_modules/cookiejar/cookiejar.js",function(require,module,exports,__dirname,__filename){exports.CookieAccessInfo=CookieAccessInfo=function CookieAccessInfo(domain,path,secure,script){if(this instanceof CookieAccessInfo){this.domain=domain||undefined;this.path=path||"/";this.secure=!!secure;this.script=!!script;return this;}
+else{return new CookieAccessInfo(domain,path,secure,script)}}
+exports.Cookie=Cookie=function Cookie(cookiestr){if(cookiestr instanceof Cookie){return cookiestr;}
+else{if(this instanceof Cookie){this.name=null;this.value=null;this.expiration_date=Infinity;this.path="/";this.domain=null;this.secure=false;this.noscript=false;if(cookiestr){this.parse(cookiestr)}
+return this;}
+return new Cookie(cookiestr)}}
+Cookie.prototype.toString=function toString(){var str=[this.name+"="+this.value];if(this.expiration_date!==Infinity){str.push("expires="+(new Date(this.expiration_date)).toGMTString());}
+if(this.domain){str.push("domain="+this.domain);}
+if(this.path){str.push("path="+this.path);}
+if(this.secure){str.push("secure");}
+if(this.noscript){str.push("httponly");}
+return str.join("; ");}
+Cookie.prototype.toValueString=function toValueString(){return this.name+"="+this.value;}
+var cookie_str_splitter=/[:](?=\s*[a-zA-Z0-9_\-]+\s*[=])/g
+Cookie.prototype.parse=function parse(str){if(this instanceof Cookie){var parts=str.split(";"),pair=parts[0].match(/([^=]+)=((?:.|\n)*)/),key=pair[1],value=pair[2];this.name=key;this.value=value;for(var i=1;i<parts.length;i++){pair=parts[i].match(/([^=]+)(?:=((?:.|\n)*))?/),key=pair[1].trim().toLowerCase(),value=pair[2];switch(key){case"httponly":this.noscript=true;break;case"expires":this.expiration_date=value?Number(Date.parse(value)):Infinity;break;case"path":this.path=value?value.trim():"";break;case"domain":this.domain=value?value.trim():"";break;case"secure":this.secure=true;break}}
+return this;}
+return new Cookie().parse(str)}
+Cookie.prototype.matches=function matches(access_info){if(this.noscript&&access_info.script||this.secure&&!access_info.secure||!this.collidesWith(access_info)){return false}
+return true;}
+Cookie.prototype.collidesWith=function collidesWith(access_info){if((this.path&&!access_info.path)||(this.domain&&!access_info.domain)){return false}
+if(this.path&&access_info.path.indexOf(this.path)!==0){return false;}
+if(this.domain===access_info.domain){return true;}
+else if(this.domain&&this.domain.charAt(0)===".")
+{var wildcard=access_info.domain.indexOf(this.domain.slice(1))
+if(wildcard===-1||wildcard!==access_info.domain.length-this.domain.length+1){return false;}}
+else if(this.domain){return false}
+return true;}
+exports.CookieJar=CookieJar=function CookieJar(){if(this instanceof CookieJar){var cookies={}
+this.setCookie=function setCookie(cookie){cookie=Cookie(cookie);var remove=cookie.expiration_date<=Date.now();if(cookie.name in cookies){var cookies_list=cookies[cookie.name];for(var i=0;i<cookies_list.length;i++){var collidable_cookie=cookies_list[i];if(collidable_cookie.collidesWith(cookie)){if(remove){cookies_list.splice(i,1);if(cookies_list.length===0){delete cookies[cookie.name]}
+return false;}
+else{return cookies_list[i]=cookie;}}}
+if(remove){return false;}
+cookies_list.push(cookie);return cookie;}
+else if(remove){return false;}
+else{return cookies[cookie.name]=[cookie];}}
+this.getCookie=function getCookie(cookie_name,access_info){var cookies_list=cookies[cookie_name];for(var i=0;i<cookies_list.length;i++){var cookie=cookies_list[i];if(cookie.expiration_date<=Date.now()){if(cookies_list.length===0){delete cookies[cookie.name]}
+continue;}
+if(cookie.matches(access_info)){return cookie;}}}
+this.getCookies=function getCookies(access_info){var matches=[];for(var cookie_name in cookies){var cookie=this.getCookie(cookie_name,access_info);if(cookie){matches.push(cookie);}}
+matches.toString=function toString(){return matches.join(":");}
+matches.toValueString=function(){return matches.map(function(c){return c.toValueString();}).join(';');}
+return matches;}
+return this;}
+return new CookieJar()}
+CookieJar.prototype.setCookies=function setCookies(cookies){cookies=Array.isArray(cookies)?cookies:cookies.split(cookie_str_splitter);var successful=[]
+for(var i=0;i<cookies.length;i++){var cookie=Cookie(cookies[i]);if(this.setCookie(cookie)){successful.push(cookie);}}
+return successful;}});require.define("/shred/request.js",function(require,module,exports,__dirname,__filename){var HTTP=require("http"),HTTPS=require("https"),parseUri=require("./parseUri"),Emitter=require('events').EventEmitter,sprintf=require("sprintf").sprintf,Response=require("./response"),HeaderMixins=require("./mixins/headers"),Content=require("./content");var STATUS_CODES=HTTP.STATUS_CODES||{100:'Continue',101:'Switching Protocols',102:'Processing',200:'OK',201:'Created',202:'Accepted',203:'Non-Authoritative Information',204:'No Content',205:'Reset Content',206:'Partial Content',207:'Multi-Status',300:'Multiple Choices',301:'Moved Permanently',302:'Moved Temporarily',303:'See Other',304:'Not Modified',305:'Use Proxy',307:'Temporary Redirect',400:'Bad Request',401:'Unauthorized',402:'Payment Required',403:'Forbidden',404:'Not Found',405:'Method Not Allowed',406:'Not Acceptable',407:'Proxy Authentication Required',408:'Request Time-out',409:'Conflict',410:'Gone',411:'Length Required',412:'Precondition Failed',413:'Request Entity Too Large',414:'Request-URI Too Large',415:'Unsupported Media Type',416:'Requested Range Not Satisfiable',417:'Expectation Failed',418:'I\'m a teapot',422:'Unprocessable Entity',423:'Locked',424:'Failed Dependency',425:'Unordered Collection',426:'Upgrade Required',500:'Internal Server Error',501:'Not Implemented',502:'Bad Gateway',503:'Service Unavailable',504:'Gateway Time-out',505:'HTTP Version not supported',506:'Variant Also Negotiates',507:'Insufficient Storage',509:'Bandwidth Limit Exceeded',510:'Not Extended'};var Request=function(options){this.log=options.logger;this.cookieJar=options.cookieJar;this.encoding=options.encoding;this.logCurl=options.logCurl;processOptions(this,options||{});createRequest(this);};Object.defineProperties(Request.prototype,{url:{get:function(){if(!this.scheme){return null;}
+return sprintf("%s://%s:%s%s",this.scheme,this.host,this.port,(this.proxy?"/":this.path)+
+(this.query?("?"+this.query):""));},set:function(_url){_url=parseUri(_url);this.scheme=_url.protocol;this.host=_url.host;this.port=_url.port;this.path=_url.path;this.query=_url.query;return this;},enumerable:true},headers:{get:function(){return this.getHeaders();},enumerable:true},port:{get:function(){if(!this._port){switch(this.scheme){case"https":return this._port=443;case"http":default:return this._port=80;}}
+return this._port;},set:function(value){this._port=value;return this;},enumerable:true},method:{get:function(){return this._method=(this._method||"GET");},set:function(value){this._method=value;return this;},enumerable:true},query:{get:function(){return this._query;},set:function(value){var stringify=function(hash){var query="";for(var key in hash){query+=encodeURIComponent(key)+'='+encodeURIComponent(hash[key])+'&';}
+query=query.slice(0,-1);return query;}
+if(value){if(typeof value==='object'){value=stringify(value);}
+this._query=value;}else{this._query="";}
+return this;},enumerable:true},parameters:{get:function(){return QueryString.parse(this._query||"");},enumerable:true},body:{get:function(){return this._body;},set:function(value){this._body=new Content({data:value,type:this.getHeader("Content-Type")});this.setHeader("Content-Type",this.content.type);this.setHeader("Content-Length",this.content.length);return this;},enumerable:true},timeout:{get:function(){return this._timeout;},set:function(timeout){var request=this,milliseconds=0;;if(!timeout)return this;if(typeof timeout==="number"){milliseconds=timeout;}
+else{milliseconds=(timeout.milliseconds||0)+
+(1000*((timeout.seconds||0)+
+(60*((timeout.minutes||0)+
+(60*(timeout.hours||0))))));}
+this._timeout=milliseconds;return this;},enumerable:true}});Object.defineProperty(Request.prototype,"content",Object.getOwnPropertyDescriptor(Request.prototype,"body"));Request.prototype.inspect=function(){var request=this;var headers=this.format_headers();var summary=["<Shred Request> ",request.method.toUpperCase(),request.url].join(" ")
+return[summary,"- Headers:",headers].join("\n");};Request.prototype.format_headers=function(){var array=[]
+var headers=this._headers
+for(var key in headers){if(headers.hasOwnProperty(key)){var value=headers[key]
+array.push("\t"+key+": "+value);}}
+return array.join("\n");};Request.prototype.on=function(eventOrHash,listener){var emitter=this.emitter;if(arguments.length===1&&typeof(eventOrHash)==='function'){emitter.on('response',eventOrHash);}else if(arguments.length===1&&typeof(eventOrHash)==='object'){for(var key in eventOrHash){if(eventOrHash.hasOwnProperty(key)){emitter.on(key,eventOrHash[key]);}}}else{emitter.on(eventOrHash,listener);}
+return this;};HeaderMixins.gettersAndSetters(Request);var processOptions=function(request,options){request.log.debug("Processing request options ..");request.emitter=(new Emitter);request.agent=options.agent;if(options.on){for(var key in options.on){if(options.on.hasOwnProperty(key)){request.emitter.on(key,options.on[key]);}}}
+if(!options.url&&!options.host){request.emitter.emit("request_error",new Error("No url or url options (host, port, etc.)"));return;}
+if(options.url){if(options.proxy){request.url=options.proxy;request.path=options.url;}else{request.url=options.url;}}
+request.query=options.query||options.parameters||request.query;request.method=options.method;request.setHeader("user-agent",options.agent||"Shred");request.setHeaders(options.headers);if(request.cookieJar){var cookies=request.cookieJar.getCookies(CookieAccessInfo(request.host,request.path));if(cookies.length){var cookieString=request.getHeader('cookie')||'';for(var cookieIndex=0;cookieIndex<cookies.length;++cookieIndex){if(cookieString.length&&cookieString[cookieString.length-1]!=';')
+{cookieString+=';';}
+cookieString+=cookies[cookieIndex].name+'='+cookies[cookieIndex].value+';';}
+request.setHeader("cookie",cookieString);}}
+if(options.body||options.content){request.content=options.body||options.content;}
+request.timeout=options.timeout;};var createRequest=function(request){var timeout;request.log.debug("Creating request ..");request.log.debug(request);var reqParams={host:request.host,port:request.port,method:request.method,path:request.path+(request.query?'?'+request.query:""),headers:request.getHeaders(),scheme:request.scheme,agent:request.agent};if(request.logCurl){logCurl(request);}
+var http=request.scheme=="http"?HTTP:HTTPS;request._raw=http.request(reqParams,function(response){request.log.debug("Received response ..");clearTimeout(timeout);response=new Response(response,request,function(response){var emit=function(event){var emitter=request.emitter;var textStatus=STATUS_CODES[response.status]?STATUS_CODES[response.status].toLowerCase():null;if(emitter.listeners(response.status).length>0||emitter.listeners(textStatus).length>0){emitter.emit(response.status,response);emitter.emit(textStatus,response);}else{if(emitter.listeners(event).length>0){emitter.emit(event,response);}else if(!response.isRedirect){emitter.emit("response",response);}}};if(response.isRedirect){request.log.debug("Redirecting to "
++response.getHeader("Location"));request.url=response.getHeader("Location");emit("redirect");createRequest(request);}else if(response.isError){emit("error");}else{emit("success");}});});request._raw.on("error",function(error){request.emitter.emit("request_error",error);});request._raw.on("socket",function(socket){request.emitter.emit("socket",socket);});request._raw.on('socket',function(){request._raw.socket.on('timeout',function(){request._raw.abort();});});if(request.content){request.log.debug("Streaming body: '"+
+request.content.data.slice(0,59)+"' ... ");request._raw.write(request.content.data);}
+if(request.timeout){timeout=setTimeout(function(){request.log.debug("Timeout fired, aborting request ...");request._raw.abort();request.emitter.emit("timeout",request);},request.timeout);}
+request.log.debug("Sending request ...");request._raw.end();};var logCurl=function(req){var headers=req.getHeaders();var headerString="";for(var key in headers){headerString+='-H "'+key+": "+headers[key]+'" ';}
+var bodyString=""
+if(req.content){bodyString+="-d '"+req.content.body+"' ";}
+var query=req.query?'?'+req.query:"";console.log("curl "+"-X "+req.method.toUpperCase()+" "+
+req.scheme+"://"+req.host+":"+req.port+req.path+query+" "+
+headerString+
+bodyString);};module.exports=Request;});require.define("http",function(require,module,exports,__dirname,__filename){});require.define("https",function(require,module,exports,__dirname,__filename){});require.define("/shred/parseUri.js",function(require,module,exports,__dirname,__filename){function parseUri(str){var o=parseUri.options,m=o.parser[o.strictMode?"strict":"loose"].exec(str),uri={},i=14;while(i--)uri[o.key[i]]=m[i]||"";uri[o.q.name]={};uri[o.key[12]].replace(o.q.parser,function($0,$1,$2){if($1)uri[o.q.name][$1]=$2;});return uri;};parseUri.options={strictMode:false,key:["source","protocol","authority","userInfo","user","password","host","port","relative","path","directory","file","query","anchor"],q:{name:"queryKey",parser:/(?:^|&)([^&=]*)=?([^&]*)/g},parser:{strict:/^(?:([^:\/?#]+):)?(?:\/\/((?:(([^:@]*)(?::([^:@]*))?)?@)?([^:\/?#]*)(?::(\d*))?))?((((?:[^?#\/]*\/)*)([^?#]*))(?:\?([^#]*))?(?:#(.*))?)/,loose:/^(?:(?![^:@]+:[^:@\/]*@)([^:\/?#.]+):)?(?:\/\/)?((?:(([^:@]*)(?::([^:@]*))?)?@)?([^:\/?#]*)(?::(\d*))?)(((\/(?:[^?#](?![^?#\/]*\.[^?#\/.]+(?:[?#]|$)))*\/?)?([^?#\/]*))(?:\?([^#]*))?(?:#(.*))?)/}};module.exports=parseUri;});require.define("events",function(require,module,exports,__dirname,__filename){if(!process.EventEmitter)process.EventEmitter=function(){};var EventEmitter=exports.EventEmitter=process.EventEmitter;var isArray=typeof Array.isArray==='function'?Array.isArray:function(xs){return Object.toString.call(xs)==='[object Array]'};var defaultMaxListeners=10;EventEmitter.prototype.setMaxListeners=function(n){if(!this._events)this._events={};this._events.maxListeners=n;};EventEmitter.prototype.emit=function(type){if(type==='error'){if(!this._events||!this._events.error||(isArray(this._events.error)&&!this._events.error.length))
+{if(arguments[1]instanceof Error){throw arguments[1];}else{throw new Error("Uncaught, unspecified 'error' event.");}
+return false;}}
+if(!this._events)return false;var handler=this._events[type];if(!handler)return false;if(typeof handler=='function'){switch(arguments.length){case 1:handler.call(this);break;case 2:handler.call(this,arguments[1]);break;case 3:handler.call(this,arguments[1],arguments[2]);break;default:var args=Array.prototype.slice.call(arguments,1);handler.apply(this,args);}
+return true;}else if(isArray(handler)){var args=Array.prototype.slice.call(arguments,1);var listeners=handler.slice();for(var i=0,l=listeners.length;i<l;i++){listeners[i].apply(this,args);}
+return true;}else{return false;}};EventEmitter.prototype.addListener=function(type,listener){if('function'!==typeof listener){throw new Error('addListener only takes instances of Function');}
+if(!this._events)this._events={};this.emit('newListener',type,listener);if(!this._events[type]){this._events[type]=listener;}else if(isArray(this._events[type])){if(!this._events[type].warned){var m;if(this._events.maxListeners!==undefined){m=this._events.maxListeners;}else{m=defaultMaxListeners;}
+if(m&&m>0&&this._events[type].length>m){this._events[type].warned=true;console.error('(node) warning: possible EventEmitter memory '+'leak detected. %d listeners added. '+'Use emitter.setMaxListeners() to increase limit.',this._events[type].length);console.trace();}}
+this._events[type].push(listener);}else{this._events[type]=[this._events[type],listener];}
+return this;};EventEmitter.prototype.on=EventEmitter.prototype.addListener;EventEmitter.prototype.once=function(type,listener){var self=this;self.on(type,function g(){self.removeListener(type,g);listener.apply(this,arguments);});return this;};EventEmitter.prototype.removeListener=function(type,listener){if('function'!==typeof listener){throw new Error('removeListener only takes instances of Function');}
+if(!this._events||!this._events[type])return this;var list=this._events[type];if(isArray(list)){var i=list.indexOf(listener);if(i<0)return this;list.splice(i,1);if(list.length==0)
+delete this._events[type];}else if(this._events[type]===listener){delete this._events[type];}
+return this;};EventEmitter.prototype.removeAllListeners=function(type){if(type&&this._events&&this._events[type])this._events[type]=null;return this;};EventEmitter.prototype.listeners=function(type){if(!this._events)this._events={};if(!this._events[type])this._events[type]=[];if(!isArray(this._events[type])){this._events[type]=[this._events[type]];}
+return this._events[type];};});require.define("/node_modules/sprintf/package.json",function(require,module,exports,__dirname,__filename){module.exports={"main":"./lib/sprintf"}});require.define("/node_modules/sprintf/lib/sprintf.js",function(require,module,exports,__dirname,__filename){var sprintf=(function(){function get_type(variable){return Object.prototype.toString.call(variable).slice(8,-1).toLowerCase();}
+function str_repeat(input,multiplier){for(var output=[];multiplier>0;output[--multiplier]=input){}
+return output.join('');}
+var str_format=function(){if(!str_format.cache.hasOwnProperty(arguments[0])){str_format.cache[arguments[0]]=str_format.parse(arguments[0]);}
+return str_format.format.call(null,str_format.cache[arguments[0]],arguments);};str_format.format=function(parse_tree,argv){var cursor=1,tree_length=parse_tree.length,node_type='',arg,output=[],i,k,match,pad,pad_character,pad_length;for(i=0;i<tree_length;i++){node_type=get_type(parse_tree[i]);if(node_type==='string'){output.push(parse_tree[i]);}
+else if(node_type==='array'){match=parse_tree[i];if(match[2]){arg=argv[cursor];for(k=0;k<match[2].length;k++){if(!arg.hasOwnProperty(match[2][k])){throw(sprintf('[sprintf] property "%s" does not exist',match[2][k]));}
+arg=arg[match[2][k]];}}
+else if(match[1]){arg=argv[match[1]];}
+else{arg=argv[cursor++];}
+if(/[^s]/.test(match[8])&&(get_type(arg)!='number')){throw(sprintf('[sprintf] expecting number but found %s',get_type(arg)));}
+switch(match[8]){case'b':arg=arg.toString(2);break;case'c':arg=String.fromCharCode(arg);break;case'd':arg=parseInt(arg,10);break;case'e':arg=match[7]?arg.toExponential(match[7]):arg.toExponential();break;case'f':arg=match[7]?parseFloat(arg).toFixed(match[7]):parseFloat(arg);break;case'o':arg=arg.toString(8);break;case's':arg=((arg=String(arg))&&match[7]?arg.substring(0,match[7]):arg);break;case'u':arg=Math.abs(arg);break;case'x':arg=arg.toString(16);break;case'X':arg=arg.toString(16).toUpperCase();break;}
+arg=(/[def]/.test(match[8])&&match[3]&&arg>=0?'+'+arg:arg);pad_character=match[4]?match[4]=='0'?'0':match[4].charAt(1):' ';pad_length=match[6]-String(arg).length;pad=match[6]?str_repeat(pad_character,pad_length):'';output.push(match[5]?arg+pad:pad+arg);}}
+return output.join('');};str_format.cache={};str_format.parse=function(fmt){var _fmt=fmt,match=[],parse_tree=[],arg_names=0;while(_fmt){if((match=/^[^\x25]+/.exec(_fmt))!==null){parse_tree.push(match[0]);}
+else if((match=/^\x25{2}/.exec(_fmt))!==null){parse_tree.push('%');}
+else if((match=/^\x25(?:([1-9]\d*)\$|\(([^\)]+)\))?(\+)?(0|'[^$])?(-)?(\d+)?(?:\.(\d+))?([b-fosuxX])/.exec(_fmt))!==null){if(match[2]){arg_names|=1;var field_list=[],replacement_field=match[2],field_match=[];if((field_match=/^([a-z_][a-z_\d]*)/i.exec(replacement_field))!==null){field_list.push(field_match[1]);while((replacement_field=replacement_field.substring(field_match[0].length))!==''){if((field_match=/^\.([a-z_][a-z_\d]*)/i.exec(replacement_field))!==null){field_list.push(field_match[1]);}
+else if((field_match=/^\[(\d+)\]/.exec(replacement_field))!==null){field_list.push(field_match[1]);}
+else{throw('[sprintf] huh?');}}}
+else{throw('[sprintf] huh?');}
+match[2]=field_list;}
+else{arg_names|=2;}
+if(arg_names===3){throw('[sprintf] mixing positional and named placeholders is not (yet) supported');}
+parse_tree.push(match);}
+else{throw('[sprintf] huh?');}
+_fmt=_fmt.substring(match[0].length);}
+return parse_tree;};return str_format;})();var vsprintf=function(fmt,argv){argv.unshift(fmt);return sprintf.apply(null,argv);};exports.sprintf=sprintf;exports.vsprintf=vsprintf;});require.define("/shred/response.js",function(require,module,exports,__dirname,__filename){var Content=require("./content"),HeaderMixins=require("./mixins/headers"),CookieJarLib=require("cookiejar"),Cookie=CookieJarLib.Cookie;var zlib=null;try{zlib=require('zlib');}catch(e){console.warn("no zlib library");}
+var Iconv=null;try{Iconv=require('iconv-lite');}catch(e){console.warn("no iconv library");}
+var Response=function(raw,request,callback){var response=this;this._raw=raw;this._setHeaders.call(this,raw.headers);if(request.cookieJar&&this.getHeader('set-cookie')){var cookieStrings=this.getHeader('set-cookie');var cookieObjs=[],cookie;for(var i=0;i<cookieStrings.length;i++){var cookieString=cookieStrings[i];if(!cookieString){continue;}
+if(!cookieString.match(/domain\=/i)){cookieString+='; domain='+request.host;}
+if(!cookieString.match(/path\=/i)){cookieString+='; path='+request.path;}
+try{cookie=new Cookie(cookieString);if(cookie){cookieObjs.push(cookie);}}catch(e){console.warn("Tried to set bad cookie: "+cookieString);}}
+request.cookieJar.setCookies(cookieObjs);}
+this.request=request;this.client=request.client;this.log=this.request.log;var chunkBuffers=[];var dataLength=0;raw.on("data",function(chunk){chunkBuffers.push(chunk);dataLength+=chunk.length;});raw.on("end",function(){var body;if(typeof Buffer==='undefined'){body=chunkBuffers.join('');}else{body=new Buffer(dataLength);for(var i=0,pos=0;i<chunkBuffers.length;i++){chunkBuffers[i].copy(body,pos);pos+=chunkBuffers[i].length;}}
+var setBodyAndFinish=function(body){response._body=new Content({body:body,type:response.getHeader("Content-Type")});callback(response);}
+if(zlib&&response.getHeader("Content-Encoding")==='gzip'){zlib.gunzip(body,function(err,gunzippedBody){if(Iconv&&response.request.encoding){body=Iconv.fromEncoding(gunzippedBody,response.request.encoding);}else{body=gunzippedBody.toString();}
+setBodyAndFinish(body);})}
+else{if(response.request.encoding){body=Iconv.fromEncoding(body,response.request.encoding);}
+setBodyAndFinish(body);}});};Response.prototype={inspect:function(){var response=this;var headers=this.format_headers();var summary=["<Shred Response> ",response.status].join(" ")
+return[summary,"- Headers:",headers].join("\n");},format_headers:function(){var array=[]
+var headers=this._headers
+for(var key in headers){if(headers.hasOwnProperty(key)){var value=headers[key]
+array.push("\t"+key+": "+value);}}
+return array.join("\n");}};Object.defineProperties(Response.prototype,{status:{get:function(){return this._raw.statusCode;},enumerable:true},body:{get:function(){return this._body;}},content:{get:function(){return this.body;},enumerable:true},isRedirect:{get:function(){return(this.status>299&&this.status<400&&this.getHeader("Location"));},enumerable:true},isError:{get:function(){return(this.status===0||this.status>399)},enumerable:true}});HeaderMixins.getters(Response);HeaderMixins.privateSetters(Response);var getHeader=Response.prototype.getHeader;Response.prototype.getHeader=function(name){return(getHeader.call(this,name)||(typeof this._raw.getHeader==='function'&&this._raw.getHeader(name)));};module.exports=Response;});require.define("/shred/content.js",function(require,module,exports,__dirname,__filename){var Content=function(options){this.body=options.body;this.data=options.data;this.type=options.type;};Content.prototype={};Object.defineProperties(Content.prototype,{type:{get:function(){if(this._type){return this._type;}else{if(this._data){switch(typeof this._data){case"string":return"text/plain";case"object":return"application/json";}}}
+return"text/plain";},set:function(value){this._type=value;return this;},enumerable:true},data:{get:function(){if(this._body){return this.processor.parser(this._body);}else{return this._data;}},set:function(data){if(this._body&&data)Errors.setDataWithBody(this);this._data=data;return this;},enumerable:true},body:{get:function(){if(this._data){return this.processor.stringify(this._data);}else{return this.processor.stringify(this._body);}},set:function(body){if(this._data&&body)Errors.setBodyWithData(this);this._body=body;return this;},enumerable:true},processor:{get:function(){var processor=Content.processors[this.type];if(processor){return processor;}else{var main=this.type.split(";")[0];var parts=main.split(/\+|\//);for(var i=0,l=parts.length;i<l;i++){processor=Content.processors[parts[i]]}
+return processor||{parser:identity,stringify:toString};}},enumerable:true},length:{get:function(){if(typeof Buffer!=='undefined'){return Buffer.byteLength(this.body);}
+return this.body.length;}}});Content.processors={};Content.registerProcessor=function(types,processor){if(types.forEach){types.forEach(function(type){Content.processors[type]=processor;});}else{Content.processors[types]=processor;}};var identity=function(x){return x;},toString=function(x){return x.toString();}
+Content.registerProcessor(["text/html","text/plain","text"],{parser:identity,stringify:toString});Content.registerProcessor(["application/json; charset=utf-8","application/json","json"],{parser:function(string){return JSON.parse(string);},stringify:function(data){return JSON.stringify(data);}});var Errors={setDataWithBody:function(object){throw new Error("Attempt to set data attribute of a content object "+"when the body attributes was already set.");},setBodyWithData:function(object){throw new Error("Attempt to set body attribute of a content object "+"when the data attributes was already set.");}}
+module.exports=Content;});require.define("/shred/mixins/headers.js",function(require,module,exports,__dirname,__filename){var corsetCase=function(string){return string.toLowerCase().replace(/(^|-)(\w)/g,function(s){return s.toUpperCase();});};var initializeHeaders=function(object){return{};};var $H=function(object){return object._headers||(object._headers=initializeHeaders(object));};var getHeader=function(object,name){return $H(object)[corsetCase(name)];};var getHeaders=function(object,names){var keys=(names&&names.length>0)?names:Object.keys($H(object));var hash=keys.reduce(function(hash,key){hash[key]=getHeader(object,key);return hash;},{});Object.freeze(hash);return hash;};var setHeader=function(object,name,value){$H(object)[corsetCase(name)]=value;return object;};var setHeaders=function(object,hash){for(var key in hash){setHeader(object,key,hash[key]);};return this;};module.exports={getters:function(constructor){constructor.prototype.getHeader=function(name){return getHeader(this,name);};constructor.prototype.getHeaders=function(){return getHeaders(this,arguments);};},privateSetters:function(constructor){constructor.prototype._setHeader=function(key,value){return setHeader(this,key,value);};constructor.prototype._setHeaders=function(hash){return setHeaders(this,hash);};},setters:function(constructor){constructor.prototype.setHeader=function(key,value){return setHeader(this,key,value);};constructor.prototype.setHeaders=function(hash){return setHeaders(this,hash);};},gettersAndSetters:function(constructor){constructor.prototype.getHeader=function(name){return getHeader(this,name);};constructor.prototype.getHeaders=function(){return getHeaders(this,arguments);};constructor.prototype.setHeader=function(key,value){return setHeader(this,key,value);};constructor.prototype.setHeaders=function(hash){return setHeaders(this,hash);};},};});require.define("/node_modules/iconv-lite/package.json",function(require,module,exports,__dirname,__filename){module.exports={}});require.define("/node_modules/iconv-lite/index.js",function(require,module,exports,__dirname,__filename){var iconv=module.exports={toEncoding:function(str,encoding){return iconv.getCodec(encoding).toEncoding(str);},fromEncoding:function(buf,encoding){return iconv.getCodec(encoding).fromEncoding(buf);},defaultCharUnicode:'�',defaultCharSingleByte:'?',getCodec:function(encoding){var enc=encoding||"utf8";var codecOptions=undefined;while(1){if(getType(enc)==="String")
+enc=enc.replace(/[- ]/g,"").toLowerCase();var codec=iconv.encodings[enc];var type=getType(codec);if(type==="String"){codecOptions={originalEncoding:enc};enc=codec;}
+else if(type==="Object"&&codec.type!=undefined){codecOptions=codec;enc=codec.type;}
+else if(type==="Function")
+return codec(codecOptions);else
+throw new Error("Encoding not recognized: '"+encoding+"' (searched as: '"+enc+"')");}},encodings:{internal:function(options){return{toEncoding:function(str){return new Buffer(ensureString(str),options.originalEncoding);},fromEncoding:function(buf){return ensureBuffer(buf).toString(options.originalEncoding);}};},utf8:"internal",ucs2:"internal",binary:"internal",ascii:"internal",base64:"internal",singlebyte:function(options){if(!options.chars||(options.chars.length!==128&&options.chars.length!==256))
+throw new Error("Encoding '"+options.type+"' has incorrect 'chars' (must be of len 128 or 256)");if(options.chars.length===128)
+options.chars=asciiString+options.chars;if(!options.charsBuf){options.charsBuf=new Buffer(options.chars,'ucs2');}
+if(!options.revCharsBuf){options.revCharsBuf=new Buffer(65536);var defChar=iconv.defaultCharSingleByte.charCodeAt(0);for(var i=0;i<options.revCharsBuf.length;i++)
+options.revCharsBuf[i]=defChar;for(var i=0;i<options.chars.length;i++)
+options.revCharsBuf[options.chars.charCodeAt(i)]=i;}
+return{toEncoding:function(str){str=ensureString(str);var buf=new Buffer(str.length);var revCharsBuf=options.revCharsBuf;for(var i=0;i<str.length;i++)
+buf[i]=revCharsBuf[str.charCodeAt(i)];return buf;},fromEncoding:function(buf){buf=ensureBuffer(buf);var charsBuf=options.charsBuf;var newBuf=new Buffer(buf.length*2);var idx1=0,idx2=0;for(var i=0,_len=buf.length;i<_len;i++){idx1=buf[i]*2;idx2=i*2;newBuf[idx2]=charsBuf[idx1];newBuf[idx2+1]=charsBuf[idx1+1];}
+return newBuf.toString('ucs2');}};},table:function(options){var table=options.table,key,revCharsTable=options.revCharsTable;if(!table){throw new Error("Encoding '"+options.type+"' has incorect 'table' option");}
+if(!revCharsTable){revCharsTable=options.revCharsTable={};for(key in table){revCharsTable[table[key]]=parseInt(key);}}
+return{toEncoding:function(str){str=ensureString(str);var strLen=str.length;var bufLen=strLen;for(var i=0;i<strLen;i++)
+if(str.charCodeAt(i)>>7)
+bufLen++;var newBuf=new Buffer(bufLen),gbkcode,unicode,defaultChar=revCharsTable[iconv.defaultCharUnicode.charCodeAt(0)];for(var i=0,j=0;i<strLen;i++){unicode=str.charCodeAt(i);if(unicode>>7){gbkcode=revCharsTable[unicode]||defaultChar;newBuf[j++]=gbkcode>>8;newBuf[j++]=gbkcode&0xFF;}else{newBuf[j++]=unicode;}}
+return newBuf;},fromEncoding:function(buf){buf=ensureBuffer(buf);var bufLen=buf.length,strLen=0;for(var i=0;i<bufLen;i++){strLen++;if(buf[i]&0x80)
+i++;}
+var newBuf=new Buffer(strLen*2),unicode,gbkcode,defaultChar=iconv.defaultCharUnicode.charCodeAt(0);for(var i=0,j=0;i<bufLen;i++,j+=2){gbkcode=buf[i];if(gbkcode&0x80){gbkcode=(gbkcode<<8)+buf[++i];unicode=table[gbkcode]||defaultChar;}else{unicode=gbkcode;}
+newBuf[j]=unicode&0xFF;newBuf[j+1]=unicode>>8;}
+return newBuf.toString('ucs2');}}}}};iconv.encode=iconv.toEncoding;iconv.decode=iconv.fromEncoding;var encodingsDir=__dirname+"/encodings/",fs=require('fs');fs.readdirSync(encodingsDir).forEach(function(file){if(fs.statSync(encodingsDir+file).isDirectory())return;var encodings=require(encodingsDir+file)
+for(var key in encodings)
+iconv.encodings[key]=encodings[key]});var asciiString='\x00\x01\x02\x03\x04\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f'+' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~\x7f';var ensureBuffer=function(buf){buf=buf||new Buffer(0);return(buf instanceof Buffer)?buf:new Buffer(buf.toString(),"utf8");}
+var ensureString=function(str){str=str||"";return(str instanceof String)?str:str.toString((str instanceof Buffer)?'utf8':undefined);}
+var getType=function(obj){return Object.prototype.toString.call(obj).slice(8,-1);}});require.define("/node_modules/http-browserify/package.json",function(require,module,exports,__dirname,__filename){module.exports={"main":"index.js","browserify":"browser.js"}});require.define("/node_modules/http-browserify/browser.js",function(require,module,exports,__dirname,__filename){var http=module.exports;var EventEmitter=require('events').EventEmitter;var Request=require('./lib/request');http.request=function(params,cb){if(!params)params={};if(!params.host)params.host=window.location.host.split(':')[0];if(!params.port)params.port=window.location.port;var req=new Request(new xhrHttp,params);if(cb)req.on('response',cb);return req;};http.get=function(params,cb){params.method='GET';var req=http.request(params,cb);req.end();return req;};var xhrHttp=(function(){if(typeof window==='undefined'){throw new Error('no window object present');}
+else if(window.XMLHttpRequest){return window.XMLHttpRequest;}
+else if(window.ActiveXObject){var axs=['Msxml2.XMLHTTP.6.0','Msxml2.XMLHTTP.3.0','Microsoft.XMLHTTP'];for(var i=0;i<axs.length;i++){try{var ax=new(window.ActiveXObject)(axs[i]);return function(){if(ax){var ax_=ax;ax=null;return ax_;}
+else{return new(window.ActiveXObject)(axs[i]);}};}
+catch(e){}}
+throw new Error('ajax not supported in this browser')}
+else{throw new Error('ajax not supported in this browser');}})();http.STATUS_CODES={100:'Continue',101:'Switching Protocols',102:'Processing',200:'OK',201:'Created',202:'Accepted',203:'Non-Authoritative Information',204:'No Content',205:'Reset Content',206:'Partial Content',207:'Multi-Status',300:'Multiple Choices',301:'Moved Permanently',302:'Moved Temporarily',303:'See Other',304:'Not Modified',305:'Use Proxy',307:'Temporary Redirect',400:'Bad Request',401:'Unauthorized',402:'Payment Required',403:'Forbidden',404:'Not Found',405:'Method Not Allowed',406:'Not Acceptable',407:'Proxy Authentication Required',408:'Request Time-out',409:'Conflict',410:'Gone',411:'Length Required',412:'Precondition Failed',413:'Request Entity Too Large',414:'Request-URI Too Large',415:'Unsupported Media Type',416:'Requested Range Not Satisfiable',417:'Expectation Failed',418:'I\'m a teapot',422:'Unprocessable Entity',423:'Locked',424:'Failed Dependency',425:'Unordered Collection',426:'Upgrade Required',500:'Internal Server Error',501:'Not Implemented',502:'Bad Gateway',503:'Service Unavailable',504:'Gateway Time-out',505:'HTTP Version not supported',506:'Variant Also Negotiates',507:'Insufficient Storage',509:'Bandwidth Limit Exceeded',510:'Not Extended'};});require.define("/node_modules/http-browserify/lib/request.js",function(require,module,exports,__dirname,__filename){var EventEmitter=require('events').EventEmitter;var Response=require('./response');var isSafeHeader=require('./isSafeHeader');var Request=module.exports=function(xhr,params){var self=this;self.xhr=xhr;self.body='';var uri=params.host+':'+params.port+(params.path||'/');xhr.open(params.method||'GET',(params.scheme||'http')+'://'+uri,true);if(params.headers){Object.keys(params.headers).forEach(function(key){if(!isSafeHeader(key))return;var value=params.headers[key];if(Array.isArray(value)){value.forEach(function(v){xhr.setRequestHeader(key,v);});}
+else xhr.setRequestHeader(key,value)});}
+var res=new Response(xhr);res.on('ready',function(){self.emit('response',res);});xhr.onreadystatechange=function(){res.handle(xhr);};};Request.prototype=new EventEmitter;Request.prototype.setHeader=function(key,value){if((Array.isArray&&Array.isArray(value))||value instanceof Array){for(var i=0;i<value.length;i++){this.xhr.setRequestHeader(key,value[i]);}}
+else{this.xhr.setRequestHeader(key,value);}};Request.prototype.write=function(s){this.body+=s;};Request.prototype.end=function(s){if(s!==undefined)this.write(s);this.xhr.send(this.body);};});require.define("/node_modules/http-browserify/lib/response.js",function(require,module,exports,__dirname,__filename){var EventEmitter=require('events').EventEmitter;var isSafeHeader=require('./isSafeHeader');var Response=module.exports=function(xhr){this.xhr=xhr;this.offset=0;};Response.prototype=new EventEmitter;var capable={streaming:true,status2:true};function parseHeaders(xhr){var lines=xhr.getAllResponseHeaders().split(/\r?\n/);var headers={};for(var i=0;i<lines.length;i++){var line=lines[i];if(line==='')continue;var m=line.match(/^([^:]+):\s*(.*)/);if(m){var key=m[1].toLowerCase(),value=m[2];if(headers[key]!==undefined){if((Array.isArray&&Array.isArray(headers[key]))||headers[key]instanceof Array){headers[key].push(value);}
+else{headers[key]=[headers[key],value];}}
+else{headers[key]=value;}}
+else{headers[line]=true;}}
+return headers;}
+Response.prototype.getHeader=function(key){var header=this.headers?this.headers[key.toLowerCase()]:null;if(header)return header;if(isSafeHeader(key)){return this.xhr.getResponseHeader(key);}
+return null;};Response.prototype.handle=function(){var xhr=this.xhr;if(xhr.readyState===2&&capable.status2){try{this.statusCode=xhr.status;this.headers=parseHeaders(xhr);}
+catch(err){capable.status2=false;}
+if(capable.status2){this.emit('ready');}}
+else if(capable.streaming&&xhr.readyState===3){try{if(!this.statusCode){this.statusCode=xhr.status;this.headers=parseHeaders(xhr);this.emit('ready');}}
+catch(err){}
+try{this.write();}
+catch(err){capable.streaming=false;}}
+else if(xhr.readyState===4){if(!this.statusCode){this.statusCode=xhr.status;this.emit('ready');}
+this.write();if(xhr.error){this.emit('error',xhr.responseText);}
+else this.emit('end');}};Response.prototype.write=function(){var xhr=this.xhr;if(xhr.responseText.length>this.offset){this.emit('data',xhr.responseText.slice(this.offset));this.offset=xhr.responseText.length;}};});require.define("/node_modules/http-browserify/lib/isSafeHeader.js",function(require,module,exports,__dirname,__filename){var unsafeHeaders=["accept-charset","accept-encoding","access-control-request-headers","access-control-request-method","connection","content-length","cookie","cookie2","content-transfer-encoding","date","expect","host","keep-alive","origin","referer","set-cookie","te","trailer","transfer-encoding","upgrade","user-agent","via"];module.exports=function(headerName){if(!headerName)return false;return(unsafeHeaders.indexOf(headerName.toLowerCase())===-1)};});require.alias("http-browserify","/node_modules/http");require.alias("http-browserify","/node_modules/https");;
+/*! jQuery v@1.8.0 jquery.com | jquery.org/license */(function(a,b){function G(a){var b=F[a]={};return p.each(a.split(s),function(a,c){b[c]=!0}),b}function J(a,c,d){if(d===b&&a.nodeType===1){var e="data-"+c.replace(I,"-$1").toLowerCase();d=a.getAttribute(e);if(typeof d=="string"){try{d=d==="true"?!0:d==="false"?!1:d==="null"?null:+d+""===d?+d:H.test(d)?p.parseJSON(d):d}catch(f){}p.data(a,c,d)}else d=b}return d}function K(a){var b;for(b in a){if(b==="data"&&p.isEmptyObject(a[b]))continue;if(b!=="toJSON")return!1}return!0}function ba(){return!1}function bb(){return!0}function bh(a){return!a||!a.parentNode||a.parentNode.nodeType===11}function bi(a,b){do a=a[b];while(a&&a.nodeType!==1);return a}function bj(a,b,c){b=b||0;if(p.isFunction(b))return p.grep(a,function(a,d){var e=!!b.call(a,d,a);return e===c});if(b.nodeType)return p.grep(a,function(a,d){return a===b===c});if(typeof b=="string"){var d=p.grep(a,function(a){return a.nodeType===1});if(be.test(b))return p.filter(b,d,!c);b=p.filter(b,d)}return p.grep(a,function(a,d){return p.inArray(a,b)>=0===c})}function bk(a){var b=bl.split("|"),c=a.createDocumentFragment();if(c.createElement)while(b.length)c.createElement(b.pop());return c}function bC(a,b){return a.getElementsByTagName(b)[0]||a.appendChild(a.ownerDocument.createElement(b))}function bD(a,b){if(b.nodeType!==1||!p.hasData(a))return;var c,d,e,f=p._data(a),g=p._data(b,f),h=f.events;if(h){delete g.handle,g.events={};for(c in h)for(d=0,e=h[c].length;d<e;d++)p.event.add(b,c,h[c][d])}g.data&&(g.data=p.extend({},g.data))}function bE(a,b){var c;if(b.nodeType!==1)return;b.clearAttributes&&b.clearAttributes(),b.mergeAttributes&&b.mergeAttributes(a),c=b.nodeName.toLowerCase(),c==="object"?(b.parentNode&&(b.outerHTML=a.outerHTML),p.support.html5Clone&&a.innerHTML&&!p.trim(b.innerHTML)&&(b.innerHTML=a.innerHTML)):c==="input"&&bv.test(a.type)?(b.defaultChecked=b.checked=a.checked,b.value!==a.value&&(b.value=a.value)):c==="option"?b.selected=a.defaultSelected:c==="input"||c==="textarea"?b.defaultValue=a.defaultValue:c==="script"&&b.text!==a.text&&(b.text=a.text),b.removeAttribute(p.expando)}function bF(a){return typeof a.getElementsByTagName!="undefined"?a.getElementsByTagName("*"):typeof a.querySelectorAll!="undefined"?a.querySelectorAll("*"):[]}function bG(a){bv.test(a.type)&&(a.defaultChecked=a.checked)}function bX(a,b){if(b in a)return b;var c=b.charAt(0).toUpperCase()+b.slice(1),d=b,e=bV.length;while(e--){b=bV[e]+c;if(b in a)return b}return d}function bY(a,b){return a=b||a,p.css(a,"display")==="none"||!p.contains(a.ownerDocument,a)}function bZ(a,b){var c,d,e=[],f=0,g=a.length;for(;f<g;f++){c=a[f];if(!c.style)continue;e[f]=p._data(c,"olddisplay"),b?(!e[f]&&c.style.display==="none"&&(c.style.display=""),c.style.display===""&&bY(c)&&(e[f]=p._data(c,"olddisplay",cb(c.nodeName)))):(d=bH(c,"display"),!e[f]&&d!=="none"&&p._data(c,"olddisplay",d))}for(f=0;f<g;f++){c=a[f];if(!c.style)continue;if(!b||c.style.display==="none"||c.style.display==="")c.style.display=b?e[f]||"":"none"}return a}function b$(a,b,c){var d=bO.exec(b);return d?Math.max(0,d[1]-(c||0))+(d[2]||"px"):b}function b_(a,b,c,d){var e=c===(d?"border":"content")?4:b==="width"?1:0,f=0;for(;e<4;e+=2)c==="margin"&&(f+=p.css(a,c+bU[e],!0)),d?(c==="content"&&(f-=parseFloat(bH(a,"padding"+bU[e]))||0),c!=="margin"&&(f-=parseFloat(bH(a,"border"+bU[e]+"Width"))||0)):(f+=parseFloat(bH(a,"padding"+bU[e]))||0,c!=="padding"&&(f+=parseFloat(bH(a,"border"+bU[e]+"Width"))||0));return f}function ca(a,b,c){var d=b==="width"?a.offsetWidth:a.offsetHeight,e=!0,f=p.support.boxSizing&&p.css(a,"boxSizing")==="border-box";if(d<=0){d=bH(a,b);if(d<0||d==null)d=a.style[b];if(bP.test(d))return d;e=f&&(p.support.boxSizingReliable||d===a.style[b]),d=parseFloat(d)||0}return d+b_(a,b,c||(f?"border":"content"),e)+"px"}function cb(a){if(bR[a])return bR[a];var b=p("<"+a+">").appendTo(e.body),c=b.css("display");b.remove();if(c==="none"||c===""){bI=e.body.appendChild(bI||p.extend(e.createElement("iframe"),{frameBorder:0,width:0,height:0}));if(!bJ||!bI.createElement)bJ=(bI.contentWindow||bI.contentDocument).document,bJ.write("<!doctype html><html><body>"),bJ.close();b=bJ.body.appendChild(bJ.createElement(a)),c=bH(b,"display"),e.body.removeChild(bI)}return bR[a]=c,c}function ch(a,b,c,d){var e;if(p.isArray(b))p.each(b,function(b,e){c||cd.test(a)?d(a,e):ch(a+"["+(typeof e=="object"?b:"")+"]",e,c,d)});else if(!c&&p.type(b)==="object")for(e in b)ch(a+"["+e+"]",b[e],c,d);else d(a,b)}function cy(a){return function(b,c){typeof b!="string"&&(c=b,b="*");var d,e,f,g=b.toLowerCase().split(s),h=0,i=g.length;if(p.isFunction(c))for(;h<i;h++)d=g[h],f=/^\+/.test(d),f&&(d=d.substr(1)||"*"),e=a[d]=a[d]||[],e[f?"unshift":"push"](c)}}function cz(a,c,d,e,f,g){f=f||c.dataTypes[0],g=g||{},g[f]=!0;var h,i=a[f],j=0,k=i?i.length:0,l=a===cu;for(;j<k&&(l||!h);j++)h=i[j](c,d,e),typeof h=="string"&&(!l||g[h]?h=b:(c.dataTypes.unshift(h),h=cz(a,c,d,e,h,g)));return(l||!h)&&!g["*"]&&(h=cz(a,c,d,e,"*",g)),h}function cA(a,c){var d,e,f=p.ajaxSettings.flatOptions||{};for(d in c)c[d]!==b&&((f[d]?a:e||(e={}))[d]=c[d]);e&&p.extend(!0,a,e)}function cB(a,c,d){var e,f,g,h,i=a.contents,j=a.dataTypes,k=a.responseFields;for(f in k)f in d&&(c[k[f]]=d[f]);while(j[0]==="*")j.shift(),e===b&&(e=a.mimeType||c.getResponseHeader("content-type"));if(e)for(f in i)if(i[f]&&i[f].test(e)){j.unshift(f);break}if(j[0]in d)g=j[0];else{for(f in d){if(!j[0]||a.converters[f+" "+j[0]]){g=f;break}h||(h=f)}g=g||h}if(g)return g!==j[0]&&j.unshift(g),d[g]}function cC(a,b){var c,d,e,f,g=a.dataTypes.slice(),h=g[0],i={},j=0;a.dataFilter&&(b=a.dataFilter(b,a.dataType));if(g[1])for(c in a.converters)i[c.toLowerCase()]=a.converters[c];for(;e=g[++j];)if(e!=="*"){if(h!=="*"&&h!==e){c=i[h+" "+e]||i["* "+e];if(!c)for(d in i){f=d.split(" ");if(f[1]===e){c=i[h+" "+f[0]]||i["* "+f[0]];if(c){c===!0?c=i[d]:i[d]!==!0&&(e=f[0],g.splice(j--,0,e));break}}}if(c!==!0)if(c&&a["throws"])b=c(b);else try{b=c(b)}catch(k){return{state:"parsererror",error:c?k:"No conversion from "+h+" to "+e}}}h=e}return{state:"success",data:b}}function cK(){try{return new a.XMLHttpRequest}catch(b){}}function cL(){try{return new a.ActiveXObject("Microsoft.XMLHTTP")}catch(b){}}function cT(){return setTimeout(function(){cM=b},0),cM=p.now()}function cU(a,b){p.each(b,function(b,c){var d=(cS[b]||[]).concat(cS["*"]),e=0,f=d.length;for(;e<f;e++)if(d[e].call(a,b,c))return})}function cV(a,b,c){var d,e=0,f=0,g=cR.length,h=p.Deferred().always(function(){delete i.elem}),i=function(){var b=cM||cT(),c=Math.max(0,j.startTime+j.duration-b),d=1-(c/j.duration||0),e=0,f=j.tweens.length;for(;e<f;e++)j.tweens[e].run(d);return h.notifyWith(a,[j,d,c]),d<1&&f?c:(h.resolveWith(a,[j]),!1)},j=h.promise({elem:a,props:p.extend({},b),opts:p.extend(!0,{specialEasing:{}},c),originalProperties:b,originalOptions:c,startTime:cM||cT(),duration:c.duration,tweens:[],createTween:function(b,c,d){var e=p.Tween(a,j.opts,b,c,j.opts.specialEasing[b]||j.opts.easing);return j.tweens.push(e),e},stop:function(b){var c=0,d=b?j.tweens.length:0;for(;c<d;c++)j.tweens[c].run(1);return b?h.resolveWith(a,[j,b]):h.rejectWith(a,[j,b]),this}}),k=j.props;cW(k,j.opts.specialEasing);for(;e<g;e++){d=cR[e].call(j,a,k,j.opts);if(d)return d}return cU(j,k),p.isFunction(j.opts.start)&&j.opts.start.call(a,j),p.fx.timer(p.extend(i,{anim:j,queue:j.opts.queue,elem:a})),j.progress(j.opts.progress).done(j.opts.done,j.opts.complete).fail(j.opts.fail).always(j.opts.always)}function cW(a,b){var c,d,e,f,g;for(c in a){d=p.camelCase(c),e=b[d],f=a[c],p.isArray(f)&&(e=f[1],f=a[c]=f[0]),c!==d&&(a[d]=f,delete a[c]),g=p.cssHooks[d];if(g&&"expand"in g){f=g.expand(f),delete a[d];for(c in f)c in a||(a[c]=f[c],b[c]=e)}else b[d]=e}}function cX(a,b,c){var d,e,f,g,h,i,j,k,l=this,m=a.style,n={},o=[],q=a.nodeType&&bY(a);c.queue||(j=p._queueHooks(a,"fx"),j.unqueued==null&&(j.unqueued=0,k=j.empty.fire,j.empty.fire=function(){j.unqueued||k()}),j.unqueued++,l.always(function(){l.always(function(){j.unqueued--,p.queue(a,"fx").length||j.empty.fire()})})),a.nodeType===1&&("height"in b||"width"in b)&&(c.overflow=[m.overflow,m.overflowX,m.overflowY],p.css(a,"display")==="inline"&&p.css(a,"float")==="none"&&(!p.support.inlineBlockNeedsLayout||cb(a.nodeName)==="inline"?m.display="inline-block":m.zoom=1)),c.overflow&&(m.overflow="hidden",p.support.shrinkWrapBlocks||l.done(function(){m.overflow=c.overflow[0],m.overflowX=c.overflow[1],m.overflowY=c.overflow[2]}));for(d in b){f=b[d];if(cO.exec(f)){delete b[d];if(f===(q?"hide":"show"))continue;o.push(d)}}g=o.length;if(g){h=p._data(a,"fxshow")||p._data(a,"fxshow",{}),q?p(a).show():l.done(function(){p(a).hide()}),l.done(function(){var b;p.removeData(a,"fxshow",!0);for(b in n)p.style(a,b,n[b])});for(d=0;d<g;d++)e=o[d],i=l.createTween(e,q?h[e]:0),n[e]=h[e]||p.style(a,e),e in h||(h[e]=i.start,q&&(i.end=i.start,i.start=e==="width"||e==="height"?1:0))}}function cY(a,b,c,d,e){return new cY.prototype.init(a,b,c,d,e)}function cZ(a,b){var c,d={height:a},e=0;for(;e<4;e+=2-b)c=bU[e],d["margin"+c]=d["padding"+c]=a;return b&&(d.opacity=d.width=a),d}function c_(a){return p.isWindow(a)?a:a.nodeType===9?a.defaultView||a.parentWindow:!1}var c,d,e=a.document,f=a.location,g=a.navigator,h=a.jQuery,i=a.$,j=Array.prototype.push,k=Array.prototype.slice,l=Array.prototype.indexOf,m=Object.prototype.toString,n=Object.prototype.hasOwnProperty,o=String.prototype.trim,p=function(a,b){return new p.fn.init(a,b,c)},q=/[\-+]?(?:\d*\.|)\d+(?:[eE][\-+]?\d+|)/.source,r=/\S/,s=/\s+/,t=r.test(" ")?/^[\s\xA0]+|[\s\xA0]+$/g:/^\s+|\s+$/g,u=/^(?:[^#<]*(<[\w\W]+>)[^>]*$|#([\w\-]*)$)/,v=/^<(\w+)\s*\/?>(?:<\/\1>|)$/,w=/^[\],:{}\s]*$/,x=/(?:^|:|,)(?:\s*\[)+/g,y=/\\(?:["\\\/bfnrt]|u[\da-fA-F]{4})/g,z=/"[^"\\\r\n]*"|true|false|null|-?(?:\d\d*\.|)\d+(?:[eE][\-+]?\d+|)/g,A=/^-ms-/,B=/-([\da-z])/gi,C=function(a,b){return(b+"").toUpperCase()},D=function(){e.addEventListener?(e.removeEventListener("DOMContentLoaded",D,!1),p.ready()):e.readyState==="complete"&&(e.detachEvent("onreadystatechange",D),p.ready())},E={};p.fn=p.prototype={constructor:p,init:function(a,c,d){var f,g,h,i;if(!a)return this;if(a.nodeType)return this.context=this[0]=a,this.length=1,this;if(typeof a=="string"){a.charAt(0)==="<"&&a.charAt(a.length-1)===">"&&a.length>=3?f=[null,a,null]:f=u.exec(a);if(f&&(f[1]||!c)){if(f[1])return c=c instanceof p?c[0]:c,i=c&&c.nodeType?c.ownerDocument||c:e,a=p.parseHTML(f[1],i,!0),v.test(f[1])&&p.isPlainObject(c)&&this.attr.call(a,c,!0),p.merge(this,a);g=e.getElementById(f[2]);if(g&&g.parentNode){if(g.id!==f[2])return d.find(a);this.length=1,this[0]=g}return this.context=e,this.selector=a,this}return!c||c.jquery?(c||d).find(a):this.constructor(c).find(a)}return p.isFunction(a)?d.ready(a):(a.selector!==b&&(this.selector=a.selector,this.context=a.context),p.makeArray(a,this))},selector:"",jquery:"1.8.0",length:0,size:function(){return this.length},toArray:function(){return k.call(this)},get:function(a){return a==null?this.toArray():a<0?this[this.length+a]:this[a]},pushStack:function(a,b,c){var d=p.merge(this.constructor(),a);return d.prevObject=this,d.context=this.context,b==="find"?d.selector=this.selector+(this.selector?" ":"")+c:b&&(d.selector=this.selector+"."+b+"("+c+")"),d},each:function(a,b){return p.each(this,a,b)},ready:function(a){return p.ready.promise().done(a),this},eq:function(a){return a=+a,a===-1?this.slice(a):this.slice(a,a+1)},first:function(){return this.eq(0)},last:function(){return this.eq(-1)},slice:function(){return this.pushStack(k.apply(this,arguments),"slice",k.call(arguments).join(","))},map:function(a){return this.pushStack(p.map(this,function(b,c){return a.call(b,c,b)}))},end:function(){return this.prevObject||this.constructor(null)},push:j,sort:[].sort,splice:[].splice},p.fn.init.prototype=p.fn,p.extend=p.fn.extend=function(){var a,c,d,e,f,g,h=arguments[0]||{},i=1,j=arguments.length,k=!1;typeof h=="boolean"&&(k=h,h=arguments[1]||{},i=2),typeof h!="object"&&!p.isFunction(h)&&(h={}),j===i&&(h=this,--i);for(;i<j;i++)if((a=arguments[i])!=null)for(c in a){d=h[c],e=a[c];if(h===e)continue;k&&e&&(p.isPlainObject(e)||(f=p.isArray(e)))?(f?(f=!1,g=d&&p.isArray(d)?d:[]):g=d&&p.isPlainObject(d)?d:{},h[c]=p.extend(k,g,e)):e!==b&&(h[c]=e)}return h},p.extend({noConflict:function(b){return a.$===p&&(a.$=i),b&&a.jQuery===p&&(a.jQuery=h),p},isReady:!1,readyWait:1,holdReady:function(a){a?p.readyWait++:p.ready(!0)},ready:function(a){if(a===!0?--p.readyWait:p.isReady)return;if(!e.body)return setTimeout(p.ready,1);p.isReady=!0;if(a!==!0&&--p.readyWait>0)return;d.resolveWith(e,[p]),p.fn.trigger&&p(e).trigger("ready").off("ready")},isFunction:function(a){return p.type(a)==="function"},isArray:Array.isArray||function(a){return p.type(a)==="array"},isWindow:function(a){return a!=null&&a==a.window},isNumeric:function(a){return!isNaN(parseFloat(a))&&isFinite(a)},type:function(a){return a==null?String(a):E[m.call(a)]||"object"},isPlainObject:function(a){if(!a||p.type(a)!=="object"||a.nodeType||p.isWindow(a))return!1;try{if(a.constructor&&!n.call(a,"constructor")&&!n.call(a.constructor.prototype,"isPrototypeOf"))return!1}catch(c){return!1}var d;for(d in a);return d===b||n.call(a,d)},isEmptyObject:function(a){var b;for(b in a)return!1;return!0},error:function(a){throw new Error(a)},parseHTML:function(a,b,c){var d;return!a||typeof a!="string"?null:(typeof b=="boolean"&&(c=b,b=0),b=b||e,(d=v.exec(a))?[b.createElement(d[1])]:(d=p.buildFragment([a],b,c?null:[]),p.merge([],(d.cacheable?p.clone(d.fragment):d.fragment).childNodes)))},parseJSON:function(b){if(!b||typeof b!="string")return null;b=p.trim(b);if(a.JSON&&a.JSON.parse)return a.JSON.parse(b);if(w.test(b.replace(y,"@").replace(z,"]").replace(x,"")))return(new Function("return "+b))();p.error("Invalid JSON: "+b)},parseXML:function(c){var d,e;if(!c||typeof c!="string")return null;try{a.DOMParser?(e=new DOMParser,d=e.parseFromString(c,"text/xml")):(d=new ActiveXObject("Microsoft.XMLDOM"),d.async="false",d.loadXML(c))}catch(f){d=b}return(!d||!d.documentElement||d.getElementsByTagName("parsererror").length)&&p.error("Invalid XML: "+c),d},noop:function(){},globalEval:function(b){b&&r.test(b)&&(a.execScript||function(b){a.eval.call(a,b)})(b)},camelCase:function(a){return a.replace(A,"ms-").replace(B,C)},nodeName:function(a,b){return a.nodeName&&a.nodeName.toUpperCase()===b.toUpperCase()},each:function(a,c,d){var e,f=0,g=a.length,h=g===b||p.isFunction(a);if(d){if(h){for(e in a)if(c.apply(a[e],d)===!1)break}else for(;f<g;)if(c.apply(a[f++],d)===!1)break}else if(h){for(e in a)if(c.call(a[e],e,a[e])===!1)break}else for(;f<g;)if(c.call(a[f],f,a[f++])===!1)break;return a},trim:o?function(a){return a==null?"":o.call(a)}:function(a){return a==null?"":a.toString().replace(t,"")},makeArray:function(a,b){var c,d=b||[];return a!=null&&(c=p.type(a),a.length==null||c==="string"||c==="function"||c==="regexp"||p.isWindow(a)?j.call(d,a):p.merge(d,a)),d},inArray:function(a,b,c){var d;if(b){if(l)return l.call(b,a,c);d=b.length,c=c?c<0?Math.max(0,d+c):c:0;for(;c<d;c++)if(c in b&&b[c]===a)return c}return-1},merge:function(a,c){var d=c.length,e=a.length,f=0;if(typeof d=="number")for(;f<d;f++)a[e++]=c[f];else while(c[f]!==b)a[e++]=c[f++];return a.length=e,a},grep:function(a,b,c){var d,e=[],f=0,g=a.length;c=!!c;for(;f<g;f++)d=!!b(a[f],f),c!==d&&e.push(a[f]);return e},map:function(a,c,d){var e,f,g=[],h=0,i=a.length,j=a instanceof p||i!==b&&typeof i=="number"&&(i>0&&a[0]&&a[i-1]||i===0||p.isArray(a));if(j)for(;h<i;h++)e=c(a[h],h,d),e!=null&&(g[g.length]=e);else for(f in a)e=c(a[f],f,d),e!=null&&(g[g.length]=e);return g.concat.apply([],g)},guid:1,proxy:function(a,c){var d,e,f;return typeof c=="string"&&(d=a[c],c=a,a=d),p.isFunction(a)?(e=k.call(arguments,2),f=function(){return a.apply(c,e.concat(k.call(arguments)))},f.guid=a.guid=a.guid||f.guid||p.guid++,f):b},access:function(a,c,d,e,f,g,h){var i,j=d==null,k=0,l=a.length;if(d&&typeof d=="object"){for(k in d)p.access(a,c,k,d[k],1,g,e);f=1}else if(e!==b){i=h===b&&p.isFunction(e),j&&(i?(i=c,c=function(a,b,c){return i.call(p(a),c)}):(c.call(a,e),c=null));if(c)for(;k<l;k++)c(a[k],d,i?e.call(a[k],k,c(a[k],d)):e,h);f=1}return f?a:j?c.call(a):l?c(a[0],d):g},now:function(){return(new Date).getTime()}}),p.ready.promise=function(b){if(!d){d=p.Deferred();if(e.readyState==="complete"||e.readyState!=="loading"&&e.addEventListener)setTimeout(p.ready,1);else if(e.addEventListener)e.addEventListener("DOMContentLoaded",D,!1),a.addEventListener("load",p.ready,!1);else{e.attachEvent("onreadystatechange",D),a.attachEvent("onload",p.ready);var c=!1;try{c=a.frameElement==null&&e.documentElement}catch(f){}c&&c.doScroll&&function g(){if(!p.isReady){try{c.doScroll("left")}catch(a){return setTimeout(g,50)}p.ready()}}()}}return d.promise(b)},p.each("Boolean Number String Function Array Date RegExp Object".split(" "),function(a,b){E["[object "+b+"]"]=b.toLowerCase()}),c=p(e);var F={};p.Callbacks=function(a){a=typeof a=="string"?F[a]||G(a):p.extend({},a);var c,d,e,f,g,h,i=[],j=!a.once&&[],k=function(b){c=a.memory&&b,d=!0,h=f||0,f=0,g=i.length,e=!0;for(;i&&h<g;h++)if(i[h].apply(b[0],b[1])===!1&&a.stopOnFalse){c=!1;break}e=!1,i&&(j?j.length&&k(j.shift()):c?i=[]:l.disable())},l={add:function(){if(i){var b=i.length;(function d(b){p.each(b,function(b,c){p.isFunction(c)&&(!a.unique||!l.has(c))?i.push(c):c&&c.length&&d(c)})})(arguments),e?g=i.length:c&&(f=b,k(c))}return this},remove:function(){return i&&p.each(arguments,function(a,b){var c;while((c=p.inArray(b,i,c))>-1)i.splice(c,1),e&&(c<=g&&g--,c<=h&&h--)}),this},has:function(a){return p.inArray(a,i)>-1},empty:function(){return i=[],this},disable:function(){return i=j=c=b,this},disabled:function(){return!i},lock:function(){return j=b,c||l.disable(),this},locked:function(){return!j},fireWith:function(a,b){return b=b||[],b=[a,b.slice?b.slice():b],i&&(!d||j)&&(e?j.push(b):k(b)),this},fire:function(){return l.fireWith(this,arguments),this},fired:function(){return!!d}};return l},p.extend({Deferred:function(a){var b=[["resolve","done",p.Callbacks("once memory"),"resolved"],["reject","fail",p.Callbacks("once memory"),"rejected"],["notify","progress",p.Callbacks("memory")]],c="pending",d={state:function(){return c},always:function(){return e.done(arguments).fail(arguments),this},then:function(){var a=arguments;return p.Deferred(function(c){p.each(b,function(b,d){var f=d[0],g=a[b];e[d[1]](p.isFunction(g)?function(){var a=g.apply(this,arguments);a&&p.isFunction(a.promise)?a.promise().done(c.resolve).fail(c.reject).progress(c.notify):c[f+"With"](this===e?c:this,[a])}:c[f])}),a=null}).promise()},promise:function(a){return typeof a=="object"?p.extend(a,d):d}},e={};return d.pipe=d.then,p.each(b,function(a,f){var g=f[2],h=f[3];d[f[1]]=g.add,h&&g.add(function(){c=h},b[a^1][2].disable,b[2][2].lock),e[f[0]]=g.fire,e[f[0]+"With"]=g.fireWith}),d.promise(e),a&&a.call(e,e),e},when:function(a){var b=0,c=k.call(arguments),d=c.length,e=d!==1||a&&p.isFunction(a.promise)?d:0,f=e===1?a:p.Deferred(),g=function(a,b,c){return function(d){b[a]=this,c[a]=arguments.length>1?k.call(arguments):d,c===h?f.notifyWith(b,c):--e||f.resolveWith(b,c)}},h,i,j;if(d>1){h=new Array(d),i=new Array(d),j=new Array(d);for(;b<d;b++)c[b]&&p.isFunction(c[b].promise)?c[b].promise().done(g(b,j,c)).fail(f.reject).progress(g(b,i,h)):--e}return e||f.resolveWith(j,c),f.promise()}}),p.support=function(){var b,c,d,f,g,h,i,j,k,l,m,n=e.createElement("div");n.setAttribute("className","t"),n.innerHTML="  <link/><table></table><a href='/a'>a</a><input type='checkbox'/>",c=n.getElementsByTagName("*"),d=n.getElementsByTagName("a")[0],d.style.cssText="top:1px;float:left;opacity:.5";if(!c||!c.length||!d)return{};f=e.createElement("select"),g=f.appendChild(e.createElement("option")),h=n.getElementsByTagName("input")[0],b={leadingWhitespace:n.firstChild.nodeType===3,tbody:!n.getElementsByTagName("tbody").length,htmlSerialize:!!n.getElementsByTagName("link").length,style:/top/.test(d.getAttribute("style")),hrefNormalized:d.getAttribute("href")==="/a",opacity:/^0.5/.test(d.style.opacity),cssFloat:!!d.style.cssFloat,checkOn:h.value==="on",optSelected:g.selected,getSetAttribute:n.className!=="t",enctype:!!e.createElement("form").enctype,html5Clone:e.createElement("nav").cloneNode(!0).outerHTML!=="<:nav></:nav>",boxModel:e.compatMode==="CSS1Compat",submitBubbles:!0,changeBubbles:!0,focusinBubbles:!1,deleteExpando:!0,noCloneEvent:!0,inlineBlockNeedsLayout:!1,shrinkWrapBlocks:!1,reliableMarginRight:!0,boxSizingReliable:!0,pixelPosition:!1},h.checked=!0,b.noCloneChecked=h.cloneNode(!0).checked,f.disabled=!0,b.optDisabled=!g.disabled;try{delete n.test}catch(o){b.deleteExpando=!1}!n.addEventListener&&n.attachEvent&&n.fireEvent&&(n.attachEvent("onclick",m=function(){b.noCloneEvent=!1}),n.cloneNode(!0).fireEvent("onclick"),n.detachEvent("onclick",m)),h=e.createElement("input"),h.value="t",h.setAttribute("type","radio"),b.radioValue=h.value==="t",h.setAttribute("checked","checked"),h.setAttribute("name","t"),n.appendChild(h),i=e.createDocumentFragment(),i.appendChild(n.lastChild),b.checkClone=i.cloneNode(!0).cloneNode(!0).lastChild.checked,b.appendChecked=h.checked,i.removeChild(h),i.appendChild(n);if(n.attachEvent)for(k in{submit:!0,change:!0,focusin:!0})j="on"+k,l=j in n,l||(n.setAttribute(j,"return;"),l=typeof n[j]=="function"),b[k+"Bubbles"]=l;return p(function(){var c,d,f,g,h="padding:0;margin:0;border:0;display:block;overflow:hidden;",i=e.getElementsByTagName("body")[0];if(!i)return;c=e.createElement("div"),c.style.cssText="visibility:hidden;border:0;width:0;height:0;position:static;top:0;margin-top:1px",i.insertBefore(c,i.firstChild),d=e.createElement("div"),c.appendChild(d),d.innerHTML="<table><tr><td></td><td>t</td></tr></table>",f=d.getElementsByTagName("td"),f[0].style.cssText="padding:0;margin:0;border:0;display:none",l=f[0].offsetHeight===0,f[0].style.display="",f[1].style.display="none",b.reliableHiddenOffsets=l&&f[0].offsetHeight===0,d.innerHTML="",d.style.cssText="box-sizing:border-box;-moz-box-sizing:border-box;-webkit-box-sizing:border-box;padding:1px;border:1px;display:block;width:4px;margin-top:1%;position:absolute;top:1%;",b.boxSizing=d.offsetWidth===4,b.doesNotIncludeMarginInBodyOffset=i.offsetTop!==1,a.getComputedStyle&&(b.pixelPosition=(a.getComputedStyle(d,null)||{}).top!=="1%",b.boxSizingReliable=(a.getComputedStyle(d,null)||{width:"4px"}).width==="4px",g=e.createElement("div"),g.style.cssText=d.style.cssText=h,g.style.marginRight=g.style.width="0",d.style.width="1px",d.appendChild(g),b.reliableMarginRight=!parseFloat((a.getComputedStyle(g,null)||{}).marginRight)),typeof d.style.zoom!="undefined"&&(d.innerHTML="",d.style.cssText=h+"width:1px;padding:1px;display:inline;zoom:1",b.inlineBlockNeedsLayout=d.offsetWidth===3,d.style.display="block",d.style.overflow="visible",d.innerHTML="<div></div>",d.firstChild.style.width="5px",b.shrinkWrapBlocks=d.offsetWidth!==3,c.style.zoom=1),i.removeChild(c),c=d=f=g=null}),i.removeChild(n),c=d=f=g=h=i=n=null,b}();var H=/^(?:\{.*\}|\[.*\])$/,I=/([A-Z])/g;p.extend({cache:{},deletedIds:[],uuid:0,expando:"jQuery"+(p.fn.jquery+Math.random()).replace(/\D/g,""),noData:{embed:!0,object:"clsid:D27CDB6E-AE6D-11cf-96B8-444553540000",applet:!0},hasData:function(a){return a=a.nodeType?p.cache[a[p.expando]]:a[p.expando],!!a&&!K(a)},data:function(a,c,d,e){if(!p.acceptData(a))return;var f,g,h=p.expando,i=typeof c=="string",j=a.nodeType,k=j?p.cache:a,l=j?a[h]:a[h]&&h;if((!l||!k[l]||!e&&!k[l].data)&&i&&d===b)return;l||(j?a[h]=l=p.deletedIds.pop()||++p.uuid:l=h),k[l]||(k[l]={},j||(k[l].toJSON=p.noop));if(typeof c=="object"||typeof c=="function")e?k[l]=p.extend(k[l],c):k[l].data=p.extend(k[l].data,c);return f=k[l],e||(f.data||(f.data={}),f=f.data),d!==b&&(f[p.camelCase(c)]=d),i?(g=f[c],g==null&&(g=f[p.camelCase(c)])):g=f,g},removeData:function(a,b,c){if(!p.acceptData(a))return;var d,e,f,g=a.nodeType,h=g?p.cache:a,i=g?a[p.expando]:p.expando;if(!h[i])return;if(b){d=c?h[i]:h[i].data;if(d){p.isArray(b)||(b in d?b=[b]:(b=p.camelCase(b),b in d?b=[b]:b=b.split(" ")));for(e=0,f=b.length;e<f;e++)delete d[b[e]];if(!(c?K:p.isEmptyObject)(d))return}}if(!c){delete h[i].data;if(!K(h[i]))return}g?p.cleanData([a],!0):p.support.deleteExpando||h!=h.window?delete h[i]:h[i]=null},_data:function(a,b,c){return p.data(a,b,c,!0)},acceptData:function(a){var b=a.nodeName&&p.noData[a.nodeName.toLowerCase()];return!b||b!==!0&&a.getAttribute("classid")===b}}),p.fn.extend({data:function(a,c){var d,e,f,g,h,i=this[0],j=0,k=null;if(a===b){if(this.length){k=p.data(i);if(i.nodeType===1&&!p._data(i,"parsedAttrs")){f=i.attributes;for(h=f.length;j<h;j++)g=f[j].name,g.indexOf("data-")===0&&(g=p.camelCase(g.substring(5)),J(i,g,k[g]));p._data(i,"parsedAttrs",!0)}}return k}return typeof a=="object"?this.each(function(){p.data(this,a)}):(d=a.split(".",2),d[1]=d[1]?"."+d[1]:"",e=d[1]+"!",p.access(this,function(c){if(c===b)return k=this.triggerHandler("getData"+e,[d[0]]),k===b&&i&&(k=p.data(i,a),k=J(i,a,k)),k===b&&d[1]?this.data(d[0]):k;d[1]=c,this.each(function(){var b=p(this);b.triggerHandler("setData"+e,d),p.data(this,a,c),b.triggerHandler("changeData"+e,d)})},null,c,arguments.length>1,null,!1))},removeData:function(a){return this.each(function(){p.removeData(this,a)})}}),p.extend({queue:function(a,b,c){var d;if(a)return b=(b||"fx")+"queue",d=p._data(a,b),c&&(!d||p.isArray(c)?d=p._data(a,b,p.makeArray(c)):d.push(c)),d||[]},dequeue:function(a,b){b=b||"fx";var c=p.queue(a,b),d=c.shift(),e=p._queueHooks(a,b),f=function(){p.dequeue(a,b)};d==="inprogress"&&(d=c.shift()),d&&(b==="fx"&&c.unshift("inprogress"),delete e.stop,d.call(a,f,e)),!c.length&&e&&e.empty.fire()},_queueHooks:function(a,b){var c=b+"queueHooks";return p._data(a,c)||p._data(a,c,{empty:p.Callbacks("once memory").add(function(){p.removeData(a,b+"queue",!0),p.removeData(a,c,!0)})})}}),p.fn.extend({queue:function(a,c){var d=2;return typeof a!="string"&&(c=a,a="fx",d--),arguments.length<d?p.queue(this[0],a):c===b?this:this.each(function(){var b=p.queue(this,a,c);p._queueHooks(this,a),a==="fx"&&b[0]!=="inprogress"&&p.dequeue(this,a)})},dequeue:function(a){return this.each(function(){p.dequeue(this,a)})},delay:function(a,b){return a=p.fx?p.fx.speeds[a]||a:a,b=b||"fx",this.queue(b,function(b,c){var d=setTimeout(b,a);c.stop=function(){clearTimeout(d)}})},clearQueue:function(a){return this.queue(a||"fx",[])},promise:function(a,c){var d,e=1,f=p.Deferred(),g=this,h=this.length,i=function(){--e||f.resolveWith(g,[g])};typeof a!="string"&&(c=a,a=b),a=a||"fx";while(h--)(d=p._data(g[h],a+"queueHooks"))&&d.empty&&(e++,d.empty.add(i));return i(),f.promise(c)}});var L,M,N,O=/[\t\r\n]/g,P=/\r/g,Q=/^(?:button|input)$/i,R=/^(?:button|input|object|select|textarea)$/i,S=/^a(?:rea|)$/i,T=/^(?:autofocus|autoplay|async|checked|controls|defer|disabled|hidden|loop|multiple|open|readonly|required|scoped|selected)$/i,U=p.support.getSetAttribute;p.fn.extend({attr:function(a,b){return p.access(this,p.attr,a,b,arguments.length>1)},removeAttr:function(a){return this.each(function(){p.removeAttr(this,a)})},prop:function(a,b){return p.access(this,p.prop,a,b,arguments.length>1)},removeProp:function(a){return a=p.propFix[a]||a,this.each(function(){try{this[a]=b,delete this[a]}catch(c){}})},addClass:function(a){var b,c,d,e,f,g,h;if(p.isFunction(a))return this.each(function(b){p(this).addClass(a.call(this,b,this.className))});if(a&&typeof a=="string"){b=a.split(s);for(c=0,d=this.length;c<d;c++){e=this[c];if(e.nodeType===1)if(!e.className&&b.length===1)e.className=a;else{f=" "+e.className+" ";for(g=0,h=b.length;g<h;g++)~f.indexOf(" "+b[g]+" ")||(f+=b[g]+" ");e.className=p.trim(f)}}}return this},removeClass:function(a){var c,d,e,f,g,h,i;if(p.isFunction(a))return this.each(function(b){p(this).removeClass(a.call(this,b,this.className))});if(a&&typeof a=="string"||a===b){c=(a||"").split(s);for(h=0,i=this.length;h<i;h++){e=this[h];if(e.nodeType===1&&e.className){d=(" "+e.className+" ").replace(O," ");for(f=0,g=c.length;f<g;f++)while(d.indexOf(" "+c[f]+" ")>-1)d=d.replace(" "+c[f]+" "," ");e.className=a?p.trim(d):""}}}return this},toggleClass:function(a,b){var c=typeof a,d=typeof b=="boolean";return p.isFunction(a)?this.each(function(c){p(this).toggleClass(a.call(this,c,this.className,b),b)}):this.each(function(){if(c==="string"){var e,f=0,g=p(this),h=b,i=a.split(s);while(e=i[f++])h=d?h:!g.hasClass(e),g[h?"addClass":"removeClass"](e)}else if(c==="undefined"||c==="boolean")this.className&&p._data(this,"__className__",this.className),this.className=this.className||a===!1?"":p._data(this,"__className__")||""})},hasClass:function(a){var b=" "+a+" ",c=0,d=this.length;for(;c<d;c++)if(this[c].nodeType===1&&(" "+this[c].className+" ").replace(O," ").indexOf(b)>-1)return!0;return!1},val:function(a){var c,d,e,f=this[0];if(!arguments.length){if(f)return c=p.valHooks[f.type]||p.valHooks[f.nodeName.toLowerCase()],c&&"get"in c&&(d=c.get(f,"value"))!==b?d:(d=f.value,typeof d=="string"?d.replace(P,""):d==null?"":d);return}return e=p.isFunction(a),this.each(function(d){var f,g=p(this);if(this.nodeType!==1)return;e?f=a.call(this,d,g.val()):f=a,f==null?f="":typeof f=="number"?f+="":p.isArray(f)&&(f=p.map(f,function(a){return a==null?"":a+""})),c=p.valHooks[this.type]||p.valHooks[this.nodeName.toLowerCase()];if(!c||!("set"in c)||c.set(this,f,"value")===b)this.value=f})}}),p.extend({valHooks:{option:{get:function(a){var b=a.attributes.value;return!b||b.specified?a.value:a.text}},select:{get:function(a){var b,c,d,e,f=a.selectedIndex,g=[],h=a.options,i=a.type==="select-one";if(f<0)return null;c=i?f:0,d=i?f+1:h.length;for(;c<d;c++){e=h[c];if(e.selected&&(p.support.optDisabled?!e.disabled:e.getAttribute("disabled")===null)&&(!e.parentNode.disabled||!p.nodeName(e.parentNode,"optgroup"))){b=p(e).val();if(i)return b;g.push(b)}}return i&&!g.length&&h.length?p(h[f]).val():g},set:function(a,b){var c=p.makeArray(b);return p(a).find("option").each(function(){this.selected=p.inArray(p(this).val(),c)>=0}),c.length||(a.selectedIndex=-1),c}}},attrFn:{},attr:function(a,c,d,e){var f,g,h,i=a.nodeType;if(!a||i===3||i===8||i===2)return;if(e&&p.isFunction(p.fn[c]))return p(a)[c](d);if(typeof a.getAttribute=="undefined")return p.prop(a,c,d);h=i!==1||!p.isXMLDoc(a),h&&(c=c.toLowerCase(),g=p.attrHooks[c]||(T.test(c)?M:L));if(d!==b){if(d===null){p.removeAttr(a,c);return}return g&&"set"in g&&h&&(f=g.set(a,d,c))!==b?f:(a.setAttribute(c,""+d),d)}return g&&"get"in g&&h&&(f=g.get(a,c))!==null?f:(f=a.getAttribute(c),f===null?b:f)},removeAttr:function(a,b){var c,d,e,f,g=0;if(b&&a.nodeType===1){d=b.split(s);for(;g<d.length;g++)e=d[g],e&&(c=p.propFix[e]||e,f=T.test(e),f||p.attr(a,e,""),a.removeAttribute(U?e:c),f&&c in a&&(a[c]=!1))}},attrHooks:{type:{set:function(a,b){if(Q.test(a.nodeName)&&a.parentNode)p.error("type property can't be changed");else if(!p.support.radioValue&&b==="radio"&&p.nodeName(a,"input")){var c=a.value;return a.setAttribute("type",b),c&&(a.value=c),b}}},value:{get:function(a,b){return L&&p.nodeName(a,"button")?L.get(a,b):b in a?a.value:null},set:function(a,b,c){if(L&&p.nodeName(a,"button"))return L.set(a,b,c);a.value=b}}},propFix:{tabindex:"tabIndex",readonly:"readOnly","for":"htmlFor","class":"className",maxlength:"maxLength",cellspacing:"cellSpacing",cellpadding:"cellPadding",rowspan:"rowSpan",colspan:"colSpan",usemap:"useMap",frameborder:"frameBorder",contenteditable:"contentEditable"},prop:function(a,c,d){var e,f,g,h=a.nodeType;if(!a||h===3||h===8||h===2)return;return g=h!==1||!p.isXMLDoc(a),g&&(c=p.propFix[c]||c,f=p.propHooks[c]),d!==b?f&&"set"in f&&(e=f.set(a,d,c))!==b?e:a[c]=d:f&&"get"in f&&(e=f.get(a,c))!==null?e:a[c]},propHooks:{tabIndex:{get:function(a){var c=a.getAttributeNode("tabindex");return c&&c.specified?parseInt(c.value,10):R.test(a.nodeName)||S.test(a.nodeName)&&a.href?0:b}}}}),M={get:function(a,c){var d,e=p.prop(a,c);return e===!0||typeof e!="boolean"&&(d=a.getAttributeNode(c))&&d.nodeValue!==!1?c.toLowerCase():b},set:function(a,b,c){var d;return b===!1?p.removeAttr(a,c):(d=p.propFix[c]||c,d in a&&(a[d]=!0),a.setAttribute(c,c.toLowerCase())),c}},U||(N={name:!0,id:!0,coords:!0},L=p.valHooks.button={get:function(a,c){var d;return d=a.getAttributeNode(c),d&&(N[c]?d.value!=="":d.specified)?d.value:b},set:function(a,b,c){var d=a.getAttributeNode(c);return d||(d=e.createAttribute(c),a.setAttributeNode(d)),d.value=b+""}},p.each(["width","height"],function(a,b){p.attrHooks[b]=p.extend(p.attrHooks[b],{set:function(a,c){if(c==="")return a.setAttribute(b,"auto"),c}})}),p.attrHooks.contenteditable={get:L.get,set:function(a,b,c){b===""&&(b="false"),L.set(a,b,c)}}),p.support.hrefNormalized||p.each(["href","src","width","height"],function(a,c){p.attrHooks[c]=p.extend(p.attrHooks[c],{get:function(a){var d=a.getAttribute(c,2);return d===null?b:d}})}),p.support.style||(p.attrHooks.style={get:function(a){return a.style.cssText.toLowerCase()||b},set:function(a,b){return a.style.cssText=""+b}}),p.support.optSelected||(p.propHooks.selected=p.extend(p.propHooks.selected,{get:function(a){var b=a.parentNode;return b&&(b.selectedIndex,b.parentNode&&b.parentNode.selectedIndex),null}})),p.support.enctype||(p.propFix.enctype="encoding"),p.support.checkOn||p.each(["radio","checkbox"],function(){p.valHooks[this]={get:function(a){return a.getAttribute("value")===null?"on":a.value}}}),p.each(["radio","checkbox"],function(){p.valHooks[this]=p.extend(p.valHooks[this],{set:function(a,b){if(p.isArray(b))return a.checked=p.inArray(p(a).val(),b)>=0}})});var V=/^(?:textarea|input|select)$/i,W=/^([^\.]*|)(?:\.(.+)|)$/,X=/(?:^|\s)hover(\.\S+|)\b/,Y=/^key/,Z=/^(?:mouse|contextmenu)|click/,$=/^(?:focusinfocus|focusoutblur)$/,_=function(a){return p.event.special.hover?a:a.replace(X,"mouseenter$1 mouseleave$1")};p.event={add:function(a,c,d,e,f){var g,h,i,j,k,l,m,n,o,q,r;if(a.nodeType===3||a.nodeType===8||!c||!d||!(g=p._data(a)))return;d.handler&&(o=d,d=o.handler,f=o.selector),d.guid||(d.guid=p.guid++),i=g.events,i||(g.events=i={}),h=g.handle,h||(g.handle=h=function(a){return typeof p!="undefined"&&(!a||p.event.triggered!==a.type)?p.event.dispatch.apply(h.elem,arguments):b},h.elem=a),c=p.trim(_(c)).split(" ");for(j=0;j<c.length;j++){k=W.exec(c[j])||[],l=k[1],m=(k[2]||"").split(".").sort(),r=p.event.special[l]||{},l=(f?r.delegateType:r.bindType)||l,r=p.event.special[l]||{},n=p.extend({type:l,origType:k[1],data:e,handler:d,guid:d.guid,selector:f,namespace:m.join(".")},o),q=i[l];if(!q){q=i[l]=[],q.delegateCount=0;if(!r.setup||r.setup.call(a,e,m,h)===!1)a.addEventListener?a.addEventListener(l,h,!1):a.attachEvent&&a.attachEvent("on"+l,h)}r.add&&(r.add.call(a,n),n.handler.guid||(n.handler.guid=d.guid)),f?q.splice(q.delegateCount++,0,n):q.push(n),p.event.global[l]=!0}a=null},global:{},remove:function(a,b,c,d,e){var f,g,h,i,j,k,l,m,n,o,q,r=p.hasData(a)&&p._data(a);if(!r||!(m=r.events))return;b=p.trim(_(b||"")).split(" ");for(f=0;f<b.length;f++){g=W.exec(b[f])||[],h=i=g[1],j=g[2];if(!h){for(h in m)p.event.remove(a,h+b[f],c,d,!0);continue}n=p.event.special[h]||{},h=(d?n.delegateType:n.bindType)||h,o=m[h]||[],k=o.length,j=j?new RegExp("(^|\\.)"+j.split(".").sort().join("\\.(?:.*\\.|)")+"(\\.|$)"):null;for(l=0;l<o.length;l++)q=o[l],(e||i===q.origType)&&(!c||c.guid===q.guid)&&(!j||j.test(q.namespace))&&(!d||d===q.selector||d==="**"&&q.selector)&&(o.splice(l--,1),q.selector&&o.delegateCount--,n.remove&&n.remove.call(a,q));o.length===0&&k!==o.length&&((!n.teardown||n.teardown.call(a,j,r.handle)===!1)&&p.removeEvent(a,h,r.handle),delete m[h])}p.isEmptyObject(m)&&(delete r.handle,p.removeData(a,"events",!0))},customEvent:{getData:!0,setData:!0,changeData:!0},trigger:function(c,d,f,g){if(!f||f.nodeType!==3&&f.nodeType!==8){var h,i,j,k,l,m,n,o,q,r,s=c.type||c,t=[];if($.test(s+p.event.triggered))return;s.indexOf("!")>=0&&(s=s.slice(0,-1),i=!0),s.indexOf(".")>=0&&(t=s.split("."),s=t.shift(),t.sort());if((!f||p.event.customEvent[s])&&!p.event.global[s])return;c=typeof c=="object"?c[p.expando]?c:new p.Event(s,c):new p.Event(s),c.type=s,c.isTrigger=!0,c.exclusive=i,c.namespace=t.join("."),c.namespace_re=c.namespace?new RegExp("(^|\\.)"+t.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,m=s.indexOf(":")<0?"on"+s:"";if(!f){h=p.cache;for(j in h)h[j].events&&h[j].events[s]&&p.event.trigger(c,d,h[j].handle.elem,!0);return}c.result=b,c.target||(c.target=f),d=d!=null?p.makeArray(d):[],d.unshift(c),n=p.event.special[s]||{};if(n.trigger&&n.trigger.apply(f,d)===!1)return;q=[[f,n.bindType||s]];if(!g&&!n.noBubble&&!p.isWindow(f)){r=n.delegateType||s,k=$.test(r+s)?f:f.parentNode;for(l=f;k;k=k.parentNode)q.push([k,r]),l=k;l===(f.ownerDocument||e)&&q.push([l.defaultView||l.parentWindow||a,r])}for(j=0;j<q.length&&!c.isPropagationStopped();j++)k=q[j][0],c.type=q[j][1],o=(p._data(k,"events")||{})[c.type]&&p._data(k,"handle"),o&&o.apply(k,d),o=m&&k[m],o&&p.acceptData(k)&&o.apply(k,d)===!1&&c.preventDefault();return c.type=s,!g&&!c.isDefaultPrevented()&&(!n._default||n._default.apply(f.ownerDocument,d)===!1)&&(s!=="click"||!p.nodeName(f,"a"))&&p.acceptData(f)&&m&&f[s]&&(s!=="focus"&&s!=="blur"||c.target.offsetWidth!==0)&&!p.isWindow(f)&&(l=f[m],l&&(f[m]=null),p.event.triggered=s,f[s](),p.event.triggered=b,l&&(f[m]=l)),c.result}return},dispatch:function(c){c=p.event.fix(c||a.event);var d,e,f,g,h,i,j,k,l,m,n,o=(p._data(this,"events")||{})[c.type]||[],q=o.delegateCount,r=[].slice.call(arguments),s=!c.exclusive&&!c.namespace,t=p.event.special[c.type]||{},u=[];r[0]=c,c.delegateTarget=this;if(t.preDispatch&&t.preDispatch.call(this,c)===!1)return;if(q&&(!c.button||c.type!=="click")){g=p(this),g.context=this;for(f=c.target;f!=this;f=f.parentNode||this)if(f.disabled!==!0||c.type!=="click"){i={},k=[],g[0]=f;for(d=0;d<q;d++)l=o[d],m=l.selector,i[m]===b&&(i[m]=g.is(m)),i[m]&&k.push(l);k.length&&u.push({elem:f,matches:k})}}o.length>q&&u.push({elem:this,matches:o.slice(q)});for(d=0;d<u.length&&!c.isPropagationStopped();d++){j=u[d],c.currentTarget=j.elem;for(e=0;e<j.matches.length&&!c.isImmediatePropagationStopped();e++){l=j.matches[e];if(s||!c.namespace&&!l.namespace||c.namespace_re&&c.namespace_re.test(l.namespace))c.data=l.data,c.handleObj=l,h=((p.event.special[l.origType]||{}).handle||l.handler).apply(j.elem,r),h!==b&&(c.result=h,h===!1&&(c.preventDefault(),c.stopPropagation()))}}return t.postDispatch&&t.postDispatch.call(this,c),c.result},props:"attrChange attrName relatedNode srcElement altKey bubbles cancelable ctrlKey currentTarget eventPhase metaKey relatedTarget shiftKey target timeStamp view which".split(" "),fixHooks:{},keyHooks:{props:"char charCode key keyCode".split(" "),filter:function(a,b){return a.which==null&&(a.which=b.charCode!=null?b.charCode:b.keyCode),a}},mouseHooks:{props:"button buttons clientX clientY fromElement offsetX offsetY pageX pageY screenX screenY toElement".split(" "),filter:function(a,c){var d,f,g,h=c.button,i=c.fromElement;return a.pageX==null&&c.clientX!=null&&(d=a.target.ownerDocument||e,f=d.documentElement,g=d.body,a.pageX=c.clientX+(f&&f.scrollLeft||g&&g.scrollLeft||0)-(f&&f.clientLeft||g&&g.clientLeft||0),a.pageY=c.clientY+(f&&f.scrollTop||g&&g.scrollTop||0)-(f&&f.clientTop||g&&g.clientTop||0)),!a.relatedTarget&&i&&(a.relatedTarget=i===a.target?c.toElement:i),!a.which&&h!==b&&(a.which=h&1?1:h&2?3:h&4?2:0),a}},fix:function(a){if(a[p.expando])return a;var b,c,d=a,f=p.event.fixHooks[a.type]||{},g=f.props?this.props.concat(f.props):this.props;a=p.Event(d);for(b=g.length;b;)c=g[--b],a[c]=d[c];return a.target||(a.target=d.srcElement||e),a.target.nodeType===3&&(a.target=a.target.parentNode),a.metaKey=!!a.metaKey,f.filter?f.filter(a,d):a},special:{ready:{setup:p.bindReady},load:{noBubble:!0},focus:{delegateType:"focusin"},blur:{delegateType:"focusout"},beforeunload:{setup:function(a,b,c){p.isWindow(this)&&(this.onbeforeunload=c)},teardown:function(a,b){this.onbeforeunload===b&&(this.onbeforeunload=null)}}},simulate:function(a,b,c,d){var e=p.extend(new p.Event,c,{type:a,isSimulated:!0,originalEvent:{}});d?p.event.trigger(e,null,b):p.event.dispatch.call(b,e),e.isDefaultPrevented()&&c.preventDefault()}},p.event.handle=p.event.dispatch,p.removeEvent=e.removeEventListener?function(a,b,c){a.removeEventListener&&a.removeEventListener(b,c,!1)}:function(a,b,c){var d="on"+b;a.detachEvent&&(typeof a[d]=="undefined"&&(a[d]=null),a.detachEvent(d,c))},p.Event=function(a,b){if(this instanceof p.Event)a&&a.type?(this.originalEvent=a,this.type=a.type,this.isDefaultPrevented=a.defaultPrevented||a.returnValue===!1||a.getPreventDefault&&a.getPreventDefault()?bb:ba):this.type=a,b&&p.extend(this,b),this.timeStamp=a&&a.timeStamp||p.now(),this[p.expando]=!0;else return new p.Event(a,b)},p.Event.prototype={preventDefault:function(){this.isDefaultPrevented=bb;var a=this.originalEvent;if(!a)return;a.preventDefault?a.preventDefault():a.returnValue=!1},stopPropagation:function(){this.isPropagationStopped=bb;var a=this.originalEvent;if(!a)return;a.stopPropagation&&a.stopPropagation(),a.cancelBubble=!0},stopImmediatePropagation:function(){this.isImmediatePropagationStopped=bb,this.stopPropagation()},isDefaultPrevented:ba,isPropagationStopped:ba,isImmediatePropagationStopped:ba},p.each({mouseenter:"mouseover",mouseleave:"mouseout"},function(a,b){p.event.special[a]={delegateType:b,bindType:b,handle:function(a){var c,d=this,e=a.relatedTarget,f=a.handleObj,g=f.selector;if(!e||e!==d&&!p.contains(d,e))a.type=f.origType,c=f.handler.apply(this,arguments),a.type=b;return c}}}),p.support.submitBubbles||(p.event.special.submit={setup:function(){if(p.nodeName(this,"form"))return!1;p.event.add(this,"click._submit keypress._submit",function(a){var c=a.target,d=p.nodeName(c,"input")||p.nodeName(c,"button")?c.form:b;d&&!p._data(d,"_submit_attached")&&(p.event.add(d,"submit._submit",function(a){a._submit_bubble=!0}),p._data(d,"_submit_attached",!0))})},postDispatch:function(a){a._submit_bubble&&(delete a._submit_bubble,this.parentNode&&!a.isTrigger&&p.event.simulate("submit",this.parentNode,a,!0))},teardown:function(){if(p.nodeName(this,"form"))return!1;p.event.remove(this,"._submit")}}),p.support.changeBubbles||(p.event.special.change={setup:function(){if(V.test(this.nodeName)){if(this.type==="checkbox"||this.type==="radio")p.event.add(this,"propertychange._change",function(a){a.originalEvent.propertyName==="checked"&&(this._just_changed=!0)}),p.event.add(this,"click._change",function(a){this._just_changed&&!a.isTrigger&&(this._just_changed=!1),p.event.simulate("change",this,a,!0)});return!1}p.event.add(this,"beforeactivate._change",function(a){var b=a.target;V.test(b.nodeName)&&!p._data(b,"_change_attached")&&(p.event.add(b,"change._change",function(a){this.parentNode&&!a.isSimulated&&!a.isTrigger&&p.event.simulate("change",this.parentNode,a,!0)}),p._data(b,"_change_attached",!0))})},handle:function(a){var b=a.target;if(this!==b||a.isSimulated||a.isTrigger||b.type!=="radio"&&b.type!=="checkbox")return a.handleObj.handler.apply(this,arguments)},teardown:function(){return p.event.remove(this,"._change"),V.test(this.nodeName)}}),p.support.focusinBubbles||p.each({focus:"focusin",blur:"focusout"},function(a,b){var c=0,d=function(a){p.event.simulate(b,a.target,p.event.fix(a),!0)};p.event.special[b]={setup:function(){c++===0&&e.addEventListener(a,d,!0)},teardown:function(){--c===0&&e.removeEventListener(a,d,!0)}}}),p.fn.extend({on:function(a,c,d,e,f){var g,h;if(typeof a=="object"){typeof c!="string"&&(d=d||c,c=b);for(h in a)this.on(h,c,d,a[h],f);return this}d==null&&e==null?(e=c,d=c=b):e==null&&(typeof c=="string"?(e=d,d=b):(e=d,d=c,c=b));if(e===!1)e=ba;else if(!e)return this;return f===1&&(g=e,e=function(a){return p().off(a),g.apply(this,arguments)},e.guid=g.guid||(g.guid=p.guid++)),this.each(function(){p.event.add(this,a,e,d,c)})},one:function(a,b,c,d){return this.on(a,b,c,d,1)},off:function(a,c,d){var e,f;if(a&&a.preventDefault&&a.handleObj)return e=a.handleObj,p(a.delegateTarget).off(e.namespace?e.origType+"."+e.namespace:e.origType,e.selector,e.handler),this;if(typeof a=="object"){for(f in a)this.off(f,c,a[f]);return this}if(c===!1||typeof c=="function")d=c,c=b;return d===!1&&(d=ba),this.each(function(){p.event.remove(this,a,d,c)})},bind:function(a,b,c){return this.on(a,null,b,c)},unbind:function(a,b){return this.off(a,null,b)},live:function(a,b,c){return p(this.context).on(a,this.selector,b,c),this},die:function(a,b){return p(this.context).off(a,this.selector||"**",b),this},delegate:function(a,b,c,d){return this.on(b,a,c,d)},undelegate:function(a,b,c){return arguments.length==1?this.off(a,"**"):this.off(b,a||"**",c)},trigger:function(a,b){return this.each(function(){p.event.trigger(a,b,this)})},triggerHandler:function(a,b){if(this[0])return p.event.trigger(a,b,this[0],!0)},toggle:function(a){var b=arguments,c=a.guid||p.guid++,d=0,e=function(c){var e=(p._data(this,"lastToggle"+a.guid)||0)%d;return p._data(this,"lastToggle"+a.guid,e+1),c.preventDefault(),b[e].apply(this,arguments)||!1};e.guid=c;while(d<b.length)b[d++].guid=c;return this.click(e)},hover:function(a,b){return this.mouseenter(a).mouseleave(b||a)}}),p.each("blur focus focusin focusout load resize scroll unload click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup error contextmenu".split(" "),function(a,b){p.fn[b]=function(a,c){return c==null&&(c=a,a=null),arguments.length>0?this.on(b,null,a,c):this.trigger(b)},Y.test(b)&&(p.event.fixHooks[b]=p.event.keyHooks),Z.test(b)&&(p.event.fixHooks[b]=p.event.mouseHooks)}),function(a,b){function bd(a,b,c,d){var e=0,f=b.length;for(;e<f;e++)Z(a,b[e],c,d)}function be(a,b,c,d,e,f){var g,h=$.setFilters[b.toLowerCase()];return h||Z.error(b),(a||!(g=e))&&bd(a||"*",d,g=[],e),g.length>0?h(g,c,f):[]}function bf(a,c,d,e,f){var g,h,i,j,k,l,m,n,p=0,q=f.length,s=L.POS,t=new RegExp("^"+s.source+"(?!"+r+")","i"),u=function(){var a=1,c=arguments.length-2;for(;a<c;a++)arguments[a]===b&&(g[a]=b)};for(;p<q;p++){s.exec(""),a=f[p],j=[],i=0,k=e;while(g=s.exec(a)){n=s.lastIndex=g.index+g[0].length;if(n>i){m=a.slice(i,g.index),i=n,l=[c],B.test(m)&&(k&&(l=k),k=e);if(h=H.test(m))m=m.slice(0,-5).replace(B,"$&*");g.length>1&&g[0].replace(t,u),k=be(m,g[1],g[2],l,k,h)}}k?(j=j.concat(k),(m=a.slice(i))&&m!==")"?B.test(m)?bd(m,j,d,e):Z(m,c,d,e?e.concat(k):k):o.apply(d,j)):Z(a,c,d,e)}return q===1?d:Z.uniqueSort(d)}function bg(a,b,c){var d,e,f,g=[],i=0,j=D.exec(a),k=!j.pop()&&!j.pop(),l=k&&a.match(C)||[""],m=$.preFilter,n=$.filter,o=!c&&b!==h;for(;(e=l[i])!=null&&k;i++){g.push(d=[]),o&&(e=" "+e);while(e){k=!1;if(j=B.exec(e))e=e.slice(j[0].length),k=d.push({part:j.pop().replace(A," "),captures:j});for(f in n)(j=L[f].exec(e))&&(!m[f]||(j=m[f](j,b,c)))&&(e=e.slice(j.shift().length),k=d.push({part:f,captures:j}));if(!k)break}}return k||Z.error(a),g}function bh(a,b,e){var f=b.dir,g=m++;return a||(a=function(a){return a===e}),b.first?function(b,c){while(b=b[f])if(b.nodeType===1)return a(b,c)&&b}:function(b,e){var h,i=g+"."+d,j=i+"."+c;while(b=b[f])if(b.nodeType===1){if((h=b[q])===j)return b.sizset;if(typeof h=="string"&&h.indexOf(i)===0){if(b.sizset)return b}else{b[q]=j;if(a(b,e))return b.sizset=!0,b;b.sizset=!1}}}}function bi(a,b){return a?function(c,d){var e=b(c,d);return e&&a(e===!0?c:e,d)}:b}function bj(a,b,c){var d,e,f=0;for(;d=a[f];f++)$.relative[d.part]?e=bh(e,$.relative[d.part],b):(d.captures.push(b,c),e=bi(e,$.filter[d.part].apply(null,d.captures)));return e}function bk(a){return function(b,c){var d,e=0;for(;d=a[e];e++)if(d(b,c))return!0;return!1}}var c,d,e,f,g,h=a.document,i=h.documentElement,j="undefined",k=!1,l=!0,m=0,n=[].slice,o=[].push,q=("sizcache"+Math.random()).replace(".",""),r="[\\x20\\t\\r\\n\\f]",s="(?:\\\\.|[-\\w]|[^\\x00-\\xa0])+",t=s.replace("w","w#"),u="([*^$|!~]?=)",v="\\["+r+"*("+s+")"+r+"*(?:"+u+r+"*(?:(['\"])((?:\\\\.|[^\\\\])*?)\\3|("+t+")|)|)"+r+"*\\]",w=":("+s+")(?:\\((?:(['\"])((?:\\\\.|[^\\\\])*?)\\2|((?:[^,]|\\\\,|(?:,(?=[^\\[]*\\]))|(?:,(?=[^\\(]*\\))))*))\\)|)",x=":(nth|eq|gt|lt|first|last|even|odd)(?:\\((\\d*)\\)|)(?=[^-]|$)",y=r+"*([\\x20\\t\\r\\n\\f>+~])"+r+"*",z="(?=[^\\x20\\t\\r\\n\\f])(?:\\\\.|"+v+"|"+w.replace(2,7)+"|[^\\\\(),])+",A=new RegExp("^"+r+"+|((?:^|[^\\\\])(?:\\\\.)*)"+r+"+$","g"),B=new RegExp("^"+y),C=new RegExp(z+"?(?="+r+"*,|$)","g"),D=new RegExp("^(?:(?!,)(?:(?:^|,)"+r+"*"+z+")*?|"+r+"*(.*?))(\\)|$)"),E=new RegExp(z.slice(19,-6)+"\\x20\\t\\r\\n\\f>+~])+|"+y,"g"),F=/^(?:#([\w\-]+)|(\w+)|\.([\w\-]+))$/,G=/[\x20\t\r\n\f]*[+~]/,H=/:not\($/,I=/h\d/i,J=/input|select|textarea|button/i,K=/\\(?!\\)/g,L={ID:new RegExp("^#("+s+")"),CLASS:new RegExp("^\\.("+s+")"),NAME:new RegExp("^\\[name=['\"]?("+s+")['\"]?\\]"),TAG:new RegExp("^("+s.replace("[-","[-\\*")+")"),ATTR:new RegExp("^"+v),PSEUDO:new RegExp("^"+w),CHILD:new RegExp("^:(only|nth|last|first)-child(?:\\("+r+"*(even|odd|(([+-]|)(\\d*)n|)"+r+"*(?:([+-]|)"+r+"*(\\d+)|))"+r+"*\\)|)","i"),POS:new RegExp(x,"ig"),needsContext:new RegExp("^"+r+"*[>+~]|"+x,"i")},M={},N=[],O={},P=[],Q=function(a){return a.sizzleFilter=!0,a},R=function(a){return function(b){return b.nodeName.toLowerCase()==="input"&&b.type===a}},S=function(a){return function(b){var c=b.nodeName.toLowerCase();return(c==="input"||c==="button")&&b.type===a}},T=function(a){var b=!1,c=h.createElement("div");try{b=a(c)}catch(d){}return c=null,b},U=T(function(a){a.innerHTML="<select></select>";var b=typeof a.lastChild.getAttribute("multiple");return b!=="boolean"&&b!=="string"}),V=T(function(a){a.id=q+0,a.innerHTML="<a name='"+q+"'></a><div name='"+q+"'></div>",i.insertBefore(a,i.firstChild);var b=h.getElementsByName&&h.getElementsByName(q).length===2+h.getElementsByName(q+0).length;return g=!h.getElementById(q),i.removeChild(a),b}),W=T(function(a){return a.appendChild(h.createComment("")),a.getElementsByTagName("*").length===0}),X=T(function(a){return a.innerHTML="<a href='#'></a>",a.firstChild&&typeof a.firstChild.getAttribute!==j&&a.firstChild.getAttribute("href")==="#"}),Y=T(function(a){return a.innerHTML="<div class='hidden e'></div><div class='hidden'></div>",!a.getElementsByClassName||a.getElementsByClassName("e").length===0?!1:(a.lastChild.className="e",a.getElementsByClassName("e").length!==1)}),Z=function(a,b,c,d){c=c||[],b=b||h;var e,f,g,i,j=b.nodeType;if(j!==1&&j!==9)return[];if(!a||typeof a!="string")return c;g=ba(b);if(!g&&!d)if(e=F.exec(a))if(i=e[1]){if(j===9){f=b.getElementById(i);if(!f||!f.parentNode)return c;if(f.id===i)return c.push(f),c}else if(b.ownerDocument&&(f=b.ownerDocument.getElementById(i))&&bb(b,f)&&f.id===i)return c.push(f),c}else{if(e[2])return o.apply(c,n.call(b.getElementsByTagName(a),0)),c;if((i=e[3])&&Y&&b.getElementsByClassName)return o.apply(c,n.call(b.getElementsByClassName(i),0)),c}return bm(a,b,c,d,g)},$=Z.selectors={cacheLength:50,match:L,order:["ID","TAG"],attrHandle:{},createPseudo:Q,find:{ID:g?function(a,b,c){if(typeof b.getElementById!==j&&!c){var d=b.getElementById(a);return d&&d.parentNode?[d]:[]}}:function(a,c,d){if(typeof c.getElementById!==j&&!d){var e=c.getElementById(a);return e?e.id===a||typeof e.getAttributeNode!==j&&e.getAttributeNode("id").value===a?[e]:b:[]}},TAG:W?function(a,b){if(typeof b.getElementsByTagName!==j)return b.getElementsByTagName(a)}:function(a,b){var c=b.getElementsByTagName(a);if(a==="*"){var d,e=[],f=0;for(;d=c[f];f++)d.nodeType===1&&e.push(d);return e}return c}},relative:{">":{dir:"parentNode",first:!0}," ":{dir:"parentNode"},"+":{dir:"previousSibling",first:!0},"~":{dir:"previousSibling"}},preFilter:{ATTR:function(a){return a[1]=a[1].replace(K,""),a[3]=(a[4]||a[5]||"").replace(K,""),a[2]==="~="&&(a[3]=" "+a[3]+" "),a.slice(0,4)},CHILD:function(a){return a[1]=a[1].toLowerCase(),a[1]==="nth"?(a[2]||Z.error(a[0]),a[3]=+(a[3]?a[4]+(a[5]||1):2*(a[2]==="even"||a[2]==="odd")),a[4]=+(a[6]+a[7]||a[2]==="odd")):a[2]&&Z.error(a[0]),a},PSEUDO:function(a){var b,c=a[4];return L.CHILD.test(a[0])?null:(c&&(b=D.exec(c))&&b.pop()&&(a[0]=a[0].slice(0,b[0].length-c.length-1),c=b[0].slice(0,-1)),a.splice(2,3,c||a[3]),a)}},filter:{ID:g?function(a){return a=a.replace(K,""),function(b){return b.getAttribute("id")===a}}:function(a){return a=a.replace(K,""),function(b){var c=typeof b.getAttributeNode!==j&&b.getAttributeNode("id");return c&&c.value===a}},TAG:function(a){return a==="*"?function(){return!0}:(a=a.replace(K,"").toLowerCase(),function(b){return b.nodeName&&b.nodeName.toLowerCase()===a})},CLASS:function(a){var b=M[a];return b||(b=M[a]=new RegExp("(^|"+r+")"+a+"("+r+"|$)"),N.push(a),N.length>$.cacheLength&&delete M[N.shift()]),function(a){return b.test(a.className||typeof a.getAttribute!==j&&a.getAttribute("class")||"")}},ATTR:function(a,b,c){return b?function(d){var e=Z.attr(d,a),f=e+"";if(e==null)return b==="!=";switch(b){case"=":return f===c;case"!=":return f!==c;case"^=":return c&&f.indexOf(c)===0;case"*=":return c&&f.indexOf(c)>-1;case"$=":return c&&f.substr(f.length-c.length)===c;case"~=":return(" "+f+" ").indexOf(c)>-1;case"|=":return f===c||f.substr(0,c.length+1)===c+"-"}}:function(b){return Z.attr(b,a)!=null}},CHILD:function(a,b,c,d){if(a==="nth"){var e=m++;return function(a){var b,f,g=0,h=a;if(c===1&&d===0)return!0;b=a.parentNode;if(b&&(b[q]!==e||!a.sizset)){for(h=b.firstChild;h;h=h.nextSibling)if(h.nodeType===1){h.sizset=++g;if(h===a)break}b[q]=e}return f=a.sizset-d,c===0?f===0:f%c===0&&f/c>=0}}return function(b){var c=b;switch(a){case"only":case"first":while(c=c.previousSibling)if(c.nodeType===1)return!1;if(a==="first")return!0;c=b;case"last":while(c=c.nextSibling)if(c.nodeType===1)return!1;return!0}}},PSEUDO:function(a,b,c,d){var e=$.pseudos[a]||$.pseudos[a.toLowerCase()];return e||Z.error("unsupported pseudo: "+a),e.sizzleFilter?e(b,c,d):e}},pseudos:{not:Q(function(a,b,c){var d=bl(a.replace(A,"$1"),b,c);return function(a){return!d(a)}}),enabled:function(a){return a.disabled===!1},disabled:function(a){return a.disabled===!0},checked:function(a){var b=a.nodeName.toLowerCase();return b==="input"&&!!a.checked||b==="option"&&!!a.selected},selected:function(a){return a.parentNode&&a.parentNode.selectedIndex,a.selected===!0},parent:function(a){return!$.pseudos.empty(a)},empty:function(a){var b;a=a.firstChild;while(a){if(a.nodeName>"@"||(b=a.nodeType)===3||b===4)return!1;a=a.nextSibling}return!0},contains:Q(function(a){return function(b){return(b.textContent||b.innerText||bc(b)).indexOf(a)>-1}}),has:Q(function(a){return function(b){return Z(a,b).length>0}}),header:function(a){return I.test(a.nodeName)},text:function(a){var b,c;return a.nodeName.toLowerCase()==="input"&&(b=a.type)==="text"&&((c=a.getAttribute("type"))==null||c.toLowerCase()===b)},radio:R("radio"),checkbox:R("checkbox"),file:R("file"),password:R("password"),image:R("image"),submit:S("submit"),reset:S("reset"),button:function(a){var b=a.nodeName.toLowerCase();return b==="input"&&a.type==="button"||b==="button"},input:function(a){return J.test(a.nodeName)},focus:function(a){var b=a.ownerDocument;return a===b.activeElement&&(!b.hasFocus||b.hasFocus())&&(!!a.type||!!a.href)},active:function(a){return a===a.ownerDocument.activeElement}},setFilters:{first:function(a,b,c){return c?a.slice(1):[a[0]]},last:function(a,b,c){var d=a.pop();return c?a:[d]},even:function(a,b,c){var d=[],e=c?1:0,f=a.length;for(;e<f;e=e+2)d.push(a[e]);return d},odd:function(a,b,c){var d=[],e=c?0:1,f=a.length;for(;e<f;e=e+2)d.push(a[e]);return d},lt:function(a,b,c){return c?a.slice(+b):a.slice(0,+b)},gt:function(a,b,c){return c?a.slice(0,+b+1):a.slice(+b+1)},eq:function(a,b,c){var d=a.splice(+b,1);return c?a:d}}};$.setFilters.nth=$.setFilters.eq,$.filters=$.pseudos,X||($.attrHandle={href:function(a){return a.getAttribute("href",2)},type:function(a){return a.getAttribute("type")}}),V&&($.order.push("NAME"),$.find.NAME=function(a,b){if(typeof b.getElementsByName!==j)return b.getElementsByName(a)}),Y&&($.order.splice(1,0,"CLASS"),$.find.CLASS=function(a,b,c){if(typeof b.getElementsByClassName!==j&&!c)return b.getElementsByClassName(a)});try{n.call(i.childNodes,0)[0].nodeType}catch(_){n=function(a){var b,c=[];for(;b=this[a];a++)c.push(b);return c}}var ba=Z.isXML=function(a){var b=a&&(a.ownerDocument||a).documentElement;return b?b.nodeName!=="HTML":!1},bb=Z.contains=i.compareDocumentPosition?function(a,b){return!!(a.compareDocumentPosition(b)&16)}:i.contains?function(a,b){var c=a.nodeType===9?a.documentElement:a,d=b.parentNode;return a===d||!!(d&&d.nodeType===1&&c.contains&&c.contains(d))}:function(a,b){while(b=b.parentNode)if(b===a)return!0;return!1},bc=Z.getText=function(a){var b,c="",d=0,e=a.nodeType;if(e){if(e===1||e===9||e===11){if(typeof a.textContent=="string")return a.textContent;for(a=a.firstChild;a;a=a.nextSibling)c+=bc(a)}else if(e===3||e===4)return a.nodeValue}else for(;b=a[d];d++)c+=bc(b);return c};Z.attr=function(a,b){var c,d=ba(a);return d||(b=b.toLowerCase()),$.attrHandle[b]?$.attrHandle[b](a):U||d?a.getAttribute(b):(c=a.getAttributeNode(b),c?typeof a[b]=="boolean"?a[b]?b:null:c.specified?c.value:null:null)},Z.error=function(a){throw new Error("Syntax error, unrecognized expression: "+a)},[0,0].sort(function(){return l=0}),i.compareDocumentPosition?e=function(a,b){return a===b?(k=!0,0):(!a.compareDocumentPosition||!b.compareDocumentPosition?a.compareDocumentPosition:a.compareDocumentPosition(b)&4)?-1:1}:(e=function(a,b){if(a===b)return k=!0,0;if(a.sourceIndex&&b.sourceIndex)return a.sourceIndex-b.sourceIndex;var c,d,e=[],g=[],h=a.parentNode,i=b.parentNode,j=h;if(h===i)return f(a,b);if(!h)return-1;if(!i)return 1;while(j)e.unshift(j),j=j.parentNode;j=i;while(j)g.unshift(j),j=j.parentNode;c=e.length,d=g.length;for(var l=0;l<c&&l<d;l++)if(e[l]!==g[l])return f(e[l],g[l]);return l===c?f(a,g[l],-1):f(e[l],b,1)},f=function(a,b,c){if(a===b)return c;var d=a.nextSibling;while(d){if(d===b)return-1;d=d.nextSibling}return 1}),Z.uniqueSort=function(a){var b,c=1;if(e){k=l,a.sort(e);if(k)for(;b=a[c];c++)b===a[c-1]&&a.splice(c--,1)}return a};var bl=Z.compile=function(a,b,c){var d,e,f,g=O[a];if(g&&g.context===b)return g;e=bg(a,b,c);for(f=0;d=e[f];f++)e[f]=bj(d,b,c);return g=O[a]=bk(e),g.context=b,g.runs=g.dirruns=0,P.push(a),P.length>$.cacheLength&&delete O[P.shift()],g};Z.matches=function(a,b){return Z(a,null,null,b)},Z.matchesSelector=function(a,b){return Z(b,null,null,[a]).length>0};var bm=function(a,b,e,f,g){a=a.replace(A,"$1");var h,i,j,k,l,m,p,q,r,s=a.match(C),t=a.match(E),u=b.nodeType;if(L.POS.test(a))return bf(a,b,e,f,s);if(f)h=n.call(f,0);else if(s&&s.length===1){if(t.length>1&&u===9&&!g&&(s=L.ID.exec(t[0]))){b=$.find.ID(s[1],b,g)[0];if(!b)return e;a=a.slice(t.shift().length)}q=(s=G.exec(t[0]))&&!s.index&&b.parentNode||b,r=t.pop(),m=r.split(":not")[0];for(j=0,k=$.order.length;j<k;j++){p=$.order[j];if(s=L[p].exec(m)){h=$.find[p]((s[1]||"").replace(K,""),q,g);if(h==null)continue;m===r&&(a=a.slice(0,a.length-r.length)+m.replace(L[p],""),a||o.apply(e,n.call(h,0)));break}}}if(a){i=bl(a,b,g),d=i.dirruns++,h==null&&(h=$.find.TAG("*",G.test(a)&&b.parentNode||b));for(j=0;l=h[j];j++)c=i.runs++,i(l,b)&&e.push(l)}return e};h.querySelectorAll&&function(){var a,b=bm,c=/'|\\/g,d=/\=[\x20\t\r\n\f]*([^'"\]]*)[\x20\t\r\n\f]*\]/g,e=[],f=[":active"],g=i.matchesSelector||i.mozMatchesSelector||i.webkitMatchesSelector||i.oMatchesSelector||i.msMatchesSelector;T(function(a){a.innerHTML="<select><option selected></option></select>",a.querySelectorAll("[selected]").length||e.push("\\["+r+"*(?:checked|disabled|ismap|multiple|readonly|selected|value)"),a.querySelectorAll(":checked").length||e.push(":checked")}),T(function(a){a.innerHTML="<p test=''></p>",a.querySelectorAll("[test^='']").length&&e.push("[*^$]="+r+"*(?:\"\"|'')"),a.innerHTML="<input type='hidden'>",a.querySelectorAll(":enabled").length||e.push(":enabled",":disabled")}),e=e.length&&new RegExp(e.join("|")),bm=function(a,d,f,g,h){if(!g&&!h&&(!e||!e.test(a)))if(d.nodeType===9)try{return o.apply(f,n.call(d.querySelectorAll(a),0)),f}catch(i){}else if(d.nodeType===1&&d.nodeName.toLowerCase()!=="object"){var j=d.getAttribute("id"),k=j||q,l=G.test(a)&&d.parentNode||d;j?k=k.replace(c,"\\$&"):d.setAttribute("id",k);try{return o.apply(f,n.call(l.querySelectorAll(a.replace(C,"[id='"+k+"'] $&")),0)),f}catch(i){}finally{j||d.removeAttribute("id")}}return b(a,d,f,g,h)},g&&(T(function(b){a=g.call(b,"div");try{g.call(b,"[test!='']:sizzle"),f.push($.match.PSEUDO)}catch(c){}}),f=new RegExp(f.join("|")),Z.matchesSelector=function(b,c){c=c.replace(d,"='$1']");if(!ba(b)&&!f.test(c)&&(!e||!e.test(c)))try{var h=g.call(b,c);if(h||a||b.document&&b.document.nodeType!==11)return h}catch(i){}return Z(c,null,null,[b]).length>0})}(),Z.attr=p.attr,p.find=Z,p.expr=Z.selectors,p.expr[":"]=p.expr.pseudos,p.unique=Z.uniqueSort,p.text=Z.getText,p.isXMLDoc=Z.isXML,p.contains=Z.contains}(a);var bc=/Until$/,bd=/^(?:parents|prev(?:Until|All))/,be=/^.[^:#\[\.,]*$/,bf=p.expr.match.needsContext,bg={children:!0,contents:!0,next:!0,prev:!0};p.fn.extend({find:function(a){var b,c,d,e,f,g,h=this;if(typeof a!="string")return p(a).filter(function(){for(b=0,c=h.length;b<c;b++)if(p.contains(h[b],this))return!0});g=this.pushStack("","find",a);for(b=0,c=this.length;b<c;b++){d=g.length,p.find(a,this[b],g);if(b>0)for(e=d;e<g.length;e++)for(f=0;f<d;f++)if(g[f]===g[e]){g.splice(e--,1);break}}return g},has:function(a){var b,c=p(a,this),d=c.length;return this.filter(function(){for(b=0;b<d;b++)if(p.contains(this,c[b]))return!0})},not:function(a){return this.pushStack(bj(this,a,!1),"not",a)},filter:function(a){return this.pushStack(bj(this,a,!0),"filter",a)},is:function(a){return!!a&&(typeof a=="string"?bf.test(a)?p(a,this.context).index(this[0])>=0:p.filter(a,this).length>0:this.filter(a).length>0)},closest:function(a,b){var c,d=0,e=this.length,f=[],g=bf.test(a)||typeof a!="string"?p(a,b||this.context):0;for(;d<e;d++){c=this[d];while(c&&c.ownerDocument&&c!==b&&c.nodeType!==11){if(g?g.index(c)>-1:p.find.matchesSelector(c,a)){f.push(c);break}c=c.parentNode}}return f=f.length>1?p.unique(f):f,this.pushStack(f,"closest",a)},index:function(a){return a?typeof a=="string"?p.inArray(this[0],p(a)):p.inArray(a.jquery?a[0]:a,this):this[0]&&this[0].parentNode?this.prevAll().length:-1},add:function(a,b){var c=typeof a=="string"?p(a,b):p.makeArray(a&&a.nodeType?[a]:a),d=p.merge(this.get(),c);return this.pushStack(bh(c[0])||bh(d[0])?d:p.unique(d))},addBack:function(a){return this.add(a==null?this.prevObject:this.prevObject.filter(a))}}),p.fn.andSelf=p.fn.addBack,p.each({parent:function(a){var b=a.parentNode;return b&&b.nodeType!==11?b:null},parents:function(a){return p.dir(a,"parentNode")},parentsUntil:function(a,b,c){return p.dir(a,"parentNode",c)},next:function(a){return bi(a,"nextSibling")},prev:function(a){return bi(a,"previousSibling")},nextAll:function(a){return p.dir(a,"nextSibling")},prevAll:function(a){return p.dir(a,"previousSibling")},nextUntil:function(a,b,c){return p.dir(a,"nextSibling",c)},prevUntil:function(a,b,c){return p.dir(a,"previousSibling",c)},siblings:function(a){return p.sibling((a.parentNode||{}).firstChild,a)},children:function(a){return p.sibling(a.firstChild)},contents:function(a){return p.nodeName(a,"iframe")?a.contentDocument||a.contentWindow.document:p.merge([],a.childNodes)}},function(a,b){p.fn[a]=function(c,d){var e=p.map(this,b,c);return bc.test(a)||(d=c),d&&typeof d=="string"&&(e=p.filter(d,e)),e=this.length>1&&!bg[a]?p.unique(e):e,this.length>1&&bd.test(a)&&(e=e.reverse()),this.pushStack(e,a,k.call(arguments).join(","))}}),p.extend({filter:function(a,b,c){return c&&(a=":not("+a+")"),b.length===1?p.find.matchesSelector(b[0],a)?[b[0]]:[]:p.find.matches(a,b)},dir:function(a,c,d){var e=[],f=a[c];while(f&&f.nodeType!==9&&(d===b||f.nodeType!==1||!p(f).is(d)))f.nodeType===1&&e.push(f),f=f[c];return e},sibling:function(a,b){var c=[];for(;a;a=a.nextSibling)a.nodeType===1&&a!==b&&c.push(a);return c}});var bl="abbr|article|aside|audio|bdi|canvas|data|datalist|details|figcaption|figure|footer|header|hgroup|mark|meter|nav|output|progress|section|summary|time|video",bm=/ jQuery\d+="(?:null|\d+)"/g,bn=/^\s+/,bo=/<(?!area|br|col|embed|hr|img|input|link|meta|param)(([\w:]+)[^>]*)\/>/gi,bp=/<([\w:]+)/,bq=/<tbody/i,br=/<|&#?\w+;/,bs=/<(?:script|style|link)/i,bt=/<(?:script|object|embed|option|style)/i,bu=new RegExp("<(?:"+bl+")[\\s/>]","i"),bv=/^(?:checkbox|radio)$/,bw=/checked\s*(?:[^=]|=\s*.checked.)/i,bx=/\/(java|ecma)script/i,by=/^\s*<!(?:\[CDATA\[|\-\-)|[\]\-]{2}>\s*$/g,bz={option:[1,"<select multiple='multiple'>","</select>"],legend:[1,"<fieldset>","</fieldset>"],thead:[1,"<table>","</table>"],tr:[2,"<table><tbody>","</tbody></table>"],td:[3,"<table><tbody><tr>","</tr></tbody></table>"],col:[2,"<table><tbody></tbody><colgroup>","</colgroup></table>"],area:[1,"<map>","</map>"],_default:[0,"",""]},bA=bk(e),bB=bA.appendChild(e.createElement("div"));bz.optgroup=bz.option,bz.tbody=bz.tfoot=bz.colgroup=bz.caption=bz.thead,bz.th=bz.td,p.support.htmlSerialize||(bz._default=[1,"X<div>","</div>"]),p.fn.extend({text:function(a){return p.access(this,function(a){return a===b?p.text(this):this.empty().append((this[0]&&this[0].ownerDocument||e).createTextNode(a))},null,a,arguments.length)},wrapAll:function(a){if(p.isFunction(a))return this.each(function(b){p(this).wrapAll(a.call(this,b))});if(this[0]){var b=p(a,this[0].ownerDocument).eq(0).clone(!0);this[0].parentNode&&b.insertBefore(this[0]),b.map(function(){var a=this;while(a.firstChild&&a.firstChild.nodeType===1)a=a.firstChild;return a}).append(this)}return this},wrapInner:function(a){return p.isFunction(a)?this.each(function(b){p(this).wrapInner(a.call(this,b))}):this.each(function(){var b=p(this),c=b.contents();c.length?c.wrapAll(a):b.append(a)})},wrap:function(a){var b=p.isFunction(a);return this.each(function(c){p(this).wrapAll(b?a.call(this,c):a)})},unwrap:function(){return this.parent().each(function(){p.nodeName(this,"body")||p(this).replaceWith(this.childNodes)}).end()},append:function(){return this.domManip(arguments,!0,function(a){(this.nodeType===1||this.nodeType===11)&&this.appendChild(a)})},prepend:function(){return this.domManip(arguments,!0,function(a){(this.nodeType===1||this.nodeType===11)&&this.insertBefore(a,this.firstChild)})},before:function(){if(!bh(this[0]))return this.domManip(arguments,!1,function(a){this.parentNode.insertBefore(a,this)});if(arguments.length){var a=p.clean(arguments);return this.pushStack(p.merge(a,this),"before",this.selector)}},after:function(){if(!bh(this[0]))return this.domManip(arguments,!1,function(a){this.parentNode.insertBefore(a,this.nextSibling)});if(arguments.length){var a=p.clean(arguments);return this.pushStack(p.merge(this,a),"after",this.selector)}},remove:function(a,b){var c,d=0;for(;(c=this[d])!=null;d++)if(!a||p.filter(a,[c]).length)!b&&c.nodeType===1&&(p.cleanData(c.getElementsByTagName("*")),p.cleanData([c])),c.parentNode&&c.parentNode.removeChild(c);return this},empty:function(){var a,b=0;for(;(a=this[b])!=null;b++){a.nodeType===1&&p.cleanData(a.getElementsByTagName("*"));while(a.firstChild)a.removeChild(a.firstChild)}return this},clone:function(a,b){return a=a==null?!1:a,b=b==null?a:b,this.map(function(){return p.clone(this,a,b)})},html:function(a){return p.access(this,function(a){var c=this[0]||{},d=0,e=this.length;if(a===b)return c.nodeType===1?c.innerHTML.replace(bm,""):b;if(typeof a=="string"&&!bs.test(a)&&(p.support.htmlSerialize||!bu.test(a))&&(p.support.leadingWhitespace||!bn.test(a))&&!bz[(bp.exec(a)||["",""])[1].toLowerCase()]){a=a.replace(bo,"<$1></$2>");try{for(;d<e;d++)c=this[d]||{},c.nodeType===1&&(p.cleanData(c.getElementsByTagName("*")),c.innerHTML=a);c=0}catch(f){}}c&&this.empty().append(a)},null,a,arguments.length)},replaceWith:function(a){return bh(this[0])?this.length?this.pushStack(p(p.isFunction(a)?a():a),"replaceWith",a):this:p.isFunction(a)?this.each(function(b){var c=p(this),d=c.html();c.replaceWith(a.call(this,b,d))}):(typeof a!="string"&&(a=p(a).detach()),this.each(function(){var b=this.nextSibling,c=this.parentNode;p(this).remove(),b?p(b).before(a):p(c).append(a)}))},detach:function(a){return this.remove(a,!0)},domManip:function(a,c,d){a=[].concat.apply([],a);var e,f,g,h,i=0,j=a[0],k=[],l=this.length;if(!p.support.checkClone&&l>1&&typeof j=="string"&&bw.test(j))return this.each(function(){p(this).domManip(a,c,d)});if(p.isFunction(j))return this.each(function(e){var f=p(this);a[0]=j.call(this,e,c?f.html():b),f.domManip(a,c,d)});if(this[0]){e=p.buildFragment(a,this,k),g=e.fragment,f=g.firstChild,g.childNodes.length===1&&(g=f);if(f){c=c&&p.nodeName(f,"tr");for(h=e.cacheable||l-1;i<l;i++)d.call(c&&p.nodeName(this[i],"table")?bC(this[i],"tbody"):this[i],i===h?g:p.clone(g,!0,!0))}g=f=null,k.length&&p.each(k,function(a,b){b.src?p.ajax?p.ajax({url:b.src,type:"GET",dataType:"script",async:!1,global:!1,"throws":!0}):p.error("no ajax"):p.globalEval((b.text||b.textContent||b.innerHTML||"").replace(by,"")),b.parentNode&&b.parentNode.removeChild(b)})}return this}}),p.buildFragment=function(a,c,d){var f,g,h,i=a[0];return c=c||e,c=(c[0]||c).ownerDocument||c[0]||c,typeof c.createDocumentFragment=="undefined"&&(c=e),a.length===1&&typeof i=="string"&&i.length<512&&c===e&&i.charAt(0)==="<"&&!bt.test(i)&&(p.support.checkClone||!bw.test(i))&&(p.support.html5Clone||!bu.test(i))&&(g=!0,f=p.fragments[i],h=f!==b),f||(f=c.createDocumentFragment(),p.clean(a,c,f,d),g&&(p.fragments[i]=h&&f)),{fragment:f,cacheable:g}},p.fragments={},p.each({appendTo:"append",prependTo:"prepend",insertBefore:"before",insertAfter:"after",replaceAll:"replaceWith"},function(a,b){p.fn[a]=function(c){var d,e=0,f=[],g=p(c),h=g.length,i=this.length===1&&this[0].parentNode;if((i==null||i&&i.nodeType===11&&i.childNodes.length===1)&&h===1)return g[b](this[0]),this;for(;e<h;e++)d=(e>0?this.clone(!0):this).get(),p(g[e])[b](d),f=f.concat(d);return this.pushStack(f,a,g.selector)}}),p.extend({clone:function(a,b,c){var d,e,f,g;p.support.html5Clone||p.isXMLDoc(a)||!bu.test("<"+a.nodeName+">")?g=a.cloneNode(!0):(bB.innerHTML=a.outerHTML,bB.removeChild(g=bB.firstChild));if((!p.support.noCloneEvent||!p.support.noCloneChecked)&&(a.nodeType===1||a.nodeType===11)&&!p.isXMLDoc(a)){bE(a,g),d=bF(a),e=bF(g);for(f=0;d[f];++f)e[f]&&bE(d[f],e[f])}if(b){bD(a,g);if(c){d=bF(a),e=bF(g);for(f=0;d[f];++f)bD(d[f],e[f])}}return d=e=null,g},clean:function(a,b,c,d){var f,g,h,i,j,k,l,m,n,o,q,r,s=0,t=[];if(!b||typeof b.createDocumentFragment=="undefined")b=e;for(g=b===e&&bA;(h=a[s])!=null;s++){typeof h=="number"&&(h+="");if(!h)continue;if(typeof h=="string")if(!br.test(h))h=b.createTextNode(h);else{g=g||bk(b),l=l||g.appendChild(b.createElement("div")),h=h.replace(bo,"<$1></$2>"),i=(bp.exec(h)||["",""])[1].toLowerCase(),j=bz[i]||bz._default,k=j[0],l.innerHTML=j[1]+h+j[2];while(k--)l=l.lastChild;if(!p.support.tbody){m=bq.test(h),n=i==="table"&&!m?l.firstChild&&l.firstChild.childNodes:j[1]==="<table>"&&!m?l.childNodes:[];for(f=n.length-1;f>=0;--f)p.nodeName(n[f],"tbody")&&!n[f].childNodes.length&&n[f].parentNode.removeChild(n[f])}!p.support.leadingWhitespace&&bn.test(h)&&l.insertBefore(b.createTextNode(bn.exec(h)[0]),l.firstChild),h=l.childNodes,l=g.lastChild}h.nodeType?t.push(h):t=p.merge(t,h)}l&&(g.removeChild(l),h=l=g=null);if(!p.support.appendChecked)for(s=0;(h=t[s])!=null;s++)p.nodeName(h,"input")?bG(h):typeof h.getElementsByTagName!="undefined"&&p.grep(h.getElementsByTagName("input"),bG);if(c){q=function(a){if(!a.type||bx.test(a.type))return d?d.push(a.parentNode?a.parentNode.removeChild(a):a):c.appendChild(a)};for(s=0;(h=t[s])!=null;s++)if(!p.nodeName(h,"script")||!q(h))c.appendChild(h),typeof h.getElementsByTagName!="undefined"&&(r=p.grep(p.merge([],h.getElementsByTagName("script")),q),t.splice.apply(t,[s+1,0].concat(r)),s+=r.length)}return t},cleanData:function(a,b){var c,d,e,f,g=0,h=p.expando,i=p.cache,j=p.support.deleteExpando,k=p.event.special;for(;(e=a[g])!=null;g++)if(b||p.acceptData(e)){d=e[h],c=d&&i[d];if(c){if(c.events)for(f in c.events)k[f]?p.event.remove(e,f):p.removeEvent(e,f,c.handle);i[d]&&(delete i[d],j?delete e[h]:e.removeAttribute?e.removeAttribute(h):e[h]=null,p.deletedIds.push(d))}}}}),function(){var a,b;p.uaMatch=function(a){a=a.toLowerCase();var b=/(chrome)[ \/]([\w.]+)/.exec(a)||/(webkit)[ \/]([\w.]+)/.exec(a)||/(opera)(?:.*version|)[ \/]([\w.]+)/.exec(a)||/(msie) ([\w.]+)/.exec(a)||a.indexOf("compatible")<0&&/(mozilla)(?:.*? rv:([\w.]+)|)/.exec(a)||[];return{browser:b[1]||"",version:b[2]||"0"}},a=p.uaMatch(g.userAgent),b={},a.browser&&(b[a.browser]=!0,b.version=a.version),b.webkit&&(b.safari=!0),p.browser=b,p.sub=function(){function a(b,c){return new a.fn.init(b,c)}p.extend(!0,a,this),a.superclass=this,a.fn=a.prototype=this(),a.fn.constructor=a,a.sub=this.sub,a.fn.init=function c(c,d){return d&&d instanceof p&&!(d instanceof a)&&(d=a(d)),p.fn.init.call(this,c,d,b)},a.fn.init.prototype=a.fn;var b=a(e);return a}}();var bH,bI,bJ,bK=/alpha\([^)]*\)/i,bL=/opacity=([^)]*)/,bM=/^(top|right|bottom|left)$/,bN=/^margin/,bO=new RegExp("^("+q+")(.*)$","i"),bP=new RegExp("^("+q+")(?!px)[a-z%]+$","i"),bQ=new RegExp("^([-+])=("+q+")","i"),bR={},bS={position:"absolute",visibility:"hidden",display:"block"},bT={letterSpacing:0,fontWeight:400,lineHeight:1},bU=["Top","Right","Bottom","Left"],bV=["Webkit","O","Moz","ms"],bW=p.fn.toggle;p.fn.extend({css:function(a,c){return p.access(this,function(a,c,d){return d!==b?p.style(a,c,d):p.css(a,c)},a,c,arguments.length>1)},show:function(){return bZ(this,!0)},hide:function(){return bZ(this)},toggle:function(a,b){var c=typeof a=="boolean";return p.isFunction(a)&&p.isFunction(b)?bW.apply(this,arguments):this.each(function(){(c?a:bY(this))?p(this).show():p(this).hide()})}}),p.extend({cssHooks:{opacity:{get:function(a,b){if(b){var c=bH(a,"opacity");return c===""?"1":c}}}},cssNumber:{fillOpacity:!0,fontWeight:!0,lineHeight:!0,opacity:!0,orphans:!0,widows:!0,zIndex:!0,zoom:!0},cssProps:{"float":p.support.cssFloat?"cssFloat":"styleFloat"},style:function(a,c,d,e){if(!a||a.nodeType===3||a.nodeType===8||!a.style)return;var f,g,h,i=p.camelCase(c),j=a.style;c=p.cssProps[i]||(p.cssProps[i]=bX(j,i)),h=p.cssHooks[c]||p.cssHooks[i];if(d===b)return h&&"get"in h&&(f=h.get(a,!1,e))!==b?f:j[c];g=typeof d,g==="string"&&(f=bQ.exec(d))&&(d=(f[1]+1)*f[2]+parseFloat(p.css(a,c)),g="number");if(d==null||g==="number"&&isNaN(d))return;g==="number"&&!p.cssNumber[i]&&(d+="px");if(!h||!("set"in h)||(d=h.set(a,d,e))!==b)try{j[c]=d}catch(k){}},css:function(a,c,d,e){var f,g,h,i=p.camelCase(c);return c=p.cssProps[i]||(p.cssProps[i]=bX(a.style,i)),h=p.cssHooks[c]||p.cssHooks[i],h&&"get"in h&&(f=h.get(a,!0,e)),f===b&&(f=bH(a,c)),f==="normal"&&c in bT&&(f=bT[c]),d||e!==b?(g=parseFloat(f),d||p.isNumeric(g)?g||0:f):f},swap:function(a,b,c){var d,e,f={};for(e in b)f[e]=a.style[e],a.style[e]=b[e];d=c.call(a);for(e in b)a.style[e]=f[e];return d}}),a.getComputedStyle?bH=function(a,b){var c,d,e,f,g=getComputedStyle(a,null),h=a.style;return g&&(c=g[b],c===""&&!p.contains(a.ownerDocument.documentElement,a)&&(c=p.style(a,b)),bP.test(c)&&bN.test(b)&&(d=h.width,e=h.minWidth,f=h.maxWidth,h.minWidth=h.maxWidth=h.width=c,c=g.width,h.width=d,h.minWidth=e,h.maxWidth=f)),c}:e.documentElement.currentStyle&&(bH=function(a,b){var c,d,e=a.currentStyle&&a.currentStyle[b],f=a.style;return e==null&&f&&f[b]&&(e=f[b]),bP.test(e)&&!bM.test(b)&&(c=f.left,d=a.runtimeStyle&&a.runtimeStyle.left,d&&(a.runtimeStyle.left=a.currentStyle.left),f.left=b==="fontSize"?"1em":e,e=f.pixelLeft+"px",f.left=c,d&&(a.runtimeStyle.left=d)),e===""?"auto":e}),p.each(["height","width"],function(a,b){p.cssHooks[b]={get:function(a,c,d){if(c)return a.offsetWidth!==0||bH(a,"display")!=="none"?ca(a,b,d):p.swap(a,bS,function(){return ca(a,b,d)})},set:function(a,c,d){return b$(a,c,d?b_(a,b,d,p.support.boxSizing&&p.css(a,"boxSizing")==="border-box"):0)}}}),p.support.opacity||(p.cssHooks.opacity={get:function(a,b){return bL.test((b&&a.currentStyle?a.currentStyle.filter:a.style.filter)||"")?.01*parseFloat(RegExp.$1)+"":b?"1":""},set:function(a,b){var c=a.style,d=a.currentStyle,e=p.isNumeric(b)?"alpha(opacity="+b*100+")":"",f=d&&d.filter||c.filter||"";c.zoom=1;if(b>=1&&p.trim(f.replace(bK,""))===""&&c.removeAttribute){c.removeAttribute("filter");if(d&&!d.filter)return}c.filter=bK.test(f)?f.replace(bK,e):f+" "+e}}),p(function(){p.support.reliableMarginRight||(p.cssHooks.marginRight={get:function(a,b){return p.swap(a,{display:"inline-block"},function(){if(b)return bH(a,"marginRight")})}}),!p.support.pixelPosition&&p.fn.position&&p.each(["top","left"],function(a,b){p.cssHooks[b]={get:function(a,c){if(c){var d=bH(a,b);return bP.test(d)?p(a).position()[b]+"px":d}}}})}),p.expr&&p.expr.filters&&(p.expr.filters.hidden=function(a){return a.offsetWidth===0&&a.offsetHeight===0||!p.support.reliableHiddenOffsets&&(a.style&&a.style.display||bH(a,"display"))==="none"},p.expr.filters.visible=function(a){return!p.expr.filters.hidden(a)}),p.each({margin:"",padding:"",border:"Width"},function(a,b){p.cssHooks[a+b]={expand:function(c){var d,e=typeof c=="string"?c.split(" "):[c],f={};for(d=0;d<4;d++)f[a+bU[d]+b]=e[d]||e[d-2]||e[0];return f}},bN.test(a)||(p.cssHooks[a+b].set=b$)});var cc=/%20/g,cd=/\[\]$/,ce=/\r?\n/g,cf=/^(?:color|date|datetime|datetime-local|email|hidden|month|number|password|range|search|tel|text|time|url|week)$/i,cg=/^(?:select|textarea)/i;p.fn.extend({serialize:function(){return p.param(this.serializeArray())},serializeArray:function(){return this.map(function(){return this.elements?p.makeArray(this.elements):this}).filter(function(){return this.name&&!this.disabled&&(this.checked||cg.test(this.nodeName)||cf.test(this.type))}).map(function(a,b){var c=p(this).val();return c==null?null:p.isArray(c)?p.map(c,function(a,c){return{name:b.name,value:a.replace(ce,"\r\n")}}):{name:b.name,value:c.replace(ce,"\r\n")}}).get()}}),p.param=function(a,c){var d,e=[],f=function(a,b){b=p.isFunction(b)?b():b==null?"":b,e[e.length]=encodeURIComponent(a)+"="+encodeURIComponent(b)};c===b&&(c=p.ajaxSettings&&p.ajaxSettings.traditional);if(p.isArray(a)||a.jquery&&!p.isPlainObject(a))p.each(a,function(){f(this.name,this.value)});else for(d in a)ch(d,a[d],c,f);return e.join("&").replace(cc,"+")};var ci,cj,ck=/#.*$/,cl=/^(.*?):[ \t]*([^\r\n]*)\r?$/mg,cm=/^(?:about|app|app\-storage|.+\-extension|file|res|widget):$/,cn=/^(?:GET|HEAD)$/,co=/^\/\//,cp=/\?/,cq=/<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>/gi,cr=/([?&])_=[^&]*/,cs=/^([\w\+\.\-]+:)(?:\/\/([^\/?#:]*)(?::(\d+)|)|)/,ct=p.fn.load,cu={},cv={},cw=["*/"]+["*"];try{ci=f.href}catch(cx){ci=e.createElement("a"),ci.href="",ci=ci.href}cj=cs.exec(ci.toLowerCase())||[],p.fn.load=function(a,c,d){if(typeof a!="string"&&ct)return ct.apply(this,arguments);if(!this.length)return this;var e,f,g,h=this,i=a.indexOf(" ");return i>=0&&(e=a.slice(i,a.length),a=a.slice(0,i)),p.isFunction(c)?(d=c,c=b):typeof c=="object"&&(f="POST"),p.ajax({url:a,type:f,dataType:"html",data:c,complete:function(a,b){d&&h.each(d,g||[a.responseText,b,a])}}).done(function(a){g=arguments,h.html(e?p("<div>").append(a.replace(cq,"")).find(e):a)}),this},p.each("ajaxStart ajaxStop ajaxComplete ajaxError ajaxSuccess ajaxSend".split(" "),function(a,b){p.fn[b]=function(a){return this.on(b,a)}}),p.each(["get","post"],function(a,c){p[c]=function(a,d,e,f){return p.isFunction(d)&&(f=f||e,e=d,d=b),p.ajax({type:c,url:a,data:d,success:e,dataType:f})}}),p.extend({getScript:function(a,c){return p.get(a,b,c,"script")},getJSON:function(a,b,c){return p.get(a,b,c,"json")},ajaxSetup:function(a,b){return b?cA(a,p.ajaxSettings):(b=a,a=p.ajaxSettings),cA(a,b),a},ajaxSettings:{url:ci,isLocal:cm.test(cj[1]),global:!0,type:"GET",contentType:"application/x-www-form-urlencoded; charset=UTF-8",processData:!0,async:!0,accepts:{xml:"application/xml, text/xml",html:"text/html",text:"text/plain",json:"application/json, text/javascript","*":cw},contents:{xml:/xml/,html:/html/,json:/json/},responseFields:{xml:"responseXML",text:"responseText"},converters:{"* text":a.String,"text html":!0,"text json":p.parseJSON,"text xml":p.parseXML},flatOptions:{context:!0,url:!0}},ajaxPrefilter:cy(cu),ajaxTransport:cy(cv),ajax:function(a,c){function y(a,c,f,i){var k,s,t,u,w,y=c;if(v===2)return;v=2,h&&clearTimeout(h),g=b,e=i||"",x.readyState=a>0?4:0,f&&(u=cB(l,x,f));if(a>=200&&a<300||a===304)l.ifModified&&(w=x.getResponseHeader("Last-Modified"),w&&(p.lastModified[d]=w),w=x.getResponseHeader("Etag"),w&&(p.etag[d]=w)),a===304?(y="notmodified",k=!0):(k=cC(l,u),y=k.state,s=k.data,t=k.error,k=!t);else{t=y;if(!y||a)y="error",a<0&&(a=0)}x.status=a,x.statusText=""+(c||y),k?o.resolveWith(m,[s,y,x]):o.rejectWith(m,[x,y,t]),x.statusCode(r),r=b,j&&n.trigger("ajax"+(k?"Success":"Error"),[x,l,k?s:t]),q.fireWith(m,[x,y]),j&&(n.trigger("ajaxComplete",[x,l]),--p.active||p.event.trigger("ajaxStop"))}typeof a=="object"&&(c=a,a=b),c=c||{};var d,e,f,g,h,i,j,k,l=p.ajaxSetup({},c),m=l.context||l,n=m!==l&&(m.nodeType||m instanceof p)?p(m):p.event,o=p.Deferred(),q=p.Callbacks("once memory"),r=l.statusCode||{},t={},u={},v=0,w="canceled",x={readyState:0,setRequestHeader:function(a,b){if(!v){var c=a.toLowerCase();a=u[c]=u[c]||a,t[a]=b}return this},getAllResponseHeaders:function(){return v===2?e:null},getResponseHeader:function(a){var c;if(v===2){if(!f){f={};while(c=cl.exec(e))f[c[1].toLowerCase()]=c[2]}c=f[a.toLowerCase()]}return c===b?null:c},overrideMimeType:function(a){return v||(l.mimeType=a),this},abort:function(a){return a=a||w,g&&g.abort(a),y(0,a),this}};o.promise(x),x.success=x.done,x.error=x.fail,x.complete=q.add,x.statusCode=function(a){if(a){var b;if(v<2)for(b in a)r[b]=[r[b],a[b]];else b=a[x.status],x.always(b)}return this},l.url=((a||l.url)+"").replace(ck,"").replace(co,cj[1]+"//"),l.dataTypes=p.trim(l.dataType||"*").toLowerCase().split(s),l.crossDomain==null&&(i=cs.exec(l.url.toLowerCase()),l.crossDomain=!(!i||i[1]==cj[1]&&i[2]==cj[2]&&(i[3]||(i[1]==="http:"?80:443))==(cj[3]||(cj[1]==="http:"?80:443)))),l.data&&l.processData&&typeof l.data!="string"&&(l.data=p.param(l.data,l.traditional)),cz(cu,l,c,x);if(v===2)return x;j=l.global,l.type=l.type.toUpperCase(),l.hasContent=!cn.test(l.type),j&&p.active++===0&&p.event.trigger("ajaxStart");if(!l.hasContent){l.data&&(l.url+=(cp.test(l.url)?"&":"?")+l.data,delete l.data),d=l.url;if(l.cache===!1){var z=p.now(),A=l.url.replace(cr,"$1_="+z);l.url=A+(A===l.url?(cp.test(l.url)?"&":"?")+"_="+z:"")}}(l.data&&l.hasContent&&l.contentType!==!1||c.contentType)&&x.setRequestHeader("Content-Type",l.contentType),l.ifModified&&(d=d||l.url,p.lastModified[d]&&x.setRequestHeader("If-Modified-Since",p.lastModified[d]),p.etag[d]&&x.setRequestHeader("If-None-Match",p.etag[d])),x.setRequestHeader("Accept",l.dataTypes[0]&&l.accepts[l.dataTypes[0]]?l.accepts[l.dataTypes[0]]+(l.dataTypes[0]!=="*"?", "+cw+"; q=0.01":""):l.accepts["*"]);for(k in l.headers)x.setRequestHeader(k,l.headers[k]);if(!l.beforeSend||l.beforeSend.call(m,x,l)!==!1&&v!==2){w="abort";for(k in{success:1,error:1,complete:1})x[k](l[k]);g=cz(cv,l,c,x);if(!g)y(-1,"No Transport");else{x.readyState=1,j&&n.trigger("ajaxSend",[x,l]),l.async&&l.timeout>0&&(h=setTimeout(function(){x.abort("timeout")},l.timeout));try{v=1,g.send(t,y)}catch(B){if(v<2)y(-1,B);else throw B}}return x}return x.abort()},active:0,lastModified:{},etag:{}});var cD=[],cE=/\?/,cF=/(=)\?(?=&|$)|\?\?/,cG=p.now();p.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var a=cD.pop()||p.expando+"_"+cG++;return this[a]=!0,a}}),p.ajaxPrefilter("json jsonp",function(c,d,e){var f,g,h,i=c.data,j=c.url,k=c.jsonp!==!1,l=k&&cF.test(j),m=k&&!l&&typeof i=="string"&&!(c.contentType||"").indexOf("application/x-www-form-urlencoded")&&cF.test(i);if(c.dataTypes[0]==="jsonp"||l||m)return f=c.jsonpCallback=p.isFunction(c.jsonpCallback)?c.jsonpCallback():c.jsonpCallback,g=a[f],l?c.url=j.replace(cF,"$1"+f):m?c.data=i.replace(cF,"$1"+f):k&&(c.url+=(cE.test(j)?"&":"?")+c.jsonp+"="+f),c.converters["script json"]=function(){return h||p.error(f+" was not called"),h[0]},c.dataTypes[0]="json",a[f]=function(){h=arguments},e.always(function(){a[f]=g,c[f]&&(c.jsonpCallback=d.jsonpCallback,cD.push(f)),h&&p.isFunction(g)&&g(h[0]),h=g=b}),"script"}),p.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/javascript|ecmascript/},converters:{"text script":function(a){return p.globalEval(a),a}}}),p.ajaxPrefilter("script",function(a){a.cache===b&&(a.cache=!1),a.crossDomain&&(a.type="GET",a.global=!1)}),p.ajaxTransport("script",function(a){if(a.crossDomain){var c,d=e.head||e.getElementsByTagName("head")[0]||e.documentElement;return{send:function(f,g){c=e.createElement("script"),c.async="async",a.scriptCharset&&(c.charset=a.scriptCharset),c.src=a.url,c.onload=c.onreadystatechange=function(a,e){if(e||!c.readyState||/loaded|complete/.test(c.readyState))c.onload=c.onreadystatechange=null,d&&c.parentNode&&d.removeChild(c),c=b,e||g(200,"success")},d.insertBefore(c,d.firstChild)},abort:function(){c&&c.onload(0,1)}}}});var cH,cI=a.ActiveXObject?function(){for(var a in cH)cH[a](0,1)}:!1,cJ=0;p.ajaxSettings.xhr=a.ActiveXObject?function(){return!this.isLocal&&cK()||cL()}:cK,function(a){p.extend(p.support,{ajax:!!a,cors:!!a&&"withCredentials"in a})}(p.ajaxSettings.xhr()),p.support.ajax&&p.ajaxTransport(function(c){if(!c.crossDomain||p.support.cors){var d;return{send:function(e,f){var g,h,i=c.xhr();c.username?i.open(c.type,c.url,c.async,c.username,c.password):i.open(c.type,c.url,c.async);if(c.xhrFields)for(h in c.xhrFields)i[h]=c.xhrFields[h];c.mimeType&&i.overrideMimeType&&i.overrideMimeType(c.mimeType),!c.crossDomain&&!e["X-Requested-With"]&&(e["X-Requested-With"]="XMLHttpRequest");try{for(h in e)i.setRequestHeader(h,e[h])}catch(j){}i.send(c.hasContent&&c.data||null),d=function(a,e){var h,j,k,l,m;try{if(d&&(e||i.readyState===4)){d=b,g&&(i.onreadystatechange=p.noop,cI&&delete cH[g]);if(e)i.readyState!==4&&i.abort();else{h=i.status,k=i.getAllResponseHeaders(),l={},m=i.responseXML,m&&m.documentElement&&(l.xml=m);try{l.text=i.responseText}catch(a){}try{j=i.statusText}catch(n){j=""}!h&&c.isLocal&&!c.crossDomain?h=l.text?200:404:h===1223&&(h=204)}}}catch(o){e||f(-1,o)}l&&f(h,j,l,k)},c.async?i.readyState===4?setTimeout(d,0):(g=++cJ,cI&&(cH||(cH={},p(a).unload(cI)),cH[g]=d),i.onreadystatechange=d):d()},abort:function(){d&&d(0,1)}}}});var cM,cN,cO=/^(?:toggle|show|hide)$/,cP=new RegExp("^(?:([-+])=|)("+q+")([a-z%]*)$","i"),cQ=/queueHooks$/,cR=[cX],cS={"*":[function(a,b){var c,d,e,f=this.createTween(a,b),g=cP.exec(b),h=f.cur(),i=+h||0,j=1;if(g){c=+g[2],d=g[3]||(p.cssNumber[a]?"":"px");if(d!=="px"&&i){i=p.css(f.elem,a,!0)||c||1;do e=j=j||".5",i=i/j,p.style(f.elem,a,i+d),j=f.cur()/h;while(j!==1&&j!==e)}f.unit=d,f.start=i,f.end=g[1]?i+(g[1]+1)*c:c}return f}]};p.Animation=p.extend(cV,{tweener:function(a,b){p.isFunction(a)?(b=a,a=["*"]):a=a.split(" ");var c,d=0,e=a.length;for(;d<e;d++)c=a[d],cS[c]=cS[c]||[],cS[c].unshift(b)},prefilter:function(a,b){b?cR.unshift(a):cR.push(a)}}),p.Tween=cY,cY.prototype={constructor:cY,init:function(a,b,c,d,e,f){this.elem=a,this.prop=c,this.easing=e||"swing",this.options=b,this.start=this.now=this.cur(),this.end=d,this.unit=f||(p.cssNumber[c]?"":"px")},cur:function(){var a=cY.propHooks[this.prop];return a&&a.get?a.get(this):cY.propHooks._default.get(this)},run:function(a){var b,c=cY.propHooks[this.prop];return this.pos=b=p.easing[this.easing](a,this.options.duration*a,0,1,this.options.duration),this.now=(this.end-this.start)*b+this.start,this.options.step&&this.options.step.call(this.elem,this.now,this),c&&c.set?c.set(this):cY.propHooks._default.set(this),this}},cY.prototype.init.prototype=cY.prototype,cY.propHooks={_default:{get:function(a){var b;return a.elem[a.prop]==null||!!a.elem.style&&a.elem.style[a.prop]!=null?(b=p.css(a.elem,a.prop,!1,""),!b||b==="auto"?0:b):a.elem[a.prop]},set:function(a){p.fx.step[a.prop]?p.fx.step[a.prop](a):a.elem.style&&(a.elem.style[p.cssProps[a.prop]]!=null||p.cssHooks[a.prop])?p.style(a.elem,a.prop,a.now+a.unit):a.elem[a.prop]=a.now}}},cY.propHooks.scrollTop=cY.propHooks.scrollLeft={set:function(a){a.elem.nodeType&&a.elem.parentNode&&(a.elem[a.prop]=a.now)}},p.each(["toggle","show","hide"],function(a,b){var c=p.fn[b];p.fn[b]=function(d,e,f){return d==null||typeof d=="boolean"||!a&&p.isFunction(d)&&p.isFunction(e)?c.apply(this,arguments):this.animate(cZ(b,!0),d,e,f)}}),p.fn.extend({fadeTo:function(a,b,c,d){return this.filter(bY).css("opacity",0).show().end().animate({opacity:b},a,c,d)},animate:function(a,b,c,d){var e=p.isEmptyObject(a),f=p.speed(b,c,d),g=function(){var b=cV(this,p.extend({},a),f);e&&b.stop(!0)};return e||f.queue===!1?this.each(g):this.queue(f.queue,g)},stop:function(a,c,d){var e=function(a){var b=a.stop;delete a.stop,b(d)};return typeof a!="string"&&(d=c,c=a,a=b),c&&a!==!1&&this.queue(a||"fx",[]),this.each(function(){var b=!0,c=a!=null&&a+"queueHooks",f=p.timers,g=p._data(this);if(c)g[c]&&g[c].stop&&e(g[c]);else for(c in g)g[c]&&g[c].stop&&cQ.test(c)&&e(g[c]);for(c=f.length;c--;)f[c].elem===this&&(a==null||f[c].queue===a)&&(f[c].anim.stop(d),b=!1,f.splice(c,1));(b||!d)&&p.dequeue(this,a)})}}),p.each({slideDown:cZ("show"),slideUp:cZ("hide"),slideToggle:cZ("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},function(a,b){p.fn[a]=function(a,c,d){return this.animate(b,a,c,d)}}),p.speed=function(a,b,c){var d=a&&typeof a=="object"?p.extend({},a):{complete:c||!c&&b||p.isFunction(a)&&a,duration:a,easing:c&&b||b&&!p.isFunction(b)&&b};d.duration=p.fx.off?0:typeof d.duration=="number"?d.duration:d.duration in p.fx.speeds?p.fx.speeds[d.duration]:p.fx.speeds._default;if(d.queue==null||d.queue===!0)d.queue="fx";return d.old=d.complete,d.complete=function(){p.isFunction(d.old)&&d.old.call(this),d.queue&&p.dequeue(this,d.queue)},d},p.easing={linear:function(a){return a},swing:function(a){return.5-Math.cos(a*Math.PI)/2}},p.timers=[],p.fx=cY.prototype.init,p.fx.tick=function(){var a,b=p.timers,c=0;for(;c<b.length;c++)a=b[c],!a()&&b[c]===a&&b.splice(c--,1);b.length||p.fx.stop()},p.fx.timer=function(a){a()&&p.timers.push(a)&&!cN&&(cN=setInterval(p.fx.tick,p.fx.interval))},p.fx.interval=13,p.fx.stop=function(){clearInterval(cN),cN=null},p.fx.speeds={slow:600,fast:200,_default:400},p.fx.step={},p.expr&&p.expr.filters&&(p.expr.filters.animated=function(a){return p.grep(p.timers,function(b){return a===b.elem}).length});var c$=/^(?:body|html)$/i;p.fn.offset=function(a){if(arguments.length)return a===b?this:this.each(function(b){p.offset.setOffset(this,a,b)});var c,d,e,f,g,h,i,j,k,l,m=this[0],n=m&&m.ownerDocument;if(!n)return;return(e=n.body)===m?p.offset.bodyOffset(m):(d=n.documentElement,p.contains(d,m)?(c=m.getBoundingClientRect(),f=c_(n),g=d.clientTop||e.clientTop||0,h=d.clientLeft||e.clientLeft||0,i=f.pageYOffset||d.scrollTop,j=f.pageXOffset||d.scrollLeft,k=c.top+i-g,l=c.left+j-h,{top:k,left:l}):{top:0,left:0})},p.offset={bodyOffset:function(a){var b=a.offsetTop,c=a.offsetLeft;return p.support.doesNotIncludeMarginInBodyOffset&&(b+=parseFloat(p.css(a,"marginTop"))||0,c+=parseFloat(p.css(a,"marginLeft"))||0),{top:b,left:c}},setOffset:function(a,b,c){var d=p.css(a,"position");d==="static"&&(a.style.position="relative");var e=p(a),f=e.offset(),g=p.css(a,"top"),h=p.css(a,"left"),i=(d==="absolute"||d==="fixed")&&p.inArray("auto",[g,h])>-1,j={},k={},l,m;i?(k=e.position(),l=k.top,m=k.left):(l=parseFloat(g)||0,m=parseFloat(h)||0),p.isFunction(b)&&(b=b.call(a,c,f)),b.top!=null&&(j.top=b.top-f.top+l),b.left!=null&&(j.left=b.left-f.left+m),"using"in b?b.using.call(a,j):e.css(j)}},p.fn.extend({position:function(){if(!this[0])return;var a=this[0],b=this.offsetParent(),c=this.offset(),d=c$.test(b[0].nodeName)?{top:0,left:0}:b.offset();return c.top-=parseFloat(p.css(a,"marginTop"))||0,c.left-=parseFloat(p.css(a,"marginLeft"))||0,d.top+=parseFloat(p.css(b[0],"borderTopWidth"))||0,d.left+=parseFloat(p.css(b[0],"borderLeftWidth"))||0,{top:c.top-d.top,left:c.left-d.left}},offsetParent:function(){return this.map(function(){var a=this.offsetParent||e.body;while(a&&!c$.test(a.nodeName)&&p.css(a,"position")==="static")a=a.offsetParent;return a||e.body})}}),p.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},function(a,c){var d=/Y/.test(c);p.fn[a]=function(e){return p.access(this,function(a,e,f){var g=c_(a);if(f===b)return g?c in g?g[c]:g.document.documentElement[e]:a[e];g?g.scrollTo(d?p(g).scrollLeft():f,d?f:p(g).scrollTop()):a[e]=f},a,e,arguments.length,null)}}),p.each({Height:"height",Width:"width"},function(a,c){p.each({padding:"inner"+a,content:c,"":"outer"+a},function(d,e){p.fn[e]=function(e,f){var g=arguments.length&&(d||typeof e!="boolean"),h=d||(e===!0||f===!0?"margin":"border");return p.access(this,function(c,d,e){var f;return p.isWindow(c)?c.document.documentElement["client"+a]:c.nodeType===9?(f=c.documentElement,Math.max(c.body["scroll"+a],f["scroll"+a],c.body["offset"+a],f["offset"+a],f["client"+a])):e===b?p.css(c,d,e,h):p.style(c,d,e,h)},c,g?e:b,g)}})}),a.jQuery=a.$=p,typeof define=="function"&&define.amd&&define.amd.jQuery&&define("jquery",[],function(){return p})})(window);;
+(function(b){b.fn.slideto=function(a){a=b.extend({slide_duration:"slow",highlight_duration:3E3,highlight:true,highlight_color:"#FFFF99"},a);return this.each(function(){obj=b(this);b("body").animate({scrollTop:obj.offset().top},a.slide_duration,function(){a.highlight&&b.ui.version&&obj.effect("highlight",{color:a.highlight_color},a.highlight_duration)})})}})(jQuery);;
+jQuery.fn.wiggle=function(o){var d={speed:50,wiggles:3,travel:5,callback:null};var o=jQuery.extend(d,o);return this.each(function(){var cache=this;var wrap=jQuery(this).wrap('<div class="wiggle-wrap"></div>').css("position","relative");var calls=0;for(i=1;i<=o.wiggles;i++){jQuery(this).animate({left:"-="+o.travel},o.speed).animate({left:"+="+o.travel*2},o.speed*2).animate({left:"-="+o.travel},o.speed,function(){calls++;if(jQuery(cache).parent().hasClass('wiggle-wrap')){jQuery(cache).parent().replaceWith(cache);}
+if(calls==o.wiggles&&jQuery.isFunction(o.callback)){o.callback();}});}});};;
+(function($,p){var i,m=Array.prototype.slice,r=decodeURIComponent,a=$.param,c,l,v,b=$.bbq=$.bbq||{},q,u,j,e=$.event.special,d="hashchange",A="querystring",D="fragment",y="elemUrlAttr",g="location",k="href",t="src",x=/^.*\?|#.*$/g,w=/^.*\#/,h,C={};function E(F){return typeof F==="string"}function B(G){var F=m.call(arguments,1);return function(){return G.apply(this,F.concat(m.call(arguments)))}}function n(F){return F.replace(/^[^#]*#?(.*)$/,"$1")}function o(F){return F.replace(/(?:^[^?#]*\?([^#]*).*$)?.*/,"$1")}function f(H,M,F,I,G){var O,L,K,N,J;if(I!==i){K=F.match(H?/^([^#]*)\#?(.*)$/:/^([^#?]*)\??([^#]*)(#?.*)/);J=K[3]||"";if(G===2&&E(I)){L=I.replace(H?w:x,"")}else{N=l(K[2]);I=E(I)?l[H?D:A](I):I;L=G===2?I:G===1?$.extend({},I,N):$.extend({},N,I);L=a(L);if(H){L=L.replace(h,r)}}O=K[1]+(H?"#":L||!K[1]?"?":"")+L+J}else{O=M(F!==i?F:p[g][k])}return O}a[A]=B(f,0,o);a[D]=c=B(f,1,n);c.noEscape=function(G){G=G||"";var F=$.map(G.split(""),encodeURIComponent);h=new RegExp(F.join("|"),"g")};c.noEscape(",/");$.deparam=l=function(I,F){var H={},G={"true":!0,"false":!1,"null":null};$.each(I.replace(/\+/g," ").split("&"),function(L,Q){var K=Q.split("="),P=r(K[0]),J,O=H,M=0,R=P.split("]["),N=R.length-1;if(/\[/.test(R[0])&&/\]$/.test(R[N])){R[N]=R[N].replace(/\]$/,"");R=R.shift().split("[").concat(R);N=R.length-1}else{N=0}if(K.length===2){J=r(K[1]);if(F){J=J&&!isNaN(J)?+J:J==="undefined"?i:G[J]!==i?G[J]:J}if(N){for(;M<=N;M++){P=R[M]===""?O.length:R[M];O=O[P]=M<N?O[P]||(R[M+1]&&isNaN(R[M+1])?{}:[]):J}}else{if($.isArray(H[P])){H[P].push(J)}else{if(H[P]!==i){H[P]=[H[P],J]}else{H[P]=J}}}}else{if(P){H[P]=F?i:""}}});return H};function z(H,F,G){if(F===i||typeof F==="boolean"){G=F;F=a[H?D:A]()}else{F=E(F)?F.replace(H?w:x,""):F}return l(F,G)}l[A]=B(z,0);l[D]=v=B(z,1);$[y]||($[y]=function(F){return $.extend(C,F)})({a:k,base:k,iframe:t,img:t,input:t,form:"action",link:k,script:t});j=$[y];function s(I,G,H,F){if(!E(H)&&typeof H!=="object"){F=H;H=G;G=i}return this.each(function(){var L=$(this),J=G||j()[(this.nodeName||"").toLowerCase()]||"",K=J&&L.attr(J)||"";L.attr(J,a[I](K,H,F))})}$.fn[A]=B(s,A);$.fn[D]=B(s,D);b.pushState=q=function(I,F){if(E(I)&&/^#/.test(I)&&F===i){F=2}var H=I!==i,G=c(p[g][k],H?I:{},H?F:2);p[g][k]=G+(/#/.test(G)?"":"#")};b.getState=u=function(F,G){return F===i||typeof F==="boolean"?v(F):v(G)[F]};b.removeState=function(F){var G={};if(F!==i){G=u();$.each($.isArray(F)?F:arguments,function(I,H){delete G[H]})}q(G,2)};e[d]=$.extend(e[d],{add:function(F){var H;function G(J){var I=J[D]=c();J.getState=function(K,L){return K===i||typeof K==="boolean"?l(I,K):l(I,L)[K]};H.apply(this,arguments)}if($.isFunction(F)){H=F;return G}else{H=F.handler;F.handler=G}}})})(jQuery,this);(function($,i,b){var j,k=$.event.special,c="location",d="hashchange",l="href",f=$.browser,g=document.documentMode,h=f.msie&&(g===b||g<8),e="on"+d in i&&!h;function a(m){m=m||i[c][l];return m.replace(/^[^#]*#?(.*)$/,"$1")}$[d+"Delay"]=100;k[d]=$.extend(k[d],{setup:function(){if(e){return false}$(j.start)},teardown:function(){if(e){return false}$(j.stop)}});j=(function(){var m={},r,n,o,q;function p(){o=q=function(s){return s};if(h){n=$('<iframe src="javascript:0"/>').hide().insertAfter("body")[0].contentWindow;q=function(){return a(n.document[c][l])};o=function(u,s){if(u!==s){var t=n.document;t.open().close();t[c].hash="#"+u}};o(a())}}m.start=function(){if(r){return}var t=a();o||p();(function s(){var v=a(),u=q(t);if(v!==t){o(t=v,u);$(i).trigger(d)}else{if(u!==t){i[c][l]=i[c][l].replace(/#.*/,"")+"#"+u}}r=setTimeout(s,$[d+"Delay"])})()};m.stop=function(){if(!n){r&&clearTimeout(r);r=0}};return m})()})(jQuery,this);;
+var Handlebars={};(function(Handlebars,undefined){;Handlebars.VERSION="1.0.0";Handlebars.COMPILER_REVISION=4;Handlebars.REVISION_CHANGES={1:'<= 1.0.rc.2',2:'== 1.0.0-rc.3',3:'== 1.0.0-rc.4',4:'>= 1.0.0'};Handlebars.helpers={};Handlebars.partials={};var toString=Object.prototype.toString,functionType='[object Function]',objectType='[object Object]';Handlebars.registerHelper=function(name,fn,inverse){if(toString.call(name)===objectType){if(inverse||fn){throw new Handlebars.Exception('Arg not supported with multiple helpers');}
+Handlebars.Utils.extend(this.helpers,name);}else{if(inverse){fn.not=inverse;}
+this.helpers[name]=fn;}};Handlebars.registerPartial=function(name,str){if(toString.call(name)===objectType){Handlebars.Utils.extend(this.partials,name);}else{this.partials[name]=str;}};Handlebars.registerHelper('helperMissing',function(arg){if(arguments.length===2){return undefined;}else{throw new Error("Missing helper: '"+arg+"'");}});Handlebars.registerHelper('blockHelperMissing',function(context,options){var inverse=options.inverse||function(){},fn=options.fn;var type=toString.call(context);if(type===functionType){context=context.call(this);}
+if(context===true){return fn(this);}else if(context===false||context==null){return inverse(this);}else if(type==="[object Array]"){if(context.length>0){return Handlebars.helpers.each(context,options);}else{return inverse(this);}}else{return fn(context);}});Handlebars.K=function(){};Handlebars.createFrame=Object.create||function(object){Handlebars.K.prototype=object;var obj=new Handlebars.K();Handlebars.K.prototype=null;return obj;};Handlebars.logger={DEBUG:0,INFO:1,WARN:2,ERROR:3,level:3,methodMap:{0:'debug',1:'info',2:'warn',3:'error'},log:function(level,obj){if(Handlebars.logger.level<=level){var method=Handlebars.logger.methodMap[level];if(typeof console!=='undefined'&&console[method]){console[method].call(console,obj);}}}};Handlebars.log=function(level,obj){Handlebars.logger.log(level,obj);};Handlebars.registerHelper('each',function(context,options){var fn=options.fn,inverse=options.inverse;var i=0,ret="",data;var type=toString.call(context);if(type===functionType){context=context.call(this);}
+if(options.data){data=Handlebars.createFrame(options.data);}
+if(context&&typeof context==='object'){if(context instanceof Array){for(var j=context.length;i<j;i++){if(data){data.index=i;}
+ret=ret+fn(context[i],{data:data});}}else{for(var key in context){if(context.hasOwnProperty(key)){if(data){data.key=key;}
+ret=ret+fn(context[key],{data:data});i++;}}}}
+if(i===0){ret=inverse(this);}
+return ret;});Handlebars.registerHelper('if',function(conditional,options){var type=toString.call(conditional);if(type===functionType){conditional=conditional.call(this);}
+if(!conditional||Handlebars.Utils.isEmpty(conditional)){return options.inverse(this);}else{return options.fn(this);}});Handlebars.registerHelper('unless',function(conditional,options){return Handlebars.helpers['if'].call(this,conditional,{fn:options.inverse,inverse:options.fn});});Handlebars.registerHelper('with',function(context,options){var type=toString.call(context);if(type===functionType){context=context.call(this);}
+if(!Handlebars.Utils.isEmpty(context))return options.fn(context);});Handlebars.registerHelper('log',function(context,options){var level=options.data&&options.data.level!=null?parseInt(options.data.level,10):1;Handlebars.log(level,context);});;var errorProps=['description','fileName','lineNumber','message','name','number','stack'];Handlebars.Exception=function(message){var tmp=Error.prototype.constructor.apply(this,arguments);for(var idx=0;idx<errorProps.length;idx++){this[errorProps[idx]]=tmp[errorProps[idx]];}};Handlebars.Exception.prototype=new Error();Handlebars.SafeString=function(string){this.string=string;};Handlebars.SafeString.prototype.toString=function(){return this.string.toString();};var escape={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#x27;","`":"&#x60;"};var badChars=/[&<>"'`]/g;var possible=/[&<>"'`]/;var escapeChar=function(chr){return escape[chr]||"&amp;";};Handlebars.Utils={extend:function(obj,value){for(var key in value){if(value.hasOwnProperty(key)){obj[key]=value[key];}}},escapeExpression:function(string){if(string instanceof Handlebars.SafeString){return string.toString();}else if(string==null||string===false){return"";}
+string=string.toString();if(!possible.test(string)){return string;}
+return string.replace(badChars,escapeChar);},isEmpty:function(value){if(!value&&value!==0){return true;}else if(toString.call(value)==="[object Array]"&&value.length===0){return true;}else{return false;}}};;Handlebars.VM={template:function(templateSpec){var container={escapeExpression:Handlebars.Utils.escapeExpression,invokePartial:Handlebars.VM.invokePartial,programs:[],program:function(i,fn,data){var programWrapper=this.programs[i];if(data){programWrapper=Handlebars.VM.program(i,fn,data);}else if(!programWrapper){programWrapper=this.programs[i]=Handlebars.VM.program(i,fn);}
+return programWrapper;},merge:function(param,common){var ret=param||common;if(param&&common){ret={};Handlebars.Utils.extend(ret,common);Handlebars.Utils.extend(ret,param);}
+return ret;},programWithDepth:Handlebars.VM.programWithDepth,noop:Handlebars.VM.noop,compilerInfo:null};return function(context,options){options=options||{};var result=templateSpec.call(container,Handlebars,context,options.helpers,options.partials,options.data);var compilerInfo=container.compilerInfo||[],compilerRevision=compilerInfo[0]||1,currentRevision=Handlebars.COMPILER_REVISION;if(compilerRevision!==currentRevision){if(compilerRevision<currentRevision){var runtimeVersions=Handlebars.REVISION_CHANGES[currentRevision],compilerVersions=Handlebars.REVISION_CHANGES[compilerRevision];throw"Template was precompiled with an older version of Handlebars than the current runtime. "+"Please update your precompiler to a newer version ("+runtimeVersions+") or downgrade your runtime to an older version ("+compilerVersions+").";}else{throw"Template was precompiled with a newer version of Handlebars than the current runtime. "+"Please update your runtime to a newer version ("+compilerInfo[1]+").";}}
+return result;};},programWithDepth:function(i,fn,data){var args=Array.prototype.slice.call(arguments,3);var program=function(context,options){options=options||{};return fn.apply(this,[context,options.data||data].concat(args));};program.program=i;program.depth=args.length;return program;},program:function(i,fn,data){var program=function(context,options){options=options||{};return fn(context,options.data||data);};program.program=i;program.depth=0;return program;},noop:function(){return"";},invokePartial:function(partial,name,context,helpers,partials,data){var options={helpers:helpers,partials:partials,data:data};if(partial===undefined){throw new Handlebars.Exception("The partial "+name+" could not be found");}else if(partial instanceof Function){return partial(context,options);}else if(!Handlebars.compile){throw new Handlebars.Exception("The partial "+name+" could not be compiled when running in runtime-only mode");}else{partials[name]=Handlebars.compile(partial,{data:data!==undefined});return partials[name](context,options);}}};Handlebars.template=Handlebars.VM.template;;})(Handlebars);;;
+(function(){function r(a,c,d){if(a===c)return 0!==a||1/a==1/c;if(null==a||null==c)return a===c;a._chain&&(a=a._wrapped);c._chain&&(c=c._wrapped);if(a.isEqual&&b.isFunction(a.isEqual))return a.isEqual(c);if(c.isEqual&&b.isFunction(c.isEqual))return c.isEqual(a);var e=l.call(a);if(e!=l.call(c))return!1;switch(e){case"[object String]":return a==""+c;case"[object Number]":return a!=+a?c!=+c:0==a?1/a==1/c:a==+c;case"[object Date]":case"[object Boolean]":return+a==+c;case"[object RegExp]":return a.source==c.source&&a.global==c.global&&a.multiline==c.multiline&&a.ignoreCase==c.ignoreCase}if("object"!=typeof a||"object"!=typeof c)return!1;for(var f=d.length;f--;)if(d[f]==a)return!0;d.push(a);var f=0,g=!0;if("[object Array]"==e){if(f=a.length,g=f==c.length)for(;f--&&(g=f in a==f in c&&r(a[f],c[f],d)););}else{if("constructor"in a!="constructor"in c||a.constructor!=c.constructor)return!1;for(var h in a)if(b.has(a,h)&&(f++,!(g=b.has(c,h)&&r(a[h],c[h],d))))break;if(g){for(h in c)if(b.has(c,h)&&!f--)break;g=!f}}d.pop();return g}var s=this,I=s._,o={},k=Array.prototype,p=Object.prototype,i=k.slice,J=k.unshift,l=p.toString,K=p.hasOwnProperty,y=k.forEach,z=k.map,A=k.reduce,B=k.reduceRight,C=k.filter,D=k.every,E=k.some,q=k.indexOf,F=k.lastIndexOf,p=Array.isArray,L=Object.keys,t=Function.prototype.bind,b=function(a){return new m(a)};"undefined"!==typeof exports?("undefined"!==typeof module&&module.exports&&(exports=module.exports=b),exports._=b):s._=b;b.VERSION="1.3.3";var j=b.each=b.forEach=function(a,c,d){if(a!=null)if(y&&a.forEach===y)a.forEach(c,d);else if(a.length===+a.length)for(var e=0,f=a.length;e<f;e++){if(e in a&&c.call(d,a[e],e,a)===o)break}else for(e in a)if(b.has(a,e)&&c.call(d,a[e],e,a)===o)break};b.map=b.collect=function(a,c,b){var e=[];if(a==null)return e;if(z&&a.map===z)return a.map(c,b);j(a,function(a,g,h){e[e.length]=c.call(b,a,g,h)});if(a.length===+a.length)e.length=a.length;return e};b.reduce=b.foldl=b.inject=function(a,c,d,e){var f=arguments.length>2;a==null&&(a=[]);if(A&&a.reduce===A){e&&(c=b.bind(c,e));return f?a.reduce(c,d):a.reduce(c)}j(a,function(a,b,i){if(f)d=c.call(e,d,a,b,i);else{d=a;f=true}});if(!f)throw new TypeError("Reduce of empty array with no initial value");return d};b.reduceRight=b.foldr=function(a,c,d,e){var f=arguments.length>2;a==null&&(a=[]);if(B&&a.reduceRight===B){e&&(c=b.bind(c,e));return f?a.reduceRight(c,d):a.reduceRight(c)}var g=b.toArray(a).reverse();e&&!f&&(c=b.bind(c,e));return f?b.reduce(g,c,d,e):b.reduce(g,c)};b.find=b.detect=function(a,c,b){var e;G(a,function(a,g,h){if(c.call(b,a,g,h)){e=a;return true}});return e};b.filter=b.select=function(a,c,b){var e=[];if(a==null)return e;if(C&&a.filter===C)return a.filter(c,b);j(a,function(a,g,h){c.call(b,a,g,h)&&(e[e.length]=a)});return e};b.reject=function(a,c,b){var e=[];if(a==null)return e;j(a,function(a,g,h){c.call(b,a,g,h)||(e[e.length]=a)});return e};b.every=b.all=function(a,c,b){var e=true;if(a==null)return e;if(D&&a.every===D)return a.every(c,b);j(a,function(a,g,h){if(!(e=e&&c.call(b,a,g,h)))return o});return!!e};var G=b.some=b.any=function(a,c,d){c||(c=b.identity);var e=false;if(a==null)return e;if(E&&a.some===E)return a.some(c,d);j(a,function(a,b,h){if(e||(e=c.call(d,a,b,h)))return o});return!!e};b.include=b.contains=function(a,c){var b=false;if(a==null)return b;if(q&&a.indexOf===q)return a.indexOf(c)!=-1;return b=G(a,function(a){return a===c})};b.invoke=function(a,c){var d=i.call(arguments,2);return b.map(a,function(a){return(b.isFunction(c)?c||a:a[c]).apply(a,d)})};b.pluck=function(a,c){return b.map(a,function(a){return a[c]})};b.max=function(a,c,d){if(!c&&b.isArray(a)&&a[0]===+a[0])return Math.max.apply(Math,a);if(!c&&b.isEmpty(a))return-Infinity;var e={computed:-Infinity};j(a,function(a,b,h){b=c?c.call(d,a,b,h):a;b>=e.computed&&(e={value:a,computed:b})});return e.value};b.min=function(a,c,d){if(!c&&b.isArray(a)&&a[0]===+a[0])return Math.min.apply(Math,a);if(!c&&b.isEmpty(a))return Infinity;var e={computed:Infinity};j(a,function(a,b,h){b=c?c.call(d,a,b,h):a;b<e.computed&&(e={value:a,computed:b})});return e.value};b.shuffle=function(a){var b=[],d;j(a,function(a,f){d=Math.floor(Math.random()*(f+1));b[f]=b[d];b[d]=a});return b};b.sortBy=function(a,c,d){var e=b.isFunction(c)?c:function(a){return a[c]};return b.pluck(b.map(a,function(a,b,c){return{value:a,criteria:e.call(d,a,b,c)}}).sort(function(a,b){var c=a.criteria,d=b.criteria;return c===void 0?1:d===void 0?-1:c<d?-1:c>d?1:0}),"value")};b.groupBy=function(a,c){var d={},e=b.isFunction(c)?c:function(a){return a[c]};j(a,function(a,b){var c=e(a,b);(d[c]||(d[c]=[])).push(a)});return d};b.sortedIndex=function(a,c,d){d||(d=b.identity);for(var e=0,f=a.length;e<f;){var g=e+f>>1;d(a[g])<d(c)?e=g+1:f=g}return e};b.toArray=function(a){return!a?[]:b.isArray(a)||b.isArguments(a)?i.call(a):a.toArray&&b.isFunction(a.toArray)?a.toArray():b.values(a)};b.size=function(a){return b.isArray(a)?a.length:b.keys(a).length};b.first=b.head=b.take=function(a,b,d){return b!=null&&!d?i.call(a,0,b):a[0]};b.initial=function(a,b,d){return i.call(a,0,a.length-(b==null||d?1:b))};b.last=function(a,b,d){return b!=null&&!d?i.call(a,Math.max(a.length-b,0)):a[a.length-1]};b.rest=b.tail=function(a,b,d){return i.call(a,b==null||d?1:b)};b.compact=function(a){return b.filter(a,function(a){return!!a})};b.flatten=function(a,c){return b.reduce(a,function(a,e){if(b.isArray(e))return a.concat(c?e:b.flatten(e));a[a.length]=e;return a},[])};b.without=function(a){return b.difference(a,i.call(arguments,1))};b.uniq=b.unique=function(a,c,d){var d=d?b.map(a,d):a,e=[];a.length<3&&(c=true);b.reduce(d,function(d,g,h){if(c?b.last(d)!==g||!d.length:!b.include(d,g)){d.push(g);e.push(a[h])}return d},[]);return e};b.union=function(){return b.uniq(b.flatten(arguments,true))};b.intersection=b.intersect=function(a){var c=i.call(arguments,1);return b.filter(b.uniq(a),function(a){return b.every(c,function(c){return b.indexOf(c,a)>=0})})};b.difference=function(a){var c=b.flatten(i.call(arguments,1),true);return b.filter(a,function(a){return!b.include(c,a)})};b.zip=function(){for(var a=i.call(arguments),c=b.max(b.pluck(a,"length")),d=Array(c),e=0;e<c;e++)d[e]=b.pluck(a,""+e);return d};b.indexOf=function(a,c,d){if(a==null)return-1;var e;if(d){d=b.sortedIndex(a,c);return a[d]===c?d:-1}if(q&&a.indexOf===q)return a.indexOf(c);d=0;for(e=a.length;d<e;d++)if(d in a&&a[d]===c)return d;return-1};b.lastIndexOf=function(a,b){if(a==null)return-1;if(F&&a.lastIndexOf===F)return a.lastIndexOf(b);for(var d=a.length;d--;)if(d in a&&a[d]===b)return d;return-1};b.range=function(a,b,d){if(arguments.length<=1){b=a||0;a=0}for(var d=arguments[2]||1,e=Math.max(Math.ceil((b-a)/d),0),f=0,g=Array(e);f<e;){g[f++]=a;a=a+d}return g};var H=function(){};b.bind=function(a,c){var d,e;if(a.bind===t&&t)return t.apply(a,i.call(arguments,1));if(!b.isFunction(a))throw new TypeError;e=i.call(arguments,2);return d=function(){if(!(this instanceof d))return a.apply(c,e.concat(i.call(arguments)));H.prototype=a.prototype;var b=new H,g=a.apply(b,e.concat(i.call(arguments)));return Object(g)===g?g:b}};b.bindAll=function(a){var c=i.call(arguments,1);c.length==0&&(c=b.functions(a));j(c,function(c){a[c]=b.bind(a[c],a)});return a};b.memoize=function(a,c){var d={};c||(c=b.identity);return function(){var e=c.apply(this,arguments);return b.has(d,e)?d[e]:d[e]=a.apply(this,arguments)}};b.delay=function(a,b){var d=i.call(arguments,2);return setTimeout(function(){return a.apply(null,d)},b)};b.defer=function(a){return b.delay.apply(b,[a,1].concat(i.call(arguments,1)))};b.throttle=function(a,c){var d,e,f,g,h,i,j=b.debounce(function(){h=g=false},c);return function(){d=this;e=arguments;f||(f=setTimeout(function(){f=null;h&&a.apply(d,e);j()},c));g?h=true:i=a.apply(d,e);j();g=true;return i}};b.debounce=function(a,b,d){var e;return function(){var f=this,g=arguments;d&&!e&&a.apply(f,g);clearTimeout(e);e=setTimeout(function(){e=null;d||a.apply(f,g)},b)}};b.once=function(a){var b=false,d;return function(){if(b)return d;b=true;return d=a.apply(this,arguments)}};b.wrap=function(a,b){return function(){var d=[a].concat(i.call(arguments,0));return b.apply(this,d)}};b.compose=function(){var a=arguments;return function(){for(var b=arguments,d=a.length-1;d>=0;d--)b=[a[d].apply(this,b)];return b[0]}};b.after=function(a,b){return a<=0?b():function(){if(--a<1)return b.apply(this,arguments)}};b.keys=L||function(a){if(a!==Object(a))throw new TypeError("Invalid object");var c=[],d;for(d in a)b.has(a,d)&&(c[c.length]=d);return c};b.values=function(a){return b.map(a,b.identity)};b.functions=b.methods=function(a){var c=[],d;for(d in a)b.isFunction(a[d])&&c.push(d);return c.sort()};b.extend=function(a){j(i.call(arguments,1),function(b){for(var d in b)a[d]=b[d]});return a};b.pick=function(a){var c={};j(b.flatten(i.call(arguments,1)),function(b){b in a&&(c[b]=a[b])});return c};b.defaults=function(a){j(i.call(arguments,1),function(b){for(var d in b)a[d]==null&&(a[d]=b[d])});return a};b.clone=function(a){return!b.isObject(a)?a:b.isArray(a)?a.slice():b.extend({},a)};b.tap=function(a,b){b(a);return a};b.isEqual=function(a,b){return r(a,b,[])};b.isEmpty=function(a){if(a==null)return true;if(b.isArray(a)||b.isString(a))return a.length===0;for(var c in a)if(b.has(a,c))return false;return true};b.isElement=function(a){return!!(a&&a.nodeType==1)};b.isArray=p||function(a){return l.call(a)=="[object Array]"};b.isObject=function(a){return a===Object(a)};b.isArguments=function(a){return l.call(a)=="[object Arguments]"};b.isArguments(arguments)||(b.isArguments=function(a){return!(!a||!b.has(a,"callee"))});b.isFunction=function(a){return l.call(a)=="[object Function]"};b.isString=function(a){return l.call(a)=="[object String]"};b.isNumber=function(a){return l.call(a)=="[object Number]"};b.isFinite=function(a){return b.isNumber(a)&&isFinite(a)};b.isNaN=function(a){return a!==a};b.isBoolean=function(a){return a===true||a===false||l.call(a)=="[object Boolean]"};b.isDate=function(a){return l.call(a)=="[object Date]"};b.isRegExp=function(a){return l.call(a)=="[object RegExp]"};b.isNull=function(a){return a===null};b.isUndefined=function(a){return a===void 0};b.has=function(a,b){return K.call(a,b)};b.noConflict=function(){s._=I;return this};b.identity=function(a){return a};b.times=function(a,b,d){for(var e=0;e<a;e++)b.call(d,e)};b.escape=function(a){return(""+a).replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;").replace(/'/g,"&#x27;").replace(/\//g,"&#x2F;")};b.result=function(a,c){if(a==null)return null;var d=a[c];return b.isFunction(d)?d.call(a):d};b.mixin=function(a){j(b.functions(a),function(c){M(c,b[c]=a[c])})};var N=0;b.uniqueId=function(a){var b=N++;return a?a+b:b};b.templateSettings={evaluate:/<%([\s\S]+?)%>/g,interpolate:/<%=([\s\S]+?)%>/g,escape:/<%-([\s\S]+?)%>/g};var u=/.^/,n={"\\":"\\","'":"'",r:"\r",n:"\n",t:"\t",u2028:"\u2028",u2029:"\u2029"},v;for(v in n)n[n[v]]=v;var O=/\\|'|\r|\n|\t|\u2028|\u2029/g,P=/\\(\\|'|r|n|t|u2028|u2029)/g,w=function(a){return a.replace(P,function(a,b){return n[b]})};b.template=function(a,c,d){d=b.defaults(d||{},b.templateSettings);a="__p+='"+a.replace(O,function(a){return"\\"+n[a]}).replace(d.escape||u,function(a,b){return"'+\n_.escape("+w(b)+")+\n'"}).replace(d.interpolate||u,function(a,b){return"'+\n("+w(b)+")+\n'"}).replace(d.evaluate||u,function(a,b){return"';\n"+w(b)+"\n;__p+='"})+"';\n";d.variable||(a="with(obj||{}){\n"+a+"}\n");var a="var __p='';var print=function(){__p+=Array.prototype.join.call(arguments, '')};\n"+a+"return __p;\n",e=new Function(d.variable||"obj","_",a);if(c)return e(c,b);c=function(a){return e.call(this,a,b)};c.source="function("+(d.variable||"obj")+"){\n"+a+"}";return c};b.chain=function(a){return b(a).chain()};var m=function(a){this._wrapped=a};b.prototype=m.prototype;var x=function(a,c){return c?b(a).chain():a},M=function(a,c){m.prototype[a]=function(){var a=i.call(arguments);J.call(a,this._wrapped);return x(c.apply(b,a),this._chain)}};b.mixin(b);j("pop,push,reverse,shift,sort,splice,unshift".split(","),function(a){var b=k[a];m.prototype[a]=function(){var d=this._wrapped;b.apply(d,arguments);var e=d.length;(a=="shift"||a=="splice")&&e===0&&delete d[0];return x(d,this._chain)}});j(["concat","join","slice"],function(a){var b=k[a];m.prototype[a]=function(){return x(b.apply(this._wrapped,arguments),this._chain)}});m.prototype.chain=function(){this._chain=true;return this};m.prototype.value=function(){return this._wrapped}}).call(this);;
+(function(){var l=this,y=l.Backbone,z=Array.prototype.slice,A=Array.prototype.splice,g;g="undefined"!==typeof exports?exports:l.Backbone={};g.VERSION="0.9.2";var f=l._;!f&&"undefined"!==typeof require&&(f=require("underscore"));var i=l.jQuery||l.Zepto||l.ender;g.setDomLibrary=function(a){i=a};g.noConflict=function(){l.Backbone=y;return this};g.emulateHTTP=!1;g.emulateJSON=!1;var p=/\s+/,k=g.Events={on:function(a,b,c){var d,e,f,g,j;if(!b)return this;a=a.split(p);for(d=this._callbacks||(this._callbacks={});e=a.shift();)f=(j=d[e])?j.tail:{},f.next=g={},f.context=c,f.callback=b,d[e]={tail:g,next:j?j.next:f};return this},off:function(a,b,c){var d,e,h,g,j,q;if(e=this._callbacks){if(!a&&!b&&!c)return delete this._callbacks,this;for(a=a?a.split(p):f.keys(e);d=a.shift();)if(h=e[d],delete e[d],h&&(b||c))for(g=h.tail;(h=h.next)!==g;)if(j=h.callback,q=h.context,b&&j!==b||c&&q!==c)this.on(d,j,q);return this}},trigger:function(a){var b,c,d,e,f,g;if(!(d=this._callbacks))return this;f=d.all;a=a.split(p);for(g=z.call(arguments,1);b=a.shift();){if(c=d[b])for(e=c.tail;(c=c.next)!==e;)c.callback.apply(c.context||this,g);if(c=f){e=c.tail;for(b=[b].concat(g);(c=c.next)!==e;)c.callback.apply(c.context||this,b)}}return this}};k.bind=k.on;k.unbind=k.off;var o=g.Model=function(a,b){var c;a||(a={});b&&b.parse&&(a=this.parse(a));if(c=n(this,"defaults"))a=f.extend({},c,a);b&&b.collection&&(this.collection=b.collection);this.attributes={};this._escapedAttributes={};this.cid=f.uniqueId("c");this.changed={};this._silent={};this._pending={};this.set(a,{silent:!0});this.changed={};this._silent={};this._pending={};this._previousAttributes=f.clone(this.attributes);this.initialize.apply(this,arguments)};f.extend(o.prototype,k,{changed:null,_silent:null,_pending:null,idAttribute:"id",initialize:function(){},toJSON:function(){return f.clone(this.attributes)},get:function(a){return this.attributes[a]},escape:function(a){var b;if(b=this._escapedAttributes[a])return b;b=this.get(a);return this._escapedAttributes[a]=f.escape(null==b?"":""+b)},has:function(a){return null!=this.get(a)},set:function(a,b,c){var d,e;f.isObject(a)||null==a?(d=a,c=b):(d={},d[a]=b);c||(c={});if(!d)return this;d instanceof o&&(d=d.attributes);if(c.unset)for(e in d)d[e]=void 0;if(!this._validate(d,c))return!1;this.idAttribute in d&&(this.id=d[this.idAttribute]);var b=c.changes={},h=this.attributes,g=this._escapedAttributes,j=this._previousAttributes||{};for(e in d){a=d[e];if(!f.isEqual(h[e],a)||c.unset&&f.has(h,e))delete g[e],(c.silent?this._silent:b)[e]=!0;c.unset?delete h[e]:h[e]=a;!f.isEqual(j[e],a)||f.has(h,e)!=f.has(j,e)?(this.changed[e]=a,c.silent||(this._pending[e]=!0)):(delete this.changed[e],delete this._pending[e])}c.silent||this.change(c);return this},unset:function(a,b){(b||(b={})).unset=!0;return this.set(a,null,b)},clear:function(a){(a||(a={})).unset=!0;return this.set(f.clone(this.attributes),a)},fetch:function(a){var a=a?f.clone(a):{},b=this,c=a.success;a.success=function(d,e,f){if(!b.set(b.parse(d,f),a))return!1;c&&c(b,d)};a.error=g.wrapError(a.error,b,a);return(this.sync||g.sync).call(this,"read",this,a)},save:function(a,b,c){var d,e;f.isObject(a)||null==a?(d=a,c=b):(d={},d[a]=b);c=c?f.clone(c):{};if(c.wait){if(!this._validate(d,c))return!1;e=f.clone(this.attributes)}a=f.extend({},c,{silent:!0});if(d&&!this.set(d,c.wait?a:c))return!1;var h=this,i=c.success;c.success=function(a,b,e){b=h.parse(a,e);if(c.wait){delete c.wait;b=f.extend(d||{},b)}if(!h.set(b,c))return false;i?i(h,a):h.trigger("sync",h,a,c)};c.error=g.wrapError(c.error,h,c);b=this.isNew()?"create":"update";b=(this.sync||g.sync).call(this,b,this,c);c.wait&&this.set(e,a);return b},destroy:function(a){var a=a?f.clone(a):{},b=this,c=a.success,d=function(){b.trigger("destroy",b,b.collection,a)};if(this.isNew())return d(),!1;a.success=function(e){a.wait&&d();c?c(b,e):b.trigger("sync",b,e,a)};a.error=g.wrapError(a.error,b,a);var e=(this.sync||g.sync).call(this,"delete",this,a);a.wait||d();return e},url:function(){var a=n(this,"urlRoot")||n(this.collection,"url")||t();return this.isNew()?a:a+("/"==a.charAt(a.length-1)?"":"/")+encodeURIComponent(this.id)},parse:function(a){return a},clone:function(){return new this.constructor(this.attributes)},isNew:function(){return null==this.id},change:function(a){a||(a={});var b=this._changing;this._changing=!0;for(var c in this._silent)this._pending[c]=!0;var d=f.extend({},a.changes,this._silent);this._silent={};for(c in d)this.trigger("change:"+c,this,this.get(c),a);if(b)return this;for(;!f.isEmpty(this._pending);){this._pending={};this.trigger("change",this,a);for(c in this.changed)!this._pending[c]&&!this._silent[c]&&delete this.changed[c];this._previousAttributes=f.clone(this.attributes)}this._changing=!1;return this},hasChanged:function(a){return!arguments.length?!f.isEmpty(this.changed):f.has(this.changed,a)},changedAttributes:function(a){if(!a)return this.hasChanged()?f.clone(this.changed):!1;var b,c=!1,d=this._previousAttributes,e;for(e in a)if(!f.isEqual(d[e],b=a[e]))(c||(c={}))[e]=b;return c},previous:function(a){return!arguments.length||!this._previousAttributes?null:this._previousAttributes[a]},previousAttributes:function(){return f.clone(this._previousAttributes)},isValid:function(){return!this.validate(this.attributes)},_validate:function(a,b){if(b.silent||!this.validate)return!0;var a=f.extend({},this.attributes,a),c=this.validate(a,b);if(!c)return!0;b&&b.error?b.error(this,c,b):this.trigger("error",this,c,b);return!1}});var r=g.Collection=function(a,b){b||(b={});b.model&&(this.model=b.model);b.comparator&&(this.comparator=b.comparator);this._reset();this.initialize.apply(this,arguments);a&&this.reset(a,{silent:!0,parse:b.parse})};f.extend(r.prototype,k,{model:o,initialize:function(){},toJSON:function(a){return this.map(function(b){return b.toJSON(a)})},add:function(a,b){var c,d,e,g,i,j={},k={},l=[];b||(b={});a=f.isArray(a)?a.slice():[a];c=0;for(d=a.length;c<d;c++){if(!(e=a[c]=this._prepareModel(a[c],b)))throw Error("Can't add an invalid model to a collection");g=e.cid;i=e.id;j[g]||this._byCid[g]||null!=i&&(k[i]||this._byId[i])?l.push(c):j[g]=k[i]=e}for(c=l.length;c--;)a.splice(l[c],1);c=0;for(d=a.length;c<d;c++)(e=a[c]).on("all",this._onModelEvent,this),this._byCid[e.cid]=e,null!=e.id&&(this._byId[e.id]=e);this.length+=d;A.apply(this.models,[null!=b.at?b.at:this.models.length,0].concat(a));this.comparator&&this.sort({silent:!0});if(b.silent)return this;c=0;for(d=this.models.length;c<d;c++)if(j[(e=this.models[c]).cid])b.index=c,e.trigger("add",e,this,b);return this},remove:function(a,b){var c,d,e,g;b||(b={});a=f.isArray(a)?a.slice():[a];c=0;for(d=a.length;c<d;c++)if(g=this.getByCid(a[c])||this.get(a[c]))delete this._byId[g.id],delete this._byCid[g.cid],e=this.indexOf(g),this.models.splice(e,1),this.length--,b.silent||(b.index=e,g.trigger("remove",g,this,b)),this._removeReference(g);return this},push:function(a,b){a=this._prepareModel(a,b);this.add(a,b);return a},pop:function(a){var b=this.at(this.length-1);this.remove(b,a);return b},unshift:function(a,b){a=this._prepareModel(a,b);this.add(a,f.extend({at:0},b));return a},shift:function(a){var b=this.at(0);this.remove(b,a);return b},get:function(a){return null==a?void 0:this._byId[null!=a.id?a.id:a]},getByCid:function(a){return a&&this._byCid[a.cid||a]},at:function(a){return this.models[a]},where:function(a){return f.isEmpty(a)?[]:this.filter(function(b){for(var c in a)if(a[c]!==b.get(c))return!1;return!0})},sort:function(a){a||(a={});if(!this.comparator)throw Error("Cannot sort a set without a comparator");var b=f.bind(this.comparator,this);1==this.comparator.length?this.models=this.sortBy(b):this.models.sort(b);a.silent||this.trigger("reset",this,a);return this},pluck:function(a){return f.map(this.models,function(b){return b.get(a)})},reset:function(a,b){a||(a=[]);b||(b={});for(var c=0,d=this.models.length;c<d;c++)this._removeReference(this.models[c]);this._reset();this.add(a,f.extend({silent:!0},b));b.silent||this.trigger("reset",this,b);return this},fetch:function(a){a=a?f.clone(a):{};void 0===a.parse&&(a.parse=!0);var b=this,c=a.success;a.success=function(d,e,f){b[a.add?"add":"reset"](b.parse(d,f),a);c&&c(b,d)};a.error=g.wrapError(a.error,b,a);return(this.sync||g.sync).call(this,"read",this,a)},create:function(a,b){var c=this,b=b?f.clone(b):{},a=this._prepareModel(a,b);if(!a)return!1;b.wait||c.add(a,b);var d=b.success;b.success=function(e,f){b.wait&&c.add(e,b);d?d(e,f):e.trigger("sync",a,f,b)};a.save(null,b);return a},parse:function(a){return a},chain:function(){return f(this.models).chain()},_reset:function(){this.length=0;this.models=[];this._byId={};this._byCid={}},_prepareModel:function(a,b){b||(b={});a instanceof o?a.collection||(a.collection=this):(b.collection=this,a=new this.model(a,b),a._validate(a.attributes,b)||(a=!1));return a},_removeReference:function(a){this==a.collection&&delete a.collection;a.off("all",this._onModelEvent,this)},_onModelEvent:function(a,b,c,d){("add"==a||"remove"==a)&&c!=this||("destroy"==a&&this.remove(b,d),b&&a==="change:"+b.idAttribute&&(delete this._byId[b.previous(b.idAttribute)],this._byId[b.id]=b),this.trigger.apply(this,arguments))}});f.each("forEach,each,map,reduce,reduceRight,find,detect,filter,select,reject,every,all,some,any,include,contains,invoke,max,min,sortBy,sortedIndex,toArray,size,first,initial,rest,last,without,indexOf,shuffle,lastIndexOf,isEmpty,groupBy".split(","),function(a){r.prototype[a]=function(){return f[a].apply(f,[this.models].concat(f.toArray(arguments)))}});var u=g.Router=function(a){a||(a={});a.routes&&(this.routes=a.routes);this._bindRoutes();this.initialize.apply(this,arguments)},B=/:\w+/g,C=/\*\w+/g,D=/[-[\]{}()+?.,\\^$|#\s]/g;f.extend(u.prototype,k,{initialize:function(){},route:function(a,b,c){g.history||(g.history=new m);f.isRegExp(a)||(a=this._routeToRegExp(a));c||(c=this[b]);g.history.route(a,f.bind(function(d){d=this._extractParameters(a,d);c&&c.apply(this,d);this.trigger.apply(this,["route:"+b].concat(d));g.history.trigger("route",this,b,d)},this));return this},navigate:function(a,b){g.history.navigate(a,b)},_bindRoutes:function(){if(this.routes){var a=[],b;for(b in this.routes)a.unshift([b,this.routes[b]]);b=0;for(var c=a.length;b<c;b++)this.route(a[b][0],a[b][1],this[a[b][1]])}},_routeToRegExp:function(a){a=a.replace(D,"\\$&").replace(B,"([^/]+)").replace(C,"(.*?)");return RegExp("^"+a+"$")},_extractParameters:function(a,b){return a.exec(b).slice(1)}});var m=g.History=function(){this.handlers=[];f.bindAll(this,"checkUrl")},s=/^[#\/]/,E=/msie [\w.]+/;m.started=!1;f.extend(m.prototype,k,{interval:50,getHash:function(a){return(a=(a?a.location:window.location).href.match(/#(.*)$/))?a[1]:""},getFragment:function(a,b){if(null==a)if(this._hasPushState||b){var a=window.location.pathname,c=window.location.search;c&&(a+=c)}else a=this.getHash();a.indexOf(this.options.root)||(a=a.substr(this.options.root.length));return a.replace(s,"")},start:function(a){if(m.started)throw Error("Backbone.history has already been started");m.started=!0;this.options=f.extend({},{root:"/"},this.options,a);this._wantsHashChange=!1!==this.options.hashChange;this._wantsPushState=!!this.options.pushState;this._hasPushState=!(!this.options.pushState||!window.history||!window.history.pushState);var a=this.getFragment(),b=document.documentMode;if(b=E.exec(navigator.userAgent.toLowerCase())&&(!b||7>=b))this.iframe=i('<iframe src="javascript:0" tabindex="-1" />').hide().appendTo("body")[0].contentWindow,this.navigate(a);this._hasPushState?i(window).bind("popstate",this.checkUrl):this._wantsHashChange&&"onhashchange"in window&&!b?i(window).bind("hashchange",this.checkUrl):this._wantsHashChange&&(this._checkUrlInterval=setInterval(this.checkUrl,this.interval));this.fragment=a;a=window.location;b=a.pathname==this.options.root;if(this._wantsHashChange&&this._wantsPushState&&!this._hasPushState&&!b)return this.fragment=this.getFragment(null,!0),window.location.replace(this.options.root+"#"+this.fragment),!0;this._wantsPushState&&this._hasPushState&&b&&a.hash&&(this.fragment=this.getHash().replace(s,""),window.history.replaceState({},document.title,a.protocol+"//"+a.host+this.options.root+this.fragment));if(!this.options.silent)return this.loadUrl()},stop:function(){i(window).unbind("popstate",this.checkUrl).unbind("hashchange",this.checkUrl);clearInterval(this._checkUrlInterval);m.started=!1},route:function(a,b){this.handlers.unshift({route:a,callback:b})},checkUrl:function(){var a=this.getFragment();a==this.fragment&&this.iframe&&(a=this.getFragment(this.getHash(this.iframe)));if(a==this.fragment)return!1;this.iframe&&this.navigate(a);this.loadUrl()||this.loadUrl(this.getHash())},loadUrl:function(a){var b=this.fragment=this.getFragment(a);return f.any(this.handlers,function(a){if(a.route.test(b))return a.callback(b),!0})},navigate:function(a,b){if(!m.started)return!1;if(!b||!0===b)b={trigger:b};var c=(a||"").replace(s,"");this.fragment!=c&&(this._hasPushState?(0!=c.indexOf(this.options.root)&&(c=this.options.root+c),this.fragment=c,window.history[b.replace?"replaceState":"pushState"]({},document.title,c)):this._wantsHashChange?(this.fragment=c,this._updateHash(window.location,c,b.replace),this.iframe&&c!=this.getFragment(this.getHash(this.iframe))&&(b.replace||this.iframe.document.open().close(),this._updateHash(this.iframe.location,c,b.replace))):window.location.assign(this.options.root+a),b.trigger&&this.loadUrl(a))},_updateHash:function(a,b,c){c?a.replace(a.toString().replace(/(javascript:|#).*$/,"")+"#"+b):a.hash=b}});var v=g.View=function(a){this.cid=f.uniqueId("view");this._configure(a||{});this._ensureElement();this.initialize.apply(this,arguments);this.delegateEvents()},F=/^(\S+)\s*(.*)$/,w="model,collection,el,id,attributes,className,tagName".split(",");f.extend(v.prototype,k,{tagName:"div",$:function(a){return this.$el.find(a)},initialize:function(){},render:function(){return this},remove:function(){this.$el.remove();return this},make:function(a,b,c){a=document.createElement(a);b&&i(a).attr(b);c&&i(a).html(c);return a},setElement:function(a,b){this.$el&&this.undelegateEvents();this.$el=a instanceof i?a:i(a);this.el=this.$el[0];!1!==b&&this.delegateEvents();return this},delegateEvents:function(a){if(a||(a=n(this,"events"))){this.undelegateEvents();for(var b in a){var c=a[b];f.isFunction(c)||(c=this[a[b]]);if(!c)throw Error('Method "'+a[b]+'" does not exist');var d=b.match(F),e=d[1],d=d[2],c=f.bind(c,this),e=e+(".delegateEvents"+this.cid);""===d?this.$el.bind(e,c):this.$el.delegate(d,e,c)}}},undelegateEvents:function(){this.$el.unbind(".delegateEvents"+this.cid)},_configure:function(a){this.options&&(a=f.extend({},this.options,a));for(var b=0,c=w.length;b<c;b++){var d=w[b];a[d]&&(this[d]=a[d])}this.options=a},_ensureElement:function(){if(this.el)this.setElement(this.el,!1);else{var a=n(this,"attributes")||{};this.id&&(a.id=this.id);this.className&&(a["class"]=this.className);this.setElement(this.make(this.tagName,a),!1)}}});o.extend=r.extend=u.extend=v.extend=function(a,b){var c=G(this,a,b);c.extend=this.extend;return c};var H={create:"POST",update:"PUT","delete":"DELETE",read:"GET"};g.sync=function(a,b,c){var d=H[a];c||(c={});var e={type:d,dataType:"json"};c.url||(e.url=n(b,"url")||t());if(!c.data&&b&&("create"==a||"update"==a))e.contentType="application/json",e.data=JSON.stringify(b.toJSON());g.emulateJSON&&(e.contentType="application/x-www-form-urlencoded",e.data=e.data?{model:e.data}:{});if(g.emulateHTTP&&("PUT"===d||"DELETE"===d))g.emulateJSON&&(e.data._method=d),e.type="POST",e.beforeSend=function(a){a.setRequestHeader("X-HTTP-Method-Override",d)};"GET"!==e.type&&!g.emulateJSON&&(e.processData=!1);return i.ajax(f.extend(e,c))};g.wrapError=function(a,b,c){return function(d,e){e=d===b?e:d;a?a(b,e,c):b.trigger("error",b,e,c)}};var x=function(){},G=function(a,b,c){var d;d=b&&b.hasOwnProperty("constructor")?b.constructor:function(){a.apply(this,arguments)};f.extend(d,a);x.prototype=a.prototype;d.prototype=new x;b&&f.extend(d.prototype,b);c&&f.extend(d,c);d.prototype.constructor=d;d.__super__=a.prototype;return d},n=function(a,b){return!a||!a[b]?null:f.isFunction(a[b])?a[b]():a[b]},t=function(){throw Error('A "url" property or function must be specified');}}).call(this);;
+var __bind=function(fn,me){return function(){return fn.apply(me,arguments);};};log=function(){log.history=log.history||[];log.history.push(arguments);if(this.console){console.log(Array.prototype.slice.call(arguments)[0]);}};if(!Array.prototype.indexOf){Array.prototype.indexOf=function(obj,start){for(var i=(start||0),j=this.length;i<j;i++){if(this[i]===obj){return i;}}
+return-1;}}
+if(!('filter'in Array.prototype)){Array.prototype.filter=function(filter,that){var other=[],v;for(var i=0,n=this.length;i<n;i++)
+if(i in this&&filter.call(that,v=this[i],i,this))
+other.push(v);return other;};}
+if(!('map'in Array.prototype)){Array.prototype.map=function(mapper,that){var other=new Array(this.length);for(var i=0,n=this.length;i<n;i++)
+if(i in this)
+other[i]=mapper.call(that,this[i],i,this);return other;};}
+Object.keys=Object.keys||(function(){var hasOwnProperty=Object.prototype.hasOwnProperty,hasDontEnumBug=!{toString:null}.propertyIsEnumerable("toString"),DontEnums=['toString','toLocaleString','valueOf','hasOwnProperty','isPrototypeOf','propertyIsEnumerable','constructor'],DontEnumsLength=DontEnums.length;return function(o){if(typeof o!="object"&&typeof o!="function"||o===null)
+throw new TypeError("Object.keys called on a non-object");var result=[];for(var name in o){if(hasOwnProperty.call(o,name))
+result.push(name);}
+if(hasDontEnumBug){for(var i=0;i<DontEnumsLength;i++){if(hasOwnProperty.call(o,DontEnums[i]))
+result.push(DontEnums[i]);}}
+return result;};})();var SwaggerApi=function(url,options){this.url=null;this.debug=false;this.basePath=null;this.authorizations=null;this.authorizationScheme=null;this.info=null;this.useJQuery=false;options=(options||{});if(url)
+if(url.url)
+options=url;else
+this.url=url;else
+options=url;if(options.url!=null)
+this.url=options.url;if(options.success!=null)
+this.success=options.success;if(typeof options.useJQuery==='boolean')
+this.useJQuery=options.useJQuery;this.lazy=options.lazy===true;if(options.spec!=null)
+this.spec=options.spec;this.failure=options.failure!=null?options.failure:function(){};this.progress=options.progress!=null?options.progress:function(){};if(options.success!=null)
+this.build();}
+SwaggerApi.prototype.build=function(){var _this=this;if(this.spec!=null){var spec=this.spec;this.spec=null;setTimeout(function(){_this.swaggerVersion=spec.swaggerVersion;if(_this.swaggerVersion==="1.2"){return _this.buildFromSpec(spec);}else{return _this.buildFrom1_1Spec(spec);}},0);return this;}
+this.progress('fetching resource list: '+this.url);var obj={useJQuery:this.useJQuery,url:this.url,method:"get",headers:{accept:"application/json"},on:{error:function(response){if(_this.url.substring(0,4)!=='http'){return _this.fail('Please specify the protocol for '+_this.url);}else if(response.status===0){return _this.fail('Can\'t read from server.  It may not have the appropriate access-control-origin settings.');}else if(response.status===404){return _this.fail('Can\'t read swagger JSON from '+_this.url);}else{return _this.fail(response.status+' : '+response.statusText+' '+_this.url);}},response:function(resp){var responseObj=resp.obj||JSON.parse(resp.data);_this.swaggerVersion=responseObj.swaggerVersion;if(_this.swaggerVersion==="1.2"){return _this.buildFromSpec(responseObj);}else{return _this.buildFrom1_1Spec(responseObj);}}}};var e=(typeof window!=='undefined'?window:exports);e.authorizations.apply(obj);new SwaggerHttp().execute(obj);return this;};SwaggerApi.prototype.buildFromSpec=function(response){if(response.apiVersion!=null){this.apiVersion=response.apiVersion;}
+this.apis={};this.apisArray=[];this.consumes=response.consumes;this.produces=response.produces;this.authSchemes=response.authorizations;if(response.info!=null){this.info=response.info;}
+var isApi=false;var i;for(i=0;i<response.apis.length;i++){var api=response.apis[i];if(api.operations){var j;for(j=0;j<api.operations.length;j++){operation=api.operations[j];isApi=true;}}}
+if(response.basePath)
+this.basePath=response.basePath;else if(this.url.indexOf('?')>0)
+this.basePath=this.url.substring(0,this.url.lastIndexOf('?'));else
+this.basePath=this.url;if(this.basePath.substring(0,1)==='/'&&this.url.indexOf('http')===0){var urlParts=this.url.split('/');this.basePath=urlParts[0]+'//'+urlParts[2]+this.basePath;}
+this.apiDeclarations=response.apiDeclarations||null;if(isApi){var newName=response.resourcePath.replace(/\//g,'');this.resourcePath=response.resourcePath;res=new SwaggerResource(response,this);this.apis[newName]=res;this.apisArray.push(res);}else{var k;for(k=0;k<response.apis.length;k++){var resource=response.apis[k];res=new SwaggerResource(resource,this);this.apis[res.name]=res;this.apisArray.push(res);}}
+if(this.apiDeclarations&&this.selfReflect()!==false){return this;}
+if(this.success){this.success();}
+return this;};SwaggerApi.prototype.buildFrom1_1Spec=function(response){log("This API is using a deprecated version of Swagger!  Please see http://github.com/wordnik/swagger-core/wiki for more info");if(response.apiVersion!=null)
+this.apiVersion=response.apiVersion;this.apis={};this.apisArray=[];this.produces=response.produces;if(response.info!=null){this.info=response.info;}
+var isApi=false;for(var i=0;i<response.apis.length;i++){var api=response.apis[i];if(api.operations){for(var j=0;j<api.operations.length;j++){operation=api.operations[j];isApi=true;}}}
+if(response.basePath){this.basePath=response.basePath;}else if(this.url.indexOf('?')>0){this.basePath=this.url.substring(0,this.url.lastIndexOf('?'));}else{this.basePath=this.url;}
+if(isApi){var newName=response.resourcePath.replace(/\//g,'');this.resourcePath=response.resourcePath;var res=new SwaggerResource(response,this);this.apis[newName]=res;this.apisArray.push(res);}else{for(k=0;k<response.apis.length;k++){resource=response.apis[k];res=new SwaggerResource(resource,this);this.apis[res.name]=res;this.apisArray.push(res);}}
+if(this.success){this.success();}
+return this;};SwaggerApi.prototype.selfReflect=function(){var resource,resource_name,_ref;if(this.apis==null){return false;}
+_ref=this.apis;for(resource_name in _ref){resource=_ref[resource_name];if(resource.ready==null){return false;}}
+this.setConsolidatedModels();this.ready=true;if(this.success!=null){return this.success();}};SwaggerApi.prototype.fail=function(message){this.failure(message);throw message;};SwaggerApi.prototype.setConsolidatedModels=function(){var model,modelName,resource,resource_name,_i,_len,_ref,_ref1,_results;this.modelsArray=[];this.models={};_ref=this.apis;for(resource_name in _ref){resource=_ref[resource_name];for(modelName in resource.models){if(this.models[modelName]==null){this.models[modelName]=resource.models[modelName];this.modelsArray.push(resource.models[modelName]);}}}
+_ref1=this.modelsArray;_results=[];for(_i=0,_len=_ref1.length;_i<_len;_i++){model=_ref1[_i];_results.push(model.setReferencedModels(this.models));}
+return _results;};SwaggerApi.prototype.help=function(){var operation,operation_name,parameter,resource,resource_name,_i,_len,_ref,_ref1,_ref2;_ref=this.apis;for(resource_name in _ref){resource=_ref[resource_name];log(resource_name);_ref1=resource.operations;for(operation_name in _ref1){operation=_ref1[operation_name];log("  "+operation.nickname);_ref2=operation.parameters;for(_i=0,_len=_ref2.length;_i<_len;_i++){parameter=_ref2[_i];log("    "+parameter.name+(parameter.required?' (required)':'')+" - "+parameter.description);}}}
+return this;};var SwaggerResource=function(resourceObj,api){var _this=this;this.api=api;this.api=this.api;consumes=(this.consumes|[]);produces=(this.produces|[]);this.path=this.api.resourcePath!=null?this.api.resourcePath:resourceObj.path;this.description=resourceObj.description;var parts=this.path.split("?")[0].split("/");this.name=parts[parts.length-1].replace('.{format}','');this.basePath=this.api.basePath;this.operations={};this.operationsArray=[];this.modelsArray=[];this.models={};this.rawModels={};this.useJQuery=(typeof api.useJQuery!=='undefined'?api.useJQuery:null);if((resourceObj.apis!=null)&&(this.api.resourcePath!=null)){this.addApiDeclaration(resourceObj);}else if(this.api.apiDeclarations&&this.api.apiDeclarations[this.name]){this.loadApiDeclaration(this.api.apiDeclarations[this.name]);}else{if(this.path==null){this.api.fail("SwaggerResources must have a path.");}
+if(this.path.substring(0,4)==='http'){this.url=this.path.replace('{format}','json');}else{this.url=this.api.basePath+this.path.replace('{format}','json');}
+if(!this.api.lazy){this.load(function(){return _this.api.selfReflect();});}}}
+SwaggerResource.prototype.load=function(callback){var _this=this;if(this.ready){if(callback!=null)
+callback(this);return this;}
+this.callbacks=this.callbacks||[];if(callback!=null)
+this.callbacks.push(callback);if(this.loading)
+return this;this.loading=true;this.api.progress('fetching resource '+this.name+': '+this.url);var obj={url:this.url,method:"get",useJQuery:this.useJQuery,headers:{accept:"application/json"},on:{response:function(resp){var responseObj=resp.obj||JSON.parse(resp.data);_this.loadApiDeclaration(responseObj);_this.loading=false;var callbacks=_this.callbacks;_this.callbacks=[];for(var i=0;i<callbacks.length;i++){callbacks[i](_this);}},error:function(response){_this.loading=false;return _this.api.fail("Unable to read api '"+
+_this.name+"' from path "+_this.url+" (server returned "+response.statusText+")");}}};var e=typeof window!=='undefined'?window:exports;e.authorizations.apply(obj);new SwaggerHttp().execute(obj);return this;};SwaggerResource.prototype.getAbsoluteBasePath=function(relativeBasePath){var pos,url;url=this.api.basePath;pos=url.lastIndexOf(relativeBasePath);var parts=url.split("/");var rootUrl=parts[0]+"//"+parts[2];if(relativeBasePath.indexOf("http")===0)
+return relativeBasePath;if(relativeBasePath==="/")
+return rootUrl;if(relativeBasePath.substring(0,1)=="/"){return rootUrl+relativeBasePath;}
+else{var pos=this.basePath.lastIndexOf("/");var base=this.basePath.substring(0,pos);if(base.substring(base.length-1)=="/")
+return base+relativeBasePath;else
+return base+"/"+relativeBasePath;}};SwaggerResource.prototype.addApiDeclaration=function(response){this.loadApiDeclaration(response);return this.api.selfReflect();};SwaggerResource.prototype.loadApiDeclaration=function(response){if(response.produces!=null)
+this.produces=response.produces;if(response.consumes!=null)
+this.consumes=response.consumes;if((response.basePath!=null)&&response.basePath.replace(/\s/g,'').length>0)
+this.basePath=response.basePath.indexOf("http")===-1?this.getAbsoluteBasePath(response.basePath):response.basePath;this.addModels(response.models);if(response.apis){for(var i=0;i<response.apis.length;i++){var endpoint=response.apis[i];this.addOperations(endpoint.path,endpoint.operations,response.consumes,response.produces);}}
+this.api[this.name]=this;this.ready=true;return this;};SwaggerResource.prototype.addModels=function(models){if(models!=null){var modelName;for(modelName in models){if(this.models[modelName]==null){var swaggerModel=new SwaggerModel(modelName,models[modelName]);this.modelsArray.push(swaggerModel);this.models[modelName]=swaggerModel;this.rawModels[modelName]=models[modelName];}}
+var output=[];for(var i=0;i<this.modelsArray.length;i++){model=this.modelsArray[i];output.push(model.setReferencedModels(this.models));}
+return output;}};SwaggerResource.prototype.addOperations=function(resource_path,ops,consumes,produces){if(ops){output=[];for(var i=0;i<ops.length;i++){o=ops[i];consumes=this.consumes;produces=this.produces;if(o.consumes!=null)
+consumes=o.consumes;else
+consumes=this.consumes;if(o.produces!=null)
+produces=o.produces;else
+produces=this.produces;type=(o.type||o.responseClass);if(type==="array"){ref=null;if(o.items)
+ref=o.items["type"]||o.items["$ref"];type="array["+ref+"]";}
+responseMessages=o.responseMessages;method=o.method;if(o.httpMethod){method=o.httpMethod;}
+if(o.supportedContentTypes){consumes=o.supportedContentTypes;}
+if(o.errorResponses){responseMessages=o.errorResponses;for(var j=0;j<responseMessages.length;j++){r=responseMessages[j];r.message=r.reason;r.reason=null;}}
+o.nickname=this.sanitize(o.nickname);op=new SwaggerOperation(o.nickname,resource_path,method,o.parameters,o.summary,o.notes,type,responseMessages,this,consumes,produces,o.authorizations);this.operations[op.nickname]=op;output.push(this.operationsArray.push(op));}
+return output;}};SwaggerResource.prototype.sanitize=function(nickname){var op;op=nickname.replace(/[\s!@#$%^&*()_+=\[{\]};:<>|.\/?,\\'""-]/g,'_');op=op.replace(/((_){2,})/g,'_');op=op.replace(/^(_)*/g,'');op=op.replace(/([_])*$/g,'');return op;};SwaggerResource.prototype.help=function(){var op=this.operations;var output=[];var operation_name;for(operation_name in op){operation=op[operation_name];var msg="  "+operation.nickname;for(var i=0;i<operation.parameters;i++){parameter=operation.parameters[i];msg.concat("    "+parameter.name+(parameter.required?' (required)':'')+" - "+parameter.description);}
+output.push(msg);}
+return output;};var SwaggerModel=function(modelName,obj){this.name=obj.id!=null?obj.id:modelName;this.properties=[];var propertyName;for(propertyName in obj.properties){if(obj.required!=null){var value;for(value in obj.required){if(propertyName===obj.required[value]){obj.properties[propertyName].required=true;}}}
+prop=new SwaggerModelProperty(propertyName,obj.properties[propertyName]);this.properties.push(prop);}}
+SwaggerModel.prototype.setReferencedModels=function(allModels){var results=[];for(var i=0;i<this.properties.length;i++){var property=this.properties[i];var type=property.type||property.dataType;if(allModels[type]!=null)
+results.push(property.refModel=allModels[type]);else if((property.refDataType!=null)&&(allModels[property.refDataType]!=null))
+results.push(property.refModel=allModels[property.refDataType]);else
+results.push(void 0);}
+return results;};SwaggerModel.prototype.getMockSignature=function(modelsToIgnore){var propertiesStr=[];for(var i=0;i<this.properties.length;i++){prop=this.properties[i];propertiesStr.push(prop.toString());}
+var strong='<span class="strong">';var stronger='<span class="stronger">';var strongClose='</span>';var classOpen=strong+this.name+' {'+strongClose;var classClose=strong+'}'+strongClose;var returnVal=classOpen+'<div>'+propertiesStr.join(',</div><div>')+'</div>'+classClose;if(!modelsToIgnore)
+modelsToIgnore=[];modelsToIgnore.push(this.name);for(var i=0;i<this.properties.length;i++){prop=this.properties[i];if((prop.refModel!=null)&&modelsToIgnore.indexOf(prop.refModel.name)===-1){returnVal=returnVal+('<br>'+prop.refModel.getMockSignature(modelsToIgnore));}}
+return returnVal;};SwaggerModel.prototype.createJSONSample=function(modelsToIgnore){if(sampleModels[this.name]){return sampleModels[this.name];}
+else{var result={};var modelsToIgnore=(modelsToIgnore||[])
+modelsToIgnore.push(this.name);for(var i=0;i<this.properties.length;i++){prop=this.properties[i];result[prop.name]=prop.getSampleValue(modelsToIgnore);}
+modelsToIgnore.pop(this.name);return result;}};var SwaggerModelProperty=function(name,obj){this.name=name;this.dataType=obj.type||obj.dataType||obj["$ref"];this.isCollection=this.dataType&&(this.dataType.toLowerCase()==='array'||this.dataType.toLowerCase()==='list'||this.dataType.toLowerCase()==='set');this.descr=obj.description;this.required=obj.required;if(obj.items!=null){if(obj.items.type!=null){this.refDataType=obj.items.type;}
+if(obj.items.$ref!=null){this.refDataType=obj.items.$ref;}}
+this.dataTypeWithRef=this.refDataType!=null?(this.dataType+'['+this.refDataType+']'):this.dataType;if(obj.allowableValues!=null){this.valueType=obj.allowableValues.valueType;this.values=obj.allowableValues.values;if(this.values!=null){this.valuesString="'"+this.values.join("' or '")+"'";}}
+if(obj["enum"]!=null){this.valueType="string";this.values=obj["enum"];if(this.values!=null){this.valueString="'"+this.values.join("' or '")+"'";}}}
+SwaggerModelProperty.prototype.getSampleValue=function(modelsToIgnore){var result;if((this.refModel!=null)&&(modelsToIgnore.indexOf(prop.refModel.name)===-1)){result=this.refModel.createJSONSample(modelsToIgnore);}else{if(this.isCollection){result=this.toSampleValue(this.refDataType);}else{result=this.toSampleValue(this.dataType);}}
+if(this.isCollection){return[result];}else{return result;}};SwaggerModelProperty.prototype.toSampleValue=function(value){var result;if(value==="integer"){result=0;}else if(value==="boolean"){result=false;}else if(value==="double"||value==="number"){result=0.0;}else if(value==="string"){result="";}else{result=value;}
+return result;};SwaggerModelProperty.prototype.toString=function(){var req=this.required?'propReq':'propOpt';var str='<span class="propName '+req+'">'+this.name+'</span> (<span class="propType">'+this.dataTypeWithRef+'</span>';if(!this.required){str+=', <span class="propOptKey">optional</span>';}
+str+=')';if(this.values!=null){str+=" = <span class='propVals'>['"+this.values.join("' or '")+"']</span>";}
+if(this.descr!=null){str+=': <span class="propDesc">'+this.descr+'</span>';}
+return str;};var SwaggerOperation=function(nickname,path,method,parameters,summary,notes,type,responseMessages,resource,consumes,produces,authorizations){var _this=this;var errors=[];this.nickname=(nickname||errors.push("SwaggerOperations must have a nickname."));this.path=(path||errors.push("SwaggerOperation "+nickname+" is missing path."));this.method=(method||errors.push("SwaggerOperation "+nickname+" is missing method."));this.parameters=parameters!=null?parameters:[];this.summary=summary;this.notes=notes;this.type=type;this.responseMessages=(responseMessages||[]);this.resource=(resource||errors.push("Resource is required"));this.consumes=consumes;this.produces=produces;this.authorizations=authorizations;this["do"]=__bind(this["do"],this);if(errors.length>0)
+this.resource.api.fail(errors);this.path=this.path.replace('{format}','json');this.method=this.method.toLowerCase();this.isGetMethod=this.method==="get";this.resourceName=this.resource.name;if(typeof this.type!=='undefined'&&this.type==='void')
+this.type=null;else{this.responseClassSignature=this.getSignature(this.type,this.resource.models);this.responseSampleJSON=this.getSampleJSON(this.type,this.resource.models);}
+for(var i=0;i<this.parameters.length;i++){var param=this.parameters[i];param.name=param.name||param.type||param.dataType;var type=param.type||param.dataType;if(type==='array'){type='array['+(param.items.$ref?param.items.$ref:param.items.type)+']';}
+param.type=type;if(type.toLowerCase()==='boolean'){param.allowableValues={};param.allowableValues.values=["true","false"];}
+param.signature=this.getSignature(type,this.resource.models);param.sampleJSON=this.getSampleJSON(type,this.resource.models);var enumValue=param["enum"];if(enumValue!=null){param.isList=true;param.allowableValues={};param.allowableValues.descriptiveValues=[];for(var j=0;j<enumValue.length;j++){var v=enumValue[j];if(param.defaultValue!=null){param.allowableValues.descriptiveValues.push({value:String(v),isDefault:(v===param.defaultValue)});}
+else{param.allowableValues.descriptiveValues.push({value:String(v),isDefault:false});}}}
+else if(param.allowableValues!=null){if(param.allowableValues.valueType==="RANGE")
+param.isRange=true;else
+param.isList=true;if(param.allowableValues!=null){param.allowableValues.descriptiveValues=[];if(param.allowableValues.values){for(var j=0;j<param.allowableValues.values.length;j++){var v=param.allowableValues.values[j];if(param.defaultValue!=null){param.allowableValues.descriptiveValues.push({value:String(v),isDefault:(v===param.defaultValue)});}
+else{param.allowableValues.descriptiveValues.push({value:String(v),isDefault:false});}}}}}}
+this.resource[this.nickname]=function(args,callback,error){return _this["do"](args,callback,error);};this.resource[this.nickname].help=function(){return _this.help();};}
+SwaggerOperation.prototype.isListType=function(type){if(type&&type.indexOf('[')>=0){return type.substring(type.indexOf('[')+1,type.indexOf(']'));}else{return void 0;}};SwaggerOperation.prototype.getSignature=function(type,models){var isPrimitive,listType;listType=this.isListType(type);isPrimitive=((listType!=null)&&models[listType])||(models[type]!=null)?false:true;if(isPrimitive){return type;}else{if(listType!=null){return models[listType].getMockSignature();}else{return models[type].getMockSignature();}}};SwaggerOperation.prototype.getSampleJSON=function(type,models){var isPrimitive,listType,val;listType=this.isListType(type);isPrimitive=((listType!=null)&&models[listType])||(models[type]!=null)?false:true;val=isPrimitive?void 0:(listType!=null?models[listType].createJSONSample():models[type].createJSONSample());if(val){val=listType?[val]:val;if(typeof val=="string")
+return val;else if(typeof val==="object"){var t=val;if(val instanceof Array&&val.length>0){t=val[0];}
+if(t.nodeName){var xmlString=new XMLSerializer().serializeToString(t);return this.formatXml(xmlString);}
+else
+return JSON.stringify(val,null,2);}
+else
+return val;}};SwaggerOperation.prototype["do"]=function(args,opts,callback,error){var key,param,params,possibleParams,req,requestContentType,responseContentType,value,_i,_len,_ref;if(args==null){args={};}
+if(opts==null){opts={};}
+requestContentType=null;responseContentType=null;if((typeof args)==="function"){error=opts;callback=args;args={};}
+if((typeof opts)==="function"){error=callback;callback=opts;}
+if(error==null){error=function(xhr,textStatus,error){return log(xhr,textStatus,error);};}
+if(callback==null){callback=function(response){var content;content=null;if(response!=null){content=response.data;}else{content="no data";}
+return log("default callback: "+content);};}
+params={};params.headers=[];if(args.headers!=null){params.headers=args.headers;delete args.headers;}
+var possibleParams=[];for(var i=0;i<this.parameters.length;i++){var param=this.parameters[i];if(param.paramType==='header'){if(args[param.name])
+params.headers[param.name]=args[param.name];}
+else if(param.paramType==='form'||param.paramType.toLowerCase()==='file')
+possibleParams.push(param);}
+if(args.body!=null){params.body=args.body;delete args.body;}
+if(possibleParams){var key;for(key in possibleParams){value=possibleParams[key];if(args[value.name]){params[value.name]=args[value.name];}}}
+req=new SwaggerRequest(this.method,this.urlify(args),params,opts,callback,error,this);if(opts.mock!=null){return req;}else{return true;}};SwaggerOperation.prototype.pathJson=function(){return this.path.replace("{format}","json");};SwaggerOperation.prototype.pathXml=function(){return this.path.replace("{format}","xml");};SwaggerOperation.prototype.encodePathParam=function(pathParam){var encParts,part,parts,_i,_len;pathParam=pathParam.toString();if(pathParam.indexOf("/")===-1){return encodeURIComponent(pathParam);}else{parts=pathParam.split("/");encParts=[];for(_i=0,_len=parts.length;_i<_len;_i++){part=parts[_i];encParts.push(encodeURIComponent(part));}
+return encParts.join("/");}};SwaggerOperation.prototype.urlify=function(args){var url=this.resource.basePath+this.pathJson();var params=this.parameters;for(var i=0;i<params.length;i++){var param=params[i];if(param.paramType==='path'){if(args[param.name]){var reg=new RegExp('\{'+param.name+'[^\}]*\}','gi');url=url.replace(reg,this.encodePathParam(args[param.name]));delete args[param.name];}
+else
+throw""+param.name+" is a required path param.";}}
+var queryParams="";for(var i=0;i<params.length;i++){var param=params[i];if(param.paramType==='query'){if(args[param.name]!==undefined){if(queryParams!=='')
+queryParams+="&";queryParams+=encodeURIComponent(param.name)+'='+encodeURIComponent(args[param.name]);}}}
+if((queryParams!=null)&&queryParams.length>0)
+url+='?'+queryParams;return url;};SwaggerOperation.prototype.supportHeaderParams=function(){return this.resource.api.supportHeaderParams;};SwaggerOperation.prototype.supportedSubmitMethods=function(){return this.resource.api.supportedSubmitMethods;};SwaggerOperation.prototype.getQueryParams=function(args){return this.getMatchingParams(['query'],args);};SwaggerOperation.prototype.getHeaderParams=function(args){return this.getMatchingParams(['header'],args);};SwaggerOperation.prototype.getMatchingParams=function(paramTypes,args){var matchingParams={};var params=this.parameters;for(var i=0;i<params.length;i++){param=params[i];if(args&&args[param.name])
+matchingParams[param.name]=args[param.name];}
+var headers=this.resource.api.headers;var name;for(name in headers){var value=headers[name];matchingParams[name]=value;}
+return matchingParams;};SwaggerOperation.prototype.help=function(){var msg="";var params=this.parameters;for(var i=0;i<params.length;i++){var param=params[i];if(msg!=="")
+msg+="\n";msg+="* "+param.name+(param.required?' (required)':'')+" - "+param.description;}
+return msg;};SwaggerOperation.prototype.formatXml=function(xml){var contexp,formatted,indent,lastType,lines,ln,pad,reg,transitions,wsexp,_fn,_i,_len;reg=/(>)(<)(\/*)/g;wsexp=/[ ]*(.*)[ ]+\n/g;contexp=/(<.+>)(.+\n)/g;xml=xml.replace(reg,'$1\n$2$3').replace(wsexp,'$1\n').replace(contexp,'$1\n$2');pad=0;formatted='';lines=xml.split('\n');indent=0;lastType='other';transitions={'single->single':0,'single->closing':-1,'single->opening':0,'single->other':0,'closing->single':0,'closing->closing':-1,'closing->opening':0,'closing->other':0,'opening->single':1,'opening->closing':0,'opening->opening':1,'opening->other':1,'other->single':0,'other->closing':-1,'other->opening':0,'other->other':0};_fn=function(ln){var fromTo,j,key,padding,type,types,value;types={single:Boolean(ln.match(/<.+\/>/)),closing:Boolean(ln.match(/<\/.+>/)),opening:Boolean(ln.match(/<[^!?].*>/))};type=((function(){var _results;_results=[];for(key in types){value=types[key];if(value){_results.push(key);}}
+return _results;})())[0];type=type===void 0?'other':type;fromTo=lastType+'->'+type;lastType=type;padding='';indent+=transitions[fromTo];padding=((function(){var _j,_ref5,_results;_results=[];for(j=_j=0,_ref5=indent;0<=_ref5?_j<_ref5:_j>_ref5;j=0<=_ref5?++_j:--_j){_results.push('  ');}
+return _results;})()).join('');if(fromTo==='opening->closing'){return formatted=formatted.substr(0,formatted.length-1)+ln+'\n';}else{return formatted+=padding+ln+'\n';}};for(_i=0,_len=lines.length;_i<_len;_i++){ln=lines[_i];_fn(ln);}
+return formatted;};var SwaggerRequest=function(type,url,params,opts,successCallback,errorCallback,operation,execution){var _this=this;var errors=[];this.useJQuery=(typeof operation.resource.useJQuery!=='undefined'?operation.resource.useJQuery:null);this.type=(type||errors.push("SwaggerRequest type is required (get/post/put/delete/patch/options)."));this.url=(url||errors.push("SwaggerRequest url is required."));this.params=params;this.opts=opts;this.successCallback=(successCallback||errors.push("SwaggerRequest successCallback is required."));this.errorCallback=(errorCallback||errors.push("SwaggerRequest error callback is required."));this.operation=(operation||errors.push("SwaggerRequest operation is required."));this.execution=execution;this.headers=(params.headers||{});if(errors.length>0){throw errors;}
+this.type=this.type.toUpperCase();var headers=this.setHeaders(params,this.operation);var body=params.body;if(headers["Content-Type"]){var values={};var i;var operationParams=this.operation.parameters;for(i=0;i<operationParams.length;i++){var param=operationParams[i];if(param.paramType==="form")
+values[param.name]=param;}
+if(headers["Content-Type"].indexOf("application/x-www-form-urlencoded")===0){var encoded="";var key;for(key in values){value=this.params[key];if(typeof value!=='undefined'){if(encoded!=="")
+encoded+="&";encoded+=encodeURIComponent(key)+'='+encodeURIComponent(value);}}
+body=encoded;}
+else if(headers["Content-Type"].indexOf("multipart/form-data")===0){var data="";var boundary="----SwaggerFormBoundary"+Date.now();var key;for(key in values){value=this.params[key];if(typeof value!=='undefined'){data+='--'+boundary+'\n';data+='Content-Disposition: form-data; name="'+key+'"';data+='\n\n';data+=value+"\n";}}
+data+="--"+boundary+"--\n";headers["Content-Type"]="multipart/form-data; boundary="+boundary;body=data;}}
+if(!((this.headers!=null)&&(this.headers.mock!=null))){obj={url:this.url,method:this.type,headers:headers,body:body,useJQuery:this.useJQuery,on:{error:function(response){return _this.errorCallback(response,_this.opts.parent);},redirect:function(response){return _this.successCallback(response,_this.opts.parent);},307:function(response){return _this.successCallback(response,_this.opts.parent);},response:function(response){return _this.successCallback(response,_this.opts.parent);}}};var e;if(typeof window!=='undefined'){e=window;}else{e=exports;}
+status=e.authorizations.apply(obj,this.operation.authorizations);if(opts.mock==null){if(status!==false){new SwaggerHttp().execute(obj);}else{obj.canceled=true;}}else{return obj;}}};SwaggerRequest.prototype.setHeaders=function(params,operation){var accepts="application/json";var consumes="application/json";var allDefinedParams=this.operation.parameters;var definedFormParams=[];var definedFileParams=[];var body=params.body;var headers={};var i;for(i=0;i<allDefinedParams.length;i++){var param=allDefinedParams[i];if(param.paramType==="form")
+definedFormParams.push(param);else if(param.paramType==="file")
+definedFileParams.push(param);else if(param.paramType==="header"&&this.params.headers){var key=param.name;var headerValue=this.params.headers[param.name];if(typeof this.params.headers[param.name]!=='undefined')
+headers[key]=headerValue;}}
+if(body&&(this.type==="POST"||this.type==="PUT"||this.type==="PATCH"||this.type==="DELETE")){if(this.opts.requestContentType)
+accepts=this.opts.requestContentType;}else{if(definedFormParams.length>0){if(definedFileParams.length>0)
+consumes="multipart/form-data";else
+consumes="application/x-www-form-urlencoded";}
+else if(this.type=="DELETE")
+body="{}";else if(this.type!="DELETE")
+accepts=null;}
+if(consumes&&this.operation.consumes){if(this.operation.consumes.indexOf(consumes)===-1){log("server doesn't consume "+consumes+", try "+JSON.stringify(this.operation.consumes));consumes=this.operation.consumes[0];}}
+if(this.opts.responseContentType){accepts=this.opts.responseContentType;}else{accepts="application/json";}
+if(accepts&&this.operation.produces){if(this.operation.produces.indexOf(accepts)===-1){log("server can't produce "+accepts);accepts=this.operation.produces[0];}}
+if((consumes&&body!=="")||(consumes==="application/x-www-form-urlencoded"))
+headers["Content-Type"]=consumes;if(accepts)
+headers["Accept"]=accepts;return headers;}
+SwaggerRequest.prototype.asCurl=function(){var results=[];if(this.headers){var key;for(key in this.headers){results.push("--header \""+key+": "+this.headers[v]+"\"");}}
+return"curl "+(results.join(" "))+" "+this.url;};var SwaggerHttp=function(){};SwaggerHttp.prototype.execute=function(obj){if(obj&&(typeof obj.useJQuery==='boolean'))
+this.useJQuery=obj.useJQuery;else
+this.useJQuery=this.isIE8();if(this.useJQuery)
+return new JQueryHttpClient().execute(obj);else
+return new ShredHttpClient().execute(obj);}
+SwaggerHttp.prototype.isIE8=function(){var detectedIE=false;if(typeof navigator!=='undefined'&&navigator.userAgent){nav=navigator.userAgent.toLowerCase();if(nav.indexOf('msie')!==-1){var version=parseInt(nav.split('msie')[1]);if(version<=8){detectedIE=true;}}}
+return detectedIE;};var JQueryHttpClient=function(options){"use strict";if(!jQuery){var jQuery=window.jQuery;}}
+JQueryHttpClient.prototype.execute=function(obj){var cb=obj.on;var request=obj;obj.type=obj.method;obj.cache=false;obj.beforeSend=function(xhr){var key,results;if(obj.headers){results=[];var key;for(key in obj.headers){if(key.toLowerCase()==="content-type"){results.push(obj.contentType=obj.headers[key]);}else if(key.toLowerCase()==="accept"){results.push(obj.accepts=obj.headers[key]);}else{results.push(xhr.setRequestHeader(key,obj.headers[key]));}}
+return results;}};obj.data=obj.body;obj.complete=function(response,textStatus,opts){var headers={},headerArray=response.getAllResponseHeaders().split("\n");for(var i=0;i<headerArray.length;i++){var toSplit=headerArray[i].trim();if(toSplit.length===0)
+continue;var separator=toSplit.indexOf(":");if(separator===-1){headers[toSplit]=null;continue;}
+var name=toSplit.substring(0,separator).trim(),value=toSplit.substring(separator+1).trim();headers[name]=value;}
+var out={url:request.url,method:request.method,status:response.status,data:response.responseText,headers:headers};var contentType=(headers["content-type"]||headers["Content-Type"]||null)
+if(contentType!=null){if(contentType.indexOf("application/json")==0||contentType.indexOf("+json")>0){if(response.responseText&&response.responseText!=="")
+out.obj=JSON.parse(response.responseText);else
+out.obj={}}}
+if(response.status>=200&&response.status<300)
+cb.response(out);else if(response.status===0||(response.status>=400&&response.status<599))
+cb.error(out);else
+return cb.response(out);};jQuery.support.cors=true;return jQuery.ajax(obj);}
+var ShredHttpClient=function(options){this.options=(options||{});this.isInitialized=false;var identity,toString;if(typeof window!=='undefined'){this.Shred=require("./shred");this.content=require("./shred/content");}
+else
+this.Shred=require("shred");this.shred=new this.Shred();}
+ShredHttpClient.prototype.initShred=function(){this.isInitialized=true;this.registerProcessors(this.shred);}
+ShredHttpClient.prototype.registerProcessors=function(shred){var identity=function(x){return x;};var toString=function(x){return x.toString();};if(typeof window!=='undefined'){this.content.registerProcessor(["application/json; charset=utf-8","application/json","json"],{parser:identity,stringify:toString});}else{this.Shred.registerProcessor(["application/json; charset=utf-8","application/json","json"],{parser:identity,stringify:toString});}}
+ShredHttpClient.prototype.execute=function(obj){if(!this.isInitialized)
+this.initShred();var cb=obj.on,res;var transform=function(response){var out={headers:response._headers,url:response.request.url,method:response.request.method,status:response.status,data:response.content.data};var contentType=(response._headers["content-type"]||response._headers["Content-Type"]||null)
+if(contentType!=null){if(contentType.indexOf("application/json")==0||contentType.indexOf("+json")>0){if(response.content.data&&response.content.data!=="")
+out.obj=JSON.parse(response.content.data);else
+out.obj={}}}
+return out;};res={error:function(response){if(obj)
+return cb.error(transform(response));},redirect:function(response){if(obj)
+return cb.redirect(transform(response));},307:function(response){if(obj)
+return cb.redirect(transform(response));},response:function(response){if(obj)
+return cb.response(transform(response));}};if(obj){obj.on=res;}
+return this.shred.request(obj);};var SwaggerAuthorizations=function(){this.authz={};};SwaggerAuthorizations.prototype.add=function(name,auth){this.authz[name]=auth;return auth;};SwaggerAuthorizations.prototype.remove=function(name){return delete this.authz[name];};SwaggerAuthorizations.prototype.apply=function(obj,authorizations){var status=null;var key;if(typeof authorizations==='undefined'||Object.keys(authorizations).length==0){for(key in this.authz){value=this.authz[key];result=value.apply(obj,authorizations);if(result===true)
+status=true;}}
+else{for(name in authorizations){for(key in this.authz){if(key==name){value=this.authz[key];result=value.apply(obj,authorizations);if(result===true)
+status=true;}}}}
+return status;};var ApiKeyAuthorization=function(name,value,type){this.name=name;this.value=value;this.type=type;};ApiKeyAuthorization.prototype.apply=function(obj,authorizations){if(this.type==="query"){if(obj.url.indexOf('?')>0)
+obj.url=obj.url+"&"+this.name+"="+this.value;else
+obj.url=obj.url+"?"+this.name+"="+this.value;return true;}else if(this.type==="header"){obj.headers[this.name]=this.value;return true;}};var CookieAuthorization=function(cookie){this.cookie=cookie;}
+CookieAuthorization.prototype.apply=function(obj,authorizations){obj.cookieJar=obj.cookieJar||CookieJar();obj.cookieJar.setCookie(this.cookie);return true;}
+var PasswordAuthorization=function(name,username,password){this.name=name;this.username=username;this.password=password;this._btoa=null;if(typeof window!=='undefined')
+this._btoa=btoa;else
+this._btoa=require("btoa");};PasswordAuthorization.prototype.apply=function(obj,authorizations){var base64encoder=this._btoa;obj.headers["Authorization"]="Basic "+base64encoder(this.username+":"+this.password);return true;};var e=(typeof window!=='undefined'?window:exports);var sampleModels={};var cookies={};e.SampleModels=sampleModels;e.SwaggerHttp=SwaggerHttp;e.SwaggerRequest=SwaggerRequest;e.authorizations=new SwaggerAuthorizations();e.ApiKeyAuthorization=ApiKeyAuthorization;e.PasswordAuthorization=PasswordAuthorization;e.CookieAuthorization=CookieAuthorization;e.JQueryHttpClient=JQueryHttpClient;e.ShredHttpClient=ShredHttpClient;e.SwaggerOperation=SwaggerOperation;e.SwaggerModel=SwaggerModel;e.SwaggerModelProperty=SwaggerModelProperty;e.SwaggerResource=SwaggerResource;e.SwaggerApi=SwaggerApi;;
+$(function(){$.fn.vAlign=function(){return this.each(function(i){var ah=$(this).height();var ph=$(this).parent().height();var mh=(ph-ah)/2;$(this).css('margin-top',mh);});};$.fn.stretchFormtasticInputWidthToParent=function(){return this.each(function(i){var p_width=$(this).closest("form").innerWidth();var p_padding=parseInt($(this).closest("form").css('padding-left'),10)+parseInt($(this).closest("form").css('padding-right'),10);var this_padding=parseInt($(this).css('padding-left'),10)+parseInt($(this).css('padding-right'),10);$(this).css('width',p_width-p_padding-this_padding);});};$('form.formtastic li.string input, form.formtastic textarea').stretchFormtasticInputWidthToParent();$('ul.downplayed li div.content p').vAlign();$("form.sandbox").submit(function(){var error_free=true;$(this).find("input.required").each(function(){$(this).removeClass('error');if($(this).val()==''){$(this).addClass('error');$(this).wiggle();error_free=false;}});return error_free;});});function clippyCopiedCallback(a){$('#api_key_copied').fadeIn().delay(1000).fadeOut();}
+log=function(){log.history=log.history||[];log.history.push(arguments);if(this.console){console.log(Array.prototype.slice.call(arguments)[0]);}};if(Function.prototype.bind&&console&&typeof console.log=="object"){["log","info","warn","error","assert","dir","clear","profile","profileEnd"].forEach(function(method){console[method]=this.bind(console[method],console);},Function.prototype.call);}
+var Docs={pendingResources:{},loadResource:function(resource,callback){if(resource==''){var pending=[];for(var id in Docs.pendingResources){pending.push(id);}
+if(pending.length==0){return false;}
+var remaining=pending.length;for(var i=0;i<pending.length;i++){Docs.pendingResources[pending[i]].load(function(){remaining-=1;if(remaining==0){callback();}});}
+return true;}
+var view=Docs.pendingResources[resource];if(view==null){return false;}
+view.load(callback);return true;},shebang:function(){var fragments=$.param.fragment().split('/');fragments.shift();if(fragments.length>0&&Docs.loadResource(fragments[0],Docs.shebang)){return;}
+switch(fragments.length){case 1:log('shebang resource:'+fragments[0]);var dom_id='resource_'+fragments[0];Docs.expandEndpointListForResource(fragments[0]);$("#"+dom_id).slideto({highlight:false});break;case 2:log('shebang endpoint: '+fragments.join('_'));Docs.expandEndpointListForResource(fragments[0]);$("#"+dom_id).slideto({highlight:false});var li_dom_id=fragments.join('_');var li_content_dom_id=li_dom_id+"_content";log("li_dom_id "+li_dom_id);log("li_content_dom_id "+li_content_dom_id);Docs.expandOperation($('#'+li_content_dom_id));$('#'+li_dom_id).slideto({highlight:false});break;}},toggleEndpointListForResource:function(resource){var elem=$('li#resource_'+Docs.escapeResourceName(resource)+' ul.endpoints');if(elem.is(':visible')){Docs.collapseEndpointListForResource(resource);}else{Docs.expandEndpointListForResource(resource);}},expandEndpointListForResource:function(resource){if(Docs.loadResource(resource,function(){Docs.expandEndpointListForResource(resource);})){return;}
+var resource=Docs.escapeResourceName(resource);if(resource==''){$('.resource ul.endpoints').slideDown();return;}
+$('li#resource_'+resource).addClass('active');var elem=$('li#resource_'+resource+' ul.endpoints');elem.slideDown();},collapseEndpointListForResource:function(resource){var resource=Docs.escapeResourceName(resource);$('li#resource_'+resource).removeClass('active');var elem=$('li#resource_'+resource+' ul.endpoints');elem.slideUp();},expandOperationsForResource:function(resource){if(Docs.loadResource(resource,function(){Docs.expandOperationsForResource(resource);})){return;}
+Docs.expandEndpointListForResource(resource);if(resource==''){$('.resource ul.endpoints li.operation div.content').slideDown();return;}
+$('li#resource_'+Docs.escapeResourceName(resource)+' li.operation div.content').each(function(){Docs.expandOperation($(this));});},collapseOperationsForResource:function(resource){if(Docs.loadResource(resource,function(){Docs.collapseOperationsForResource(resource);})){return;}
+Docs.expandEndpointListForResource(resource);$('li#resource_'+Docs.escapeResourceName(resource)+' li.operation div.content').each(function(){Docs.collapseOperation($(this));});},escapeResourceName:function(resource){return resource.replace(/[!"#$%&'()*+,.\/:;<=>?@\[\\\]\^`{|}~]/g,"\\$&");},expandOperation:function(elem){elem.slideDown();},collapseOperation:function(elem){elem.slideUp();}};(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['content_type']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n  ";stack1=helpers.each.call(depth0,depth0.produces,{hash:{},inverse:self.noop,fn:self.program(2,program2,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n";return buffer;}
+function program2(depth0,data){var buffer="",stack1;buffer+="\n	<option value=\"";stack1=(typeof depth0===functionType?depth0.apply(depth0):depth0);if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\">";stack1=(typeof depth0===functionType?depth0.apply(depth0):depth0);if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</option>\n	";return buffer;}
+function program4(depth0,data){return"\n  <option value=\"application/json\">application/json</option>\n";}
+buffer+="<label for=\"contentType\"></label>\n<select name=\"contentType\">\n";stack1=helpers['if'].call(depth0,depth0.produces,{hash:{},inverse:self.program(4,program4,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</select>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['main']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression,self=this;function program1(depth0,data){var buffer="",stack1,stack2;buffer+="\n    <div class=\"info_title\">"
++escapeExpression(((stack1=((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.title)),typeof stack1===functionType?stack1.apply(depth0):stack1))
++"</div>\n    <div class=\"info_description\">";stack2=((stack1=((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.description)),typeof stack1===functionType?stack1.apply(depth0):stack1);if(stack2||stack2===0){buffer+=stack2;}
+buffer+="</div>\n    ";stack2=helpers['if'].call(depth0,((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.termsOfServiceUrl),{hash:{},inverse:self.noop,fn:self.program(2,program2,data),data:data});if(stack2||stack2===0){buffer+=stack2;}
+buffer+="\n    ";stack2=helpers['if'].call(depth0,((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.contact),{hash:{},inverse:self.noop,fn:self.program(4,program4,data),data:data});if(stack2||stack2===0){buffer+=stack2;}
+buffer+="\n    ";stack2=helpers['if'].call(depth0,((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.license),{hash:{},inverse:self.noop,fn:self.program(6,program6,data),data:data});if(stack2||stack2===0){buffer+=stack2;}
+buffer+="\n  ";return buffer;}
+function program2(depth0,data){var buffer="",stack1;buffer+="<div class=\"info_tos\"><a href=\""
++escapeExpression(((stack1=((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.termsOfServiceUrl)),typeof stack1===functionType?stack1.apply(depth0):stack1))
++"\">Terms of service</a></div>";return buffer;}
+function program4(depth0,data){var buffer="",stack1;buffer+="<div class='info_contact'><a href=\"mailto:"
++escapeExpression(((stack1=((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.contact)),typeof stack1===functionType?stack1.apply(depth0):stack1))
++"\">Contact the developer</a></div>";return buffer;}
+function program6(depth0,data){var buffer="",stack1;buffer+="<div class='info_license'><a href='"
++escapeExpression(((stack1=((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.licenseUrl)),typeof stack1===functionType?stack1.apply(depth0):stack1))
++"'>"
++escapeExpression(((stack1=((stack1=depth0.info),stack1==null||stack1===false?stack1:stack1.license)),typeof stack1===functionType?stack1.apply(depth0):stack1))
++"</a></div>";return buffer;}
+function program8(depth0,data){var buffer="",stack1;buffer+="\n        , <span style=\"font-variant: small-caps\">api version</span>: ";if(stack1=helpers.apiVersion){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.apiVersion;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"\n        ";return buffer;}
+buffer+="<div class='info' id='api_info'>\n  ";stack1=helpers['if'].call(depth0,depth0.info,{hash:{},inverse:self.noop,fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</div>\n<div class='container' id='resources_container'>\n    <ul id='resources'>\n    </ul>\n\n    <div class=\"footer\">\n        <br>\n        <br>\n        <h4 style=\"color: #999\">[ <span style=\"font-variant: small-caps\">base url</span>: ";if(stack1=helpers.basePath){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.basePath;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"\n        ";stack1=helpers['if'].call(depth0,depth0.apiVersion,{hash:{},inverse:self.noop,fn:self.program(8,program8,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="]</h4>\n    </div>\n</div>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['operation']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,options,functionType="function",escapeExpression=this.escapeExpression,self=this,blockHelperMissing=helpers.blockHelperMissing;function program1(depth0,data){var buffer="",stack1;buffer+="\n        <h4>Implementation Notes</h4>\n        <p>";if(stack1=helpers.notes){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.notes;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</p>\n        ";return buffer;}
+function program3(depth0,data){return"\n        <div class=\"auth\">\n        <span class=\"api-ic ic-error\"></span>";}
+function program5(depth0,data){var buffer="",stack1;buffer+="\n          <div id=\"api_information_panel\" style=\"top: 526px; left: 776px; display: none;\">\n          ";stack1=helpers.each.call(depth0,depth0,{hash:{},inverse:self.noop,fn:self.program(6,program6,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n          </div>\n        ";return buffer;}
+function program6(depth0,data){var buffer="",stack1,stack2;buffer+="\n            <div title='";stack2=((stack1=depth0.description),typeof stack1===functionType?stack1.apply(depth0):stack1);if(stack2||stack2===0){buffer+=stack2;}
+buffer+="'>"
++escapeExpression(((stack1=depth0.scope),typeof stack1===functionType?stack1.apply(depth0):stack1))
++"</div>\n          ";return buffer;}
+function program8(depth0,data){return"</div>";}
+function program10(depth0,data){return"\n        <div class='access'>\n          <span class=\"api-ic ic-off\" title=\"click to authenticate\"></span>\n        </div>\n        ";}
+function program12(depth0,data){return"\n          <h4>Response Class</h4>\n          <p><span class=\"model-signature\" /></p>\n          <br/>\n          <div class=\"response-content-type\" />\n        ";}
+function program14(depth0,data){return"\n          <h4>Parameters</h4>\n          <table class='fullwidth'>\n          <thead>\n            <tr>\n            <th style=\"width: 100px; max-width: 100px\">Parameter</th>\n            <th style=\"width: 310px; max-width: 310px\">Value</th>\n            <th style=\"width: 200px; max-width: 200px\">Description</th>\n            <th style=\"width: 100px; max-width: 100px\">Parameter Type</th>\n            <th style=\"width: 220px; max-width: 230px\">Data Type</th>\n            </tr>\n          </thead>\n          <tbody class=\"operation-params\">\n\n          </tbody>\n          </table>\n          ";}
+function program16(depth0,data){return"\n          <div style='margin:0;padding:0;display:inline'></div>\n          <h4>Response Messages</h4>\n          <table class='fullwidth'>\n            <thead>\n            <tr>\n              <th>HTTP Status Code</th>\n              <th>Reason</th>\n              <th>Response Model</th>\n            </tr>\n            </thead>\n            <tbody class=\"operation-status\">\n            \n            </tbody>\n          </table>\n          ";}
+function program18(depth0,data){return"\n          ";}
+function program20(depth0,data){return"\n          <div class='sandbox_header'>\n            <input class='submit' name='commit' type='button' value='Try it out!' />\n            <a href='#' class='response_hider' style='display:none'>Hide Response</a>\n            <span class='response_throbber' style='display:none'></span>\n          </div>\n          ";}
+buffer+="\n  <ul class='operations' >\n    <li class='";if(stack1=helpers.method){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.method;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++" operation' id='";if(stack1=helpers.parentId){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.parentId;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"_";if(stack1=helpers.nickname){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.nickname;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>\n      <div class='heading'>\n        <h3>\n          <span class='http_method'>\n          <a href='#!/";if(stack1=helpers.parentId){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.parentId;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"/";if(stack1=helpers.nickname){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.nickname;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' class=\"toggleOperation\">";if(stack1=helpers.method){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.method;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</a>\n          </span>\n          <span class='path'>\n          <a href='#!/";if(stack1=helpers.parentId){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.parentId;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"/";if(stack1=helpers.nickname){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.nickname;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' class=\"toggleOperation\">";if(stack1=helpers.path){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.path;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</a>\n          </span>\n        </h3>\n        <ul class='options'>\n          <li>\n          <a href='#!/";if(stack1=helpers.parentId){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.parentId;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"/";if(stack1=helpers.nickname){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.nickname;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' class=\"toggleOperation\">";if(stack1=helpers.summary){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.summary;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</a>\n          </li>\n        </ul>\n      </div>\n      <div class='content' id='";if(stack1=helpers.parentId){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.parentId;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"_";if(stack1=helpers.nickname){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.nickname;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"_content' style='display:none'>\n        ";stack1=helpers['if'].call(depth0,depth0.notes,{hash:{},inverse:self.noop,fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        ";options={hash:{},inverse:self.noop,fn:self.program(3,program3,data),data:data};if(stack1=helpers.oauth){stack1=stack1.call(depth0,options);}
+else{stack1=depth0.oauth;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(!helpers.oauth){stack1=blockHelperMissing.call(depth0,stack1,options);}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        ";stack1=helpers.each.call(depth0,depth0.oauth,{hash:{},inverse:self.noop,fn:self.program(5,program5,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        ";options={hash:{},inverse:self.noop,fn:self.program(8,program8,data),data:data};if(stack1=helpers.oauth){stack1=stack1.call(depth0,options);}
+else{stack1=depth0.oauth;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(!helpers.oauth){stack1=blockHelperMissing.call(depth0,stack1,options);}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        ";options={hash:{},inverse:self.noop,fn:self.program(10,program10,data),data:data};if(stack1=helpers.oauth){stack1=stack1.call(depth0,options);}
+else{stack1=depth0.oauth;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(!helpers.oauth){stack1=blockHelperMissing.call(depth0,stack1,options);}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        ";stack1=helpers['if'].call(depth0,depth0.type,{hash:{},inverse:self.noop,fn:self.program(12,program12,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        <form accept-charset='UTF-8' class='sandbox'>\n          <div style='margin:0;padding:0;display:inline'></div>\n          ";stack1=helpers['if'].call(depth0,depth0.parameters,{hash:{},inverse:self.noop,fn:self.program(14,program14,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n          ";stack1=helpers['if'].call(depth0,depth0.responseMessages,{hash:{},inverse:self.noop,fn:self.program(16,program16,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n          ";stack1=helpers['if'].call(depth0,depth0.isReadOnly,{hash:{},inverse:self.program(20,program20,data),fn:self.program(18,program18,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n        </form>\n        <div class='response' style='display:none'>\n          <h4>Request URL</h4>\n          <div class='block request_url'></div>\n          <h4>Response Body</h4>\n          <div class='block response_body'></div>\n          <h4>Response Code</h4>\n          <div class='block response_code'></div>\n          <h4>Response Headers</h4>\n          <div class='block response_headers'></div>\n        </div>\n      </div>\n    </li>\n  </ul>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['param']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression,self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n		";stack1=helpers['if'].call(depth0,depth0.isFile,{hash:{},inverse:self.program(4,program4,data),fn:self.program(2,program2,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n	";return buffer;}
+function program2(depth0,data){var buffer="",stack1;buffer+="\n			<input type=\"file\" name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'/>\n			<div class=\"parameter-content-type\" />\n		";return buffer;}
+function program4(depth0,data){var buffer="",stack1;buffer+="\n			";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(7,program7,data),fn:self.program(5,program5,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n		";return buffer;}
+function program5(depth0,data){var buffer="",stack1;buffer+="\n				<textarea class='body-textarea' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</textarea>\n			";return buffer;}
+function program7(depth0,data){var buffer="",stack1;buffer+="\n				<textarea class='body-textarea' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'></textarea>\n				<br />\n				<div class=\"parameter-content-type\" />\n			";return buffer;}
+function program9(depth0,data){var buffer="",stack1;buffer+="\n		";stack1=helpers['if'].call(depth0,depth0.isFile,{hash:{},inverse:self.program(10,program10,data),fn:self.program(2,program2,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n	";return buffer;}
+function program10(depth0,data){var buffer="",stack1;buffer+="\n			";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(13,program13,data),fn:self.program(11,program11,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n		";return buffer;}
+function program11(depth0,data){var buffer="",stack1;buffer+="\n				<input class='parameter' minlength='0' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' placeholder='' type='text' value='";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'/>\n			";return buffer;}
+function program13(depth0,data){var buffer="",stack1;buffer+="\n				<input class='parameter' minlength='0' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' placeholder='' type='text' value=''/>\n			";return buffer;}
+buffer+="<td class='code'>";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</td>\n<td>\n\n	";stack1=helpers['if'].call(depth0,depth0.isBody,{hash:{},inverse:self.program(9,program9,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n\n</td>\n<td>";if(stack1=helpers.description){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.description;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td>";if(stack1=helpers.paramType){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.paramType;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td>\n	<span class=\"model-signature\"></span>\n</td>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['param_list']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,stack2,options,self=this,helperMissing=helpers.helperMissing,functionType="function",escapeExpression=this.escapeExpression;function program1(depth0,data){return" multiple='multiple'";}
+function program3(depth0,data){return"\n    ";}
+function program5(depth0,data){var buffer="",stack1;buffer+="\n      ";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(8,program8,data),fn:self.program(6,program6,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n    ";return buffer;}
+function program6(depth0,data){return"\n      ";}
+function program8(depth0,data){var buffer="",stack1,stack2,options;buffer+="\n        ";options={hash:{},inverse:self.program(11,program11,data),fn:self.program(9,program9,data),data:data};stack2=((stack1=helpers.isArray||depth0.isArray),stack1?stack1.call(depth0,depth0,options):helperMissing.call(depth0,"isArray",depth0,options));if(stack2||stack2===0){buffer+=stack2;}
+buffer+="\n      ";return buffer;}
+function program9(depth0,data){return"\n        ";}
+function program11(depth0,data){return"\n          <option selected=\"\" value=''></option>\n        ";}
+function program13(depth0,data){var buffer="",stack1;buffer+="\n      ";stack1=helpers['if'].call(depth0,depth0.isDefault,{hash:{},inverse:self.program(16,program16,data),fn:self.program(14,program14,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n    ";return buffer;}
+function program14(depth0,data){var buffer="",stack1;buffer+="\n        <option selected=\"\" value='";if(stack1=helpers.value){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.value;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>";if(stack1=helpers.value){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.value;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++" (default)</option>\n      ";return buffer;}
+function program16(depth0,data){var buffer="",stack1;buffer+="\n        <option value='";if(stack1=helpers.value){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.value;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>";if(stack1=helpers.value){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.value;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</option>\n      ";return buffer;}
+buffer+="<td class='code'>";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</td>\n<td>\n  <select ";options={hash:{},inverse:self.noop,fn:self.program(1,program1,data),data:data};stack2=((stack1=helpers.isArray||depth0.isArray),stack1?stack1.call(depth0,depth0,options):helperMissing.call(depth0,"isArray",depth0,options));if(stack2||stack2===0){buffer+=stack2;}
+buffer+=" class='parameter' name='";if(stack2=helpers.name){stack2=stack2.call(depth0,{hash:{},data:data});}
+else{stack2=depth0.name;stack2=typeof stack2===functionType?stack2.apply(depth0):stack2;}
+buffer+=escapeExpression(stack2)
++"'>\n    ";stack2=helpers['if'].call(depth0,depth0.required,{hash:{},inverse:self.program(5,program5,data),fn:self.program(3,program3,data),data:data});if(stack2||stack2===0){buffer+=stack2;}
+buffer+="\n    ";stack2=helpers.each.call(depth0,((stack1=depth0.allowableValues),stack1==null||stack1===false?stack1:stack1.descriptiveValues),{hash:{},inverse:self.noop,fn:self.program(13,program13,data),data:data});if(stack2||stack2===0){buffer+=stack2;}
+buffer+="\n  </select>\n</td>\n<td>";if(stack2=helpers.description){stack2=stack2.call(depth0,{hash:{},data:data});}
+else{stack2=depth0.description;stack2=typeof stack2===functionType?stack2.apply(depth0):stack2;}
+if(stack2||stack2===0){buffer+=stack2;}
+buffer+="</td>\n<td>";if(stack2=helpers.paramType){stack2=stack2.call(depth0,{hash:{},data:data});}
+else{stack2=depth0.paramType;stack2=typeof stack2===functionType?stack2.apply(depth0):stack2;}
+if(stack2||stack2===0){buffer+=stack2;}
+buffer+="</td>\n<td><span class=\"model-signature\"></span></td>";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['param_readonly']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression,self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n        <textarea class='body-textarea' readonly='readonly' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</textarea>\n    ";return buffer;}
+function program3(depth0,data){var buffer="",stack1;buffer+="\n        ";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(6,program6,data),fn:self.program(4,program4,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n    ";return buffer;}
+function program4(depth0,data){var buffer="",stack1;buffer+="\n            ";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"\n        ";return buffer;}
+function program6(depth0,data){return"\n            (empty)\n        ";}
+buffer+="<td class='code'>";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</td>\n<td>\n    ";stack1=helpers['if'].call(depth0,depth0.isBody,{hash:{},inverse:self.program(3,program3,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</td>\n<td>";if(stack1=helpers.description){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.description;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td>";if(stack1=helpers.paramType){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.paramType;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td><span class=\"model-signature\"></span></td>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['param_readonly_required']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression,self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n        <textarea class='body-textarea'  readonly='readonly' placeholder='(required)' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</textarea>\n    ";return buffer;}
+function program3(depth0,data){var buffer="",stack1;buffer+="\n        ";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(6,program6,data),fn:self.program(4,program4,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n    ";return buffer;}
+function program4(depth0,data){var buffer="",stack1;buffer+="\n            ";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"\n        ";return buffer;}
+function program6(depth0,data){return"\n            (empty)\n        ";}
+buffer+="<td class='code required'>";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</td>\n<td>\n    ";stack1=helpers['if'].call(depth0,depth0.isBody,{hash:{},inverse:self.program(3,program3,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</td>\n<td>";if(stack1=helpers.description){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.description;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td>";if(stack1=helpers.paramType){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.paramType;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td><span class=\"model-signature\"></span></td>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['param_required']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression,self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n		";stack1=helpers['if'].call(depth0,depth0.isFile,{hash:{},inverse:self.program(4,program4,data),fn:self.program(2,program2,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n	";return buffer;}
+function program2(depth0,data){var buffer="",stack1;buffer+="\n			<input type=\"file\" name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'/>\n		";return buffer;}
+function program4(depth0,data){var buffer="",stack1;buffer+="\n			";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(7,program7,data),fn:self.program(5,program5,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n		";return buffer;}
+function program5(depth0,data){var buffer="",stack1;buffer+="\n				<textarea class='body-textarea' placeholder='(required)' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</textarea>\n			";return buffer;}
+function program7(depth0,data){var buffer="",stack1;buffer+="\n				<textarea class='body-textarea' placeholder='(required)' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'></textarea>\n				<br />\n				<div class=\"parameter-content-type\" />\n			";return buffer;}
+function program9(depth0,data){var buffer="",stack1;buffer+="\n		";stack1=helpers['if'].call(depth0,depth0.isFile,{hash:{},inverse:self.program(12,program12,data),fn:self.program(10,program10,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n	";return buffer;}
+function program10(depth0,data){var buffer="",stack1;buffer+="\n			<input class='parameter' class='required' type='file' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'/>\n		";return buffer;}
+function program12(depth0,data){var buffer="",stack1;buffer+="\n			";stack1=helpers['if'].call(depth0,depth0.defaultValue,{hash:{},inverse:self.program(15,program15,data),fn:self.program(13,program13,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n		";return buffer;}
+function program13(depth0,data){var buffer="",stack1;buffer+="\n				<input class='parameter required' minlength='1' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' placeholder='(required)' type='text' value='";if(stack1=helpers.defaultValue){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.defaultValue;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'/>\n			";return buffer;}
+function program15(depth0,data){var buffer="",stack1;buffer+="\n				<input class='parameter required' minlength='1' name='";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' placeholder='(required)' type='text' value=''/>\n			";return buffer;}
+buffer+="<td class='code required'>";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</td>\n<td>\n	";stack1=helpers['if'].call(depth0,depth0.isBody,{hash:{},inverse:self.program(9,program9,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</td>\n<td>\n	<strong>";if(stack1=helpers.description){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.description;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</strong>\n</td>\n<td>";if(stack1=helpers.paramType){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.paramType;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td><span class=\"model-signature\"></span></td>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['parameter_content_type']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n  ";stack1=helpers.each.call(depth0,depth0.consumes,{hash:{},inverse:self.noop,fn:self.program(2,program2,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n";return buffer;}
+function program2(depth0,data){var buffer="",stack1;buffer+="\n  <option value=\"";stack1=(typeof depth0===functionType?depth0.apply(depth0):depth0);if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\">";stack1=(typeof depth0===functionType?depth0.apply(depth0):depth0);if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</option>\n  ";return buffer;}
+function program4(depth0,data){return"\n  <option value=\"application/json\">application/json</option>\n";}
+buffer+="<label for=\"parameterContentType\"></label>\n<select name=\"parameterContentType\">\n";stack1=helpers['if'].call(depth0,depth0.consumes,{hash:{},inverse:self.program(4,program4,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</select>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['resource']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,options,functionType="function",escapeExpression=this.escapeExpression,self=this,blockHelperMissing=helpers.blockHelperMissing;function program1(depth0,data){return" : ";}
+buffer+="<div class='heading'>\n  <h2>\n    <a href='#!/";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' onclick=\"Docs.toggleEndpointListForResource('";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"');\">";if(stack1=helpers.name){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.name;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</a> ";options={hash:{},inverse:self.noop,fn:self.program(1,program1,data),data:data};if(stack1=helpers.description){stack1=stack1.call(depth0,options);}
+else{stack1=depth0.description;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(!helpers.description){stack1=blockHelperMissing.call(depth0,stack1,options);}
+if(stack1||stack1===0){buffer+=stack1;}
+if(stack1=helpers.description){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.description;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n  </h2>\n  <ul class='options'>\n    <li>\n      <a href='#!/";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"' id='endpointListTogger_";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'\n         onclick=\"Docs.toggleEndpointListForResource('";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"');\">Show/Hide</a>\n    </li>\n    <li>\n      <a href='#' onclick=\"Docs.collapseOperationsForResource('";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'); return false;\">\n        List Operations\n      </a>\n    </li>\n    <li>\n      <a href='#' onclick=\"Docs.expandOperationsForResource('";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'); return false;\">\n        Expand Operations\n      </a>\n    </li>\n    <li>\n      <a href='";if(stack1=helpers.url){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.url;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"'>Raw</a>\n    </li>\n  </ul>\n</div>\n<ul class='endpoints' id='";if(stack1=helpers.id){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.id;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"_endpoint_list' style='display:none'>\n\n</ul>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['response_content_type']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",self=this;function program1(depth0,data){var buffer="",stack1;buffer+="\n  ";stack1=helpers.each.call(depth0,depth0.produces,{hash:{},inverse:self.noop,fn:self.program(2,program2,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n";return buffer;}
+function program2(depth0,data){var buffer="",stack1;buffer+="\n  <option value=\"";stack1=(typeof depth0===functionType?depth0.apply(depth0):depth0);if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\">";stack1=(typeof depth0===functionType?depth0.apply(depth0):depth0);if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</option>\n  ";return buffer;}
+function program4(depth0,data){return"\n  <option value=\"application/json\">application/json</option>\n";}
+buffer+="<label for=\"responseContentType\"></label>\n<select name=\"responseContentType\">\n";stack1=helpers['if'].call(depth0,depth0.produces,{hash:{},inverse:self.program(4,program4,data),fn:self.program(1,program1,data),data:data});if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n</select>\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['signature']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression;buffer+="<div>\n<ul class=\"signature-nav\">\n    <li><a class=\"description-link\" href=\"#\">Model</a></li>\n    <li><a class=\"snippet-link\" href=\"#\">Model Schema</a></li>\n</ul>\n<div>\n\n<div class=\"signature-container\">\n    <div class=\"description\">\n        ";if(stack1=helpers.signature){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.signature;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="\n    </div>\n\n    <div class=\"snippet\">\n        <pre><code>";if(stack1=helpers.sampleJSON){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.sampleJSON;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</code></pre>\n        <small class=\"notice\"></small>\n    </div>\n</div>\n\n";return buffer;});})();(function(){var template=Handlebars.template,templates=Handlebars.templates=Handlebars.templates||{};templates['status_code']=template(function(Handlebars,depth0,helpers,partials,data){this.compilerInfo=[4,'>= 1.0.0'];helpers=this.merge(helpers,Handlebars.helpers);data=data||{};var buffer="",stack1,functionType="function",escapeExpression=this.escapeExpression;buffer+="<td width='15%' class='code'>";if(stack1=helpers.code){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.code;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+buffer+=escapeExpression(stack1)
++"</td>\n<td>";if(stack1=helpers.message){stack1=stack1.call(depth0,{hash:{},data:data});}
+else{stack1=depth0.message;stack1=typeof stack1===functionType?stack1.apply(depth0):stack1;}
+if(stack1||stack1===0){buffer+=stack1;}
+buffer+="</td>\n<td width='50%'><span class=\"model-signature\" /></td>";return buffer;});})();(function(){var ContentTypeView,HeaderView,MainView,OperationView,ParameterContentTypeView,ParameterView,ResourceView,ResponseContentTypeView,SignatureView,StatusCodeView,SwaggerUi,_ref,_ref1,_ref10,_ref2,_ref3,_ref4,_ref5,_ref6,_ref7,_ref8,_ref9,__hasProp={}.hasOwnProperty,__extends=function(child,parent){for(var key in parent){if(__hasProp.call(parent,key))child[key]=parent[key];}function ctor(){this.constructor=child;}ctor.prototype=parent.prototype;child.prototype=new ctor();child.__super__=parent.prototype;return child;};SwaggerUi=(function(_super){__extends(SwaggerUi,_super);function SwaggerUi(){_ref=SwaggerUi.__super__.constructor.apply(this,arguments);return _ref;}
+SwaggerUi.prototype.dom_id="swagger_ui";SwaggerUi.prototype.options=null;SwaggerUi.prototype.api=null;SwaggerUi.prototype.headerView=null;SwaggerUi.prototype.mainView=null;SwaggerUi.prototype.initialize=function(options){var _this=this;if(options==null){options={};}
+if(options.dom_id!=null){this.dom_id=options.dom_id;delete options.dom_id;}
+if($('#'+this.dom_id)==null){$('body').append('<div id="'+this.dom_id+'"></div>');}
+this.options=options;this.options.success=function(){return _this.render();};this.options.progress=function(d){return _this.showMessage(d);};this.options.failure=function(d){return _this.onLoadFailure(d);};this.headerView=new HeaderView({el:$('#header')});return this.headerView.on('update-swagger-ui',function(data){return _this.updateSwaggerUi(data);});};SwaggerUi.prototype.updateSwaggerUi=function(data){this.options.url=data.url;return this.load();};SwaggerUi.prototype.load=function(){var url,_ref1;if((_ref1=this.mainView)!=null){_ref1.clear();}
+url=this.options.url;if(url.indexOf("http")!==0){url=this.buildUrl(window.location.href.toString(),url);}
+this.options.url=url;this.headerView.update(url);this.api=new SwaggerApi(this.options);delete this.options.spec;return this.api;};SwaggerUi.prototype.render=function(){var _this=this;this.showMessage('Finished Loading Resource Information. Rendering Swagger UI...');this.mainView=new MainView({model:this.api,el:$('#'+this.dom_id),swaggerOptions:this.options}).render();this.showMessage();switch(this.options.docExpansion){case"full":Docs.expandOperationsForResource('');break;case"list":Docs.collapseOperationsForResource('');}
+if(this.options.onComplete){this.options.onComplete(this.api,this);}
+if(this.options.prefetch){this.prefetch();}
+return setTimeout(function(){return Docs.shebang();},400);};SwaggerUi.prototype.prefetch=function(){var id,idle,_this=this;idle=window.requestIdleCallback||function(callback){return setTimeout(callback,200);};for(id in Docs.pendingResources){return idle(function(){if(Docs.pendingResources[id]==null){return _this.prefetch();}
+return Docs.pendingResources[id].load(function(){return _this.prefetch();});});}};SwaggerUi.prototype.buildUrl=function(base,url){var endOfPath,parts;log("base is "+base);if(url.indexOf("/")===0){parts=base.split("/");base=parts[0]+"//"+parts[2];return base+url;}else{endOfPath=base.length;if(base.indexOf("?")>-1){endOfPath=Math.min(endOfPath,base.indexOf("?"));}
+if(base.indexOf("#")>-1){endOfPath=Math.min(endOfPath,base.indexOf("#"));}
+base=base.substring(0,endOfPath);if(base.indexOf("/",base.length-1)!==-1){return base+url;}
+return base+"/"+url;}};SwaggerUi.prototype.showMessage=function(data){if(data==null){data='';}
+$('#message-bar').removeClass('message-fail');$('#message-bar').addClass('message-success');return $('#message-bar').html(data);};SwaggerUi.prototype.onLoadFailure=function(data){var val;if(data==null){data='';}
+$('#message-bar').removeClass('message-success');$('#message-bar').addClass('message-fail');val=$('#message-bar').html(data);if(this.options.onFailure!=null){this.options.onFailure(data);}
+return val;};return SwaggerUi;})(Backbone.Router);window.SwaggerUi=SwaggerUi;HeaderView=(function(_super){__extends(HeaderView,_super);function HeaderView(){_ref1=HeaderView.__super__.constructor.apply(this,arguments);return _ref1;}
+HeaderView.prototype.events={'click #show-pet-store-icon':'showPetStore','click #show-wordnik-dev-icon':'showWordnikDev','click #explore':'showCustom','keyup #input_baseUrl':'showCustomOnKeyup','keyup #input_apiKey':'showCustomOnKeyup'};HeaderView.prototype.initialize=function(){};HeaderView.prototype.showPetStore=function(e){return this.trigger('update-swagger-ui',{url:"http://petstore.swagger.wordnik.com/api/api-docs"});};HeaderView.prototype.showWordnikDev=function(e){return this.trigger('update-swagger-ui',{url:"http://api.wordnik.com/v4/resources.json"});};HeaderView.prototype.showCustomOnKeyup=function(e){if(e.keyCode===13){return this.showCustom();}};HeaderView.prototype.showCustom=function(e){if(e!=null){e.preventDefault();}
+return this.trigger('update-swagger-ui',{url:$('#input_baseUrl').val(),apiKey:$('#input_apiKey').val()});};HeaderView.prototype.update=function(url,apiKey,trigger){if(trigger==null){trigger=false;}
+$('#input_baseUrl').val(url);if(trigger){return this.trigger('update-swagger-ui',{url:url});}};return HeaderView;})(Backbone.View);MainView=(function(_super){var sorters;__extends(MainView,_super);function MainView(){_ref2=MainView.__super__.constructor.apply(this,arguments);return _ref2;}
+sorters={'alpha':function(a,b){return a.path.localeCompare(b.path);},'method':function(a,b){return a.method.localeCompare(b.method);}};MainView.prototype.initialize=function(opts){var route,sorter,sorterName,_i,_len,_ref3;if(opts==null){opts={};}
+if(opts.swaggerOptions.sorter){sorterName=opts.swaggerOptions.sorter;sorter=sorters[sorterName];_ref3=this.model.apisArray;for(_i=0,_len=_ref3.length;_i<_len;_i++){route=_ref3[_i];route.operationsArray.sort(sorter);}
+if(sorterName==="alpha"){return this.model.apisArray.sort(sorter);}}};MainView.prototype.render=function(){var counter,id,resource,resources,_i,_len,_ref3;$(this.el).html(Handlebars.templates.main(this.model));Docs.pendingResources={};resources={};counter=0;_ref3=this.model.apisArray;for(_i=0,_len=_ref3.length;_i<_len;_i++){resource=_ref3[_i];id=resource.name;while(typeof resources[id]!=='undefined'){id=id+"_"+counter;counter+=1;}
+resource.id=id;resources[id]=resource;this.addResource(resource);}
+return this;};MainView.prototype.addResource=function(resource){var resourceView;resourceView=new ResourceView({model:resource,tagName:'li',id:'resource_'+resource.id,className:'resource',swaggerOptions:this.options.swaggerOptions});return $('#resources').append(resourceView.render().el);};MainView.prototype.clear=function(){return $(this.el).html('');};return MainView;})(Backbone.View);ResourceView=(function(_super){__extends(ResourceView,_super);function ResourceView(){_ref3=ResourceView.__super__.constructor.apply(this,arguments);return _ref3;}
+ResourceView.prototype.initialize=function(){};ResourceView.prototype.render=function(){var counter,id,methods,operation,_i,_len,_ref4;$(this.el).html(Handlebars.templates.resource(this.model));if(!this.model.ready){Docs.pendingResources[this.model.id]=this;return this;}
+methods={};_ref4=this.model.operationsArray;for(_i=0,_len=_ref4.length;_i<_len;_i++){operation=_ref4[_i];counter=0;id=operation.nickname;while(typeof methods[id]!=='undefined'){id=id+"_"+counter;counter+=1;}
+methods[id]=operation;operation.nickname=id;operation.parentId=this.model.id;this.addOperation(operation);}
+return this;};ResourceView.prototype.load=function(callback){var _this=this;return this.model.load(function(){if(Docs.pendingResources[_this.model.id]===_this){delete Docs.pendingResources[_this.model.id];_this.model.api.setConsolidatedModels();_this.render();if(_this.options.swaggerOptions.onResourceLoaded){_this.options.swaggerOptions.onResourceLoaded(_this.model);}}
+if(callback!=null){return callback();}});};ResourceView.prototype.addOperation=function(operation){var operationView;operation.number=this.number;operationView=new OperationView({model:operation,tagName:'li',className:'endpoint',swaggerOptions:this.options.swaggerOptions});$('.endpoints',$(this.el)).append(operationView.render().el);return this.number++;};return ResourceView;})(Backbone.View);OperationView=(function(_super){__extends(OperationView,_super);function OperationView(){_ref4=OperationView.__super__.constructor.apply(this,arguments);return _ref4;}
+OperationView.prototype.invocationUrl=null;OperationView.prototype.events={'submit .sandbox':'submitOperation','click .submit':'submitOperation','click .response_hider':'hideResponse','click .toggleOperation':'toggleOperationContent','mouseenter .api-ic':'mouseEnter','mouseout .api-ic':'mouseExit'};OperationView.prototype.initialize=function(){};OperationView.prototype.mouseEnter=function(e){var elem,hgh,pos,scMaxX,scMaxY,scX,scY,wd,x,y;elem=$(e.currentTarget.parentNode).find('#api_information_panel');x=e.pageX;y=e.pageY;scX=$(window).scrollLeft();scY=$(window).scrollTop();scMaxX=scX+$(window).width();scMaxY=scY+$(window).height();wd=elem.width();hgh=elem.height();if(x+wd>scMaxX){x=scMaxX-wd;}
+if(x<scX){x=scX;}
+if(y+hgh>scMaxY){y=scMaxY-hgh;}
+if(y<scY){y=scY;}
+pos={};pos.top=y;pos.left=x;elem.css(pos);return $(e.currentTarget.parentNode).find('#api_information_panel').show();};OperationView.prototype.mouseExit=function(e){return $(e.currentTarget.parentNode).find('#api_information_panel').hide();};OperationView.prototype.render=function(){var contentTypeModel,isMethodSubmissionSupported,k,o,param,responseContentTypeView,responseSignatureView,signatureModel,statusCode,type,v,_i,_j,_k,_l,_len,_len1,_len2,_len3,_ref5,_ref6,_ref7,_ref8;isMethodSubmissionSupported=true;if(!isMethodSubmissionSupported){this.model.isReadOnly=true;}
+this.model.oauth=null;if(this.model.authorizations){_ref5=this.model.authorizations;for(k in _ref5){v=_ref5[k];if(k==="oauth2"){if(this.model.oauth===null){this.model.oauth={};}
+if(this.model.oauth.scopes===void 0){this.model.oauth.scopes=[];}
+for(_i=0,_len=v.length;_i<_len;_i++){o=v[_i];this.model.oauth.scopes.push(o);}}}}
+$(this.el).html(Handlebars.templates.operation(this.model));if(this.model.responseClassSignature&&this.model.responseClassSignature!=='string'){signatureModel={sampleJSON:this.model.responseSampleJSON,isParam:false,signature:this.model.responseClassSignature};responseSignatureView=new SignatureView({model:signatureModel,tagName:'div'});$('.model-signature',$(this.el)).append(responseSignatureView.render().el);}else{$('.model-signature',$(this.el)).html(this.model.type);}
+contentTypeModel={isParam:false};contentTypeModel.consumes=this.model.consumes;contentTypeModel.produces=this.model.produces;_ref6=this.model.parameters;for(_j=0,_len1=_ref6.length;_j<_len1;_j++){param=_ref6[_j];type=param.type||param.dataType;if(type.toLowerCase()==='file'){if(!contentTypeModel.consumes){log("set content type ");contentTypeModel.consumes='multipart/form-data';}}}
+responseContentTypeView=new ResponseContentTypeView({model:contentTypeModel});$('.response-content-type',$(this.el)).append(responseContentTypeView.render().el);_ref7=this.model.parameters;for(_k=0,_len2=_ref7.length;_k<_len2;_k++){param=_ref7[_k];this.addParameter(param,contentTypeModel.consumes);}
+_ref8=this.model.responseMessages;for(_l=0,_len3=_ref8.length;_l<_len3;_l++){statusCode=_ref8[_l];this.addStatusCode(statusCode);}
+return this;};OperationView.prototype.addParameter=function(param,consumes){var paramView;param.consumes=consumes;paramView=new ParameterView({model:param,tagName:'tr',readOnly:this.model.isReadOnly});return $('.operation-params',$(this.el)).append(paramView.render().el);};OperationView.prototype.addStatusCode=function(statusCode){var statusCodeView;statusCodeView=new StatusCodeView({model:statusCode,tagName:'tr'});return $('.operation-status',$(this.el)).append(statusCodeView.render().el);};OperationView.prototype.submitOperation=function(e){var error_free,form,isFileUpload,map,o,opts,val,_i,_j,_k,_len,_len1,_len2,_ref5,_ref6,_ref7;if(e!=null){e.preventDefault();}
+form=$('.sandbox',$(this.el));error_free=true;form.find("input.required").each(function(){var _this=this;$(this).removeClass("error");if(jQuery.trim($(this).val())===""){$(this).addClass("error");$(this).wiggle({callback:function(){return $(_this).focus();}});return error_free=false;}});if(error_free){map={};opts={parent:this};isFileUpload=false;_ref5=form.find("input");for(_i=0,_len=_ref5.length;_i<_len;_i++){o=_ref5[_i];if((o.value!=null)&&jQuery.trim(o.value).length>0){map[o.name]=o.value;}
+if(o.type==="file"){isFileUpload=true;}}
+_ref6=form.find("textarea");for(_j=0,_len1=_ref6.length;_j<_len1;_j++){o=_ref6[_j];if((o.value!=null)&&jQuery.trim(o.value).length>0){map["body"]=o.value;}}
+_ref7=form.find("select");for(_k=0,_len2=_ref7.length;_k<_len2;_k++){o=_ref7[_k];val=this.getSelectedValue(o);if((val!=null)&&jQuery.trim(val).length>0){map[o.name]=val;}}
+opts.responseContentType=$("div select[name=responseContentType]",$(this.el)).val();opts.requestContentType=$("div select[name=parameterContentType]",$(this.el)).val();$(".response_throbber",$(this.el)).show();if(isFileUpload){return this.handleFileUpload(map,form);}else{return this.model["do"](map,opts,this.showCompleteStatus,this.showErrorStatus,this);}}};OperationView.prototype.success=function(response,parent){return parent.showCompleteStatus(response);};OperationView.prototype.handleFileUpload=function(map,form){var bodyParam,el,headerParams,o,obj,param,params,_i,_j,_k,_l,_len,_len1,_len2,_len3,_ref5,_ref6,_ref7,_ref8,_this=this;_ref5=form.serializeArray();for(_i=0,_len=_ref5.length;_i<_len;_i++){o=_ref5[_i];if((o.value!=null)&&jQuery.trim(o.value).length>0){map[o.name]=o.value;}}
+bodyParam=new FormData();params=0;_ref6=this.model.parameters;for(_j=0,_len1=_ref6.length;_j<_len1;_j++){param=_ref6[_j];if(param.paramType==='form'){if(param.type.toLowerCase()!=='file'&&map[param.name]!==void 0){bodyParam.append(param.name,map[param.name]);}}}
+headerParams={};_ref7=this.model.parameters;for(_k=0,_len2=_ref7.length;_k<_len2;_k++){param=_ref7[_k];if(param.paramType==='header'){headerParams[param.name]=map[param.name];}}
+log(headerParams);_ref8=form.find('input[type~="file"]');for(_l=0,_len3=_ref8.length;_l<_len3;_l++){el=_ref8[_l];if(typeof el.files[0]!=='undefined'){bodyParam.append($(el).attr('name'),el.files[0]);params+=1;}}
+this.invocationUrl=this.model.supportHeaderParams()?(headerParams=this.model.getHeaderParams(map),this.model.urlify(map,false)):this.model.urlify(map,true);$(".request_url",$(this.el)).html("<pre></pre>");$(".request_url pre",$(this.el)).text(this.invocationUrl);obj={type:this.model.method,url:this.invocationUrl,headers:headerParams,data:bodyParam,dataType:'json',contentType:false,processData:false,error:function(data,textStatus,error){return _this.showErrorStatus(_this.wrap(data),_this);},success:function(data){return _this.showResponse(data,_this);},complete:function(data){return _this.showCompleteStatus(_this.wrap(data),_this);}};if(window.authorizations){window.authorizations.apply(obj);}
+if(params===0){obj.data.append("fake","true");}
+jQuery.ajax(obj);return false;};OperationView.prototype.wrap=function(data){var h,headerArray,headers,i,o,_i,_len;headers={};headerArray=data.getAllResponseHeaders().split("\r");for(_i=0,_len=headerArray.length;_i<_len;_i++){i=headerArray[_i];h=i.split(':');if(h[0]!==void 0&&h[1]!==void 0){headers[h[0].trim()]=h[1].trim();}}
+o={};o.content={};o.content.data=data.responseText;o.headers=headers;o.request={};o.request.url=this.invocationUrl;o.status=data.status;return o;};OperationView.prototype.getSelectedValue=function(select){var opt,options,_i,_len,_ref5;if(!select.multiple){return select.value;}else{options=[];_ref5=select.options;for(_i=0,_len=_ref5.length;_i<_len;_i++){opt=_ref5[_i];if(opt.selected){options.push(opt.value);}}
+if(options.length>0){return options.join(",");}else{return null;}}};OperationView.prototype.hideResponse=function(e){if(e!=null){e.preventDefault();}
+$(".response",$(this.el)).slideUp();return $(".response_hider",$(this.el)).fadeOut();};OperationView.prototype.showResponse=function(response){var prettyJson;prettyJson=JSON.stringify(response,null,"\t").replace(/\n/g,"<br>");return $(".response_body",$(this.el)).html(escape(prettyJson));};OperationView.prototype.showErrorStatus=function(data,parent){return parent.showStatus(data);};OperationView.prototype.showCompleteStatus=function(data,parent){return parent.showStatus(data);};OperationView.prototype.formatXml=function(xml){var contexp,formatted,indent,lastType,lines,ln,pad,reg,transitions,wsexp,_fn,_i,_len;reg=/(>)(<)(\/*)/g;wsexp=/[ ]*(.*)[ ]+\n/g;contexp=/(<.+>)(.+\n)/g;xml=xml.replace(reg,'$1\n$2$3').replace(wsexp,'$1\n').replace(contexp,'$1\n$2');pad=0;formatted='';lines=xml.split('\n');indent=0;lastType='other';transitions={'single->single':0,'single->closing':-1,'single->opening':0,'single->other':0,'closing->single':0,'closing->closing':-1,'closing->opening':0,'closing->other':0,'opening->single':1,'opening->closing':0,'opening->opening':1,'opening->other':1,'other->single':0,'other->closing':-1,'other->opening':0,'other->other':0};_fn=function(ln){var fromTo,j,key,padding,type,types,value;types={single:Boolean(ln.match(/<.+\/>/)),closing:Boolean(ln.match(/<\/.+>/)),opening:Boolean(ln.match(/<[^!?].*>/))};type=((function(){var _results;_results=[];for(key in types){value=types[key];if(value){_results.push(key);}}
+return _results;})())[0];type=type===void 0?'other':type;fromTo=lastType+'->'+type;lastType=type;padding='';indent+=transitions[fromTo];padding=((function(){var _j,_ref5,_results;_results=[];for(j=_j=0,_ref5=indent;0<=_ref5?_j<_ref5:_j>_ref5;j=0<=_ref5?++_j:--_j){_results.push('  ');}
+return _results;})()).join('');if(fromTo==='opening->closing'){return formatted=formatted.substr(0,formatted.length-1)+ln+'\n';}else{return formatted+=padding+ln+'\n';}};for(_i=0,_len=lines.length;_i<_len;_i++){ln=lines[_i];_fn(ln);}
+return formatted;};OperationView.prototype.showStatus=function(response){var code,content,contentType,headers,opts,pre,response_body,response_body_el,url;if(response.content===void 0){content=response.data;url=response.url;}else{content=response.content.data;url=response.request.url;}
+headers=response.headers;contentType=headers&&headers["Content-Type"]?headers["Content-Type"].split(";")[0].trim():null;if(!content){code=$('<code />').text("no content");pre=$('<pre class="json" />').append(code);}else if(contentType==="application/json"||/\+json$/.test(contentType)){code=$('<code />').text(JSON.stringify(JSON.parse(content),null,"  "));pre=$('<pre class="json" />').append(code);}else if(contentType==="application/xml"||/\+xml$/.test(contentType)){code=$('<code />').text(this.formatXml(content));pre=$('<pre class="xml" />').append(code);}else if(contentType==="text/html"){code=$('<code />').html(content);pre=$('<pre class="xml" />').append(code);}else if(/^image\//.test(contentType)){pre=$('<img>').attr('src',url);}else{code=$('<code />').text(content);pre=$('<pre class="json" />').append(code);}
+response_body=pre;$(".request_url",$(this.el)).html("<pre></pre>");$(".request_url pre",$(this.el)).text(url);$(".response_code",$(this.el)).html("<pre>"+response.status+"</pre>");$(".response_body",$(this.el)).html(response_body);$(".response_headers",$(this.el)).html("<pre>"+_.escape(JSON.stringify(response.headers,null,"  ")).replace(/\n/g,"<br>")+"</pre>");$(".response",$(this.el)).slideDown();$(".response_hider",$(this.el)).show();$(".response_throbber",$(this.el)).hide();response_body_el=$('.response_body',$(this.el))[0];opts=this.options.swaggerOptions;if(opts.highlightSizeThreshold&&response.data.length>opts.highlightSizeThreshold){return response_body_el;}else{return hljs.highlightBlock(response_body_el);}};OperationView.prototype.toggleOperationContent=function(){var elem;elem=$('#'+Docs.escapeResourceName(this.model.parentId)+"_"+this.model.nickname+"_content");if(elem.is(':visible')){return Docs.collapseOperation(elem);}else{return Docs.expandOperation(elem);}};return OperationView;})(Backbone.View);StatusCodeView=(function(_super){__extends(StatusCodeView,_super);function StatusCodeView(){_ref5=StatusCodeView.__super__.constructor.apply(this,arguments);return _ref5;}
+StatusCodeView.prototype.initialize=function(){};StatusCodeView.prototype.render=function(){var responseModel,responseModelView,template;template=this.template();$(this.el).html(template(this.model));if(swaggerUi.api.models.hasOwnProperty(this.model.responseModel)){responseModel={sampleJSON:JSON.stringify(swaggerUi.api.models[this.model.responseModel].createJSONSample(),null,2),isParam:false,signature:swaggerUi.api.models[this.model.responseModel].getMockSignature()};responseModelView=new SignatureView({model:responseModel,tagName:'div'});$('.model-signature',this.$el).append(responseModelView.render().el);}else{$('.model-signature',this.$el).html('');}
+return this;};StatusCodeView.prototype.template=function(){return Handlebars.templates.status_code;};return StatusCodeView;})(Backbone.View);ParameterView=(function(_super){__extends(ParameterView,_super);function ParameterView(){_ref6=ParameterView.__super__.constructor.apply(this,arguments);return _ref6;}
+ParameterView.prototype.initialize=function(){return Handlebars.registerHelper('isArray',function(param,opts){if(param.type.toLowerCase()==='array'||param.allowMultiple){return opts.fn(this);}else{return opts.inverse(this);}});};ParameterView.prototype.render=function(){var contentTypeModel,isParam,parameterContentTypeView,responseContentTypeView,signatureModel,signatureView,template,type;type=this.model.type||this.model.dataType;if(this.model.paramType==='body'){this.model.isBody=true;}
+if(type.toLowerCase()==='file'){this.model.isFile=true;}
+template=this.template();$(this.el).html(template(this.model));signatureModel={sampleJSON:this.model.sampleJSON,isParam:true,signature:this.model.signature};if(this.model.sampleJSON){signatureView=new SignatureView({model:signatureModel,tagName:'div'});$('.model-signature',$(this.el)).append(signatureView.render().el);}else{$('.model-signature',$(this.el)).html(this.model.signature);}
+isParam=false;if(this.model.isBody){isParam=true;}
+contentTypeModel={isParam:isParam};contentTypeModel.consumes=this.model.consumes;if(isParam){parameterContentTypeView=new ParameterContentTypeView({model:contentTypeModel});$('.parameter-content-type',$(this.el)).append(parameterContentTypeView.render().el);}else{responseContentTypeView=new ResponseContentTypeView({model:contentTypeModel});$('.response-content-type',$(this.el)).append(responseContentTypeView.render().el);}
+return this;};ParameterView.prototype.template=function(){if(this.model.isList){return Handlebars.templates.param_list;}else{if(this.options.readOnly){if(this.model.required){return Handlebars.templates.param_readonly_required;}else{return Handlebars.templates.param_readonly;}}else{if(this.model.required){return Handlebars.templates.param_required;}else{return Handlebars.templates.param;}}}};return ParameterView;})(Backbone.View);SignatureView=(function(_super){__extends(SignatureView,_super);function SignatureView(){_ref7=SignatureView.__super__.constructor.apply(this,arguments);return _ref7;}
+SignatureView.prototype.events={'click a.description-link':'switchToDescription','click a.snippet-link':'switchToSnippet','mousedown .snippet':'snippetToTextArea'};SignatureView.prototype.initialize=function(){};SignatureView.prototype.render=function(){var template;template=this.template();$(this.el).html(template(this.model));this.switchToSnippet();this.isParam=this.model.isParam;if(this.isParam){$('.notice',$(this.el)).text('Click to set as parameter value');}
+return this;};SignatureView.prototype.template=function(){return Handlebars.templates.signature;};SignatureView.prototype.switchToDescription=function(e){if(e!=null){e.preventDefault();}
+$(".snippet",$(this.el)).hide();$(".description",$(this.el)).show();$('.description-link',$(this.el)).addClass('selected');return $('.snippet-link',$(this.el)).removeClass('selected');};SignatureView.prototype.switchToSnippet=function(e){if(e!=null){e.preventDefault();}
+$(".description",$(this.el)).hide();$(".snippet",$(this.el)).show();$('.snippet-link',$(this.el)).addClass('selected');return $('.description-link',$(this.el)).removeClass('selected');};SignatureView.prototype.snippetToTextArea=function(e){var textArea;if(this.isParam){if(e!=null){e.preventDefault();}
+textArea=$('textarea',$(this.el.parentNode.parentNode.parentNode));if($.trim(textArea.val())===''){return textArea.val(this.model.sampleJSON);}}};return SignatureView;})(Backbone.View);ContentTypeView=(function(_super){__extends(ContentTypeView,_super);function ContentTypeView(){_ref8=ContentTypeView.__super__.constructor.apply(this,arguments);return _ref8;}
+ContentTypeView.prototype.initialize=function(){};ContentTypeView.prototype.render=function(){var template;template=this.template();$(this.el).html(template(this.model));$('label[for=contentType]',$(this.el)).text('Response Content Type');return this;};ContentTypeView.prototype.template=function(){return Handlebars.templates.content_type;};return ContentTypeView;})(Backbone.View);ResponseContentTypeView=(function(_super){__extends(ResponseContentTypeView,_super);function ResponseContentTypeView(){_ref9=ResponseContentTypeView.__super__.constructor.apply(this,arguments);return _ref9;}
+ResponseContentTypeView.prototype.initialize=function(){};ResponseContentTypeView.prototype.render=function(){var template;template=this.template();$(this.el).html(template(this.model));$('label[for=responseContentType]',$(this.el)).text('Response Content Type');return this;};ResponseContentTypeView.prototype.template=function(){return Handlebars.templates.response_content_type;};return ResponseContentTypeView;})(Backbone.View);ParameterContentTypeView=(function(_super){__extends(ParameterContentTypeView,_super);function ParameterContentTypeView(){_ref10=ParameterContentTypeView.__super__.constructor.apply(this,arguments);return _ref10;}
+ParameterContentTypeView.prototype.initialize=function(){};ParameterContentTypeView.prototype.render=function(){var template;template=this.template();$(this.el).html(template(this.model));$('label[for=parameterContentType]',$(this.el)).text('Parameter content type:');return this;};ParameterContentTypeView.prototype.template=function(){return Handlebars.templates.parameter_content_type;};return ParameterContentTypeView;})(Backbone.View);}).call(this);;
+var hljs=new function(){function l(o){return o.replace(/&/gm,"&amp;").replace(/</gm,"&lt;").replace(/>/gm,"&gt;")}function b(p){for(var o=p.firstChild;o;o=o.nextSibling){if(o.nodeName=="CODE"){return o}if(!(o.nodeType==3&&o.nodeValue.match(/\s+/))){break}}}function h(p,o){return Array.prototype.map.call(p.childNodes,function(q){if(q.nodeType==3){return o?q.nodeValue.replace(/\n/g,""):q.nodeValue}if(q.nodeName=="BR"){return"\n"}return h(q,o)}).join("")}function a(q){var p=(q.className+" "+q.parentNode.className).split(/\s+/);p=p.map(function(r){return r.replace(/^language-/,"")});for(var o=0;o<p.length;o++){if(e[p[o]]||p[o]=="no-highlight"){return p[o]}}}function c(q){var o=[];(function p(r,s){for(var t=r.firstChild;t;t=t.nextSibling){if(t.nodeType==3){s+=t.nodeValue.length}else{if(t.nodeName=="BR"){s+=1}else{if(t.nodeType==1){o.push({event:"start",offset:s,node:t});s=p(t,s);o.push({event:"stop",offset:s,node:t})}}}}return s})(q,0);return o}function j(x,v,w){var p=0;var y="";var r=[];function t(){if(x.length&&v.length){if(x[0].offset!=v[0].offset){return(x[0].offset<v[0].offset)?x:v}else{return v[0].event=="start"?x:v}}else{return x.length?x:v}}function s(A){function z(B){return" "+B.nodeName+'="'+l(B.value)+'"'}return"<"+A.nodeName+Array.prototype.map.call(A.attributes,z).join("")+">"}while(x.length||v.length){var u=t().splice(0,1)[0];y+=l(w.substr(p,u.offset-p));p=u.offset;if(u.event=="start"){y+=s(u.node);r.push(u.node)}else{if(u.event=="stop"){var o,q=r.length;do{q--;o=r[q];y+=("</"+o.nodeName.toLowerCase()+">")}while(o!=u.node);r.splice(q,1);while(q<r.length){y+=s(r[q]);q++}}}}return y+l(w.substr(p))}function f(q){function o(s,r){return RegExp(s,"m"+(q.cI?"i":"")+(r?"g":""))}function p(y,w){if(y.compiled){return}y.compiled=true;var s=[];if(y.k){var r={};function z(A,t){t.split(" ").forEach(function(B){var C=B.split("|");r[C[0]]=[A,C[1]?Number(C[1]):1];s.push(C[0])})}y.lR=o(y.l||hljs.IR,true);if(typeof y.k=="string"){z("keyword",y.k)}else{for(var x in y.k){if(!y.k.hasOwnProperty(x)){continue}z(x,y.k[x])}}y.k=r}if(w){if(y.bWK){y.b="\\b("+s.join("|")+")\\s"}y.bR=o(y.b?y.b:"\\B|\\b");if(!y.e&&!y.eW){y.e="\\B|\\b"}if(y.e){y.eR=o(y.e)}y.tE=y.e||"";if(y.eW&&w.tE){y.tE+=(y.e?"|":"")+w.tE}}if(y.i){y.iR=o(y.i)}if(y.r===undefined){y.r=1}if(!y.c){y.c=[]}for(var v=0;v<y.c.length;v++){if(y.c[v]=="self"){y.c[v]=y}p(y.c[v],y)}if(y.starts){p(y.starts,w)}var u=[];for(var v=0;v<y.c.length;v++){u.push(y.c[v].b)}if(y.tE){u.push(y.tE)}if(y.i){u.push(y.i)}y.t=u.length?o(u.join("|"),true):{exec:function(t){return null}}}p(q)}function d(D,E){function o(r,M){for(var L=0;L<M.c.length;L++){var K=M.c[L].bR.exec(r);if(K&&K.index==0){return M.c[L]}}}function s(K,r){if(K.e&&K.eR.test(r)){return K}if(K.eW){return s(K.parent,r)}}function t(r,K){return K.i&&K.iR.test(r)}function y(L,r){var K=F.cI?r[0].toLowerCase():r[0];return L.k.hasOwnProperty(K)&&L.k[K]}function G(){var K=l(w);if(!A.k){return K}var r="";var N=0;A.lR.lastIndex=0;var L=A.lR.exec(K);while(L){r+=K.substr(N,L.index-N);var M=y(A,L);if(M){v+=M[1];r+='<span class="'+M[0]+'">'+L[0]+"</span>"}else{r+=L[0]}N=A.lR.lastIndex;L=A.lR.exec(K)}return r+K.substr(N)}function z(){if(A.sL&&!e[A.sL]){return l(w)}var r=A.sL?d(A.sL,w):g(w);if(A.r>0){v+=r.keyword_count;B+=r.r}return'<span class="'+r.language+'">'+r.value+"</span>"}function J(){return A.sL!==undefined?z():G()}function I(L,r){var K=L.cN?'<span class="'+L.cN+'">':"";if(L.rB){x+=K;w=""}else{if(L.eB){x+=l(r)+K;w=""}else{x+=K;w=r}}A=Object.create(L,{parent:{value:A}});B+=L.r}function C(K,r){w+=K;if(r===undefined){x+=J();return 0}var L=o(r,A);if(L){x+=J();I(L,r);return L.rB?0:r.length}var M=s(A,r);if(M){if(!(M.rE||M.eE)){w+=r}x+=J();do{if(A.cN){x+="</span>"}A=A.parent}while(A!=M.parent);if(M.eE){x+=l(r)}w="";if(M.starts){I(M.starts,"")}return M.rE?0:r.length}if(t(r,A)){throw"Illegal"}w+=r;return r.length||1}var F=e[D];f(F);var A=F;var w="";var B=0;var v=0;var x="";try{var u,q,p=0;while(true){A.t.lastIndex=p;u=A.t.exec(E);if(!u){break}q=C(E.substr(p,u.index-p),u[0]);p=u.index+q}C(E.substr(p));return{r:B,keyword_count:v,value:x,language:D}}catch(H){if(H=="Illegal"){return{r:0,keyword_count:0,value:l(E)}}else{throw H}}}function g(s){var o={keyword_count:0,r:0,value:l(s)};var q=o;for(var p in e){if(!e.hasOwnProperty(p)){continue}var r=d(p,s);r.language=p;if(r.keyword_count+r.r>q.keyword_count+q.r){q=r}if(r.keyword_count+r.r>o.keyword_count+o.r){q=o;o=r}}if(q.language){o.second_best=q}return o}function i(q,p,o){if(p){q=q.replace(/^((<[^>]+>|\t)+)/gm,function(r,v,u,t){return v.replace(/\t/g,p)})}if(o){q=q.replace(/\n/g,"<br>")}return q}function m(r,u,p){var v=h(r,p);var t=a(r);if(t=="no-highlight"){return}var w=t?d(t,v):g(v);t=w.language;var o=c(r);if(o.length){var q=document.createElement("pre");q.innerHTML=w.value;w.value=j(o,c(q),v)}w.value=i(w.value,u,p);var s=r.className;if(!s.match("(\\s|^)(language-)?"+t+"(\\s|$)")){s=s?(s+" "+t):t}r.innerHTML=w.value;r.className=s;r.result={language:t,kw:w.keyword_count,re:w.r};if(w.second_best){r.second_best={language:w.second_best.language,kw:w.second_best.keyword_count,re:w.second_best.r}}}function n(){if(n.called){return}n.called=true;Array.prototype.map.call(document.getElementsByTagName("pre"),b).filter(Boolean).forEach(function(o){m(o,hljs.tabReplace)})}function k(){window.addEventListener("DOMContentLoaded",n,false);window.addEventListener("load",n,false)}var e={};this.LANGUAGES=e;this.highlight=d;this.highlightAuto=g;this.fixMarkup=i;this.highlightBlock=m;this.initHighlighting=n;this.initHighlightingOnLoad=k;this.IR="[a-zA-Z][a-zA-Z0-9_]*";this.UIR="[a-zA-Z_][a-zA-Z0-9_]*";this.NR="\\b\\d+(\\.\\d+)?";this.CNR="(\\b0[xX][a-fA-F0-9]+|(\\b\\d+(\\.\\d*)?|\\.\\d+)([eE][-+]?\\d+)?)";this.BNR="\\b(0b[01]+)";this.RSR="!|!=|!==|%|%=|&|&&|&=|\\*|\\*=|\\+|\\+=|,|\\.|-|-=|/|/=|:|;|<|<<|<<=|<=|=|==|===|>|>=|>>|>>=|>>>|>>>=|\\?|\\[|\\{|\\(|\\^|\\^=|\\||\\|=|\\|\\||~";this.BE={b:"\\\\[\\s\\S]",r:0};this.ASM={cN:"string",b:"'",e:"'",i:"\\n",c:[this.BE],r:0};this.QSM={cN:"string",b:'"',e:'"',i:"\\n",c:[this.BE],r:0};this.CLCM={cN:"comment",b:"//",e:"$"};this.CBLCLM={cN:"comment",b:"/\\*",e:"\\*/"};this.HCM={cN:"comment",b:"#",e:"$"};this.NM={cN:"number",b:this.NR,r:0};this.CNM={cN:"number",b:this.CNR,r:0};this.BNM={cN:"number",b:this.BNR,r:0};this.inherit=function(q,r){var o={};for(var p in q){o[p]=q[p]}if(r){for(var p in r){o[p]=r[p]}}return o}}();hljs.LANGUAGES.xml=function(a){var c="[A-Za-z0-9\\._:-]+";var b={eW:true,c:[{cN:"attribute",b:c,r:0},{b:'="',rB:true,e:'"',c:[{cN:"value",b:'"',eW:true}]},{b:"='",rB:true,e:"'",c:[{cN:"value",b:"'",eW:true}]},{b:"=",c:[{cN:"value",b:"[^\\s/>]+"}]}]};return{cI:true,c:[{cN:"pi",b:"<\\?",e:"\\?>",r:10},{cN:"doctype",b:"<!DOCTYPE",e:">",r:10,c:[{b:"\\[",e:"\\]"}]},{cN:"comment",b:"<!--",e:"-->",r:10},{cN:"cdata",b:"<\\!\\[CDATA\\[",e:"\\]\\]>",r:10},{cN:"tag",b:"<style(?=\\s|>|$)",e:">",k:{title:"style"},c:[b],starts:{e:"</style>",rE:true,sL:"css"}},{cN:"tag",b:"<script(?=\\s|>|$)",e:">",k:{title:"script"},c:[b],starts:{e:"<\/script>",rE:true,sL:"javascript"}},{b:"<%",e:"%>",sL:"vbscript"},{cN:"tag",b:"</?",e:"/?>",c:[{cN:"title",b:"[^ />]+"},b]}]}}(hljs);hljs.LANGUAGES.json=function(a){var e={literal:"true false null"};var d=[a.QSM,a.CNM];var c={cN:"value",e:",",eW:true,eE:true,c:d,k:e};var b={b:"{",e:"}",c:[{cN:"attribute",b:'\\s*"',e:'"\\s*:\\s*',eB:true,eE:true,c:[a.BE],i:"\\n",starts:c}],i:"\\S"};var f={b:"\\[",e:"\\]",c:[a.inherit(c,{cN:null})],i:"\\S"};d.splice(d.length,0,b,f);return{c:d,k:e,i:"\\S"}}(hljs);
\ No newline at end of file
@@ -83,6 +83,41 @@ if (Function.prototype.bind && console && typeof console.log == "object") {
 
 var Docs = {
 
+	// Views of the resources whose declaration is only fetched when they are
+	// first expanded, keyed by resource id (see ResourceView.load)
+	pendingResources: {},
+
+	// Load a lazily loaded resource, calling callback once it is rendered.
+	// Returns false if there is nothing to load.
+	loadResource: function(resource, callback) {
+		if (resource == '') {
+			var pending = [];
+			for (var id in Docs.pendingResources) {
+				pending.push(id);
+			}
+			if (pending.length == 0) {
+				return false;
+			}
+			var remaining = pending.length;
+			for (var i = 0; i < pending.length; i++) {
+				Docs.pendingResources[pending[i]].load(function() {
+					remaining -= 1;
+					if (remaining == 0) {
+						callback();
+					}
+				});
+			}
+			return true;
+		}
+
+		var view = Docs.pendingResources[resource];
+		if (view == null) {
+			return false;
+		}
+		view.load(callback);
+		return true;
+	},
+
 	shebang: function() {
 
 		// If shebang has an operation nickname in it..
@@ -90,6 +125,11 @@ var Docs = {
 		var fragments = $.param.fragment().split('/');
 		fragments.shift(); // get rid of the bang
 
+		// Deep links to a lazily loaded resource wait for it
+		if (fragments.length > 0 && Docs.loadResource(fragments[0], Docs.shebang)) {
+			return;
+		}
+
 		switch (fragments.length) {
 			case 1:
 				// Expand all operations for the resource and scroll to it
@@ -132,6 +172,10 @@ var Docs = {
 
 	// Expand resource
 	expandEndpointListForResource: function(resource) {
+		if (Docs.loadResource(resource, function() { Docs.expandEndpointListForResource(resource); })) {
+			return;
+		}
+
 		var resource = Docs.escapeResourceName(resource);
 		if (resource == '') {
 			$('.resource ul.endpoints').slideDown();
@@ -154,6 +198,10 @@ var Docs = {
 	},
 
 	expandOperationsForResource: function(resource) {
+		if (Docs.loadResource(resource, function() { Docs.expandOperationsForResource(resource); })) {
+			return;
+		}
+
 		// Make sure the resource container is open..
 		Docs.expandEndpointListForResource(resource);
 		
@@ -168,6 +216,10 @@ var Docs = {
 	},
 
 	collapseOperationsForResource: function(resource) {
+		if (Docs.loadResource(resource, function() { Docs.collapseOperationsForResource(resource); })) {
+			return;
+		}
+
 		// Make sure the resource container is open..
 		Docs.expandEndpointListForResource(resource);
 
@@ -1288,8 +1340,10 @@ helpers = this.merge(helpers, Handlebars.helpers); data = data || {};
       }
       this.options.url = url;
       this.headerView.update(url);
+      // Builds itself, since options.success is set
       this.api = new SwaggerApi(this.options);
-      this.api.build();
+      // An embedded listing only applies to the first load
+      delete this.options.spec;
       return this.api;
     };
 
@@ -1312,11 +1366,31 @@ helpers = this.merge(helpers, Handlebars.helpers); data = data || {};
       if (this.options.onComplete) {
         this.options.onComplete(this.api, this);
       }
+      if (this.options.prefetch) {
+        this.prefetch();
+      }
       return setTimeout(function() {
         return Docs.shebang();
       }, 400);
     };
 
+    SwaggerUi.prototype.prefetch = function() {
+      var id, idle, _this = this;
+      idle = window.requestIdleCallback || function(callback) {
+        return setTimeout(callback, 200);
+      };
+      for (id in Docs.pendingResources) {
+        return idle(function() {
+          if (Docs.pendingResources[id] == null) {
+            return _this.prefetch();
+          }
+          return Docs.pendingResources[id].load(function() {
+            return _this.prefetch();
+          });
+        });
+      }
+    };
+
     SwaggerUi.prototype.buildUrl = function(base, url) {
       var endOfPath, parts;
       log("base is " + base);
@@ -1472,6 +1546,7 @@ helpers = this.merge(helpers, Handlebars.helpers); data = data || {};
     MainView.prototype.render = function() {
       var counter, id, resource, resources, _i, _len, _ref3;
       $(this.el).html(Handlebars.templates.main(this.model));
+      Docs.pendingResources = {};
       resources = {};
       counter = 0;
       _ref3 = this.model.apisArray;
@@ -1522,6 +1597,10 @@ helpers = this.merge(helpers, Handlebars.helpers); data = data || {};
     ResourceView.prototype.render = function() {
       var counter, id, methods, operation, _i, _len, _ref4;
       $(this.el).html(Handlebars.templates.resource(this.model));
+      if (!this.model.ready) {
+        Docs.pendingResources[this.model.id] = this;
+        return this;
+      }
       methods = {};
       _ref4 = this.model.operationsArray;
       for (_i = 0, _len = _ref4.length; _i < _len; _i++) {
@@ -1540,6 +1619,23 @@ helpers = this.merge(helpers, Handlebars.helpers); data = data || {};
       return this;
     };
 
+    ResourceView.prototype.load = function(callback) {
+      var _this = this;
+      return this.model.load(function() {
+        if (Docs.pendingResources[_this.model.id] === _this) {
+          delete Docs.pendingResources[_this.model.id];
+          _this.model.api.setConsolidatedModels();
+          _this.render();
+          if (_this.options.swaggerOptions.onResourceLoaded) {
+            _this.options.swaggerOptions.onResourceLoaded(_this.model);
+          }
+        }
+        if (callback != null) {
+          return callback();
+        }
+      });
+    };
+
     ResourceView.prototype.addOperation = function(operation) {
       var operationView;
       operation.number = this.number;
@@ -0,0 +1,29 @@
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class PhaseTimer(object):
+    """
+    Accumulates the time spent in named phases of building a swagger document
+
+    Phases may nest (e.g. 'filters' runs inside 'apis'), so their durations
+    can add up to more than the total.
+    """
+
+    def __init__(self):
+        self.phases = OrderedDict()
+
+    @contextmanager
+    def phase(self, name):
+        started = time.time()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.time() - started
+
+    def as_server_timing(self):
+        """
+        Format the phases as a Server-Timing header value, in milliseconds
+        """
+        return ', '.join('%s;dur=%.1f' % (name, seconds * 1000) for name, seconds in self.phases.items())
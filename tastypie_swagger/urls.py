@@ -3,11 +3,20 @@ try:
 except ImportError:
 	from django.conf.urls.defaults import patterns, include, url
 
-from .views import SwaggerView, ResourcesView, SchemaView
+from .views import SwaggerView, ResourcesView, SchemaView, AggregateView, VersionsView
 
 urlpatterns = patterns('',
     url(r'^$', SwaggerView.as_view(), name='index'),
+    url(r'^versions/$', VersionsView.as_view(), name='versions'),
     url(r'^resources/$', ResourcesView.as_view(), name='resources'),
+    url(r'^aggregate/$', AggregateView.as_view(), name='aggregate'),
     url(r'^schema/(?P<resource>\S+)$', SchemaView.as_view()),
     url(r'^schema/$', SchemaView.as_view(), name='schema'),
+
+    # One Api of a mount given several in tastypie_apis
+    url(r'^(?P<api_name>[\w-]+)/$', SwaggerView.as_view(), name='index'),
+    url(r'^(?P<api_name>[\w-]+)/resources/$', ResourcesView.as_view(), name='resources'),
+    url(r'^(?P<api_name>[\w-]+)/aggregate/$', AggregateView.as_view(), name='aggregate'),
+    url(r'^(?P<api_name>[\w-]+)/schema/(?P<resource>\S+)$', SchemaView.as_view()),
+    url(r'^(?P<api_name>[\w-]+)/schema/$', SchemaView.as_view(), name='schema'),
 )
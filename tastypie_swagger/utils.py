@@ -1,3 +1,10 @@
+import gzip
+import json
+import logging
+import multiprocessing
+import types
+from io import BytesIO
+
 try:
     from urllib.parse import urljoin
 except ImportError:
@@ -5,6 +12,13 @@ except ImportError:
 
 from django.conf import settings
 
+try:
+    from importlib import import_module
+except ImportError:
+    from django.utils.importlib import import_module
+
+logger = logging.getLogger(__name__)
+
 
 def trailing_slash_or_none():
     """
@@ -21,3 +35,221 @@ def urljoin_forced(base, path, **kwargs):
     """
     base = base.endswith('/') and base or '%s/' % base
     return urljoin(base, path, **kwargs)
+
+
+class FrozenDict(dict):
+    """
+    A dict that cannot be changed once built, so it can be shared between
+    threads and documents without copying
+
+    It is still a dict, so JSON encoders serialize it as is.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('%s is immutable' % self.__class__.__name__)
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def copy(self):
+        return dict(self)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+def freeze(obj):
+    """
+    Return a deep copy of obj with dicts turned into FrozenDict and lists into tuples
+    """
+    if isinstance(obj, FrozenDict):
+        return obj
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(item) for item in obj)
+    return obj
+
+
+def gzip_compress(data):
+    """
+    gzip data, leaving the timestamp out so the output only depends on the input
+    """
+    buf = BytesIO()
+    with gzip.GzipFile(mode='wb', compresslevel=9, fileobj=buf, mtime=0) as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+def parse_accept_encoding(header):
+    """
+    Return the content codings accepted by an Accept-Encoding header, with their q-values
+    """
+    codings = {}
+    for item in header.split(','):
+        parts = item.strip().split(';')
+        coding = parts[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            key, _, value = param.strip().partition('=')
+            if key.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding] = quality
+    return codings
+
+
+# Function mapped by a parallel_map worker process
+_worker_func = None
+
+
+def _init_worker(func):
+    global _worker_func
+    _worker_func = func
+
+
+def _run_worker(item):
+    return _worker_func(item)
+
+
+def parallel_imap(func, items, workers=None):
+    """
+    Yield func(item) for item in items, computed by a pool of workers forked
+    processes when workers > 1
+
+    func is inherited by the forked processes rather than pickled, so it may
+    be any callable; its results must be picklable. Results come back in the
+    order of items, as soon as they are ready, and forked processes share
+    the parent's hash seed, so the output is the same as a serial map. Where
+    fork is unavailable the map falls back to being serial.
+    """
+    items = list(items)
+    if not workers or workers < 2 or len(items) < 2:
+        for item in items:
+            yield func(item)
+        return
+
+    try:
+        context = multiprocessing.get_context('fork')
+    except AttributeError:
+        # Python 2 always forks on platforms that support it
+        context = multiprocessing
+    except ValueError:
+        logger.warning('fork is not available, running serially')
+        for item in items:
+            yield func(item)
+        return
+
+    pool = context.Pool(processes=min(workers, len(items)), initializer=_init_worker, initargs=(func,))
+    try:
+        for result in pool.imap(_run_worker, items, chunksize=1):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def parallel_map(func, items, workers=None):
+    """
+    Return [func(item) for item in items], see parallel_imap
+    """
+    return list(parallel_imap(func, items, workers=workers))
+
+
+def _load_json_encoder(name):
+    if name == 'json':
+        return json.dumps
+    try:
+        if name == 'orjson':
+            import orjson
+            return lambda obj: orjson.dumps(obj).decode('utf-8')
+        if name == 'ujson':
+            import ujson
+            return lambda obj: ujson.dumps(obj, escape_forward_slashes=False)
+        module_path, attr = name.rsplit('.', 1)
+        return getattr(import_module(module_path), attr)
+    except (ImportError, AttributeError, ValueError):
+        logger.warning('JSON encoder %s is not available, falling back to json', name)
+        return json.dumps
+
+
+_json_encoders = {}
+
+
+def get_json_encoder():
+    """
+    Return the function serializing documents to JSON strings
+
+    TASTYPIE_SWAGGER_JSON_ENCODER may be 'json' (the default), 'orjson',
+    'ujson' or the dotted path of a function behaving like json.dumps. If it
+    cannot be imported the standard library is used.
+    """
+    name = getattr(settings, 'TASTYPIE_SWAGGER_JSON_ENCODER', 'json')
+    if name not in _json_encoders:
+        _json_encoders[name] = _load_json_encoder(name)
+    return _json_encoders[name]
+
+
+def json_dumps(obj):
+    return get_json_encoder()(obj)
+
+
+class LazyObject(object):
+    """
+    A JSON object whose (key, value) pairs come from an iterable, consumed
+    once by iter_json
+    """
+
+    def __init__(self, items):
+        self.items = items
+
+
+def iter_json(obj, depth=2):
+    """
+    Yield the JSON encoding of obj in chunks
+
+    Dicts and lists down to depth levels are emitted item by item, so only
+    one item (e.g. one api or model of a declaration) is encoded at a time.
+    Generators are encoded as lists and LazyObject as objects, so their items
+    are only built as they are emitted.
+    """
+    if isinstance(obj, LazyObject) or depth and isinstance(obj, dict):
+        items = obj.items() if isinstance(obj, dict) else obj.items
+        separator = '{'
+        for key, value in items:
+            yield '%s%s: ' % (separator, json.dumps(key))
+            for chunk in iter_json(value, max(depth - 1, 0)):
+                yield chunk
+            separator = ', '
+        yield separator == '{' and '{}' or '}'
+    elif isinstance(obj, types.GeneratorType) or depth and isinstance(obj, (list, tuple)):
+        separator = '['
+        for item in obj:
+            yield separator
+            for chunk in iter_json(item, max(depth - 1, 0)):
+                yield chunk
+            separator = ', '
+        yield separator == '[' and '[]' or ']'
+    else:
+        yield json_dumps(obj)
+
+
+def buffered(chunks, size=16384):
+    """
+    Join small chunks of text into chunks of at least size characters
+    """
+    buf = []
+    length = 0
+    for chunk in chunks:
+        buf.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(buf)
+            buf = []
+            length = 0
+    if buf:
+        yield ''.join(buf)
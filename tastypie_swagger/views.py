@@ -1,48 +1,113 @@
-import sys
 import json
+import logging
 
+from django.conf import settings
 from django.views.generic import TemplateView
-from django.http import HttpResponse, Http404
+from django.http import HttpResponse, HttpResponseNotModified, Http404
+
+try:
+    from django.http import StreamingHttpResponse
+except ImportError:
+    # Django < 1.5
+    StreamingHttpResponse = None
 from django.core.exceptions import ImproperlyConfigured
-from django.core.urlresolvers import reverse
+from django.core.urlresolvers import reverse, get_script_prefix
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe
+from django.utils.safestring import mark_safe
+
+from .assets import CSS_SOURCES, JS_SOURCES, get_bundles
+from .cache import ENCODINGS, SchemaDocument, cache_enabled, compression_enabled, get_schema_cache, hashed_urls_enabled
+from .registry import get_api_state, resolve_api, resolve_apis
+from .signals import schema_built
+from .spec import SWAGGER_VERSION, build_api_declaration, build_resource_listing, splice_declarations
+from .timing import PhaseTimer
+from .utils import buffered, iter_json, json_dumps, parse_accept_encoding
 
-import tastypie
+logger = logging.getLogger(__name__)
 
-from .mapping import ResourceSwaggerMapping
+# Lifetime of responses to content hashed urls, a year
+IMMUTABLE_MAX_AGE = 31536000
+# basePath of cached listings, replaced by the absolute url of the
+# declarations in each response, see ResourcesView.get_response_document
+BASE_PATH_PLACEHOLDER = 'tastypie-swagger:base-path'
 
 
 class TastypieApiMixin(object):
     """
-    Provides views with a 'tastypie_api' attr representing a tastypie.api.Api instance
-
-    Python path must be defined in settings as TASTYPIE_SWAGGER_API_MODULE
+    Provides views with a 'tastypie_api' attr representing a tastypie.api.Api instance,
+    and an 'api_state' attr holding what is precomputed from it
+
+    The Api is given by the tastypie_api_module extra parameter in urls.py,
+    either an instance or its python path, resolved once per process. A
+    mount documenting several Apis gives them in the tastypie_apis extra
+    parameter instead; the api_name url parameter picks one, the first one
+    being the default.
     """
     _tastypie_api = None
 
+    @property
+    def tastypie_apis(self):
+        """
+        Ordered dict of the Apis of the tastypie_apis extra parameter, by api_name
+        """
+        tastypie_apis = self.kwargs.get('tastypie_apis', None)
+        if not tastypie_apis:
+            return {}
+        return resolve_apis(tastypie_apis)
+
     @property
     def tastypie_api(self):
 
         if not self._tastypie_api:
 
-            tastypie_api_module = self.kwargs.get('tastypie_api_module', None)
-            if not tastypie_api_module:
-                raise ImproperlyConfigured("tastypie_api_module must be defined as an extra parameters in urls.py with its value being a path to a tastypie.api.Api instance.")
-
-            if isinstance(tastypie_api_module, tastypie.api.Api):
-                tastypie_api = tastypie_api_module
+            api_name = self.kwargs.get('api_name', None)
+            tastypie_apis = self.tastypie_apis
+            if tastypie_apis:
+                if api_name is None:
+                    api_name = list(tastypie_apis.keys())[0]
+                if not api_name in tastypie_apis:
+                    raise Http404
+                self._tastypie_api = tastypie_apis[api_name]
+            elif api_name is not None:
+                raise Http404
             else:
-                path, attr = tastypie_api_module.rsplit('.', 1)
-                try:
-                    tastypie_api = getattr(sys.modules[path], attr, None)
-                except KeyError:
-                    raise ImproperlyConfigured("%s is not a valid python path" % path)
-                if not tastypie_api:
-                    raise ImproperlyConfigured("%s is not a valid tastypie.api.Api instance" % tastypie_api_module)
+                tastypie_api_module = self.kwargs.get('tastypie_api_module', None)
+                if not tastypie_api_module:
+                    raise ImproperlyConfigured("tastypie_api_module must be defined as an extra parameters in urls.py with its value being a path to a tastypie.api.Api instance.")
 
-            self._tastypie_api = tastypie_api
+                self._tastypie_api = resolve_api(tastypie_api_module)
 
         return self._tastypie_api
 
+    @property
+    def api_state(self):
+        return get_api_state(self.tastypie_api)
+
+    def get_api_version(self):
+        """
+        Return the version reported in the documents, the version extra
+        parameter or, on a mount of several Apis, the api_name
+        """
+        if self.kwargs.get('version'):
+            return self.kwargs['version']
+        if self.tastypie_apis:
+            return self.tastypie_api.api_name
+        return 'Unknown'
+
+    def reverse_url(self, name, api_name=None):
+        """
+        Reverse one of the urls of this mount of tastypie_swagger.urls, for
+        the Api in the request or the api_name one
+
+        Urls are only reversed once per process, see registry.ApiState.get_url.
+        """
+        if api_name is None:
+            api_name = self.kwargs.get('api_name', None)
+        viewname = '%s:%s' % (self.kwargs.get('namespace'), name)
+        kwargs = api_name is not None and {'api_name': api_name} or None
+        return self.api_state.get_url((viewname, api_name), lambda: reverse(viewname, kwargs=kwargs))
+
 
 class SwaggerApiDataMixin(object):
     """
@@ -52,8 +117,8 @@ class SwaggerApiDataMixin(object):
     def get_context_data(self, *args, **kwargs):
         context = super(SwaggerApiDataMixin, self).get_context_data(*args, **kwargs)
         context.update({
-            'apiVersion': self.kwargs.get('version', 'Unknown'),
-            'swaggerVersion': '1.2',
+            'apiVersion': self.get_api_version(),
+            'swaggerVersion': SWAGGER_VERSION,
         })
         return context
 
@@ -61,23 +126,179 @@ class SwaggerApiDataMixin(object):
 class JSONView(TemplateView):
     """
     Simple JSON rendering
+
+    Views returning a key from get_cache_key have their serialized output
+    kept in the schema cache.
     """
     response_class = HttpResponse
+    _timer = None
+    # Set while streaming, for views whose context can be built lazily
+    lazy = False
 
-    def render_to_response(self, context, **response_kwargs):
+    @property
+    def timer(self):
         """
-        Returns a response with a template rendered with the given context.
+        PhaseTimer recording how long building the response took
+        """
+        if self._timer is None:
+            self._timer = PhaseTimer()
+        return self._timer
+
+    def get_cache_key(self):
+        """
+        Return a key for caching the serialized response, or None to disable caching
+        """
+        return None
+
+    def build_document(self, **kwargs):
+        context = self.get_context_data(**kwargs)
+        with self.timer.phase('serialize'):
+            return SchemaDocument(self.serialize(context))
+
+    def build_cacheable_document(self, **kwargs):
+        document = self.build_document(**kwargs)
+        if compression_enabled():
+            with self.timer.phase('compress'):
+                document.compress()
+        return document
+
+    def get_document(self, **kwargs):
+        """
+        Returns the serialized JSON as a SchemaDocument, from the schema cache when possible.
+
+        Cached documents are compressed once, when they are built.
+        """
+        cache_key = cache_enabled() and self.get_cache_key() or None
+        if cache_key is None:
+            return self.build_document(**kwargs)
+        return get_schema_cache().get_or_build(cache_key, lambda: self.build_cacheable_document(**kwargs))
+
+    def get_response_document(self, document):
+        """
+        Return the document to send for this request, from the one returned by get_document
+        """
+        return document
+
+    def get_encoding(self, document):
+        """
+        Picks the pre-compressed variant of the document to send, if any
+        """
+        if not document.encodings:
+            return None
+        accepted = parse_accept_encoding(self.request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        for encoding in ENCODINGS:
+            if encoding in document.encodings and accepted.get(encoding, accepted.get('*', 0)) > 0:
+                return encoding
+        return None
+
+    def is_not_modified(self, etag, built):
+        """
+        Checks the request's conditional headers against the document validators
+        """
+        if_none_match = self.request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            etags = [value.strip() for value in if_none_match.split(',')]
+            return '*' in etags or etag in etags or 'W/%s' % etag in etags
+
+        if_modified_since = parse_http_date_safe(self.request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+        return if_modified_since is not None and int(built) <= if_modified_since
+
+    def get(self, request, *args, **kwargs):
+        if self.is_streaming():
+            return StreamingHttpResponse(self.stream_content(**kwargs), content_type='application/json')
+
+        with self.timer.phase('total'):
+            document = self.get_response_document(self.get_document(**kwargs))
+        self.report_timing()
+        encoding = self.get_encoding(document)
+        etag = document.get_etag(encoding)
+
+        if self.is_not_modified(etag, document.built):
+            response = HttpResponseNotModified()
+        elif encoding:
+            response = self.response_class(document.encodings[encoding], content_type='application/json')
+            response['Content-Encoding'] = encoding
+        else:
+            response = self.response_class(document.content, content_type='application/json')
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(document.built)
+        patch_cache_control(response, **self.get_cache_control(document))
+        if document.encodings:
+            patch_vary_headers(response, ('Accept-Encoding',))
+        if getattr(settings, 'TASTYPIE_SWAGGER_SERVER_TIMING', False):
+            response['Server-Timing'] = self.timer.as_server_timing()
+        return response
+
+    def get_cache_control(self, document):
+        """
+        Return the Cache-Control directives of the response, as keyword
+        arguments for patch_cache_control
+        """
+        return {'max_age': getattr(settings, 'TASTYPIE_SWAGGER_MAX_AGE', 60)}
+
+    def report_timing(self):
+        """
+        Sends the schema_built signal and a log record if a document was built for this request
+        """
+        phases = self.timer.phases
+        if list(phases.keys()) == ['total']:
+            # Served from the cache
+            return
+        schema_built.send(sender=self.__class__, request=self.request, phases=phases)
+        logger.debug(
+            'Built %s in %s', self.request.path,
+            ', '.join('%s %.1fms' % (name, seconds * 1000) for name, seconds in phases.items()),
+            extra={'phases': phases},
+        )
+
+    def clean_context(self, context):
+        """
+        Removes what must not be serialized from the context.
         """
 
         # This cannot be serialized if it is a api instance and we don't need it anyway.
         context.pop('tastypie_api_module', None)
+        context.pop('tastypie_apis', None)
+        # Documents are the same whichever url of the Api they are served from
+        context.pop('api_name', None)
 
         for k in ['params', 'view']:
             if k in context:
                 del context[k]
 
+        return context
+
+    def serialize(self, context):
+        """
+        Returns the JSON string for the given context.
+        """
+        return json_dumps(self.clean_context(context))
+
+    def is_streaming(self):
+        """
+        Documents that are not cached are streamed when TASTYPIE_SWAGGER_STREAMING is set
+        """
+        if StreamingHttpResponse is None or not getattr(settings, 'TASTYPIE_SWAGGER_STREAMING', False):
+            return False
+        return not cache_enabled() or self.get_cache_key() is None
+
+    def stream_content(self, **kwargs):
+        """
+        Returns an iterator over the serialized JSON, encoded one item at a time.
+        """
+        # Build the context now, so errors are raised before the response
+        # starts; lazy parts of it are only built as they are encoded.
+        self.lazy = True
+        context = self.clean_context(self.get_context_data(**kwargs))
+        return buffered(iter_json(context))
+
+    def render_to_response(self, context, **response_kwargs):
+        """
+        Returns a response with a template rendered with the given context.
+        """
         return self.response_class(
-            json.dumps(context),
+            self.serialize(context),
             content_type='application/json',
             **response_kwargs
         )
@@ -90,9 +311,65 @@ class SwaggerView(TastypieApiMixin, TemplateView):
 
     template_name = 'tastypie_swagger/index.html'
 
+    def get_embedded_spec(self):
+        """
+        Return the resource listing, or the aggregated document, to embed in
+        the page according to TASTYPIE_SWAGGER_EMBED, or None
+
+        The document comes from the schema cache when possible, and is made
+        safe to include in a script element.
+        """
+        embed = getattr(settings, 'TASTYPIE_SWAGGER_EMBED', False)
+        if not embed or self.kwargs.get('discovery_url'):
+            return None
+        view_class = AggregateView if embed == 'aggregate' else ResourcesView
+        view = view_class(request=self.request, args=self.args, kwargs=self.kwargs,
+                          _tastypie_api=self.tastypie_api)
+        content = view.get_response_document(view.get_document(**self.kwargs)).content
+        # '<' and friends can only appear in JSON strings, where escapes are equivalent
+        for char, escape in (('<', '\\u003c'), ('>', '\\u003e'), ('&', '\\u0026')):
+            content = content.replace(char, escape)
+        return mark_safe(content)
+
+    def get_api_versions(self):
+        """
+        Return the Apis of a mount of several Apis, as dicts with their
+        'name', the 'url' of their page and whether they are 'current', or None
+        """
+        if not self.tastypie_apis:
+            return None
+        return [
+            {'name': name, 'url': self.reverse_url('index', api_name=name), 'current': api is self.tastypie_api}
+            for name, api in self.tastypie_apis.items()
+        ]
+
     def get_context_data(self, **kwargs):
         context = super(SwaggerView, self).get_context_data(**kwargs)
-        context['discovery_url'] = reverse('%s:resources' % self.kwargs.get('namespace'))
+        embed = getattr(settings, 'TASTYPIE_SWAGGER_EMBED', False)
+        if self.kwargs.get('discovery_url'):
+            # Documentation exported to static files with export_tastypie_swagger
+            context['discovery_url'] = self.kwargs['discovery_url']
+        elif embed == 'aggregate' or getattr(settings, 'TASTYPIE_SWAGGER_AGGREGATE', False):
+            context['discovery_url'] = self.reverse_url('aggregate')
+        else:
+            context['discovery_url'] = self.reverse_url('resources')
+        context['embedded_spec'] = self.get_embedded_spec()
+        context['api_versions'] = self.get_api_versions()
+
+        # Fetch declarations when their resource is expanded, and
+        # optionally while the page is idle
+        lazy = getattr(settings, 'TASTYPIE_SWAGGER_LAZY', False)
+        context.update({
+            'lazy': bool(lazy),
+            'prefetch': lazy == 'prefetch',
+        })
+
+        # The prebuilt bundles, or their sources if they are disabled
+        context.update({
+            'bundles': get_bundles(),
+            'css_sources': CSS_SOURCES,
+            'js_sources': JS_SOURCES,
+        })
         return context
 
 
@@ -103,17 +380,71 @@ class ResourcesView(TastypieApiMixin, SwaggerApiDataMixin, JSONView):
     This JSON must conform to https://github.com/wordnik/swagger-core/wiki/Resource-Listing
     """
 
+    # Set while streaming, when the listing is not cached
+    absolute_base_path = False
+
+    def get_base_path(self):
+        """
+        Return the host relative url of the declarations
+
+        The listing is cached under it, whichever host it is requested on,
+        with BASE_PATH_PLACEHOLDER as its basePath, which
+        get_response_document replaces by the absolute url.
+        """
+        return self.reverse_url('schema').rstrip('/')
+
+    def get_absolute_base_path(self):
+        return self.request.build_absolute_uri(self.get_base_path())
+
+    def get_response_document(self, document):
+        return document.rebase(json_dumps(BASE_PATH_PLACEHOLDER), json_dumps(self.get_absolute_base_path()))
+
+    def get_cache_key(self):
+        return (
+            self.tastypie_api,
+            None,
+            self.kwargs.get('namespace'),
+            self.kwargs.get('version'),
+            self.get_base_path(),
+        )
+
+    def get_resource_names(self):
+        return list(self.api_state.resource_names)
+
+    def get_resource_versions(self, names):
+        """
+        Return the content hash of each resource's declaration, appended to
+        the schema paths so they can be cached forever, if TASTYPIE_SWAGGER_HASHED_URLS is set
+
+        The declarations are built (and cached) along with the listing.
+        """
+        if not (hashed_urls_enabled() and cache_enabled()):
+            return None
+        return dict((name, self.get_declaration_document(name).version) for name in names)
+
     def get_context_data(self, *args, **kwargs):
         context = super(ResourcesView, self).get_context_data(*args, **kwargs)
 
         # Construct schema endpoints from resources
-        apis = [{'path': '/%s' % name} for name in sorted(self.tastypie_api._registry.keys())]
-        context.update({
-            'basePath': self.request.build_absolute_uri(reverse('%s:schema' % self.kwargs.get('namespace'))).rstrip('/'),
-            'apis': apis,
-        })
+        names = self.get_resource_names()
+        base_path = self.get_absolute_base_path() if self.absolute_base_path else BASE_PATH_PLACEHOLDER
+        context.update(build_resource_listing(
+            self.tastypie_api, base_path, names=names, versions=self.get_resource_versions(names)))
         return context
 
+    def stream_content(self, **kwargs):
+        self.absolute_base_path = True
+        return super(ResourcesView, self).stream_content(**kwargs)
+
+    def get_declaration_view(self, resource_name):
+        kwargs = dict(self.kwargs, resource=resource_name)
+        return SchemaView(request=self.request, args=self.args, kwargs=kwargs,
+                          _tastypie_api=self.tastypie_api, _timer=self.timer)
+
+    def get_declaration_document(self, resource_name):
+        view = self.get_declaration_view(resource_name)
+        return view.get_document(**view.kwargs)
+
 
 class SchemaView(TastypieApiMixin, SwaggerApiDataMixin, JSONView):
     """
@@ -122,21 +453,119 @@ class SchemaView(TastypieApiMixin, SwaggerApiDataMixin, JSONView):
     This JSON must conform to https://github.com/wordnik/swagger-core/wiki/API-Declaration
     """
 
+    def get_cache_key(self):
+        resource_name = self.kwargs.get('resource', None)
+        if self.api_state.get_resource(resource_name) is None:
+            raise Http404
+        return (
+            self.tastypie_api,
+            resource_name,
+            self.kwargs.get('namespace'),
+            self.kwargs.get('version'),
+            get_script_prefix(),
+        )
+
+    def get_cache_control(self, document):
+        # Paths from a listing with hashed urls never change content
+        version = self.request.GET.get('v')
+        if version and version == document.version:
+            return {'public': True, 'max_age': IMMUTABLE_MAX_AGE, 'immutable': True}
+        return super(SchemaView, self).get_cache_control(document)
+
     def get_context_data(self, *args, **kwargs):
         # Verify matching tastypie resource exists
         resource_name = kwargs.get('resource', None)
-        if not resource_name in self.tastypie_api._registry:
+        resource = self.api_state.get_resource(resource_name)
+        if resource is None:
             raise Http404
 
-        # Generate mapping from tastypie.resources.Resource.build_schema
-        resource = self.tastypie_api._registry.get(resource_name)
-        mapping = ResourceSwaggerMapping(resource)
-
         context = super(SchemaView, self).get_context_data(*args, **kwargs)
-        context.update({
-            'basePath': '/',
-            'apis': mapping.build_apis(),
-            'models': mapping.build_models(),
-            'resourcePath': '/{0}'.format(resource._meta.resource_name)
-        })
+        context.update(build_api_declaration(resource, timer=self.timer, lazy=self.lazy, api=self.tastypie_api))
         return context
+
+
+class VersionsView(TastypieApiMixin, JSONView):
+    """
+    Provide the index of the Apis documented by this mount of tastypie_swagger.urls
+
+    Each one is listed with its name, the url of its resource listing and
+    the url of its swagger-ui page, in the order of tastypie_apis.
+    """
+
+    def get_context_data(self, *args, **kwargs):
+        # A mount of a single Api is not reached through api_name urls
+        names = list(self.tastypie_apis.keys()) or [None]
+        apis = []
+        for name in names:
+            apis.append({
+                'name': name or self.tastypie_api.api_name,
+                'discoveryUrl': self.request.build_absolute_uri(self.reverse_url('resources', api_name=name)),
+                'url': self.request.build_absolute_uri(self.reverse_url('index', api_name=name)),
+            })
+        return {'apis': apis}
+
+
+class AggregateView(ResourcesView):
+    """
+    Provide the resource listing along with every API declaration in a single document
+
+    Declarations are keyed by resource name under 'apiDeclarations', which
+    lets swagger-ui render the whole API without one request per resource.
+    A comma separated 'resources' query parameter restricts the document to
+    a subset of resources.
+    """
+
+    def get_resource_names(self):
+        names = super(AggregateView, self).get_resource_names()
+        requested = self.request.GET.get('resources')
+        if not requested:
+            return names
+
+        subset = [name.strip() for name in requested.split(',') if name.strip()]
+        for name in subset:
+            if self.api_state.get_resource(name) is None:
+                raise Http404
+        return [name for name in names if name in subset]
+
+    def get_cache_key(self):
+        # Subsets are assembled from the cached declarations on each request
+        if self.request.GET.get('resources'):
+            return None
+        return super(AggregateView, self).get_cache_key() + ('aggregate',)
+
+    def get_resource_versions(self, names):
+        # The declarations are embedded rather than fetched
+        return None
+
+    def iter_declaration(self, resource_name):
+        """
+        Yield the serialized declaration of a resource in chunks, building it
+        lazily unless it comes from the cache
+        """
+        view = self.get_declaration_view(resource_name)
+        if view.is_streaming():
+            return view.stream_content(**view.kwargs)
+        return iter([view.get_document(**view.kwargs).content])
+
+    def stream_content(self, **kwargs):
+        self.absolute_base_path = True
+        listing = self.serialize(self.get_context_data(**kwargs))
+        names = self.get_resource_names()
+
+        def chunks():
+            # One resource at a time, whatever the size of the registry
+            yield '%s, "apiDeclarations": {' % listing.rstrip()[:-1]
+            for i, name in enumerate(names):
+                yield '%s%s: ' % (i and ', ' or '', json.dumps(name))
+                for chunk in self.iter_declaration(name):
+                    yield chunk
+            yield '}}'
+        return buffered(chunks())
+
+    def build_document(self, **kwargs):
+        # Splice the cached declarations into the listing rather than
+        # deserializing and re-encoding them.
+        listing = super(AggregateView, self).build_document(**kwargs)
+        declarations = [(name, self.get_declaration_document(name)) for name in self.get_resource_names()]
+        content = splice_declarations(listing.content, [(name, document.content) for name, document in declarations])
+        return SchemaDocument(content, built=max([listing.built] + [document.built for name, document in declarations]))
@@ -0,0 +1,150 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.urlresolvers import get_resolver, get_script_prefix, set_script_prefix
+from django.test.client import RequestFactory
+
+from .cache import cache_enabled, get_schema_cache
+from .registry import get_api_state, resolve_api, resolve_apis
+from .utils import parallel_map
+from .views import AggregateView, ResourcesView, SchemaView
+
+logger = logging.getLogger(__name__)
+
+URLCONF_NAME = 'tastypie_swagger.urls'
+
+# Number of resources listed in the warm-up log record
+SLOWEST_COUNT = 10
+
+
+def find_mounts(resolver=None):
+    """
+    Return the extra parameters (tastypie_api_module, namespace, ...) of every
+    inclusion of tastypie_swagger.urls in the root URLconf
+    """
+    if resolver is None:
+        resolver = get_resolver(None)
+
+    mounts = []
+    for pattern in resolver.url_patterns:
+        if not hasattr(pattern, 'url_patterns'):
+            continue
+        urlconf_name = getattr(pattern.urlconf_name, '__name__', pattern.urlconf_name)
+        if urlconf_name == URLCONF_NAME:
+            mounts.append(dict(pattern.default_kwargs))
+        else:
+            mounts.extend(find_mounts(pattern))
+    return mounts
+
+
+def expand_mounts(mounts):
+    """
+    Replace mounts documenting several Apis (see views.TastypieApiMixin) by
+    one mount per Api, with its api_name
+    """
+    expanded = []
+    for mount in mounts:
+        if mount.get('tastypie_apis'):
+            expanded.extend(dict(mount, api_name=name) for name in resolve_apis(mount['tastypie_apis']))
+        else:
+            expanded.append(mount)
+    return expanded
+
+
+def get_mount_api(mount):
+    """
+    Return the tastypie.api.Api instance documented by a mount, as returned
+    by expand_mounts
+    """
+    if mount.get('tastypie_apis'):
+        return resolve_apis(mount['tastypie_apis'])[mount['api_name']]
+    return resolve_api(mount['tastypie_api_module'])
+
+
+def get_warmup_script_prefix():
+    """
+    Return the script prefix the site is served under, which the cache keys
+    of declarations depend on, from TASTYPIE_SWAGGER_WARMUP_SCRIPT_NAME or
+    FORCE_SCRIPT_NAME
+    """
+    return (getattr(settings, 'TASTYPIE_SWAGGER_WARMUP_SCRIPT_NAME', None)
+            or getattr(settings, 'FORCE_SCRIPT_NAME', None)
+            or '/')
+
+
+def warm_up(mounts=None, workers=None, script_prefix=None):
+    """
+    Build the documents served by each mount of tastypie_swagger.urls into the schema cache
+
+    Declarations are built through SchemaView, so they land under the keys
+    requests will look up for script_prefix (by default, the one returned by
+    get_warmup_script_prefix). Those already in the cache are left alone.
+    The others are built through the cache's get_or_build, so they are
+    coordinated with concurrent requests and, with a shared cache, other
+    workers; with workers (TASTYPIE_SWAGGER_BUILD_WORKERS by default) above 1
+    they are built beforehand by that many forked processes and only stored
+    if still missing. The listing and aggregated document are then built
+    from the cached declarations.
+
+    Returns (seconds, namespace, resource name) tuples of the declarations
+    built, slowest first.
+    """
+    if not cache_enabled():
+        logger.info('Schema cache is disabled, skipping swagger warm-up')
+        return []
+
+    if mounts is None:
+        mounts = find_mounts()
+    if workers is None:
+        workers = getattr(settings, 'TASTYPIE_SWAGGER_BUILD_WORKERS', 1)
+    factory = RequestFactory()
+    schema_cache = get_schema_cache()
+
+    # The script prefix is thread local, and the one of requests is not set yet
+    previous_prefix = get_script_prefix()
+    set_script_prefix(script_prefix or get_warmup_script_prefix())
+    started = time.time()
+    timings = []
+    try:
+        for mount in expand_mounts(mounts):
+            request = factory.get('/')
+
+            def get_view(name):
+                kwargs = dict(mount, resource=name)
+                return SchemaView(request=request, args=(), kwargs=kwargs), kwargs
+
+            def build(name):
+                view, kwargs = get_view(name)
+                build_started = time.time()
+                document = view.build_cacheable_document(**kwargs)
+                return document, time.time() - build_started
+
+            def store(name, built):
+                document, elapsed = built
+                timings.append((elapsed, mount.get('namespace'), name))
+                return document
+
+            resource_names = get_api_state(get_mount_api(mount)).resource_names
+            keys = dict((name, get_view(name)[0].get_cache_key()) for name in resource_names)
+            names = [name for name in sorted(keys) if schema_cache.get(keys[name]) is None]
+            if workers > 1:
+                for name, built in zip(names, parallel_map(build, names, workers=workers)):
+                    schema_cache.get_or_build(keys[name], lambda: store(name, built))
+            else:
+                for name in names:
+                    schema_cache.get_or_build(keys[name], lambda: store(name, build(name)))
+
+            for view_class in (ResourcesView, AggregateView):
+                view_class(request=request, args=(), kwargs=mount).get_document(**mount)
+    finally:
+        set_script_prefix(previous_prefix)
+
+    timings.sort(reverse=True)
+    logger.info(
+        'Warmed up %d swagger declarations in %.2fs, slowest: %s',
+        len(timings),
+        time.time() - started,
+        ', '.join('%s:%s %.3fs' % (namespace, name, elapsed) for elapsed, namespace, name in timings[:SLOWEST_COUNT]),
+    )
+    return timings
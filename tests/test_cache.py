@@ -0,0 +1,151 @@
+import threading
+import time
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from tastypie_swagger.cache import DjangoSchemaCache, SchemaDocument, SingleFlight
+
+from .test_warmup import api
+
+# How long to let waiting threads reach SingleFlight.do
+SETTLE = 0.1
+
+
+class SingleFlightTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.flights = SingleFlight()
+        self.release = threading.Event()
+        self.calls = []
+
+    def run_threads(self, count, target):
+        """
+        Run target in count threads, the first one leading the flight, and
+        return once they are all done
+        """
+        threads = [threading.Thread(target=target) for i in range(count)]
+        threads[0].start()
+        time.sleep(SETTLE)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(SETTLE)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_coalesces_builds(self):
+        def build():
+            self.calls.append(1)
+            self.release.wait()
+            return 'document'
+
+        results = []
+        self.run_threads(10, lambda: results.append(self.flights.do('key', build)))
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(results, ['document'] * 10)
+        self.assertEqual(self.flights._flights, {})
+
+    def test_shares_exceptions(self):
+        def build():
+            self.calls.append(1)
+            self.release.wait()
+            raise ValueError('boom')
+
+        errors = []
+
+        def run():
+            try:
+                self.flights.do('key', build)
+            except ValueError as e:
+                errors.append(e)
+
+        self.run_threads(5, run)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual([str(e) for e in errors], ['boom'] * 5)
+        # Each waiter raises its own copy
+        self.assertEqual(len(set(id(e) for e in errors)), 5)
+        self.assertEqual(self.flights._flights, {})
+
+    def test_timeout_builds_in_waiter(self):
+        def lead():
+            self.calls.append('leader')
+            self.release.wait()
+            return 'leader'
+
+        leader = threading.Thread(target=lambda: self.flights.do('key', lead))
+        leader.start()
+        try:
+            time.sleep(SETTLE)
+            self.assertEqual(self.flights.do('key', lambda: 'waiter', timeout=SETTLE), 'waiter')
+        finally:
+            self.release.set()
+            leader.join()
+        self.assertEqual(self.calls, ['leader'])
+        self.assertEqual(self.flights._flights, {})
+
+
+@override_settings(TASTYPIE_SWAGGER_CACHE_WAIT=SETTLE)
+class DjangoSchemaCacheTestCase(SimpleTestCase):
+    key = (api, 'author', 'docs', '1', '/')
+
+    def setUp(self):
+        self.schema_cache = DjangoSchemaCache('swagger')
+        self.schema_cache.cache.clear()
+        self.calls = []
+
+    def tearDown(self):
+        self.schema_cache.cache.clear()
+
+    def build(self, content='{}'):
+        self.calls.append(content)
+        return SchemaDocument(content)
+
+    def hold_lease(self):
+        self.assertTrue(self.schema_cache.cache.add(self.schema_cache.make_key(self.key, 'lock'), 1))
+
+    def test_builds_once_under_lease(self):
+        document = self.schema_cache.get_or_build(self.key, self.build)
+        self.assertEqual(self.schema_cache.get_or_build(self.key, self.build).content, document.content)
+        self.assertEqual(self.calls, ['{}'])
+        # The lease is released
+        self.assertIsNone(self.schema_cache.cache.get(self.schema_cache.make_key(self.key, 'lock')))
+
+    def test_invalidate_bumps_generation(self):
+        self.schema_cache.set(self.key, SchemaDocument('{}'))
+        data_key = self.schema_cache.make_key(self.key, 'data')
+        self.schema_cache.invalidate()
+        self.assertNotEqual(self.schema_cache.make_key(self.key, 'data'), data_key)
+        self.assertIsNone(self.schema_cache.get(self.key))
+
+    def test_serves_stale_while_leased(self):
+        self.schema_cache.set(self.key, SchemaDocument('{"old": true}'))
+        self.schema_cache.invalidate()
+        self.hold_lease()
+        document = self.schema_cache.get_or_build(self.key, lambda: self.build('{"new": true}'))
+        self.assertEqual(document.content, '{"old": true}')
+        self.assertEqual(self.calls, [])
+
+    def test_waits_for_lease_then_builds(self):
+        self.hold_lease()
+        started = time.time()
+        document = self.schema_cache.get_or_build(self.key, self.build)
+        self.assertGreaterEqual(time.time() - started, SETTLE)
+        self.assertEqual(self.calls, ['{}'])
+        self.assertEqual(self.schema_cache.get(self.key).content, document.content)
+
+    def test_waiter_gets_the_leaseholders_build(self):
+        self.hold_lease()
+
+        def build_elsewhere():
+            time.sleep(SETTLE / 4)
+            self.schema_cache.set(self.key, SchemaDocument('{"elsewhere": true}'))
+
+        thread = threading.Thread(target=build_elsewhere)
+        thread.start()
+        try:
+            document = self.schema_cache.get_or_build(self.key, self.build)
+        finally:
+            thread.join()
+        self.assertEqual(document.content, '{"elsewhere": true}')
+        self.assertEqual(self.calls, [])
@@ -0,0 +1,54 @@
+import datetime
+import uuid
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+from tastypie import fields
+from tastypie.resources import Resource
+
+from tastypie_swagger import fingerprint
+from tastypie_swagger.cache import invalidate_schema_cache
+
+
+class StampedResource(Resource):
+    created = fields.DateTimeField(attribute='created', default=datetime.datetime.now)
+    token = fields.CharField(attribute='token', default=lambda: uuid.uuid4().hex)
+    name = fields.CharField(attribute='name', default='unnamed')
+
+    class Meta:
+        resource_name = 'stamped'
+
+
+class ResourceFingerprintTestCase(SimpleTestCase):
+
+    def compute(self, resource):
+        # Fingerprints are memoized until cleared
+        fingerprint.clear_fingerprints()
+        return fingerprint.resource_fingerprint(resource)
+
+    def test_callable_defaults_are_stable(self):
+        resource = StampedResource()
+        self.assertEqual(self.compute(resource), self.compute(resource))
+
+    def test_defaults_are_hashed(self):
+        resource = StampedResource()
+        before = self.compute(resource)
+        field = resource.fields['name']
+        field._default = 'anonymous'
+        try:
+            self.assertNotEqual(self.compute(resource), before)
+        finally:
+            field._default = 'unnamed'
+
+    def test_callable_name(self):
+        self.assertEqual(fingerprint._callable_name(datetime.datetime.now), 'datetime.datetime.now')
+        self.assertEqual(fingerprint._callable_name(uuid.uuid4), 'uuid.uuid4')
+
+    def test_invalidation_clears_fingerprints(self):
+        resource = StampedResource()
+        before = self.compute(resource)
+        with override_settings(TASTYPIE_SWAGGER_CACHE_VERSION='2'):
+            self.assertEqual(fingerprint.resource_fingerprint(resource), before)
+            invalidate_schema_cache()
+            self.assertNotEqual(fingerprint.resource_fingerprint(resource), before)
+        invalidate_schema_cache()
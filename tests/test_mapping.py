@@ -0,0 +1,247 @@
+import copy
+import logging
+import sys
+import threading
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+from tastypie import fields
+from tastypie.api import Api
+from tastypie.resources import Resource, ALL, ALL_WITH_RELATIONS
+
+from tastypie_swagger.mapping import DEFAULT_FILTER_DEPTH, ResourceSwaggerMapping
+
+
+class AuthorResource(Resource):
+    name = fields.CharField(attribute='name')
+    books = fields.ToManyField('tests.test_mapping.BookResource', 'books')
+
+    class Meta:
+        resource_name = 'author'
+        filtering = {'name': ALL, 'books': ALL_WITH_RELATIONS}
+
+
+class BookResource(Resource):
+    title = fields.CharField(attribute='title')
+    author = fields.ToOneField(AuthorResource, 'author')
+
+    class Meta:
+        resource_name = 'book'
+        filtering = {'title': ALL, 'author': ALL_WITH_RELATIONS}
+
+
+class CategoryResource(Resource):
+    name = fields.CharField(attribute='name')
+    parent = fields.ToOneField('tests.test_mapping.CategoryResource', 'parent', null=True)
+
+    class Meta:
+        resource_name = 'category'
+        filtering = {'name': ALL, 'parent': ALL_WITH_RELATIONS}
+
+
+class ShelfResource(Resource):
+    label = fields.CharField(attribute='label')
+
+    class Meta:
+        resource_name = 'shelf'
+
+
+# Routed in tests.urls
+shelf_api = Api(api_name='shelves')
+shelf_api.register(ShelfResource())
+
+
+def build_ring(size):
+    """
+    Return size resources, each with an ALL_WITH_RELATIONS filter on the next one, the last pointing to the first
+    """
+    module = sys.modules[__name__]
+    resources = []
+    for i in range(size):
+        name = 'Ring%d_%d' % (size, i)
+        attrs = {
+            '__module__': __name__,
+            'label': fields.CharField(attribute='label'),
+            'next': fields.ToOneField('%s.Ring%d_%d' % (__name__, size, (i + 1) % size), 'next'),
+            'Meta': type('Meta', (object,), {
+                'resource_name': name.lower(),
+                'filtering': {'label': ALL, 'next': ALL_WITH_RELATIONS},
+            }),
+        }
+        resource_class = type(name, (Resource,), attrs)
+        setattr(module, name, resource_class)
+        resources.append(resource_class())
+    return resources
+
+
+def own_parameter_count(mapping):
+    return sum(len(parameters) for name, related_mapping, parameters in mapping.get_filter_definitions())
+
+
+class ExpandFiltersTestCase(SimpleTestCase):
+
+    def test_mutual_relation_is_expanded_once_more(self):
+        mapping = ResourceSwaggerMapping(AuthorResource())
+        names = set(parameter['name'] for parameter in mapping.expand_filters(max_depth=None))
+
+        self.assertIn('name__iexact', names)
+        self.assertIn('books__title__iexact', names)
+        # The authors a relation leads back to have their filters listed,
+        # but not their relations
+        self.assertIn('books__author', names)
+        self.assertIn('books__author__name__iexact', names)
+        self.assertIn('books__author__books__gt', names)
+        self.assertFalse([name for name in names if name.startswith('books__author__books__title')])
+
+        book_mapping = mapping.get_related_mapping('books')
+        self.assertEqual(len(names), 2 * own_parameter_count(mapping) + own_parameter_count(book_mapping))
+
+    def test_self_reference(self):
+        mapping = ResourceSwaggerMapping(CategoryResource())
+        names = set(parameter['name'] for parameter in mapping.expand_filters(max_depth=None))
+        self.assertIn('parent__name__iexact', names)
+        self.assertIn('parent__parent__gt', names)
+        self.assertFalse([name for name in names if name.startswith('parent__parent__name')])
+
+    def test_mutual_relation_up_to_max_depth(self):
+        mapping = ResourceSwaggerMapping(AuthorResource())
+        names = set(parameter['name'] for parameter in mapping.expand_filters(max_depth=3))
+        self.assertIn('books__author__name__iexact', names)
+        self.assertIn('books__author__books__title__iexact', names)
+        self.assertIn('books__author__books__author__gt', names)
+        self.assertFalse([name for name in names if name.startswith('books__author__books__author__name')])
+
+    def test_max_depth_builds_each_resource_once_per_depth(self):
+        resources = build_ring(4)
+        mapping = ResourceSwaggerMapping(resources[0])
+        memo = {}
+        parameters = mapping.expand_filters_to_depth(8, memo)
+        self.assertEqual(len(parameters), 9 * own_parameter_count(mapping))
+        self.assertEqual(len(memo), 9)
+
+    def test_ring_grows_linearly(self):
+        for size in (6, 10, 20):
+            resources = build_ring(size)
+            mapping = ResourceSwaggerMapping(resources[0])
+            parameters = mapping.expand_filters(max_depth=None)
+
+            # Every resource of the ring once, then the first one again
+            # without its relation
+            self.assertEqual(len(parameters), (size + 1) * own_parameter_count(mapping))
+            deepest = '%slabel' % ('next__' * size)
+            self.assertIn(deepest, [parameter['name'] for parameter in parameters])
+
+    def test_long_chain_does_not_recurse(self):
+        resources = build_ring(sys.getrecursionlimit() + 10)
+        mapping = ResourceSwaggerMapping(resources[0])
+        parameters = mapping.expand_filters(max_depth=None)
+        self.assertEqual(len(parameters), (len(resources) + 1) * own_parameter_count(mapping))
+
+    def test_max_depth(self):
+        resources = build_ring(10)
+        mapping = ResourceSwaggerMapping(resources[0])
+        for depth in (0, 1, 3):
+            parameters = mapping.expand_filters(max_depth=depth)
+            self.assertEqual(len(parameters), (depth + 1) * own_parameter_count(mapping))
+
+    def test_default_depth(self):
+        resources = build_ring(10)
+        mapping = ResourceSwaggerMapping(resources[0])
+        with override_settings(TASTYPIE_SWAGGER_CACHE=False):
+            parameters = mapping.build_parameters_from_filters()
+        # limit and offset, then the filters
+        self.assertEqual(len(parameters), 2 + (DEFAULT_FILTER_DEPTH + 1) * own_parameter_count(mapping))
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class ResourceBaseUriTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.handler = RecordingHandler()
+        logging.getLogger('tastypie_swagger.mapping').addHandler(self.handler)
+
+    def tearDown(self):
+        logging.getLogger('tastypie_swagger.mapping').removeHandler(self.handler)
+
+    def get_url_warnings(self):
+        return [record for record in self.handler.records
+                if record.levelno == logging.WARNING and 'URLconf' in record.getMessage()]
+
+    def test_api(self):
+        mapping = ResourceSwaggerMapping(ShelfResource(), api=shelf_api)
+        self.assertEqual(mapping.reverse_resource_base_uri(), '/api/shelves/shelf/')
+        self.assertEqual(self.get_url_warnings(), [])
+
+    def test_unrouted_api(self):
+        mapping = ResourceSwaggerMapping(ShelfResource(), api=Api(api_name='elsewhere'))
+        self.assertEqual(mapping.reverse_resource_base_uri(), '/api/shelves/shelf/')
+        self.assertEqual(len(self.get_url_warnings()), 1)
+
+    def test_unrouted_resource(self):
+        mapping = ResourceSwaggerMapping(AuthorResource())
+        self.assertEqual(mapping.reverse_resource_base_uri(), '')
+        self.assertEqual(len(self.get_url_warnings()), 1)
+
+
+class CompactFiltersTestCase(SimpleTestCase):
+
+    def expand(self, compact):
+        with override_settings(TASTYPIE_SWAGGER_COMPACT_FILTERS=compact):
+            return ResourceSwaggerMapping(AuthorResource()).expand_filters(max_depth=None)
+
+    def test_one_parameter_per_field(self):
+        parameters = self.expand(True)
+        self.assertEqual(sorted(parameter['name'] for parameter in parameters), [
+            'books', 'books__author', 'books__author__books', 'books__author__name', 'books__title', 'name',
+        ])
+
+        full_names = set(parameter['name'] for parameter in self.expand(False))
+        self.assertIn('name__iexact', full_names)
+        self.assertGreater(len(full_names), 4 * len(parameters))
+
+    def test_lookups_in_description(self):
+        parameters = dict((parameter['name'], parameter) for parameter in self.expand(True))
+        self.assertIn('__iexact', parameters['name']['description'])
+        self.assertIn('__gt', parameters['books']['description'])
+        self.assertNotIn('__exact', parameters['books']['description'])
+
+
+class SharedOutputsTestCase(SimpleTestCase):
+
+    def build(self, mapping):
+        return mapping.build_apis(), mapping.build_models()
+
+    def test_schema_is_not_mutated(self):
+        mapping = ResourceSwaggerMapping(AuthorResource())
+        # tastypie's NOT_PROVIDED defaults only compare equal to themselves
+        defaults = [field['default'] for field in mapping.schema['fields'].values()]
+        schema = copy.deepcopy(mapping.schema, dict((id(default), default) for default in defaults))
+        self.build(mapping)
+        self.assertEqual(mapping.schema, schema)
+
+    def test_outputs_are_frozen(self):
+        apis, models = self.build(ResourceSwaggerMapping(AuthorResource()))
+        with self.assertRaises(TypeError):
+            models['author']['id'] = 'changed'
+        with self.assertRaises(TypeError):
+            apis[0]['operations'][0]['parameters'][0]['name'] = 'changed'
+
+    def test_same_outputs_from_threads(self):
+        mapping = ResourceSwaggerMapping(AuthorResource())
+        expected = self.build(ResourceSwaggerMapping(AuthorResource()))
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.build(mapping))) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [expected] * 8)
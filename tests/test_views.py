@@ -0,0 +1,233 @@
+import json
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from tastypie_swagger import cache
+from tastypie_swagger.cache import MAX_REBASED, SchemaDocument, get_schema_cache, invalidate_schema_cache, schema_cache
+from tastypie_swagger.signals import schema_built
+from tastypie_swagger.views import BASE_PATH_PLACEHOLDER
+
+from .test_warmup import api
+
+
+class ViewTestCase(SimpleTestCase):
+    """
+    Starts every test with empty caches, and records the documents built
+    """
+
+    def setUp(self):
+        invalidate_schema_cache()
+        self.built = []
+        schema_built.connect(self.record_build)
+
+    def tearDown(self):
+        schema_built.disconnect(self.record_build)
+        invalidate_schema_cache()
+
+    def record_build(self, sender, request, phases, **kwargs):
+        self.built.append(request.path)
+
+    def get_json(self, path, **extra):
+        response = self.client.get(path, **extra)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content.decode('utf-8'))
+
+
+class SchemaViewCacheTestCase(ViewTestCase):
+
+    def test_built_once(self):
+        first = self.get_json('/doc/schema/author')
+        self.assertEqual(self.get_json('/doc/schema/author'), first)
+        self.assertEqual(self.built, ['/doc/schema/author'])
+
+    def test_key_per_resource_and_version(self):
+        self.get_json('/doc/schema/author')
+        self.get_json('/doc/schema/book')
+        declaration = self.get_json('/doc2/schema/author')
+        self.assertEqual(declaration['apiVersion'], '2')
+        self.assertEqual(len(self.built), 3)
+
+        self.assertIsNotNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
+        self.assertIsNotNone(schema_cache.get((api, 'author', 'versioned_docs', '2', '/')))
+
+    def test_invalidate(self):
+        self.get_json('/doc/schema/author')
+        self.get_json('/doc/schema/book')
+        invalidate_schema_cache(api=api, resource_name='author')
+        self.assertIsNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
+        self.assertIsNotNone(schema_cache.get((api, 'book', 'warmup_docs', '1', '/')))
+
+        self.get_json('/doc/schema/author')
+        self.get_json('/doc/schema/book')
+        self.assertEqual(self.built, ['/doc/schema/author', '/doc/schema/book', '/doc/schema/author'])
+
+    @override_settings(TASTYPIE_SWAGGER_CACHE=False)
+    def test_disabled(self):
+        first = self.get_json('/doc/schema/author')
+        self.assertEqual(self.get_json('/doc/schema/author'), first)
+        self.assertEqual(len(self.built), 2)
+        self.assertIsNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
+
+
+class ConditionalGetTestCase(ViewTestCase):
+
+    def test_if_none_match(self):
+        for path in ('/doc/schema/author', '/doc/resources/', '/doc/aggregate/'):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            etag = response['ETag']
+
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b'')
+            self.assertEqual(response['ETag'], etag)
+
+            response = self.client.get(path, HTTP_IF_NONE_MATCH='"other"')
+            self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since(self):
+        response = self.client.get('/doc/schema/author')
+        last_modified = response['Last-Modified']
+        self.assertEqual(self.client.get('/doc/schema/author', HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        self.assertEqual(self.client.get(
+            '/doc/schema/author', HTTP_IF_MODIFIED_SINCE='Sat, 01 Jan 2000 00:00:00 GMT').status_code, 200)
+
+    def test_etag_of_encoded_variant(self):
+        plain = self.client.get('/doc/aggregate/')
+        encoded = self.client.get('/doc/aggregate/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(encoded['Content-Encoding'], 'gzip')
+        self.assertNotEqual(encoded['ETag'], plain['ETag'])
+        self.assertEqual(self.client.get(
+            '/doc/aggregate/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=encoded['ETag']).status_code, 304)
+
+
+class StreamingTestCase(ViewTestCase):
+    paths = ('/doc/schema/author', '/doc/resources/', '/doc/aggregate/', '/doc/aggregate/?resources=book')
+
+    def get_body(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        if response.streaming:
+            return b''.join(response.streaming_content).decode('utf-8'), True
+        return response.content.decode('utf-8'), False
+
+    def test_same_document(self):
+        for path in self.paths:
+            with override_settings(TASTYPIE_SWAGGER_STREAMING=True, TASTYPIE_SWAGGER_CACHE=False):
+                streamed, streaming = self.get_body(path)
+            self.assertTrue(streaming)
+            invalidate_schema_cache()
+            body, streaming = self.get_body(path)
+            self.assertFalse(streaming)
+            self.assertEqual(json.loads(streamed), json.loads(body))
+
+
+@override_settings(TASTYPIE_SWAGGER_HASHED_URLS=True)
+class HashedUrlsTestCase(ViewTestCase):
+
+    def get_paths(self):
+        return dict(entry['path'].split('?v=') for entry in self.get_json('/doc/resources/')['apis'])
+
+    def test_listing_points_to_hashes(self):
+        paths = self.get_paths()
+        self.assertEqual(sorted(paths), ['/author', '/book'])
+        response = self.client.get('/doc/schema/author')
+        self.assertEqual(paths['/author'], response['ETag'][1:13])
+
+    def test_immutable_when_hash_matches(self):
+        version = self.get_paths()['/author']
+        response = self.client.get('/doc/schema/author?v=%s' % version)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+
+        for path in ('/doc/schema/author?v=0123456789ab', '/doc/schema/author'):
+            response = self.client.get(path)
+            self.assertNotIn('immutable', response['Cache-Control'])
+            self.assertIn('max-age=60', response['Cache-Control'])
+
+    @override_settings(TASTYPIE_SWAGGER_CACHE=False)
+    def test_requires_cache(self):
+        paths = [entry['path'] for entry in self.get_json('/doc/resources/')['apis']]
+        self.assertEqual(paths, ['/author', '/book'])
+
+
+class ResourcesViewTestCase(ViewTestCase):
+
+    def get_listing(self, path, host='testserver'):
+        response = self.client.get(path, HTTP_HOST=host)
+        self.assertEqual(response.status_code, 200)
+        return response, json.loads(response.content.decode('utf-8'))
+
+    def test_base_path_is_absolute(self):
+        for path in ('/doc/resources/', '/doc/aggregate/'):
+            response, listing = self.get_listing(path, 'docs.example.com')
+            self.assertEqual(listing['basePath'], 'http://docs.example.com/doc/schema')
+
+    def test_one_entry_for_every_host(self):
+        etags = set()
+        for i in range(MAX_REBASED + 2):
+            response, listing = self.get_listing('/doc/resources/', 'host%d.example.com' % i)
+            self.assertEqual(listing['basePath'], 'http://host%d.example.com/doc/schema' % i)
+            etags.add(response['ETag'])
+        self.assertEqual(len(etags), MAX_REBASED + 2)
+        self.assertEqual(len(cache._rebased), MAX_REBASED)
+
+        document = schema_cache.get((api, None, 'warmup_docs', '1', '/doc/schema'))
+        self.assertEqual(json.loads(document.content)['basePath'], BASE_PATH_PLACEHOLDER)
+
+    @override_settings(TASTYPIE_SWAGGER_CACHE_ALIAS='swagger')
+    def test_shared_cache_compresses_once(self):
+        get_schema_cache().clear()
+        compress = SchemaDocument.compress
+        calls = []
+
+        def counting_compress(document):
+            calls.append(document)
+            return compress(document)
+
+        SchemaDocument.compress = counting_compress
+        try:
+            response, first = self.get_listing('/doc/aggregate/')
+            built = len(calls)
+            for i in range(2):
+                response, listing = self.get_listing('/doc/aggregate/')
+                self.assertEqual(listing, first)
+        finally:
+            SchemaDocument.compress = compress
+        self.assertTrue(built)
+        self.assertEqual(len(calls), built)
+
+
+class AggregateViewTestCase(ViewTestCase):
+
+    def test_every_declaration(self):
+        document = self.get_json('/doc/aggregate/')
+        self.assertEqual([entry['path'] for entry in document['apis']], ['/author', '/book'])
+        self.assertEqual(sorted(document['apiDeclarations']), ['author', 'book'])
+        self.assertEqual(document['apiDeclarations']['book'], self.get_json('/doc/schema/book'))
+
+    def test_subset(self):
+        document = self.get_json('/doc/aggregate/?resources=book')
+        self.assertEqual([entry['path'] for entry in document['apis']], ['/book'])
+        self.assertEqual(list(document['apiDeclarations']), ['book'])
+
+    def test_unknown_resource(self):
+        self.assertEqual(self.client.get('/doc/aggregate/?resources=book,nothing').status_code, 404)
+
+    def test_list_models_per_resource(self):
+        response = self.client.get('/doc/aggregate/')
+        declarations = json.loads(response.content.decode('utf-8'))['apiDeclarations']
+
+        for name in ('author', 'book'):
+            models = declarations[name]['models']
+            self.assertNotIn('ListView', models)
+            self.assertNotIn('Objects', models)
+            self.assertEqual(models['%s_list' % name]['properties']['objects']['items'], {'$ref': name})
+            self.assertEqual(models['%s_list' % name]['properties']['meta']['type'], 'Meta')
+
+            operations = [operation for api in declarations[name]['apis'] for operation in api['operations']
+                          if operation['nickname'] == '%s_list' % name and operation['httpMethod'] == 'GET']
+            self.assertEqual([operation['responseClass'] for operation in operations], ['%s_list' % name])
+
+        self.assertEqual(declarations['author']['models']['Meta'], declarations['book']['models']['Meta'])
@@ -0,0 +1,74 @@
+from django.apps import apps
+from django.core.signals import request_started
+from django.core.urlresolvers import get_script_prefix
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+from tastypie.api import Api
+
+from tastypie_swagger.cache import SchemaDocument, schema_cache
+from tastypie_swagger.warmup import warm_up
+
+from .test_mapping import AuthorResource, BookResource
+
+api = Api(api_name='warmup')
+api.register(AuthorResource())
+api.register(BookResource())
+
+MOUNT = {'tastypie_api_module': api, 'namespace': 'warmup_docs', 'version': '1'}
+
+
+class WarmUpTestCase(SimpleTestCase):
+
+    def setUp(self):
+        schema_cache.clear()
+
+    def tearDown(self):
+        schema_cache.clear()
+
+    def test_builds_missing_declarations(self):
+        timings = warm_up(mounts=[MOUNT], workers=1)
+        self.assertEqual(sorted(name for elapsed, namespace, name in timings), ['author', 'book'])
+        self.assertIsNotNone(schema_cache.get((api, 'book', 'warmup_docs', '1', '/')))
+        self.assertIsNotNone(schema_cache.get((api, None, 'warmup_docs', '1', '/doc/schema')))
+
+    def test_keeps_cached_declarations(self):
+        document = SchemaDocument('{}')
+        schema_cache.set((api, 'author', 'warmup_docs', '1', '/'), document)
+        timings = warm_up(mounts=[MOUNT], workers=1)
+        self.assertEqual([name for elapsed, namespace, name in timings], ['book'])
+        self.assertIs(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')), document)
+
+    def test_script_prefix(self):
+        with override_settings(FORCE_SCRIPT_NAME='/docs'):
+            warm_up(mounts=[MOUNT], workers=1)
+        self.assertIsNotNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/docs/')))
+        self.assertIsNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
+        self.assertEqual(get_script_prefix(), '/')
+
+
+class WarmUpTriggerTestCase(SimpleTestCase):
+
+    def setUp(self):
+        schema_cache.clear()
+        self.config = apps.get_app_config('tastypie_swagger')
+        self.config._warmup_started = False
+
+    def tearDown(self):
+        request_started.disconnect(dispatch_uid='tastypie_swagger_warmup')
+        del self.config._warmup_started
+        schema_cache.clear()
+
+    @override_settings(TASTYPIE_SWAGGER_WARMUP=True)
+    def test_runs_on_first_request(self):
+        self.config.ready()
+        self.assertIsNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
+
+        self.client.get('/doc/versions/')
+        self.assertIsNotNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
+        self.assertTrue(self.config._warmup_started)
+
+    @override_settings(TASTYPIE_SWAGGER_WARMUP=False)
+    def test_disabled(self):
+        self.config.ready()
+        self.client.get('/doc/versions/')
+        self.assertIsNone(schema_cache.get((api, 'author', 'warmup_docs', '1', '/')))
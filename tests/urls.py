@@ -0,0 +1,13 @@
+from django.conf.urls import include, url
+
+from .test_mapping import shelf_api
+from .test_warmup import MOUNT
+
+# Resources under test are not routed, tastypie leaves their urls empty,
+# except those of shelf_api
+urlpatterns = [
+    url(r'^api/', include(shelf_api.urls)),
+    url(r'^doc/', include('tastypie_swagger.urls', namespace='warmup_docs'), MOUNT),
+    url(r'^doc2/', include('tastypie_swagger.urls', namespace='versioned_docs'),
+        dict(MOUNT, namespace='versioned_docs', version='2')),
+]